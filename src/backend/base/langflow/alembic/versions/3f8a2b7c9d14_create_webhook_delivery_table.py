@@ -0,0 +1,61 @@
+"""create webhook_delivery table
+
+Revision ID: 3f8a2b7c9d14
+Revises: cbd5f0a729a0
+Create Date: 2026-10-19 15:02:31.604218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a2b7c9d14"
+down_revision: str | None = "cbd5f0a729a0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not migration.table_exists("webhook_delivery", conn):
+        op.create_table(
+            "webhook_delivery",
+            sa.Column("flow_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column("user_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=True),
+            sa.Column("idempotency_key", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "RUNNING", "SUCCEEDED", "FAILED", name="webhookdeliverystatus"),
+                nullable=False,
+            ),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+            sa.Column("id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column("payload", sa.Text(), nullable=False),
+            sa.Column("locked_until", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("flow_id", "idempotency_key", name="uq_webhook_delivery_flow_id_idempotency_key"),
+        )
+        with op.batch_alter_table("webhook_delivery", schema=None) as batch_op:
+            batch_op.create_index(batch_op.f("ix_webhook_delivery_flow_id"), ["flow_id"], unique=False)
+            batch_op.create_index(
+                "ix_webhook_delivery_status_next_attempt_at", ["status", "next_attempt_at"], unique=False
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if migration.table_exists("webhook_delivery", conn):
+        with op.batch_alter_table("webhook_delivery", schema=None) as batch_op:
+            batch_op.drop_index("ix_webhook_delivery_status_next_attempt_at")
+            batch_op.drop_index(batch_op.f("ix_webhook_delivery_flow_id"))
+        op.drop_table("webhook_delivery")
+        sa.Enum(name="webhookdeliverystatus").drop(conn, checkfirst=True)
@@ -0,0 +1,63 @@
+"""add flow_tombstone table and flow_id indexes
+
+Revision ID: 9c4e1d7a2b58
+Revises: 3f8a2b7c9d14
+Create Date: 2026-10-19 17:41:09.318552
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1d7a2b58"
+down_revision: str | None = "3f8a2b7c9d14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FLOW_ID_INDEXES = {
+    "message": ("ix_message_flow_id_id", ["flow_id", "id"]),
+    "transaction": ("ix_transaction_flow_id_id", ["flow_id", "id"]),
+    "vertex_build": ("ix_vertex_build_flow_id_build_id", ["flow_id", "build_id"]),
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not migration.table_exists("flow_tombstone", conn):
+        op.create_table(
+            "flow_tombstone",
+            sa.Column("flow_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column("deleted_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("flow_id"),
+        )
+        with op.batch_alter_table("flow_tombstone", schema=None) as batch_op:
+            batch_op.create_index(batch_op.f("ix_flow_tombstone_deleted_at"), ["deleted_at"], unique=False)
+
+    inspector = sa.inspect(conn)
+    for table_name, (index_name, columns) in FLOW_ID_INDEXES.items():
+        if not migration.table_exists(table_name, conn):
+            continue
+        if index_name not in [index["name"] for index in inspector.get_indexes(table_name)]:
+            with op.batch_alter_table(table_name, schema=None) as batch_op:
+                batch_op.create_index(index_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    for table_name, (index_name, _) in FLOW_ID_INDEXES.items():
+        if not migration.table_exists(table_name, conn):
+            continue
+        if index_name in [index["name"] for index in inspector.get_indexes(table_name)]:
+            with op.batch_alter_table(table_name, schema=None) as batch_op:
+                batch_op.drop_index(index_name)
+
+    if migration.table_exists("flow_tombstone", conn):
+        with op.batch_alter_table("flow_tombstone", schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f("ix_flow_tombstone_deleted_at"))
+        op.drop_table("flow_tombstone")
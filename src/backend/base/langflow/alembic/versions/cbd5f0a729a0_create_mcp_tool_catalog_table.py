@@ -0,0 +1,51 @@
+"""create mcp_tool_catalog table
+
+Revision ID: cbd5f0a729a0
+Revises: 182e5471b900
+Create Date: 2026-10-19 09:12:44.318263
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "cbd5f0a729a0"
+down_revision: str | None = "182e5471b900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if not migration.table_exists("mcp_tool_catalog", conn):
+        op.create_table(
+            "mcp_tool_catalog",
+            sa.Column("flow_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column("user_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=True),
+            sa.Column("tool_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("action_tool_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("input_schema", sa.JSON(), nullable=True),
+            sa.Column("fingerprint", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["flow_id"], ["flow.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("flow_id"),
+        )
+        with op.batch_alter_table("mcp_tool_catalog", schema=None) as batch_op:
+            batch_op.create_index("ix_mcp_tool_catalog_user_id_tool_name", ["user_id", "tool_name"], unique=False)
+            batch_op.create_index(
+                "ix_mcp_tool_catalog_user_id_action_tool_name", ["user_id", "action_tool_name"], unique=False
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if migration.table_exists("mcp_tool_catalog", conn):
+        with op.batch_alter_table("mcp_tool_catalog", schema=None) as batch_op:
+            batch_op.drop_index("ix_mcp_tool_catalog_user_id_action_tool_name")
+            batch_op.drop_index("ix_mcp_tool_catalog_user_id_tool_name")
+        op.drop_table("mcp_tool_catalog")
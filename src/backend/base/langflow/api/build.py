@@ -6,6 +6,7 @@ import uuid
 from collections.abc import AsyncIterator
 
 from fastapi import BackgroundTasks, HTTPException, Response
+from lfx.events.stream import iter_event_batches
 from lfx.graph.graph.base import Graph
 from lfx.graph.utils import log_vertex_build
 from lfx.log.logger import logger
@@ -172,17 +173,11 @@ async def create_flow_response(
     """Create a streaming response for the flow build process."""
 
     async def consume_and_yield() -> AsyncIterator[str]:
-        while True:
-            try:
-                event_id, value, put_time = await queue.get()
-                if value is None:
-                    break
-                get_time = time.time()
-                yield value.decode("utf-8")
-                await logger.adebug(f"Event {event_id} consumed in {get_time - put_time:.4f}s")
-            except Exception as exc:  # noqa: BLE001
-                await logger.aexception(f"Error consuming event: {exc}")
-                break
+        try:
+            async for batch in iter_event_batches(queue):
+                yield b"".join(batch).decode("utf-8")
+        except Exception as exc:  # noqa: BLE001
+            await logger.aexception(f"Error consuming event: {exc}")
 
     def on_disconnect() -> None:
         logger.debug("Client disconnected, closing tasks")
@@ -1,11 +1,12 @@
 import uuid
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from lfx.log.logger import logger
 from pydantic import BaseModel
 from sqlmodel import select
 
 from langflow.api.utils import DbSession
+from langflow.initial_setup.startup import StartupReport
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_chat_service
 
@@ -63,3 +64,12 @@ async def health_check(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=response.model_dump())
     response.status = "ok"
     return response
+
+
+# /health_check/startup reports the progress and per-phase timings of the application startup
+@health_check_router.get("/health_check/startup")
+async def startup_report(request: Request) -> StartupReport:
+    orchestrator = getattr(request.app.state, "startup_orchestrator", None)
+    if orchestrator is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Startup report is not available")
+    return orchestrator.report()
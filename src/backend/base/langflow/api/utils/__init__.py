@@ -33,6 +33,7 @@ from langflow.api.utils.core import (
     has_api_terms,
     parse_exception,
     parse_value,
+    record_deleted_flows,
     remove_api_keys,
     validate_is_component,
     verify_public_flow_and_get_user,
@@ -70,6 +71,7 @@ __all__ = [
     "has_api_terms",
     "parse_exception",
     "parse_value",
+    "record_deleted_flows",
     "remove_api_keys",
     "validate_is_component",
     "verify_public_flow_and_get_user",
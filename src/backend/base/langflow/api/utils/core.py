@@ -11,19 +11,26 @@ from fastapi_pagination import Params
 from lfx.graph.graph.base import Graph
 from lfx.log.logger import logger
 from sqlalchemy import delete
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.flow_tombstone.crud import add_flow_tombstones
+from langflow.services.database.models.mcp_tool_catalog.model import MCPToolCatalogTable
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.database.models.webhook_delivery.model import WebhookDeliveryTable
 from langflow.services.deps import get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
+from langflow.services.task.temp_flow_cleanup import cleanup_worker
 from langflow.utils.constants import LANGFLOW_GLOBAL_VAR_HEADER_PREFIX
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from langflow.services.chat.service import ChatService
     from langflow.services.store.schema import StoreComponentCreate
 
@@ -299,20 +306,44 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
+    """Delete a flow and the records that belong to it.
+
+    Transactions and vertex builds are capped per flow and webhook deliveries are pruned once they are out of the
+    deduplication window, so they are deleted right away. Messages are not: a tombstone is recorded for the flow and
+    the cleanup worker deletes its messages and files in batches, see :func:`record_deleted_flows`.
+    """
     try:
         # TODO: Verify if deleting messages is safe in terms of session id relevance
         # If we delete messages directly, rather than setting flow_id to null,
         # it might cause unexpected behaviors because the session id could still be
         # used elsewhere to search for these messages.
-        await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
+        await session.exec(delete(MCPToolCatalogTable).where(MCPToolCatalogTable.flow_id == flow_id))
+        await session.exec(delete(WebhookDeliveryTable).where(WebhookDeliveryTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        await record_deleted_flows(session, [flow_id])
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
 
 
+async def record_deleted_flows(session: AsyncSession, flow_ids: Iterable[uuid.UUID]) -> None:
+    """Record tombstones for deleted flows, so that the cleanup worker removes their messages and files.
+
+    The cleanup worker only runs in the server. Without it, e.g. when flows are deleted by the flow runner, the
+    messages are deleted right away and the tombstones are left for the next server start.
+    """
+    flow_ids = list(flow_ids)
+    if not flow_ids:
+        return
+    await add_flow_tombstones(session, flow_ids)
+    if cleanup_worker.is_running:
+        cleanup_worker.notify()
+    else:
+        await session.exec(delete(MessageTable).where(col(MessageTable.flow_id).in_(flow_ids)))
+
+
 def custom_params(
     page: int | None = Query(None),
     size: int | None = Query(None),
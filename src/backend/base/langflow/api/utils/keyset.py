@@ -0,0 +1,106 @@
+"""Keyset (cursor) pagination and NDJSON streaming helpers for list endpoints.
+
+Rows are ordered by ``(timestamp, id)``. The cursor is an opaque, URL-safe token encoding the ``(timestamp, id)``
+of the last row of a page; the next page starts strictly after it. Unlike offset pagination this keeps each page
+an index range scan regardless of how deep the client pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlmodel import col
+
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from pydantic import BaseModel
+    from sqlmodel.sql.expression import SelectOfScalar
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_PAGE_LIMIT = 1000
+MAX_PAGE_LIMIT = 10000
+
+
+def encode_cursor(timestamp: datetime, row_id: Any) -> str:
+    payload = orjson.dumps([timestamp.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_cursor`. Raises a 400 error if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(timestamp), row_id
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def paginate_by_keyset(
+    stmt: SelectOfScalar,
+    timestamp_column: Any,
+    id_column: Any,
+    *,
+    cursor: str | None,
+    limit: int,
+    id_type: Callable[[str], Any] = str,
+) -> SelectOfScalar:
+    """Order ``stmt`` by ``(timestamp, id)``, start after ``cursor`` and fetch one extra row to detect a next page."""
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        try:
+            row_id = id_type(row_id)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+        stmt = stmt.where(
+            or_(
+                col(timestamp_column) > timestamp,
+                and_(col(timestamp_column) == timestamp, col(id_column) > row_id),
+            )
+        )
+    return stmt.order_by(col(timestamp_column).asc(), col(id_column).asc()).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, cursor_for: Callable[[Any], str]) -> tuple[list, str | None]:
+    """Drop the extra row fetched by :func:`paginate_by_keyset` and return the cursor of the next page, if any."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, cursor_for(page[-1])
+
+
+async def stream_ndjson(
+    stmt: SelectOfScalar,
+    *,
+    limit: int,
+    to_model: Callable[[Any], BaseModel],
+    cursor_for: Callable[[Any], str],
+) -> AsyncIterator[bytes]:
+    """Yield one JSON document per row as the database cursor produces them.
+
+    The statement must come from :func:`paginate_by_keyset`. If more rows are available, a final
+    ``{"next_cursor": ...}`` line is emitted. A dedicated session is used because the response outlives the
+    request-scoped one.
+    """
+    async with session_scope() as session:
+        result = await session.stream_scalars(stmt)
+        count = 0
+        last = None
+        async for row in result:
+            if count == limit:
+                yield orjson.dumps({"next_cursor": cursor_for(last)}) + b"\n"
+                break
+            yield to_model(row).model_dump_json().encode() + b"\n"
+            last = row
+            count += 1
+        await result.close()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
@@ -19,6 +18,7 @@ from lfx.custom.utils import (
     get_instance_name,
     update_component_build_config,
 )
+from lfx.events.stream import consume_and_yield
 from lfx.graph.graph.base import Graph
 from lfx.graph.schema import RunOutputs
 from lfx.log.logger import logger
@@ -41,17 +41,23 @@ from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+from langflow.interface.editor_sessions import copy_node, get_editor_sessions
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user, get_webhook_user
 from langflow.services.cache.utils import save_uploaded_file
 from langflow.services.database.models.flow.model import Flow, FlowRead
-from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_session_service,
+    get_settings_service,
+    get_telemetry_service,
+    get_webhook_inbox_service,
+)
 from langflow.services.telemetry.schema import RunPayload
 from langflow.utils.compression import compress_response
+from langflow.utils.constants import LANGFLOW_CACHE_BYPASS_HEADER
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -243,47 +249,11 @@ async def simple_run_flow_task(
         return None
 
 
-async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
-    """Consumes events from a queue and yields them to the client while tracking timing metrics.
-
-    This coroutine continuously pulls events from the input queue and yields them to the client.
-    It tracks timing metrics for how long events spend in the queue and how long the client takes
-    to process them.
-
-    Args:
-        queue (asyncio.Queue): The queue containing events to be consumed and yielded
-        client_consumed_queue (asyncio.Queue): A queue for tracking when the client has consumed events
-
-    Yields:
-        The value from each event in the queue
-
-    Notes:
-        - Events are tuples of (event_id, value, put_time)
-        - Breaks the loop when receiving a None value, signaling completion
-        - Tracks and logs timing metrics for queue time and client processing time
-        - Notifies client consumption via client_consumed_queue
-    """
-    while True:
-        event_id, value, put_time = await queue.get()
-        if value is None:
-            break
-        get_time = time.time()
-        yield value
-        get_time_yield = time.time()
-        client_consumed_queue.put_nowait(event_id)
-        await logger.adebug(
-            f"consumed event {event_id} "
-            f"(time in queue, {get_time - put_time:.4f}, "
-            f"client {get_time_yield - get_time:.4f})"
-        )
-
-
 async def run_flow_generator(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
     api_key_user: User | None,
     event_manager: EventManager,
-    client_consumed_queue: asyncio.Queue,
     context: dict | None = None,
 ) -> None:
     """Executes a flow asynchronously and manages event streaming to the client.
@@ -296,7 +266,6 @@ async def run_flow_generator(
         input_request (SimplifiedAPIRequest): The input parameters for the flow
         api_key_user (User | None): Optional authenticated user running the flow
         event_manager (EventManager): Manages the streaming of events to the client
-        client_consumed_queue (asyncio.Queue): Tracks client consumption of events
         context (dict | None): Optional context to pass to the flow
 
     Events Generated:
@@ -321,12 +290,11 @@ async def run_flow_generator(
             context=context,
         )
         event_manager.on_end(data={"result": result.model_dump()})
-        await client_consumed_queue.get()
     except (ValueError, InvalidChatInputError, SerializationError) as e:
         await logger.aerror(f"Error running flow: {e}")
         event_manager.on_error(data={"error": str(e)})
     finally:
-        await event_manager.queue.put((None, None, time.time))
+        await event_manager.queue.put((None, None, time.time()))
 
 
 async def check_flow_user_permission(
@@ -414,11 +382,14 @@ async def simplified_run_flow(
             context = context.copy()  # Don't modify the original context
             context["request_variables"] = request_variables
 
+    # Skip the LLM response cache of the components for this run only
+    if http_request.headers.get(LANGFLOW_CACHE_BYPASS_HEADER, "").lower() in {"1", "true", "yes"}:
+        context = {**(context or {}), "llm_cache_bypass": True}
+
     start_time = time.perf_counter()
 
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
-        asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
         event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
         main_task = asyncio.create_task(
             run_flow_generator(
@@ -426,7 +397,6 @@ async def simplified_run_flow(
                 input_request=input_request,
                 api_key_user=api_key_user,
                 event_manager=event_manager,
-                client_consumed_queue=asyncio_queue_client_consumed,
                 context=context,
             )
         )
@@ -436,7 +406,7 @@ async def simplified_run_flow(
             main_task.cancel()
 
         return StreamingResponse(
-            consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
+            consume_and_yield(asyncio_queue),
             background=on_disconnect,
             media_type="text/event-stream",
         )
@@ -519,8 +489,6 @@ async def webhook_run_flow(
     Raises:
         HTTPException: If the flow is not found or if there is an error processing the request.
     """
-    telemetry_service = get_telemetry_service()
-    start_time = time.perf_counter()
     await logger.adebug("Received webhook request")
     error_msg = ""
 
@@ -537,37 +505,29 @@ async def webhook_run_flow(
         error_msg = "Request body is empty. You should provide a JSON payload containing the flow ID."
         raise HTTPException(status_code=400, detail=error_msg)
 
+    webhook_inbox = get_webhook_inbox_service()
     try:
-        # get all webhook components in the flow
-        webhook_components = get_all_webhook_components_in_flow(flow.data)
-        tweaks = {}
-
-        for component in webhook_components:
-            tweaks[component["id"]] = {"data": data.decode() if isinstance(data, bytes) else data}
-        input_request = SimplifiedAPIRequest(
-            input_value="",
-            input_type="chat",
-            output_type="chat",
-            tweaks=tweaks,
-            session_id=None,
-        )
-
-        await logger.adebug("Starting background task")
-        run_id = str(uuid4())
-        background_tasks.add_task(
-            simple_run_flow_task,
-            flow=flow,
-            input_request=input_request,
-            api_key_user=webhook_user,
-            telemetry_service=telemetry_service,
-            start_time=start_time,
-            run_id=run_id,
+        # The delivery is stored before it is acknowledged so that it survives a restart
+        delivery, created = await webhook_inbox.accept(
+            flow.id,
+            webhook_user.id if webhook_user else None,
+            data,
+            webhook_inbox.idempotency_key(request.headers, data),
         )
     except Exception as exc:
         error_msg = str(exc)
         raise HTTPException(status_code=500, detail=error_msg) from exc
 
-    return {"message": "Task started in the background", "status": "in progress"}
+    if not created:
+        return {
+            "message": "Duplicate webhook ignored",
+            "status": delivery.status.value,
+            "delivery_id": str(delivery.id),
+        }
+
+    await logger.adebug("Starting background task")
+    background_tasks.add_task(webhook_inbox.deliver, delivery)
+    return {"message": "Task started in the background", "status": "in progress", "delivery_id": str(delivery.id)}
 
 
 @router.post(
@@ -786,6 +746,7 @@ async def custom_component(
 async def custom_component_update(
     code_request: UpdateCustomComponentRequest,
     user: CurrentActiveUser,
+    http_request: Request,
 ):
     """Update an existing custom component with new code and configuration.
 
@@ -793,56 +754,71 @@ async def custom_component_update(
     database), updates the component's build configuration, and validates outputs. Returns the updated component node as
     a JSON-serializable dictionary.
 
+    The component built from the code is kept in an editor session between updates, so only the fields that changed
+    since the previous update are set on it, and the build configs computed by ``update_build_config`` are reused for
+    identical updates of identical templates. Updates of a field with a refresh button, and updates sent with the cache
+    bypass header, always call ``update_build_config``.
+
     Raises:
         HTTPException: If an error occurs during component building or updating.
         SerializationError: If serialization of the updated component node fails.
     """
+    editor_sessions = get_editor_sessions()
+    bypass_cache = http_request.headers.get(LANGFLOW_CACHE_BYPASS_HEADER, "").lower() in {"1", "true", "yes"}
     try:
-        component = Component(_code=code_request.code)
-        component_node, cc_instance = build_custom_component_template(
-            component,
-            user_id=user.id,
-        )
+        template = code_request.get_template()
+        session = editor_sessions.get(code_request.code, user.id, template)
+        async with session.lock:
+            component_node = copy_node(session.component_node)
+            cc_instance = session.instance
 
-        component_node["tool_mode"] = code_request.tool_mode
+            component_node["tool_mode"] = code_request.tool_mode
 
-        if hasattr(cc_instance, "set_attributes"):
-            template = code_request.get_template()
-            params = {}
+            if hasattr(cc_instance, "set_attributes"):
+                changed_fields = session.changed_fields(template)
+                params = {}
 
-            for key, value_dict in template.items():
-                if isinstance(value_dict, dict):
+                for key in changed_fields:
+                    value_dict = template[key]
                     value = value_dict.get("value")
                     input_type = str(value_dict.get("_input_type"))
                     params[key] = parse_value(value, input_type)
 
-            load_from_db_fields = [
-                field_name
-                for field_name, field_dict in template.items()
-                if isinstance(field_dict, dict) and field_dict.get("load_from_db") and field_dict.get("value")
-            ]
+                load_from_db_fields = [
+                    field_name
+                    for field_name in changed_fields
+                    if template[field_name].get("load_from_db") and template[field_name].get("value")
+                ]
+                if isinstance(cc_instance, Component):
+                    params = await update_params_with_load_from_db_fields(cc_instance, params, load_from_db_fields)
+                    cc_instance.set_attributes(params)
+                    session.mark_applied(template, changed_fields)
+
+            build_config_key = session.build_config_key(template, code_request.field, code_request.field_value)
+            updated_build_config = None if bypass_cache else session.get_build_config(build_config_key)
+            if updated_build_config is None:
+                updated_build_config = code_request.get_template()
+                await update_component_build_config(
+                    cc_instance,
+                    build_config=updated_build_config,
+                    field_value=code_request.field_value,
+                    field_name=code_request.field,
+                )
+                session.set_build_config(build_config_key, updated_build_config)
+            if "code" not in updated_build_config or not updated_build_config.get("code", {}).get("value"):
+                updated_build_config = add_code_field_to_build_config(updated_build_config, code_request.code)
+            component_node["template"] = updated_build_config
+
             if isinstance(cc_instance, Component):
-                params = await update_params_with_load_from_db_fields(cc_instance, params, load_from_db_fields)
-                cc_instance.set_attributes(params)
-        updated_build_config = code_request.get_template()
-        await update_component_build_config(
-            cc_instance,
-            build_config=updated_build_config,
-            field_value=code_request.field_value,
-            field_name=code_request.field,
-        )
-        if "code" not in updated_build_config or not updated_build_config.get("code", {}).get("value"):
-            updated_build_config = add_code_field_to_build_config(updated_build_config, code_request.code)
-        component_node["template"] = updated_build_config
-
-        if isinstance(cc_instance, Component):
-            await cc_instance.run_and_validate_update_outputs(
-                frontend_node=component_node,
-                field_name=code_request.field,
-                field_value=code_request.field_value,
-            )
+                await cc_instance.run_and_validate_update_outputs(
+                    frontend_node=component_node,
+                    field_name=code_request.field,
+                    field_value=code_request.field_value,
+                )
 
     except Exception as exc:
+        # The component may be left half updated, build it again on the next update
+        editor_sessions.discard(code_request.code, user.id)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     try:
@@ -13,7 +13,7 @@ from urllib.parse import quote, unquote, urlparse
 from uuid import uuid4
 
 from lfx.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
-from lfx.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
+from lfx.base.mcp.util import get_unique_name
 from lfx.log.logger import logger
 from lfx.utils.helpers import build_content_type_from_extension
 from mcp import types
@@ -21,11 +21,15 @@ from sqlmodel import select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.helpers.flow import json_schema_from_flow
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_settings_service, get_storage_service, session_scope
+from langflow.services.deps import (
+    get_mcp_tool_catalog_service,
+    get_settings_service,
+    get_storage_service,
+    session_scope,
+)
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -182,7 +186,7 @@ async def handle_call_tool(
 
     async def execute_tool(session):
         # Get flow id from name
-        flow = await get_flow_snake_case(name, current_user.id, session, is_action=is_action)
+        flow = await get_mcp_tool_catalog_service().find_flow(session, name, current_user.id, is_action=is_action)
         if not flow:
             msg = f"Flow with name '{name}' not found"
             raise ValueError(msg)
@@ -293,35 +297,43 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
+            # Only the light columns are loaded, the input schemas come from the tool catalog
+            flows_query = select(
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.user_id,
+                Flow.updated_at,
+            )
             # Build query based on parameters
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = flows_query.where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-            else:
-                # Get all flows
-                flows_query = select(Flow)
 
-            flows = (await session.exec(flows_query)).all()
+            flows = [flow for flow in (await session.exec(flows_query)).all() if flow.user_id is not None]
+            catalog = await get_mcp_tool_catalog_service().get_entries(session, flows)
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
+                entry = catalog.get(flow.id)
+                if entry is None or entry.input_schema is None:
+                    # The input schema of the flow could not be built
                     continue
 
                 # For project-specific tools, use action names if available
                 if project_id:
-                    base_name = (
-                        sanitize_mcp_name(flow.action_name) if flow.action_name else sanitize_mcp_name(flow.name)
-                    )
+                    base_name = entry.action_tool_name
                     name = get_unique_name(base_name, MAX_MCP_TOOL_NAME_LENGTH, existing_names)
                     description = flow.action_description or (
                         flow.description if flow.description else f"Tool generated from flow: {name}"
                     )
                 else:
                     # For global tools, use simple sanitized names
-                    base_name = sanitize_mcp_name(flow.name)
+                    base_name = entry.tool_name
                     name = base_name[:MAX_MCP_TOOL_NAME_LENGTH]
                     if name in existing_names:
                         i = 1
@@ -341,7 +353,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=entry.input_schema,
                     )
                     tools.append(tool)
                     existing_names.add(name)
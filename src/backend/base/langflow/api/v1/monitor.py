@@ -1,34 +1,82 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
+from lfx.base.models.response_cache import get_llm_response_cache
+from lfx.events.stream import get_stream_metrics
+from lfx.utils.http_client_pool import get_http_client_pool
 from sqlalchemy import delete
 from sqlmodel import col, select
 
-from langflow.api.utils import DbSession, custom_params
+from langflow.api.utils import CurrentActiveUser, DbSession, custom_params
+from langflow.api.utils.keyset import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    NDJSON_MEDIA_TYPE,
+    NEXT_CURSOR_HEADER,
+    encode_cursor,
+    paginate_by_keyset,
+    split_page,
+    stream_ndjson,
+)
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
+from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.crud import (
     delete_vertex_builds_by_flow_id,
-    get_vertex_builds_by_flow_id,
+    select_latest_vertex_builds,
 )
-from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel, VertexBuildTable
+from langflow.services.database.models.webhook_delivery.crud import list_webhook_deliveries
+from langflow.services.database.models.webhook_delivery.model import WebhookDeliveryRead, WebhookDeliveryStatus
+from langflow.services.deps import get_task_service, get_webhook_inbox_service
+from langflow.services.webhook_inbox.service import WebhookDeliveryNotFoundError
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
 
 @router.get("/builds")
-async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
+async def get_vertex_builds(
+    *,
+    flow_id: Annotated[UUID, Query()],
+    session: DbSession,
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+    cursor: Annotated[
+        str | None, Query(description=f"Value of the {NEXT_CURSOR_HEADER} header of the last page")
+    ] = None,
+    stream: Annotated[bool, Query(description="Stream the builds as NDJSON, one build per line")] = False,
+) -> VertexBuildMapModel:
+    stmt = paginate_by_keyset(
+        select_latest_vertex_builds(flow_id),
+        VertexBuildTable.timestamp,
+        VertexBuildTable.build_id,
+        cursor=cursor,
+        limit=limit,
+        id_type=UUID,
+    )
+    if stream:
+        return StreamingResponse(  # type: ignore[return-value]
+            stream_ndjson(stmt, limit=limit, to_model=lambda build: build, cursor_for=_vertex_build_cursor),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
     try:
-        vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
-        return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
+        vertex_builds, next_cursor = split_page(list(await session.exec(stmt)), limit, _vertex_build_cursor)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
+
+
+def _vertex_build_cursor(build: VertexBuildTable) -> str:
+    return encode_cursor(build.timestamp, build.build_id)
 
 
 @router.delete("/builds", status_code=204)
@@ -60,33 +108,81 @@ async def get_message_sessions(
 
 @router.get("/messages", dependencies=[Depends(get_current_active_user)])
 async def get_messages(
+    *,
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=MAX_PAGE_LIMIT, description=f"Page size, {DEFAULT_PAGE_LIMIT} when a cursor is given"),
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description=f"Value of the {NEXT_CURSOR_HEADER} header of the last page")
+    ] = None,
+    stream: Annotated[bool, Query(description="Stream the messages as NDJSON, one message per line")] = False,
 ) -> list[MessageResponse]:
+    """List messages, ordered by ``order_by``.
+
+    Without a ``limit`` or ``cursor`` all the matching messages are returned. Otherwise messages are returned by
+    pages of ``limit`` and the cursor of the next page is sent in the ``X-Next-Cursor`` header.
+    """
+    paginated = limit is not None or cursor is not None or stream
+    page_limit = limit or DEFAULT_PAGE_LIMIT
+    stmt = select(MessageTable)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    if session_id:
+        from urllib.parse import unquote
+
+        decoded_session_id = unquote(session_id)
+        stmt = stmt.where(MessageTable.session_id == decoded_session_id)
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    if order_by and order_by != "timestamp":
+        # Cursors encode the (timestamp, id) of the last row, so they only work with the default ordering
+        if cursor or stream:
+            raise HTTPException(status_code=400, detail="cursor and stream require ordering by timestamp")
+        if not hasattr(MessageTable, order_by):
+            raise HTTPException(status_code=400, detail=f"Invalid order_by column: {order_by}")
+        stmt = stmt.order_by(getattr(MessageTable, order_by).asc(), col(MessageTable.id).asc())
+        if paginated:
+            stmt = stmt.limit(page_limit + 1)
+    elif paginated:
+        stmt = paginate_by_keyset(
+            stmt, MessageTable.timestamp, MessageTable.id, cursor=cursor, limit=page_limit, id_type=UUID
+        )
+    else:
+        stmt = stmt.order_by(col(MessageTable.timestamp).asc(), col(MessageTable.id).asc())
+    if stream:
+        return StreamingResponse(  # type: ignore[return-value]
+            stream_ndjson(stmt, limit=page_limit, to_model=_to_message_response, cursor_for=_message_cursor),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
     try:
-        stmt = select(MessageTable)
-        if flow_id:
-            stmt = stmt.where(MessageTable.flow_id == flow_id)
-        if session_id:
-            from urllib.parse import unquote
-
-            decoded_session_id = unquote(session_id)
-            stmt = stmt.where(MessageTable.session_id == decoded_session_id)
-        if sender:
-            stmt = stmt.where(MessageTable.sender == sender)
-        if sender_name:
-            stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = await session.exec(stmt)
-        return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+        messages = list(await session.exec(stmt))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    if paginated and order_by and order_by != "timestamp":
+        messages = messages[:page_limit]
+    elif paginated:
+        messages, next_cursor = split_page(messages, page_limit, _message_cursor)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [_to_message_response(message) for message in messages]
+
+
+def _to_message_response(message: MessageTable) -> MessageResponse:
+    return MessageResponse.model_validate(message, from_attributes=True)
+
+
+def _message_cursor(message: MessageTable) -> str:
+    return encode_cursor(message.timestamp, message.id)
 
 
 @router.delete("/messages", status_code=204, dependencies=[Depends(get_current_active_user)])
@@ -201,3 +297,73 @@ async def get_transactions(
             return await apaginate(session, stmt, params=params, transformer=transform_transaction_table)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/llm_cache", dependencies=[Depends(get_current_active_user)])
+async def get_llm_cache_stats() -> dict[str, float]:
+    """Return hit/miss counters and the hit rate of the LLM response cache."""
+    cache = get_llm_response_cache()
+    return {**cache.stats.to_dict(), "entries": len(cache.memory)}
+
+
+@router.delete("/llm_cache", status_code=204, dependencies=[Depends(get_current_active_superuser)])
+async def clear_llm_cache() -> None:
+    await get_llm_response_cache().aclear()
+
+
+@router.get("/streaming", dependencies=[Depends(get_current_active_user)])
+async def get_streaming_stats() -> dict:
+    """Return the queue residency and client lag histograms of the events streamed by this worker."""
+    return get_stream_metrics()
+
+
+@router.get("/tasks", dependencies=[Depends(get_current_active_user)])
+async def get_task_stats() -> dict:
+    """Return the number of queued, running and finished background tasks of this worker."""
+    return get_task_service().get_metrics()
+
+
+@router.get("/http_clients", dependencies=[Depends(get_current_active_user)])
+async def get_http_client_stats() -> dict:
+    """Return the request, connection reuse, retry and cache counters of the pooled component HTTP clients."""
+    return get_http_client_pool().metrics()
+
+
+async def _user_flow_ids(session: DbSession, user_id: UUID, flow_id: UUID | None = None) -> list[UUID]:
+    stmt = select(Flow.id).where(Flow.user_id == user_id)
+    if flow_id:
+        stmt = stmt.where(Flow.id == flow_id)
+    return list(await session.exec(stmt))
+
+
+@router.get("/webhooks")
+async def get_webhook_deliveries(
+    *,
+    session: DbSession,
+    current_user: CurrentActiveUser,
+    flow_id: Annotated[UUID | None, Query()] = None,
+    status: Annotated[WebhookDeliveryStatus | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> list[WebhookDeliveryRead]:
+    """List the webhook deliveries of the flows of the current user, newest first."""
+    flow_ids = await _user_flow_ids(session, current_user.id, flow_id)
+    deliveries = await list_webhook_deliveries(session, flow_ids, status=status, limit=limit, offset=offset)
+    return [WebhookDeliveryRead.model_validate(delivery, from_attributes=True) for delivery in deliveries]
+
+
+@router.post("/webhooks/{delivery_id}/replay")
+async def replay_webhook_delivery(
+    delivery_id: UUID,
+    session: DbSession,
+    current_user: CurrentActiveUser,
+) -> WebhookDeliveryRead:
+    """Run a failed or succeeded webhook delivery again."""
+    flow_ids = await _user_flow_ids(session, current_user.id)
+    try:
+        delivery = await get_webhook_inbox_service().replay(delivery_id, flow_ids)
+    except WebhookDeliveryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return WebhookDeliveryRead.model_validate(delivery, from_attributes=True)
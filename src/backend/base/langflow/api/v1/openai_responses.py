@@ -6,14 +6,16 @@ from collections.abc import AsyncGenerator
 from typing import Annotated, Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
+from lfx.events.stream import iter_event_batches
 from lfx.log.logger import logger
 from lfx.schema.openai_responses_schemas import create_openai_error
 
 from langflow.api.utils import extract_global_variables_from_headers
-from langflow.api.v1.endpoints import consume_and_yield, run_flow_generator, simple_run_flow
+from langflow.api.v1.endpoints import run_flow_generator, simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import StreamEvent, create_typed_stream_tokens_event_manager
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.schema import (
     OpenAIErrorResponse,
@@ -48,6 +50,167 @@ def has_chat_output(flow_data: dict | None) -> bool:
     return any(node.get("data", {}).get("type") in ["ChatOutput", "Chat Output"] for node in flow_data["nodes"])
 
 
+class ResponsesStreamTranslator:
+    """Translate the events of a streaming flow run into OpenAI Responses API server-sent events.
+
+    Events arrive as :class:`StreamEvent` objects, so nothing is decoded here. Text already sent is tracked as a
+    character offset per message: a token or a message update costs time proportional to its new content rather
+    than to the length of the message so far.
+    """
+
+    def __init__(self, request: OpenAIResponsesRequest, response_id: str, created: int) -> None:
+        self.request = request
+        self.response_id = response_id
+        self.created = created
+        self.total_sent = 0
+        self.tool_call_counter = 0
+        self.processed_tools: set[str] = set()
+        # Characters of each message's text already sent, and received through token events
+        self._sent: dict[str, int] = {}
+        self._tokens_received: dict[str, int] = {}
+
+    def translate(self, event: StreamEvent) -> list[str]:
+        data = event.data if isinstance(event.data, dict) else {}
+        if event.event_type == "token":
+            return self._content_chunks(self._token_delta(data))
+        if event.event_type == "add_message":
+            return [*self._tool_call_events(data.get("content_blocks") or []), *self._message_chunks(data)]
+        return []
+
+    def _token_delta(self, data: dict) -> str:
+        chunk = data.get("chunk", "")
+        if not isinstance(chunk, str) or not chunk:
+            return ""
+        message_id = str(data.get("id", ""))
+        start = self._tokens_received.get(message_id, 0)
+        end = start + len(chunk)
+        self._tokens_received[message_id] = end
+        sent = self._sent.get(message_id, 0)
+        if end <= sent:
+            # Already sent as part of a message update
+            return ""
+        self._sent[message_id] = end
+        return chunk[max(sent - start, 0) :]
+
+    def _message_chunks(self, data: dict) -> list[str]:
+        properties = data.get("properties")
+        if isinstance(properties, dict) and properties.get("state") == "complete":
+            # All content has already been streamed via token events
+            return []
+        text = data.get("text", "")
+        if (
+            not isinstance(text, str)
+            or data.get("sender") not in {"Machine", "AI", "Agent"}
+            or data.get("sender_name") not in {"Agent", "AI"}
+            or text == self.request.input
+        ):
+            return []
+        message_id = str(data.get("id", ""))
+        sent = self._sent.get(message_id, 0)
+        # Updates of a message extend its text; a shorter text means the content was reset
+        delta = text[sent:] if len(text) >= sent else text
+        self._sent[message_id] = len(text)
+        return self._content_chunks(delta)
+
+    def _content_chunks(self, content: str) -> list[str]:
+        if not content:
+            return []
+        self.total_sent += len(content)
+        chunk = OpenAIResponsesStreamChunk(
+            id=self.response_id,
+            created=self.created,
+            model=self.request.model,
+            delta={"content": content},
+        )
+        return [f"data: {chunk.model_dump_json()}\n\n"]
+
+    def _tool_call_events(self, content_blocks: list) -> list[str]:
+        events: list[str] = []
+        for block in content_blocks:
+            if not isinstance(block, dict) or block.get("title") != "Agent Steps":
+                continue
+            for step in block.get("contents", []):
+                if not isinstance(step, dict) or step.get("type") != "tool_use":
+                    continue
+                tool_name = step.get("name", "")
+                tool_input = step.get("tool_input", {})
+                tool_output = step.get("output")
+                # Only emit tool calls with explicit tool names and meaningful arguments
+                if not tool_name or tool_input is None or tool_output is None:
+                    continue
+                tool_signature = f"{tool_name}:{hash(str(sorted(tool_input.items())))}"
+                if tool_signature in self.processed_tools:
+                    continue
+                self.processed_tools.add(tool_signature)
+                events.extend(self._tool_call(tool_name, jsonable_encoder(tool_input), jsonable_encoder(tool_output)))
+        return events
+
+    def _tool_call(self, tool_name: str, tool_input: Any, tool_output: Any) -> list[str]:
+        self.tool_call_counter += 1
+        call_id = f"call_{self.tool_call_counter}"
+        tool_id = f"fc_{self.tool_call_counter}"
+        arguments_str = json.dumps(tool_input)
+        tool_call_event = {
+            "type": "response.output_item.added",
+            "item": {
+                "id": tool_id,
+                "type": "function_call",  # OpenAI uses "function_call"
+                "status": "in_progress",  # OpenAI includes status
+                "name": tool_name,
+                "arguments": "",  # Start with empty, build via deltas
+                "call_id": call_id,
+            },
+        }
+        # Send function call arguments as delta events (like OpenAI)
+        arg_delta_event = {
+            "type": "response.function_call_arguments.delta",
+            "delta": arguments_str,
+            "item_id": tool_id,
+            "output_index": 0,
+        }
+        arg_done_event = {
+            "type": "response.function_call_arguments.done",
+            "arguments": arguments_str,
+            "item_id": tool_id,
+            "output_index": 0,
+        }
+        # Check if include parameter requests tool_call.results
+        if self.request.include and "tool_call.results" in self.request.include:
+            # Format with detailed results
+            tool_done_event = {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": f"{tool_name}_{tool_id}",
+                    "inputs": tool_input,  # Raw inputs as-is
+                    "status": "completed",
+                    "type": "tool_call",
+                    "tool_name": f"{tool_name}",
+                    "results": tool_output,  # Raw output as-is
+                },
+                "output_index": 0,
+                "sequence_number": self.tool_call_counter + 5,
+            }
+        else:
+            # Regular function call format
+            tool_done_event = {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": tool_id,
+                    "type": "function_call",  # Match OpenAI format
+                    "status": "completed",
+                    "arguments": arguments_str,
+                    "call_id": call_id,
+                    "name": tool_name,
+                },
+            }
+        return [
+            f"event: response.output_item.added\ndata: {json.dumps(tool_call_event)}\n\n",
+            f"event: response.function_call_arguments.delta\ndata: {json.dumps(arg_delta_event)}\n\n",
+            f"event: response.function_call_arguments.done\ndata: {json.dumps(arg_done_event)}\n\n",
+            f"event: response.output_item.done\ndata: {json.dumps(tool_done_event)}\n\n",
+        ]
+
+
 async def run_flow_for_openai_responses(
     flow: FlowRead,
     request: OpenAIResponsesRequest,
@@ -97,8 +260,7 @@ async def run_flow_for_openai_responses(
     if stream:
         # Handle streaming response
         asyncio_queue: asyncio.Queue = asyncio.Queue()
-        asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_typed_stream_tokens_event_manager(queue=asyncio_queue)
 
         async def openai_stream_generator() -> AsyncGenerator[str, None]:
             """Convert Langflow events to OpenAI Responses API streaming format."""
@@ -108,7 +270,6 @@ async def run_flow_for_openai_responses(
                     input_request=simplified_request,
                     api_key_user=api_key_user,
                     event_manager=event_manager,
-                    client_consumed_queue=asyncio_queue_client_consumed,
                     context=context,
                 )
             )
@@ -129,237 +290,11 @@ async def run_flow_for_openai_responses(
                 )
                 yield f"data: {initial_chunk.model_dump_json()}\n\n"
 
-                tool_call_counter = 0
-                processed_tools = set()  # Track processed tool calls to avoid duplicates
-                previous_content = ""  # Track content already sent to calculate deltas
-
-                async for event_data in consume_and_yield(asyncio_queue, asyncio_queue_client_consumed):
-                    if event_data is None:
-                        await logger.adebug("[OpenAIResponses][stream] received None event_data; breaking loop")
-                        break
-
-                    content = ""
-                    token_data = {}
-
-                    # Parse byte string events as JSON
-                    if isinstance(event_data, bytes):
-                        try:
-                            import json
-
-                            event_str = event_data.decode("utf-8")
-                            parsed_event = json.loads(event_str)
-
-                            if isinstance(parsed_event, dict):
-                                event_type = parsed_event.get("event")
-                                data = parsed_event.get("data", {})
-                                await logger.adebug(
-                                    "[OpenAIResponses][stream] event: %s keys=%s",
-                                    event_type,
-                                    list(data.keys()) if isinstance(data, dict) else type(data),
-                                )
-
-                                # Handle add_message events
-                                if event_type == "token":
-                                    token_data = data.get("chunk", "")
-                                    await logger.adebug(
-                                        "[OpenAIResponses][stream] token: token_data=%s",
-                                        token_data,
-                                    )
-                                if event_type == "add_message":
-                                    sender_name = data.get("sender_name", "")
-                                    text = data.get("text", "")
-                                    sender = data.get("sender", "")
-                                    content_blocks = data.get("content_blocks", [])
-
-                                    # Get message state from properties
-                                    properties = data.get("properties", {})
-                                    message_state = properties.get("state") if isinstance(properties, dict) else None
-
-                                    await logger.adebug(
-                                        (
-                                            "[OpenAIResponses][stream] add_message: "
-                                            "sender=%s sender_name=%s text_len=%d state=%s"
-                                        ),
-                                        sender,
-                                        sender_name,
-                                        len(text) if isinstance(text, str) else -1,
-                                        message_state,
-                                    )
-
-                                    # Skip processing text content if state is "complete"
-                                    # All content has already been streamed via token events
-                                    if message_state == "complete":
-                                        await logger.adebug(
-                                            "[OpenAIResponses][stream] skipping add_message with state=complete"
-                                        )
-                                        # Still process content_blocks for tool calls, but skip text content
-                                        text = ""
-
-                                    # Look for Agent Steps in content_blocks
-                                    for block in content_blocks:
-                                        if block.get("title") == "Agent Steps":
-                                            contents = block.get("contents", [])
-                                            for step in contents:
-                                                # Look for tool_use type items
-                                                if step.get("type") == "tool_use":
-                                                    tool_name = step.get("name", "")
-                                                    tool_input = step.get("tool_input", {})
-                                                    tool_output = step.get("output")
-
-                                                    # Only emit tool calls with explicit tool names and
-                                                    # meaningful arguments
-                                                    if tool_name and tool_input is not None and tool_output is not None:
-                                                        # Create unique identifier for this tool call
-                                                        tool_signature = (
-                                                            f"{tool_name}:{hash(str(sorted(tool_input.items())))}"
-                                                        )
-
-                                                        # Skip if we've already processed this tool call
-                                                        if tool_signature in processed_tools:
-                                                            continue
-
-                                                        processed_tools.add(tool_signature)
-                                                        tool_call_counter += 1
-                                                        call_id = f"call_{tool_call_counter}"
-                                                        tool_id = f"fc_{tool_call_counter}"
-                                                        tool_call_event = {
-                                                            "type": "response.output_item.added",
-                                                            "item": {
-                                                                "id": tool_id,
-                                                                "type": "function_call",  # OpenAI uses "function_call"
-                                                                "status": "in_progress",  # OpenAI includes status
-                                                                "name": tool_name,
-                                                                "arguments": "",  # Start with empty, build via deltas
-                                                                "call_id": call_id,
-                                                            },
-                                                        }
-                                                        yield (
-                                                            f"event: response.output_item.added\n"
-                                                            f"data: {json.dumps(tool_call_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments as delta events (like OpenAI)
-                                                        arguments_str = json.dumps(tool_input)
-                                                        arg_delta_event = {
-                                                            "type": "response.function_call_arguments.delta",
-                                                            "delta": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.delta\n"
-                                                            f"data: {json.dumps(arg_delta_event)}\n\n"
-                                                        )
-
-                                                        # Send function call arguments done event
-                                                        arg_done_event = {
-                                                            "type": "response.function_call_arguments.done",
-                                                            "arguments": arguments_str,
-                                                            "item_id": tool_id,
-                                                            "output_index": 0,
-                                                        }
-                                                        yield (
-                                                            f"event: response.function_call_arguments.done\n"
-                                                            f"data: {json.dumps(arg_done_event)}\n\n"
-                                                        )
-                                                        await logger.adebug(
-                                                            "[OpenAIResponses][stream] tool_call.args.done name=%s",
-                                                            tool_name,
-                                                        )
-
-                                                        # If there's output, send completion event
-                                                        if tool_output is not None:
-                                                            # Check if include parameter requests tool_call.results
-                                                            include_results = (
-                                                                request.include
-                                                                and "tool_call.results" in request.include
-                                                            )
-
-                                                            if include_results:
-                                                                # Format with detailed results
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": f"{tool_name}_{tool_id}",
-                                                                        "inputs": tool_input,  # Raw inputs as-is
-                                                                        "status": "completed",
-                                                                        "type": "tool_call",
-                                                                        "tool_name": f"{tool_name}",
-                                                                        "results": tool_output,  # Raw output as-is
-                                                                    },
-                                                                    "output_index": 0,
-                                                                    "sequence_number": tool_call_counter + 5,
-                                                                }
-                                                            else:
-                                                                # Regular function call format
-                                                                tool_done_event = {
-                                                                    "type": "response.output_item.done",
-                                                                    "item": {
-                                                                        "id": tool_id,
-                                                                        "type": "function_call",  # Match OpenAI format
-                                                                        "status": "completed",
-                                                                        "arguments": arguments_str,
-                                                                        "call_id": call_id,
-                                                                        "name": tool_name,
-                                                                    },
-                                                                }
-
-                                                            yield (
-                                                                f"event: response.output_item.done\n"
-                                                                f"data: {json.dumps(tool_done_event)}\n\n"
-                                                            )
-                                                            await logger.adebug(
-                                                                "[OpenAIResponses][stream] tool_call.done name=%s",
-                                                                tool_name,
-                                                            )
-
-                                    # Extract text content for streaming (only AI responses)
-                                    if (
-                                        sender in ["Machine", "AI", "Agent"]
-                                        and text != request.input
-                                        and sender_name in ["Agent", "AI"]
-                                    ):
-                                        # Calculate delta: only send newly generated content
-                                        if text.startswith(previous_content):
-                                            content = text[len(previous_content) :]
-                                            previous_content = text
-                                            await logger.adebug(
-                                                "[OpenAIResponses][stream] delta computed len=%d total_len=%d",
-                                                len(content),
-                                                len(previous_content),
-                                            )
-                                        else:
-                                            # If text doesn't start with previous content, send full text
-                                            # This handles cases where the content might be reset
-                                            content = text
-                                            previous_content = text
-                                            await logger.adebug(
-                                                "[OpenAIResponses][stream] content reset; sending full text len=%d",
-                                                len(content),
-                                            )
-
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            await logger.adebug("[OpenAIResponses][stream] failed to decode event bytes; skipping")
-                            continue
-
-                    # Only send chunks with actual content
-                    if content or token_data:
-                        if isinstance(token_data, str):
-                            content = token_data
-                            await logger.adebug(
-                                f"[OpenAIResponses][stream] sent chunk with content={content}",
-                            )
-                        chunk = OpenAIResponsesStreamChunk(
-                            id=response_id,
-                            created=created_timestamp,
-                            model=request.model,
-                            delta={"content": content},
-                        )
-                        yield f"data: {chunk.model_dump_json()}\n\n"
-                        await logger.adebug(
-                            "[OpenAIResponses][stream] sent chunk with delta_len=%d",
-                            len(content),
-                        )
+                translator = ResponsesStreamTranslator(request, response_id, created_timestamp)
+                async for batch in iter_event_batches(asyncio_queue):
+                    # The events waiting together in the queue are written at once
+                    if chunk := "".join(sse_event for event in batch for sse_event in translator.translate(event)):
+                        yield chunk
 
                 # Send final completion chunk
                 final_chunk = OpenAIResponsesStreamChunk(
@@ -374,7 +309,7 @@ async def run_flow_for_openai_responses(
                 await logger.adebug(
                     "[OpenAIResponses][stream] completed: response_id=%s total_sent_len=%d",
                     response_id,
-                    len(previous_content),
+                    translator.total_sent,
                 )
 
             except Exception as e:  # noqa: BLE001
@@ -7,7 +7,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from sqlmodel.sql.expression import SelectOfScalar
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, record_deleted_flows
 from langflow.api.v1.schemas import UsersResponse
 from langflow.initial_setup.setup import get_or_create_default_folder
 from langflow.services.auth.utils import (
@@ -15,6 +15,8 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.folder.model import Folder
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
 from langflow.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
 from langflow.services.deps import get_settings_service
@@ -140,7 +142,11 @@ async def delete_user(
     if not user_db:
         raise HTTPException(status_code=404, detail="User not found")
 
+    # The flows of the user are deleted with their folders
+    stmt = select(Flow.id).join(Folder, Flow.folder_id == Folder.id).where(Folder.user_id == user_id)
+    flow_ids = (await session.exec(stmt)).all()
     await session.delete(user_db)
+    await record_deleted_flows(session, flow_ids)
     await session.commit()
 
     return {"detail": "User deleted"}
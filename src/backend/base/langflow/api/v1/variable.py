@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException
 from sqlalchemy.exc import NoResultFound
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.interface.editor_sessions import get_editor_sessions
 from langflow.services.database.models.variable.model import VariableCreate, VariableRead, VariableUpdate
 from langflow.services.deps import get_variable_service
 from langflow.services.variable.constants import CREDENTIAL_TYPE
@@ -77,6 +78,8 @@ async def update_variable(
     if not isinstance(variable_service, DatabaseVariableService):
         msg = "Variable service is not an instance of DatabaseVariableService"
         raise TypeError(msg)
+    # Components kept for the editor hold the resolved values of the variables
+    get_editor_sessions().invalidate_user(current_user.id)
     try:
         return await variable_service.update_variable_fields(
             user_id=current_user.id,
@@ -100,6 +103,7 @@ async def delete_variable(
 ) -> None:
     """Delete a variable."""
     variable_service = get_variable_service()
+    get_editor_sessions().invalidate_user(current_user.id)
     try:
         await variable_service.delete_variable_by_id(user_id=current_user.id, variable_id=variable_id, session=session)
     except Exception as e:
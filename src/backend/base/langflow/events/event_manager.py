@@ -5,14 +5,20 @@ from lfx.events.event_manager import (
     EventCallback,
     EventManager,
     PartialEventCallback,
+    StreamEvent,
+    TypedEventManager,
     create_default_event_manager,
     create_stream_tokens_event_manager,
+    create_typed_stream_tokens_event_manager,
 )
 
 __all__ = [
     "EventCallback",
     "EventManager",
     "PartialEventCallback",
+    "StreamEvent",
+    "TypedEventManager",
     "create_default_event_manager",
     "create_stream_tokens_event_manager",
+    "create_typed_stream_tokens_event_manager",
 ]
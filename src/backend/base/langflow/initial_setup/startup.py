@@ -0,0 +1,210 @@
+"""Dependency-aware orchestration of the application startup phases.
+
+The lifespan used to run every startup step strictly one after another. The
+:class:`StartupOrchestrator` lets each step declare the phases it depends on so
+that independent phases run concurrently, and splits the phases into
+*critical* ones (awaited before the server accepts traffic) and *deferred* ones
+(scheduled in the background once the server is up).
+
+Per-phase timings are collected in a :class:`StartupReport`, which is exposed by
+the ``/health_check/startup`` endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from lfx.log.logger import logger
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+PhaseStatus = Literal["pending", "running", "completed", "failed", "skipped"]
+
+
+class StartupPhaseReport(BaseModel):
+    name: str
+    critical: bool
+    depends_on: list[str]
+    status: PhaseStatus = "pending"
+    started_at: float | None = None
+    """Seconds since the orchestrator was created when the phase started."""
+    duration: float | None = None
+    """Wall-clock duration of the phase in seconds."""
+    error: str | None = None
+
+
+class StartupReport(BaseModel):
+    status: Literal["starting", "ready", "completed", "failed"] = "starting"
+    """``ready`` once all critical phases finished, ``completed`` once deferred phases finished too."""
+    critical_duration: float | None = None
+    total_duration: float | None = None
+    phases: list[StartupPhaseReport] = []
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    func: Callable[[], Awaitable[Any] | Any]
+    depends_on: tuple[str, ...] = ()
+    critical: bool = True
+    """Critical phases must succeed before the server accepts traffic; a failure aborts startup."""
+    report: StartupPhaseReport = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.report = StartupPhaseReport(name=self.name, critical=self.critical, depends_on=list(self.depends_on))
+
+
+class StartupPhaseError(Exception):
+    """Raised when a phase cannot run because a phase it depends on failed."""
+
+
+class StartupOrchestrator:
+    """Runs startup phases concurrently while respecting their declared dependencies.
+
+    Example:
+        orchestrator = StartupOrchestrator()
+        orchestrator.add_phase("services", initialize_services)
+        orchestrator.add_phase("types", cache_types, depends_on=["services"])
+        orchestrator.add_phase("starter_projects", create_projects, depends_on=["types"], critical=False)
+
+        await orchestrator.run_critical()   # before `yield` in the lifespan
+        orchestrator.start_deferred()       # runs in the background
+    """
+
+    def __init__(self) -> None:
+        self._phases: dict[str, StartupPhase] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._deferred_task: asyncio.Task | None = None
+        self._origin = time.perf_counter()
+        self._report = StartupReport()
+
+    @property
+    def phases(self) -> dict[str, StartupPhase]:
+        return self._phases
+
+    @property
+    def deferred_task(self) -> asyncio.Task | None:
+        return self._deferred_task
+
+    def add_phase(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any] | Any],
+        *,
+        depends_on: Iterable[str] = (),
+        critical: bool = True,
+    ) -> StartupPhase:
+        """Register a phase.
+
+        Args:
+            name: Unique name of the phase.
+            func: Sync or async callable without arguments. Sync callables run on the event loop.
+            depends_on: Names of the phases that must complete before this one starts.
+            critical: Whether the server must wait for this phase before accepting traffic.
+        """
+        if name in self._phases:
+            msg = f"Startup phase '{name}' is already registered"
+            raise ValueError(msg)
+        depends_on = tuple(depends_on)
+        for dependency in depends_on:
+            if dependency not in self._phases:
+                msg = f"Startup phase '{name}' depends on unknown phase '{dependency}'"
+                raise ValueError(msg)
+            if critical and not self._phases[dependency].critical:
+                msg = f"Critical startup phase '{name}' cannot depend on deferred phase '{dependency}'"
+                raise ValueError(msg)
+        phase = StartupPhase(name=name, func=func, depends_on=depends_on, critical=critical)
+        self._phases[name] = phase
+        self._report.phases.append(phase.report)
+        return phase
+
+    def report(self) -> StartupReport:
+        return self._report.model_copy(deep=True)
+
+    async def run_critical(self) -> None:
+        """Run all critical phases and wait for them. Re-raises the first failure."""
+        start = time.perf_counter()
+        critical = [phase for phase in self._phases.values() if phase.critical]
+        try:
+            await self._run(critical)
+        except BaseException:
+            self._report.status = "failed"
+            raise
+        self._report.critical_duration = time.perf_counter() - start
+        self._report.status = "ready"
+        await logger.adebug(f"Critical startup phases finished in {self._report.critical_duration:.2f}s")
+
+    def start_deferred(self) -> asyncio.Task:
+        """Schedule the deferred phases in the background. Failures are logged, never raised."""
+        deferred = [phase for phase in self._phases.values() if not phase.critical]
+
+        async def _run_deferred() -> None:
+            try:
+                await self._run(deferred)
+            except Exception as exc:  # noqa: BLE001
+                self._report.status = "failed"
+                await logger.awarning(f"Deferred startup phases failed: {exc}")
+                return
+            self._report.status = "completed"
+            self._report.total_duration = time.perf_counter() - self._origin
+            await logger.adebug(f"All startup phases finished in {self._report.total_duration:.2f}s")
+
+        self._deferred_task = asyncio.create_task(_run_deferred())
+        return self._deferred_task
+
+    async def cancel(self) -> None:
+        """Cancel every phase that is still running, including the deferred ones."""
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        if self._deferred_task and not self._deferred_task.done():
+            tasks.append(self._deferred_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, phases: list[StartupPhase]) -> None:
+        for phase in phases:
+            self._tasks[phase.name] = asyncio.create_task(self._run_phase(phase), name=f"startup:{phase.name}")
+        tasks = [self._tasks[phase.name] for phase in phases]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _run_phase(self, phase: StartupPhase) -> None:
+        for dependency in phase.depends_on:
+            try:
+                # Shield so that a cancelled dependent does not cancel a phase shared with other dependents
+                await asyncio.shield(self._tasks[dependency])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                phase.report.status = "skipped"
+                msg = f"Startup phase '{phase.name}' skipped because '{dependency}' failed"
+                raise StartupPhaseError(msg) from exc
+
+        report = phase.report
+        report.status = "running"
+        start = time.perf_counter()
+        report.started_at = start - self._origin
+        await logger.adebug(f"Starting startup phase '{phase.name}'")
+        try:
+            result = phase.func()
+            if inspect.isawaitable(result):
+                await result
+        except BaseException as exc:
+            report.status = "failed"
+            report.error = str(exc) or type(exc).__name__
+            report.duration = time.perf_counter() - start
+            raise
+        report.duration = time.perf_counter() - start
+        report.status = "completed"
+        await logger.adebug(f"Startup phase '{phase.name}' finished in {report.duration:.2f}s")
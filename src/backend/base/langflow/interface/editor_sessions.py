@@ -0,0 +1,179 @@
+"""Editor sessions of custom components.
+
+Every field change in the editor posts the full code of the component to ``/custom_component/update``. Building the
+component from its code, resolving its ``load_from_db`` fields and running ``update_build_config`` again on every
+keystroke is slow for large components. An :class:`EditorSession` keeps the component built from a given code for a
+given user, so that a field update only sets the inputs that changed since the previous update and only resolves the
+global variables of those inputs. The build configs returned by ``update_build_config`` are memoized per changed
+field, value and state of every field of the template (values, options and other attributes). Updates triggered by a
+field with a refresh button are never memoized, since they exist to fetch options again.
+
+Sessions are dropped after ``ttl`` seconds without use, when the user changes a global variable and when an update
+fails, so a broken component is always built again from its code. A session is also replaced when the template of an
+update lacks fields that were set on its component.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import TTLCache
+from lfx.custom.utils import build_custom_component_template
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from lfx.custom.custom_component.custom_component import CustomComponent
+
+DEFAULT_MAX_SESSIONS = 128
+DEFAULT_TTL = 300.0
+MAX_BUILD_CONFIGS_PER_SESSION = 64
+
+_MISSING: Any = object()
+
+
+def _code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+def copy_node(value: Any) -> Any:
+    """Deep copy a component node or build config.
+
+    ``copy.deepcopy`` cannot be used on a ``dotdict``: looking up ``__deepcopy__`` on it returns an empty dotdict.
+    """
+    if isinstance(value, dict):
+        return type(value)((key, copy_node(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [copy_node(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def _field_state(field: dict) -> tuple[Any, bool]:
+    return field.get("value"), bool(field.get("load_from_db"))
+
+
+class EditorSession:
+    """A component built from its code, with the inputs last set on it."""
+
+    def __init__(self, component_node: dict, instance: CustomComponent, build_config_ttl: float) -> None:
+        self.component_node = component_node
+        self.instance = instance
+        self.lock = asyncio.Lock()
+        self._applied: dict[str, tuple[Any, bool]] = {}
+        self._build_configs: TTLCache = TTLCache(maxsize=MAX_BUILD_CONFIGS_PER_SESSION, ttl=build_config_ttl)
+
+    def changed_fields(self, template: dict) -> list[str]:
+        """Return the fields of ``template`` whose value or ``load_from_db`` flag changed since the last update."""
+        return [
+            name
+            for name, field in template.items()
+            if isinstance(field, dict) and self._applied.get(name, _MISSING) != _field_state(field)
+        ]
+
+    def has_stale_fields(self, template: dict) -> bool:
+        """Return whether inputs were set on the component from fields that ``template`` no longer has."""
+        return any(not isinstance(template.get(name), dict) for name in self._applied)
+
+    def mark_applied(self, template: dict, fields: list[str]) -> None:
+        """Record that ``fields`` of ``template`` are set on the component."""
+        for name in fields:
+            self._applied[name] = _field_state(template[name])
+
+    @staticmethod
+    def build_config_key(template: dict, field_name: str | None, field_value: Any) -> str | None:
+        """Return the memoization key of an update, or None if the update must not be memoized."""
+        field = template.get(field_name) if field_name else None
+        if isinstance(field, dict) and field.get("refresh_button"):
+            return None
+        fields = {name: field for name, field in template.items() if isinstance(field, dict)}
+        try:
+            data = orjson.dumps([field_name, field_value, fields], option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return None
+        return hashlib.sha256(data).hexdigest()
+
+    def get_build_config(self, key: str | None) -> dict | None:
+        if key is None or (build_config := self._build_configs.get(key)) is None:
+            return None
+        return copy_node(build_config)
+
+    def set_build_config(self, key: str | None, build_config: dict) -> None:
+        if key is not None:
+            self._build_configs[key] = copy_node(build_config)
+
+
+class EditorSessionCache:
+    """Editor sessions keyed by user and code hash.
+
+    Args:
+        max_sessions: Maximum number of sessions kept. 0 builds the component again on every update.
+        ttl: Seconds a session, and each build config memoized in it, is kept without being used.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._sessions: TTLCache | None = TTLCache(maxsize=max_sessions, ttl=ttl) if max_sessions > 0 else None
+
+    def get(self, code: str, user_id: UUID | str | None, template: dict | None = None) -> EditorSession:
+        """Return the session of ``code`` for ``user_id``, building the component if needed.
+
+        The component is also built again when ``template`` lacks fields that were set on it, since it would keep
+        the inputs of those fields instead of their defaults.
+        """
+        key = (str(user_id), _code_hash(code))
+        if (
+            self._sessions is not None
+            and (session := self._sessions.get(key)) is not None
+            and (template is None or not session.has_stale_fields(template))
+        ):
+            # Reading a TTLCache does not refresh the expiration of the entry
+            self._sessions[key] = session
+            return session
+
+        from lfx.custom.custom_component.component import Component
+
+        component_node, instance = build_custom_component_template(Component(_code=code), user_id=user_id)
+        session = EditorSession(component_node, instance, self.ttl)
+        if self._sessions is not None:
+            self._sessions[key] = session
+        return session
+
+    def discard(self, code: str, user_id: UUID | str | None) -> None:
+        """Drop the session of ``code`` for ``user_id``."""
+        if self._sessions is not None:
+            self._sessions.pop((str(user_id), _code_hash(code)), None)
+
+    def invalidate_user(self, user_id: UUID | str | None) -> None:
+        """Drop the sessions of ``user_id``, for example because a global variable changed."""
+        if self._sessions is None:
+            return
+        user_key = str(user_id)
+        for key in [key for key in self._sessions if key[0] == user_key]:
+            self._sessions.pop(key, None)
+
+    def clear(self) -> None:
+        if self._sessions is not None:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions) if self._sessions is not None else 0
+
+
+_editor_sessions: EditorSessionCache | None = None
+
+
+def get_editor_sessions() -> EditorSessionCache:
+    """Return the editor sessions of this worker, sized from the settings."""
+    global _editor_sessions  # noqa: PLW0603
+    if _editor_sessions is None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        _editor_sessions = EditorSessionCache(
+            max_sessions=settings.component_editor_cache_size, ttl=settings.component_editor_cache_ttl
+        )
+    return _editor_sessions
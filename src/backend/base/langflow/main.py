@@ -39,9 +39,17 @@ from langflow.initial_setup.setup import (
     load_flows_from_directory,
     sync_flows_from_fs,
 )
+from langflow.initial_setup.startup import StartupOrchestrator
 from langflow.middleware import ContentSizeLimitMiddleware
-from langflow.services.deps import get_queue_service, get_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_queue_service,
+    get_service,
+    get_settings_service,
+    get_telemetry_service,
+    get_webhook_inbox_service,
+)
 from langflow.services.schema import ServiceType
+from langflow.services.task.temp_flow_cleanup import cleanup_worker
 from langflow.services.utils import initialize_services, initialize_settings_service, teardown_services
 
 if TYPE_CHECKING:
@@ -150,7 +158,9 @@ def get_lifespan(*, fix_migration=False, version=None):
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
-        from lfx.interface.components import get_and_cache_all_types_dict
+        from lfx.interface.components import component_cache, get_and_cache_all_types_dict
+
+        from langflow.services.cache.warm_start import warm_start_types_dict
 
         configure()
 
@@ -162,117 +172,118 @@ def get_lifespan(*, fix_migration=False, version=None):
 
         temp_dirs: list[TemporaryDirectory] = []
         sync_flows_from_fs_task = None
-        mcp_init_task = None
+        startup = StartupOrchestrator()
+        _app.state.startup_orchestrator = startup
 
         try:
-            start_time = asyncio.get_event_loop().time()
-
-            await logger.adebug("Initializing services")
-            await initialize_services(fix_migration=fix_migration)
-            await logger.adebug(f"Services initialized in {asyncio.get_event_loop().time() - start_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Setting up LLM caching")
-            setup_llm_caching()
-            await logger.adebug(f"LLM caching setup in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            if get_settings_service().auth_settings.AUTO_LOGIN:
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Initializing default super user")
-                await initialize_auto_login_default_superuser()
-                await logger.adebug(
-                    f"Default super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                )
-
-            await logger.adebug("Initializing super user")
-            await initialize_auto_login_default_superuser()
-            await logger.adebug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading bundles")
-            temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
-            get_settings_service().settings.components_path.extend(bundles_components_paths)
-            await logger.adebug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
-            await logger.adebug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            # Use file-based lock to prevent multiple workers from creating duplicate starter projects concurrently.
-            # Note that it's still possible that one worker may complete this task, release the lock,
-            # then another worker pick it up, but the operation is idempotent so worst case it duplicates
-            # the initialization work.
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Creating/updating starter projects")
-            import tempfile
-
-            from filelock import FileLock
-
-            lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
-            lock = FileLock(lock_file, timeout=1)
-            try:
-                with lock:
-                    await create_or_update_starter_projects(all_types_dict)
-                    await logger.adebug(
-                        f"Starter projects created/updated in {asyncio.get_event_loop().time() - current_time:.2f}s"
+            settings_service = get_settings_service()
+            defer_non_critical = settings_service.settings.defer_non_critical_startup
+
+            bundles_components_paths: list[str] = []
+
+            async def load_bundles() -> None:
+                loaded_temp_dirs, components_paths = await load_bundles_with_error_handling()
+                temp_dirs.extend(loaded_temp_dirs)
+                bundles_components_paths.extend(components_paths)
+                settings_service.settings.components_path.extend(components_paths)
+
+            async def add_bundles_types() -> None:
+                if defer_non_critical and bundles_components_paths:
+                    # The types were cached without waiting for the bundles, rebuild them to include the bundles
+                    component_cache.all_types_dict = None
+                    await get_and_cache_all_types_dict(settings_service, telemetry_service)
+
+            async def create_starter_projects() -> None:
+                # Use file-based lock to prevent multiple workers from creating duplicate starter projects
+                # concurrently. Note that it's still possible that one worker may complete this task, release the
+                # lock, then another worker pick it up, but the operation is idempotent so worst case it duplicates
+                # the initialization work.
+                import tempfile
+
+                from filelock import FileLock
+
+                lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
+                lock = FileLock(lock_file, timeout=1)
+                try:
+                    with lock:
+                        all_types_dict = await get_and_cache_all_types_dict(settings_service, telemetry_service)
+                        await create_or_update_starter_projects(all_types_dict)
+                except TimeoutError:
+                    # Another process has the lock
+                    await logger.adebug("Another worker is creating starter projects, skipping")
+                except Exception as e:  # noqa: BLE001
+                    await logger.awarning(
+                        f"Failed to acquire lock for starter projects: {e}. "
+                        "Starter projects may not be created or updated."
                     )
-            except TimeoutError:
-                # Another process has the lock
-                await logger.adebug("Another worker is creating starter projects, skipping")
-            except Exception as e:  # noqa: BLE001
-                await logger.awarning(
-                    f"Failed to acquire lock for starter projects: {e}. Starter projects may not be created or updated."
-                )
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting telemetry service")
-            telemetry_service.start()
-            await logger.adebug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting MCP Composer service")
-            mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
-            await mcp_composer_service.start()
-            await logger.adebug(
-                f"started MCP Composer service in {asyncio.get_event_loop().time() - current_time:.2f}s"
-            )
+            async def start_mcp_composer() -> None:
+                mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
+                await mcp_composer_service.start()
+
+            async def load_flows() -> None:
+                nonlocal sync_flows_from_fs_task
+                await load_flows_from_directory()
+                sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
+                queue_service = get_queue_service()
+                if not queue_service.is_started():  # Start if not already started
+                    queue_service.start()
+
+            async def start_webhook_inbox() -> None:
+                # Picks up retries and the deliveries left over by a previous run
+                get_webhook_inbox_service().start()
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading flows")
-            await load_flows_from_directory()
-            sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
-            queue_service = get_queue_service()
-            if not queue_service.is_started():  # Start if not already started
-                queue_service.start()
-            await logger.adebug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            total_time = asyncio.get_event_loop().time() - start_time
-            await logger.adebug(f"Total initialization time: {total_time:.2f}s")
-
-            async def delayed_init_mcp_servers():
-                await asyncio.sleep(10.0)  # Increased delay to allow starter projects to be created
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Loading MCP servers for projects")
+            async def start_cleanup_worker() -> None:
+                # Removes the records and files of deleted flows, see temp_flow_cleanup
+                await cleanup_worker.start()
+
+            async def init_mcp_servers_with_retry() -> None:
                 try:
                     await init_mcp_servers()
-                    await logger.adebug(f"MCP servers loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
                 except Exception as e:  # noqa: BLE001
                     await logger.awarning(f"First MCP server initialization attempt failed: {e}")
-                    await asyncio.sleep(5.0)  # Increased retry delay
-                    current_time = asyncio.get_event_loop().time()
+                    await asyncio.sleep(5.0)
                     await logger.adebug("Retrying MCP servers initialization")
                     try:
                         await init_mcp_servers()
-                        await logger.adebug(
-                            f"MCP servers loaded on retry in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                        )
                     except Exception as e2:  # noqa: BLE001
                         await logger.aexception(f"Failed to initialize MCP servers after retry: {e2}")
 
-            # Start the delayed initialization as a background task
-            # Allows the server to start first to avoid race conditions with MCP Server startup
-            mcp_init_task = asyncio.create_task(delayed_init_mcp_servers())
+            startup.add_phase("services", lambda: initialize_services(fix_migration=fix_migration))
+            startup.add_phase("llm_caching", setup_llm_caching, depends_on=["services"])
+            startup.add_phase("superuser", initialize_auto_login_default_superuser, depends_on=["services"])
+            startup.add_phase("telemetry", telemetry_service.start, depends_on=["services"])
+            startup.add_phase("mcp_composer", start_mcp_composer, depends_on=["services"])
+            startup.add_phase("webhook_inbox", start_webhook_inbox, depends_on=["services"], critical=False)
+            startup.add_phase("cleanup_worker", start_cleanup_worker, depends_on=["services"], critical=False)
+            startup.add_phase("bundles", load_bundles, depends_on=["services"], critical=not defer_non_critical)
+            startup.add_phase(
+                "types_cache",
+                lambda: warm_start_types_dict(settings_service, telemetry_service),
+                depends_on=["services"] if defer_non_critical else ["services", "bundles"],
+            )
+            # Runs once both the types and the bundles are loaded, whichever finishes last
+            startup.add_phase(
+                "bundles_types",
+                add_bundles_types,
+                depends_on=["types_cache", "bundles"],
+                critical=not defer_non_critical,
+            )
+            startup.add_phase("flows", load_flows, depends_on=["superuser"])
+            startup.add_phase(
+                "starter_projects",
+                create_starter_projects,
+                depends_on=["bundles_types", "superuser"],
+                critical=not defer_non_critical,
+            )
+            # MCP servers are registered per project, so they must wait for the starter projects
+            startup.add_phase(
+                "mcp_servers", init_mcp_servers_with_retry, depends_on=["starter_projects", "flows"], critical=False
+            )
+
+            await startup.run_critical()
+            # Deferred phases run once the server accepts traffic
+            startup.start_deferred()
 
             yield
 
@@ -305,13 +316,13 @@ def get_lifespan(*, fix_migration=False, version=None):
 
                 # Step 1: Cancelling Background Tasks
                 with shutdown_progress.step(1):
+                    await startup.cancel()
+                    if cleanup_worker.is_running:
+                        await cleanup_worker.stop()
                     tasks_to_cancel = []
                     if sync_flows_from_fs_task:
                         sync_flows_from_fs_task.cancel()
                         tasks_to_cancel.append(sync_flows_from_fs_task)
-                    if mcp_init_task and not mcp_init_task.done():
-                        mcp_init_task.cancel()
-                        tasks_to_cancel.append(mcp_init_task)
                     if tasks_to_cancel:
                         # Wait for all tasks to complete, capturing exceptions
                         results = await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
@@ -0,0 +1,241 @@
+"""Serialization of the values stored in external caches.
+
+Every payload starts with a small header: a magic prefix, the codec version, the format of the body and its
+compression. Three formats are used:
+
+* ``JSON``: plain data (dicts with string keys, lists, strings, numbers, booleans and None) encoded with orjson.
+* ``GRAPH``: a :class:`~lfx.graph.graph.base.Graph`, alone or wrapped by the chat service, encoded as its versioned
+  run state (see :meth:`Graph.dump_run_state`) followed by the pickled results of the built vertices.
+* ``PICKLE``: anything else, pickled with dill.
+
+Pickled sections are stamped with the Langflow version that wrote them. Another version skips them instead of
+failing to unpickle them, so rolling deploys only cost cache misses. For graphs only the vertex results are
+skipped: the graph itself is rebuilt from its run state.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from collections import Counter, defaultdict
+from typing import Any, Literal
+
+import dill
+import orjson
+from lfx.log.logger import logger
+
+from langflow.utils.version import get_version_info
+
+CompressionType = Literal["none", "zstd", "lz4"]
+
+MAGIC = b"LFC"
+CODEC_VERSION = 1
+
+FORMAT_JSON = 1
+FORMAT_GRAPH = 2
+FORMAT_PICKLE = 3
+_FORMAT_NAMES = {FORMAT_JSON: "json", FORMAT_GRAPH: "graph", FORMAT_PICKLE: "pickle"}
+
+_COMPRESSION_IDS: dict[str, int] = {"none": 0, "zstd": 1, "lz4": 2}
+_COMPRESSION_NAMES = {value: key for key, value in _COMPRESSION_IDS.items()}
+
+_HEADER = struct.Struct("!3sBBB")
+_LENGTH = struct.Struct("!I")
+_VERTEX_RESULT_ATTRIBUTES = ("built", "results", "artifacts", "built_object", "built_result", "full_data", "result")
+
+
+class CacheCodecError(ValueError):
+    """Raised when a payload cannot be decoded by this codec."""
+
+
+class IncompatibleCacheEntryError(CacheCodecError):
+    """Raised when a payload was written by an incompatible codec or Langflow version."""
+
+
+def _pickle_version() -> bytes:
+    return f"{CODEC_VERSION}:{get_version_info().get('version', 'unknown')}".encode()
+
+
+def _is_plain(value: Any) -> bool:
+    """Return whether ``value`` survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, str | bool | float):
+        return True
+    if isinstance(value, int):
+        # orjson only supports 64 bit integers
+        return -(2**63) <= value < 2**64
+    if type(value) is list:
+        return all(_is_plain(item) for item in value)
+    if type(value) is dict:
+        return all(type(key) is str and _is_plain(item) for key, item in value.items())
+    return False
+
+
+def _get_compressor(compression: str):
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            msg = "zstd compression requires the zstandard package. Please install it with `pip install zstandard`."
+            raise ImportError(msg) from exc
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    if compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as exc:
+            msg = "lz4 compression requires the lz4 package. Please install it with `pip install lz4`."
+            raise ImportError(msg) from exc
+        return lz4.frame.compress, lz4.frame.decompress
+    msg = f"Unknown compression: {compression}"
+    raise ValueError(msg)
+
+
+class CacheCodec:
+    """Versioned encoder and decoder of cache values.
+
+    Args:
+        compression: Compression of payloads of at least ``compression_threshold`` bytes.
+        compression_threshold: Size in bytes from which payloads are compressed.
+    """
+
+    def __init__(self, compression: CompressionType = "none", compression_threshold: int = 1024) -> None:
+        if compression not in _COMPRESSION_IDS:
+            msg = f"Unknown compression: {compression}"
+            raise ValueError(msg)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compress = _get_compressor(compression)[0] if compression != "none" else None
+        self._decompressors: dict[int, Any] = {}
+        self.version = _pickle_version()
+        self._stats: defaultdict[str, Counter] = defaultdict(Counter)
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize ``value``.
+
+        Raises:
+            TypeError: If the value cannot be serialized.
+        """
+        fmt, body = self._encode_body(value)
+        size = len(body)
+        compression = "none"
+        if self._compress is not None and size >= self.compression_threshold:
+            compressed = self._compress(body)
+            if len(compressed) < size:
+                body, compression = compressed, self.compression
+        self._record("encoded", fmt, size, len(body))
+        return _HEADER.pack(MAGIC, CODEC_VERSION, fmt, _COMPRESSION_IDS[compression]) + body
+
+    def decode(self, payload: bytes) -> Any:
+        """Deserialize a payload written by :meth:`encode`.
+
+        Raises:
+            IncompatibleCacheEntryError: If the payload was written by another codec or Langflow version.
+            CacheCodecError: If the payload is corrupted.
+        """
+        if len(payload) < _HEADER.size:
+            msg = "Cache payload is too short"
+            raise IncompatibleCacheEntryError(msg)
+        magic, codec_version, fmt, compression_id = _HEADER.unpack_from(payload)
+        if magic != MAGIC or codec_version != CODEC_VERSION or fmt not in _FORMAT_NAMES:
+            msg = "Cache payload was written by another codec"
+            raise IncompatibleCacheEntryError(msg)
+        if compression_id not in _COMPRESSION_NAMES:
+            msg = f"Unknown cache payload compression: {compression_id}"
+            raise IncompatibleCacheEntryError(msg)
+        try:
+            body = memoryview(payload)[_HEADER.size :]
+            if compression_id:
+                if (decompress := self._decompressors.get(compression_id)) is None:
+                    decompress = _get_compressor(_COMPRESSION_NAMES[compression_id])[1]
+                    self._decompressors[compression_id] = decompress
+                body = memoryview(decompress(body))
+            self._record("decoded", fmt, len(body), len(payload) - _HEADER.size)
+            if fmt == FORMAT_JSON:
+                return orjson.loads(body)
+            if fmt == FORMAT_GRAPH:
+                return self._decode_graph(body)
+            return self._unpickle(body)
+        except CacheCodecError:
+            raise
+        except Exception as exc:
+            msg = f"Could not decode {_FORMAT_NAMES[fmt]} cache payload: {exc}"
+            raise CacheCodecError(msg) from exc
+
+    def get_metrics(self) -> dict[str, dict[str, int]]:
+        """Return the number of values and bytes encoded and decoded per format."""
+        return {key: dict(counter) for key, counter in self._stats.items()}
+
+    def _record(self, direction: str, fmt: int, raw_size: int, stored_size: int) -> None:
+        stats = self._stats[f"{direction}_{_FORMAT_NAMES[fmt]}"]
+        stats["count"] += 1
+        stats["raw_bytes"] += raw_size
+        stats["stored_bytes"] += stored_size
+        stats["max_stored_bytes"] = max(stats["max_stored_bytes"], stored_size)
+
+    def _encode_body(self, value: Any) -> tuple[int, bytes]:
+        if _is_plain(value):
+            return FORMAT_JSON, orjson.dumps(value)
+        if (graph_body := self._encode_graph(value)) is not None:
+            return FORMAT_GRAPH, graph_body
+        return FORMAT_PICKLE, self._pickle(value)
+
+    def _pickle(self, value: Any) -> bytes:
+        try:
+            data = dill.dumps(value, recurse=True)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            msg = f"Cache values must be JSON serializable or picklable: {exc}"
+            raise TypeError(msg) from exc
+        return _LENGTH.pack(len(self.version)) + self.version + data
+
+    def _unpickle(self, body: memoryview) -> Any:
+        (length,) = _LENGTH.unpack_from(body)
+        version = bytes(body[_LENGTH.size : _LENGTH.size + length])
+        if version != self.version:
+            msg = f"Cache payload was pickled by another version ({version.decode(errors='replace')})"
+            raise IncompatibleCacheEntryError(msg)
+        return dill.loads(body[_LENGTH.size + length :])
+
+    def _encode_graph(self, value: Any) -> bytes | None:
+        from lfx.graph.graph.base import Graph
+
+        wrapped = isinstance(value, dict) and value.keys() == {"result", "type"}
+        graph = value["result"] if wrapped else value
+        if not isinstance(graph, Graph):
+            return None
+        try:
+            state = orjson.dumps({"wrapped": wrapped, "graph": graph.dump_run_state()})
+        except TypeError:
+            logger.debug("Graph run state is not JSON serializable, pickling the graph")
+            return None
+        vertex_results = {
+            vertex.id: {name: getattr(vertex, name, None) for name in _VERTEX_RESULT_ATTRIBUTES}
+            for vertex in graph.vertices
+            if vertex.built
+        }
+        try:
+            results = self._pickle(vertex_results) if vertex_results else b""
+        except TypeError as exc:
+            # The graph is still cached, its vertices are built again when needed
+            logger.debug(f"Built vertex results of the graph cannot be cached: {exc}")
+            results = b""
+        return _LENGTH.pack(len(state)) + state + results
+
+    def _decode_graph(self, body: memoryview) -> Any:
+        from lfx.graph.graph.base import Graph
+
+        (length,) = _LENGTH.unpack_from(body)
+        state = orjson.loads(body[_LENGTH.size : _LENGTH.size + length])
+        try:
+            graph = Graph.from_run_state(state["graph"])
+        except ValueError as exc:
+            raise IncompatibleCacheEntryError(str(exc)) from exc
+        if results_body := body[_LENGTH.size + length :]:
+            try:
+                vertex_results = self._unpickle(results_body)
+            except IncompatibleCacheEntryError as exc:
+                logger.debug(f"Skipping built vertex results of the cached graph: {exc}")
+                vertex_results = {}
+            for vertex_id, attributes in vertex_results.items():
+                if (vertex := graph.vertex_map.get(vertex_id)) is not None:
+                    for name, attribute in attributes.items():
+                        setattr(vertex, name, attribute)
+        return {"result": graph, "type": type(graph)} if state["wrapped"] else graph
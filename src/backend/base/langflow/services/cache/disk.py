@@ -1,27 +1,117 @@
+"""Disk cache that keeps its entries across restarts.
+
+Entries are stored with diskcache in ``cache_dir`` under ``<namespace>:<key>`` and tagged with their namespace, so
+several services can share one cache directory and clear only their own entries. Every entry records the cache
+schema and the Langflow version that wrote it. Entries written by another version are skipped rather than loaded,
+and the whole directory is no longer wiped on startup. The directory is bounded by a byte budget and evicts the
+least recently used entries once it is exceeded. A small in-memory LRU of deserialized values sits in front of the
+disk so that hot keys are not unpickled on every read.
+"""
+
 import asyncio
 import pickle
+import threading
 import time
-from typing import Generic
+from collections import OrderedDict
+from typing import Any, Generic
 
 from diskcache import Cache
 from lfx.log.logger import logger
 from lfx.services.cache.utils import CACHE_MISS
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.utils.version import get_version_info
+
+# Bump when the layout of stored entries changes
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_NAMESPACE = "langflow"
+DEFAULT_SIZE_LIMIT = 1024**3
+DEFAULT_HOT_ENTRIES = 256
+_UNSET: Any = object()
+
+
+def _entry_version() -> str:
+    return f"{CACHE_SCHEMA_VERSION}:{get_version_info().get('version', 'unknown')}"
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
-        self.cache = Cache(cache_dir)
-        # Let's clear the cache for now to maintain a similar
-        # behavior as the in-memory cache
-        # Later we should implement endpoints for the frontend to grab
-        # output logs from the cache
-        if len(self.cache) > 0:
-            self.cache.clear()
+    """Persistent, size-bounded cache with an in-memory hot tier.
+
+    Args:
+        cache_dir: Directory of the cache files, or an open ``Cache`` shared with another instance.
+        max_size: Maximum number of entries kept on disk. None only bounds the cache by ``size_limit``.
+        expiration_time: Seconds an entry stays valid. None keeps entries until they are evicted.
+        namespace: Prefix of the keys of this cache, see :meth:`namespaced`.
+        size_limit: Byte budget of the cache directory.
+        hot_entries: Number of deserialized values kept in memory. 0 disables the hot tier.
+    """
+
+    def __init__(
+        self,
+        cache_dir,
+        max_size=None,
+        expiration_time=3600,
+        *,
+        namespace: str = DEFAULT_NAMESPACE,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+        hot_entries: int = DEFAULT_HOT_ENTRIES,
+    ) -> None:
+        if isinstance(cache_dir, Cache):
+            self.cache = cache_dir
+        else:
+            self.cache = Cache(cache_dir, size_limit=size_limit, eviction_policy="least-recently-used")
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.namespace = namespace
+        self.hot_entries = hot_entries
+        self.version = _entry_version()
+        # The hot tier is also used from worker threads
+        self._hot: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._hot_lock = threading.Lock()
+
+    def namespaced(self, namespace: str, *, expiration_time=_UNSET) -> "AsyncDiskCache":
+        """Return a view of the same cache directory whose keys live in ``namespace``."""
+        return AsyncDiskCache(
+            self.cache,
+            self.max_size,
+            self.expiration_time if expiration_time is _UNSET else expiration_time,
+            namespace=namespace,
+            hot_entries=self.hot_entries,
+        )
+
+    def _key(self, key) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.expiration_time is not None and time.time() - stored_at >= self.expiration_time
+
+    def _remember(self, full_key: str, value, stored_at: float) -> None:
+        if not self.hot_entries:
+            return
+        with self._hot_lock:
+            self._hot[full_key] = (value, stored_at)
+            self._hot.move_to_end(full_key)
+            while len(self._hot) > self.hot_entries:
+                self._hot.popitem(last=False)
+
+    def _get_hot(self, full_key: str):
+        with self._hot_lock:
+            if (hot := self._hot.get(full_key)) is None:
+                return CACHE_MISS
+            value, stored_at = hot
+            if self._is_expired(stored_at):
+                del self._hot[full_key]
+                return CACHE_MISS
+            self._hot.move_to_end(full_key)
+            return value
+
+    def _forget(self, full_key: str | None = None) -> None:
+        with self._hot_lock:
+            if full_key is None:
+                self._hot.clear()
+            else:
+                self._hot.pop(full_key, None)
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         if not lock:
@@ -31,14 +121,29 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             return await asyncio.to_thread(self._get, key)
 
     def _get(self, key):
-        item = self.cache.get(key, default=None)
-        if item:
-            if time.time() - item["time"] < self.expiration_time:
-                self.cache.touch(key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+        full_key = self._key(key)
+        if (value := self._get_hot(full_key)) is not CACHE_MISS:
+            return value
+
+        item = self.cache.get(full_key, default=None)
+        if item is None:
+            return CACHE_MISS
+        if not isinstance(item, dict) or item.get("version") != self.version:
+            # Written by another Langflow version, possibly still running next to this one
+            logger.debug(f"Skipping cache item for key '{key}' written by an incompatible version")
+            return CACHE_MISS
+        if self._is_expired(item["time"]):
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
-            self.cache.delete(key)  # Log before deleting the expired item
-        return CACHE_MISS
+            self.cache.delete(full_key)
+            return CACHE_MISS
+        try:
+            value = pickle.loads(item["value"]) if item["pickled"] else item["value"]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Could not load cache item for key '{key}', deleting it: {exc}")
+            self.cache.delete(full_key)
+            return CACHE_MISS
+        self._remember(full_key, value, item["time"])
+        return value
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -48,10 +153,21 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._set(key, value)
 
     async def _set(self, key, value) -> None:
+        full_key = self._key(key)
+        stored_at = time.time()
+        self._remember(full_key, value, stored_at)
+        pickled = not isinstance(value, str | bytes)
+        try:
+            data = pickle.dumps(value) if pickled else value
+        except Exception as exc:  # noqa: BLE001
+            # Values that cannot be pickled are only kept in memory
+            logger.debug(f"Cache item for key '{key}' cannot be stored on disk: {exc}")
+            await asyncio.to_thread(self.cache.delete, full_key)
+            return
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
-        await asyncio.to_thread(self.cache.set, key, item)
+        item = {"value": data, "pickled": pickled, "time": stored_at, "version": self.version}
+        await asyncio.to_thread(self.cache.set, full_key, item, tag=self.namespace)
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -61,7 +177,9 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._delete(key)
 
     async def _delete(self, key) -> None:
-        await asyncio.to_thread(self.cache.delete, key)
+        full_key = self._key(key)
+        self._forget(full_key)
+        await asyncio.to_thread(self.cache.delete, full_key)
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -71,7 +189,9 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._clear()
 
     async def _clear(self) -> None:
-        await asyncio.to_thread(self.cache.clear)
+        """Remove the entries of this namespace only."""
+        self._forget()
+        await asyncio.to_thread(self.cache.evict, self.namespace)
 
     async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -85,11 +205,13 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
             value = existing_value
-        await self.set(key, value)
+        await self._set(key, value)
 
     async def contains(self, key) -> bool:
-        return await asyncio.to_thread(self.cache.__contains__, key)
+        full_key = self._key(key)
+        return full_key in self._hot or await asyncio.to_thread(self.cache.__contains__, full_key)
 
     async def teardown(self) -> None:
-        # Clean up the cache directory
-        self.cache.clear(retry=True)
+        # Entries are kept for the next start, only release the database connection
+        self._forget()
+        self.cache.close()
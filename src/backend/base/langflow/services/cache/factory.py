@@ -30,6 +30,8 @@ class CacheServiceFactory(ServiceFactory):
                 db=settings_service.settings.redis_db,
                 url=settings_service.settings.redis_url,
                 expiration_time=settings_service.settings.redis_cache_expire,
+                compression=settings_service.settings.redis_cache_compression,
+                compression_threshold=settings_service.settings.redis_cache_compression_threshold,
             )
 
         if settings_service.settings.cache_type == "memory":
@@ -40,5 +42,7 @@ class CacheServiceFactory(ServiceFactory):
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
+                size_limit=settings_service.settings.cache_disk_size_limit,
+                hot_entries=settings_service.settings.cache_disk_hot_entries,
             )
         return None
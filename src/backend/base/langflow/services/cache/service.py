@@ -5,7 +5,6 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from lfx.log.logger import logger
 from lfx.services.cache.utils import CACHE_MISS
 from typing_extensions import override
@@ -17,6 +16,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.codec import CacheCodec, CacheCodecError, CompressionType
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
@@ -196,7 +196,18 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        *,
+        compression: CompressionType = "none",
+        compression_threshold: int = 1024,
+        offload_threshold: int = 64 * 1024,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +217,9 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            compression (str, optional): Compression of large values: "none", "zstd" or "lz4".
+            compression_threshold (int, optional): Size in bytes from which values are compressed.
+            offload_threshold (int, optional): Size in bytes from which values are decoded in a worker thread.
         """
         # Redis is a main dependency, no need to import check
         from redis.asyncio import StrictRedis
@@ -219,6 +233,8 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.codec = CacheCodec(compression=compression, compression_threshold=compression_threshold)
+        self.offload_threshold = offload_threshold
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -236,20 +252,33 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
     async def get(self, key, lock=None):
         if key is None:
             return CACHE_MISS
-        value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        payload = await self._client.get(str(key))
+        if not payload:
+            return CACHE_MISS
+        try:
+            if len(payload) >= self.offload_threshold:
+                return await asyncio.to_thread(self.codec.decode, payload)
+            return self.codec.decode(payload)
+        except CacheCodecError as exc:
+            # Written by another version during a rolling deploy, or by the previous dill based cache
+            await logger.adebug(f"Discarding cache item for key '{key}': {exc}")
+            await self._client.delete(str(key))
+            return CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
-        try:
-            if pickled := dill.dumps(value, recurse=True):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except pickle.PicklingError as exc:
-            msg = "RedisCache only accepts values that can be pickled. "
-            raise TypeError(msg) from exc
+        if (
+            value is None
+            or isinstance(value, bool | int | float)
+            or (isinstance(value, str) and len(value) < self.offload_threshold)
+        ):
+            payload = self.codec.encode(value)
+        else:
+            payload = await asyncio.to_thread(self.codec.encode, value)
+        result = await self._client.setex(str(key), self.expiration_time, payload)
+        if not result:
+            msg = "RedisCache could not set the value."
+            raise ValueError(msg)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
@@ -286,6 +315,10 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return bool(await self._client.exists(str(key)))
 
+    def get_metrics(self) -> dict[str, dict[str, int]]:
+        """Return the number of values and bytes written and read per serialization format."""
+        return self.codec.get_metrics()
+
     def __repr__(self) -> str:
         """Return a string representation of the RedisCache instance."""
         return f"RedisCache(expiration_time={self.expiration_time})"
@@ -0,0 +1,88 @@
+"""Warm start of the component types from the persistent disk cache.
+
+Building the component types evaluates the code of every custom component to create its template, which is the
+slowest part of a cold start. When the cache service is an :class:`AsyncDiskCache`, the complete types dictionary
+is stored under a fingerprint of everything it is built from: the Langflow version, the component settings and the
+size and modification time of every custom component file. The next start with the same fingerprint loads it from
+disk instead of rebuilding it, and any change to those inputs produces a new fingerprint and a regular build.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lfx.constants import BASE_COMPONENTS_PATH
+from lfx.interface.components import _parse_dev_mode, component_cache, get_and_cache_all_types_dict
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_MISS
+
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.deps import get_cache_service
+from langflow.utils.version import get_version_info
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+TEMPLATES_NAMESPACE = "component_templates"
+
+
+def _component_files(path: str) -> list[tuple[str, int, int]]:
+    files = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            if name.endswith((".py", ".json")):
+                file_path = Path(root) / name
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                files.append((str(file_path), stat.st_size, stat.st_mtime_ns))
+    return sorted(files)
+
+
+def component_types_fingerprint(settings_service: SettingsService) -> str:
+    """Hash of everything the component types dictionary is built from."""
+    settings = settings_service.settings
+    custom_paths = [path for path in settings.components_path if path != BASE_COMPONENTS_PATH]
+    data = {
+        "version": get_version_info().get("version"),
+        "components_path": settings.components_path,
+        "components_index_path": settings.components_index_path,
+        "lazy_load_components": settings.lazy_load_components,
+        "files": {path: _component_files(path) for path in custom_paths},
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def warm_start_types_dict(settings_service: SettingsService, telemetry_service: Any | None = None) -> dict:
+    """Return the component types, loading them from the disk cache when they were built before.
+
+    Falls back to :func:`get_and_cache_all_types_dict` when the cache service is not a disk cache, in development
+    mode (built-in components are rebuilt from source) or when the types are already loaded.
+    """
+    cache_service = get_cache_service()
+    if (
+        not isinstance(cache_service, AsyncDiskCache)
+        or component_cache.all_types_dict is not None
+        or _parse_dev_mode()[0]
+    ):
+        return await get_and_cache_all_types_dict(settings_service, telemetry_service)
+
+    # Entries are keyed by their inputs, so they never need to expire
+    store = cache_service.namespaced(TEMPLATES_NAMESPACE, expiration_time=None)
+    fingerprint = await asyncio.to_thread(component_types_fingerprint, settings_service)
+    cached = await store.get(fingerprint)
+    if cached is not CACHE_MISS and component_cache.all_types_dict is None:
+        component_cache.all_types_dict = cached
+        await logger.adebug("Loaded component types from the disk cache")
+        return cached
+
+    all_types_dict = await get_and_cache_all_types_dict(settings_service, telemetry_service)
+    # Builds of older fingerprints are left to the LRU eviction of the cache, another version may still use them
+    await store.set(fingerprint, all_types_dict)
+    return all_types_dict
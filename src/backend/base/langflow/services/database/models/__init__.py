@@ -1,19 +1,25 @@
 from .api_key import ApiKey
 from .file import File
 from .flow import Flow
+from .flow_tombstone import FlowTombstoneTable
 from .folder import Folder
+from .mcp_tool_catalog import MCPToolCatalogTable
 from .message import MessageTable
 from .transactions import TransactionTable
 from .user import User
 from .variable import Variable
+from .webhook_delivery import WebhookDeliveryTable
 
 __all__ = [
     "ApiKey",
     "File",
     "Flow",
+    "FlowTombstoneTable",
     "Folder",
+    "MCPToolCatalogTable",
     "MessageTable",
     "TransactionTable",
     "User",
     "Variable",
+    "WebhookDeliveryTable",
 ]
@@ -0,0 +1,3 @@
+from .model import FlowTombstoneTable
+
+__all__ = ["FlowTombstoneTable"]
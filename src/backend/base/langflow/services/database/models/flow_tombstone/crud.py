@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlmodel import col, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from langflow.services.database.models.flow_tombstone.model import FlowTombstoneTable
+
+
+async def add_flow_tombstones(session: AsyncSession, flow_ids: Iterable[UUID]) -> None:
+    """Record that the flows of ``flow_ids`` were deleted. Flows that already have a tombstone are skipped."""
+    flow_ids = set(flow_ids)
+    if not flow_ids:
+        return
+    existing = (
+        await session.exec(select(FlowTombstoneTable.flow_id).where(col(FlowTombstoneTable.flow_id).in_(flow_ids)))
+    ).all()
+    for flow_id in flow_ids.difference(existing):
+        session.add(FlowTombstoneTable(flow_id=flow_id))
+
+
+async def get_flow_tombstones(session: AsyncSession, limit: int) -> list[FlowTombstoneTable]:
+    """Return the oldest tombstones first."""
+    stmt = select(FlowTombstoneTable).order_by(col(FlowTombstoneTable.deleted_at)).limit(limit)
+    return list((await session.exec(stmt)).all())
+
+
+async def delete_flow_tombstones(session: AsyncSession, flow_ids: Iterable[UUID]) -> None:
+    flow_ids = list(flow_ids)
+    if flow_ids:
+        await session.exec(delete(FlowTombstoneTable).where(col(FlowTombstoneTable.flow_id).in_(flow_ids)))
@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class FlowTombstoneTable(SQLModel, table=True):  # type: ignore[call-arg]
+    """A deleted flow whose messages, transactions, vertex builds and files may still have to be removed.
+
+    Tombstones are written when a flow is deleted and when the full orphan scan finds records of a flow that does not
+    exist. The cleanup worker removes the records of the flow in batches and then deletes the tombstone.
+    """
+
+    __tablename__ = "flow_tombstone"
+
+    flow_id: UUID = Field(primary_key=True)
+    deleted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
@@ -0,0 +1,3 @@
+from .model import MCPToolCatalogTable
+
+__all__ = ["MCPToolCatalogTable"]
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.mcp_tool_catalog.model import MCPToolCatalogTable
+
+
+async def get_tool_catalog_entries(session: AsyncSession, flow_ids: Sequence[UUID]) -> list[MCPToolCatalogTable]:
+    if not flow_ids:
+        return []
+    stmt = select(MCPToolCatalogTable).where(col(MCPToolCatalogTable.flow_id).in_(flow_ids))
+    return list((await session.exec(stmt)).all())
+
+
+async def upsert_tool_catalog_entries(session: AsyncSession, entries: Sequence[MCPToolCatalogTable]) -> None:
+    for entry in entries:
+        await session.merge(entry)
+    await session.flush()
+
+
+async def find_flows_by_tool_name(
+    session: AsyncSession, user_id: UUID, tool_name: str, *, is_action: bool = False
+) -> list[Flow]:
+    """Return the non-component flows of a user whose cataloged tool name matches ``tool_name``."""
+    name_column = MCPToolCatalogTable.action_tool_name if is_action else MCPToolCatalogTable.tool_name
+    stmt = (
+        select(Flow)
+        .join(MCPToolCatalogTable, col(MCPToolCatalogTable.flow_id) == Flow.id)
+        .where(col(MCPToolCatalogTable.user_id) == user_id)
+        .where(col(name_column) == tool_name)
+        .where(Flow.is_component == False)  # noqa: E712
+    )
+    return list((await session.exec(stmt)).all())
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import Index
+from sqlmodel import JSON, Column, Field, SQLModel
+
+
+class MCPToolCatalogTable(SQLModel, table=True):  # type: ignore[call-arg]
+    """Precomputed MCP tool metadata of a flow.
+
+    ``tool_name`` is the sanitized flow name and ``action_tool_name`` the sanitized action name, falling back to
+    ``tool_name`` when the flow has no action name. ``fingerprint`` identifies the version of the flow the entry was
+    computed from. Entries are deleted with their flow.
+    """
+
+    __tablename__ = "mcp_tool_catalog"
+    __table_args__ = (
+        Index("ix_mcp_tool_catalog_user_id_tool_name", "user_id", "tool_name"),
+        Index("ix_mcp_tool_catalog_user_id_action_tool_name", "user_id", "action_tool_name"),
+    )
+
+    flow_id: UUID = Field(primary_key=True, foreign_key="flow.id", ondelete="CASCADE")
+    user_id: UUID | None = Field(default=None)
+    tool_name: str = Field()
+    action_tool_name: str = Field()
+    input_schema: dict | None = Field(default=None, sa_column=Column(JSON))
+    fingerprint: str = Field()
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    # Needed for Column(JSON)
+    class Config:
+        arbitrary_types_allowed = True
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from pydantic import field_serializer, field_validator
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.serialization.serialization import get_max_items_length, get_max_text_length, serialize
@@ -75,6 +76,7 @@ class TransactionBase(SQLModel):
 
 class TransactionTable(TransactionBase, table=True):  # type: ignore[call-arg]
     __tablename__ = "transaction"
+    __table_args__ = (Index("ix_transaction_flow_id_id", "flow_id", "id"),)
     id: UUID | None = Field(default_factory=uuid4, primary_key=True)
 
 
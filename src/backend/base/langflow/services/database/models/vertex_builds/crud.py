@@ -2,30 +2,20 @@ from uuid import UUID
 
 from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.deps import get_settings_service
 
 
-async def get_vertex_builds_by_flow_id(
-    db: AsyncSession, flow_id: UUID, limit: int | None = 1000
-) -> list[VertexBuildTable]:
-    """Get the most recent vertex builds for a given flow ID.
-
-    This function retrieves vertex builds associated with a specific flow, ordered by timestamp.
-    It uses a subquery to get the latest timestamp for each build ID to ensure we get the most
-    recent versions.
+def select_latest_vertex_builds(flow_id: UUID | str) -> SelectOfScalar[VertexBuildTable]:
+    """Build a query selecting the most recent build of every vertex of a flow.
 
     Args:
-        db (AsyncSession): The database session for executing queries.
-        flow_id (UUID): The unique identifier of the flow to get builds for. Can be string or UUID.
-        limit (int | None, optional): Maximum number of builds to return. Defaults to 1000.
+        flow_id (UUID | str): The unique identifier of the flow to get builds for.
 
     Returns:
-        list[VertexBuildTable]: List of vertex builds, ordered chronologically by timestamp.
-
-    Note:
-        If flow_id is provided as a string, it will be converted to UUID automatically.
+        SelectOfScalar[VertexBuildTable]: The unordered, unlimited statement.
     """
     if isinstance(flow_id, str):
         flow_id = UUID(flow_id)
@@ -35,16 +25,36 @@ async def get_vertex_builds_by_flow_id(
         .group_by(VertexBuildTable.id)
         .subquery()
     )
-    stmt = (
+    return (
         select(VertexBuildTable)
         .join(
             subquery, (VertexBuildTable.id == subquery.c.id) & (VertexBuildTable.timestamp == subquery.c.max_timestamp)
         )
         .where(VertexBuildTable.flow_id == flow_id)
-        .order_by(col(VertexBuildTable.timestamp))
-        .limit(limit)
     )
 
+
+async def get_vertex_builds_by_flow_id(
+    db: AsyncSession, flow_id: UUID, limit: int | None = 1000
+) -> list[VertexBuildTable]:
+    """Get the most recent vertex builds for a given flow ID.
+
+    This function retrieves vertex builds associated with a specific flow, ordered by timestamp.
+    It uses a subquery to get the latest timestamp for each build ID to ensure we get the most
+    recent versions.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        flow_id (UUID): The unique identifier of the flow to get builds for. Can be string or UUID.
+        limit (int | None, optional): Maximum number of builds to return. Defaults to 1000.
+
+    Returns:
+        list[VertexBuildTable]: List of vertex builds, ordered chronologically by timestamp.
+
+    Note:
+        If flow_id is provided as a string, it will be converted to UUID automatically.
+    """
+    stmt = select_latest_vertex_builds(flow_id).order_by(col(VertexBuildTable.timestamp)).limit(limit)
     builds = await db.exec(stmt)
     return list(builds)
 
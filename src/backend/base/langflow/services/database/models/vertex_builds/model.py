@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.serialization.serialization import get_max_items_length, get_max_text_length, serialize
@@ -67,6 +67,7 @@ class VertexBuildBase(SQLModel):
 
 class VertexBuildTable(VertexBuildBase, table=True):  # type: ignore[call-arg]
     __tablename__ = "vertex_build"
+    __table_args__ = (Index("ix_vertex_build_flow_id_build_id", "flow_id", "build_id"),)
     build_id: UUID | None = Field(default_factory=uuid4, primary_key=True)
 
 
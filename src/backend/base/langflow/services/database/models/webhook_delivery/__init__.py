@@ -0,0 +1,3 @@
+from .model import WebhookDeliveryRead, WebhookDeliveryStatus, WebhookDeliveryTable
+
+__all__ = ["WebhookDeliveryRead", "WebhookDeliveryStatus", "WebhookDeliveryTable"]
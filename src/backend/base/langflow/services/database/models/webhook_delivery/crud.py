@@ -0,0 +1,108 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from langflow.services.database.models.webhook_delivery.model import WebhookDeliveryStatus, WebhookDeliveryTable
+
+
+async def create_webhook_delivery(
+    session: AsyncSession, delivery: WebhookDeliveryTable
+) -> tuple[WebhookDeliveryTable, bool]:
+    """Insert ``delivery`` unless the flow already has one with the same idempotency key.
+
+    Returns:
+        The stored delivery and whether it was created.
+    """
+    try:
+        async with session.begin_nested():
+            session.add(delivery)
+    except IntegrityError:
+        stmt = select(WebhookDeliveryTable).where(
+            WebhookDeliveryTable.flow_id == delivery.flow_id,
+            WebhookDeliveryTable.idempotency_key == delivery.idempotency_key,
+        )
+        if (existing := (await session.exec(stmt)).first()) is None:
+            raise
+        return existing, False
+    return delivery, True
+
+
+async def get_due_webhook_deliveries(session: AsyncSession, now: datetime, limit: int) -> list[WebhookDeliveryTable]:
+    """Return pending deliveries whose next attempt is due and running deliveries whose lease has expired."""
+    stmt = (
+        select(WebhookDeliveryTable)
+        .where(
+            or_(
+                (col(WebhookDeliveryTable.status) == WebhookDeliveryStatus.PENDING)
+                & (col(WebhookDeliveryTable.next_attempt_at) <= now),
+                (col(WebhookDeliveryTable.status) == WebhookDeliveryStatus.RUNNING)
+                & (col(WebhookDeliveryTable.locked_until) < now),
+            )
+        )
+        .order_by(col(WebhookDeliveryTable.next_attempt_at))
+        .limit(limit)
+    )
+    return list((await session.exec(stmt)).all())
+
+
+async def claim_webhook_delivery(
+    session: AsyncSession, delivery_id: UUID, now: datetime, locked_until: datetime
+) -> bool:
+    """Mark a due delivery as running until ``locked_until``.
+
+    The update only matches a delivery that no other process holds, so exactly one claimer succeeds.
+    """
+    stmt = (
+        update(WebhookDeliveryTable)
+        .where(
+            col(WebhookDeliveryTable.id) == delivery_id,
+            or_(
+                col(WebhookDeliveryTable.status) == WebhookDeliveryStatus.PENDING,
+                (col(WebhookDeliveryTable.status) == WebhookDeliveryStatus.RUNNING)
+                & (col(WebhookDeliveryTable.locked_until) < now),
+            ),
+        )
+        .values(
+            status=WebhookDeliveryStatus.RUNNING,
+            attempts=WebhookDeliveryTable.attempts + 1,
+            locked_until=locked_until,
+            updated_at=now,
+        )
+    )
+    result = await session.exec(stmt)  # type: ignore[call-overload]
+    return result.rowcount == 1
+
+
+async def delete_finished_webhook_deliveries(session: AsyncSession, finished_before: datetime) -> int:
+    """Delete succeeded and failed deliveries last updated before ``finished_before``.
+
+    Returns:
+        The number of deleted deliveries.
+    """
+    stmt = delete(WebhookDeliveryTable).where(
+        col(WebhookDeliveryTable.status).in_([WebhookDeliveryStatus.SUCCEEDED, WebhookDeliveryStatus.FAILED]),
+        col(WebhookDeliveryTable.updated_at) < finished_before,
+    )
+    result = await session.exec(stmt)  # type: ignore[call-overload]
+    return result.rowcount
+
+
+async def list_webhook_deliveries(
+    session: AsyncSession,
+    flow_ids: list[UUID],
+    *,
+    status: WebhookDeliveryStatus | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[WebhookDeliveryTable]:
+    if not flow_ids:
+        return []
+    stmt = select(WebhookDeliveryTable).where(col(WebhookDeliveryTable.flow_id).in_(flow_ids))
+    if status is not None:
+        stmt = stmt.where(WebhookDeliveryTable.status == status)
+    stmt = stmt.order_by(col(WebhookDeliveryTable.created_at).desc()).offset(offset).limit(limit)
+    return list((await session.exec(stmt)).all())
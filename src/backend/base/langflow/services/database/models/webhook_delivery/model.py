@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+from sqlalchemy import Index, Text, UniqueConstraint
+from sqlmodel import Column, Field, SQLModel
+
+
+class WebhookDeliveryStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class WebhookDeliveryBase(SQLModel):
+    flow_id: UUID = Field(index=True)
+    user_id: UUID | None = Field(default=None)
+    idempotency_key: str = Field()
+    status: WebhookDeliveryStatus = Field(default=WebhookDeliveryStatus.PENDING)
+    attempts: int = Field(default=0)
+    last_error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    next_attempt_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class WebhookDeliveryTable(WebhookDeliveryBase, table=True):  # type: ignore[call-arg]
+    """A webhook request accepted for a flow and the state of its delivery.
+
+    ``locked_until`` is the end of the lease of the process running the delivery. A running delivery whose lease
+    has expired, for example because that process died, is picked up again.
+    """
+
+    __tablename__ = "webhook_delivery"
+    __table_args__ = (
+        UniqueConstraint("flow_id", "idempotency_key", name="uq_webhook_delivery_flow_id_idempotency_key"),
+        Index("ix_webhook_delivery_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    payload: str = Field(sa_column=Column(Text, nullable=False))
+    locked_until: datetime | None = Field(default=None)
+
+
+class WebhookDeliveryRead(WebhookDeliveryBase):
+    id: UUID
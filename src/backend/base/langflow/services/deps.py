@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.mcp_tool_catalog.service import MCPToolCatalogService
     from langflow.services.session.service import SessionService
     from langflow.services.state.service import StateService
     from langflow.services.storage.service import StorageService
@@ -27,6 +28,7 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.webhook_inbox.service import WebhookInboxService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -266,3 +268,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_mcp_tool_catalog_service() -> MCPToolCatalogService:
+    """Retrieves the MCPToolCatalogService instance from the service manager."""
+    from langflow.services.mcp_tool_catalog.factory import MCPToolCatalogServiceFactory
+
+    return get_service(ServiceType.MCP_TOOL_CATALOG_SERVICE, MCPToolCatalogServiceFactory())
+
+
+def get_webhook_inbox_service() -> WebhookInboxService:
+    """Retrieves the WebhookInboxService instance from the service manager."""
+    from langflow.services.webhook_inbox.factory import WebhookInboxServiceFactory
+
+    return get_service(ServiceType.WEBHOOK_INBOX_SERVICE, WebhookInboxServiceFactory())
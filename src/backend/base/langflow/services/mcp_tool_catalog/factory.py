@@ -0,0 +1,11 @@
+from langflow.services.base import Service
+from langflow.services.factory import ServiceFactory
+from langflow.services.mcp_tool_catalog.service import MCPToolCatalogService
+
+
+class MCPToolCatalogServiceFactory(ServiceFactory):
+    def __init__(self):
+        super().__init__(MCPToolCatalogService)
+
+    def create(self) -> Service:
+        return MCPToolCatalogService()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from lfx.base.mcp.util import get_flow_snake_case, sanitize_mcp_name
+from lfx.log.logger import logger
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
+
+from langflow.helpers.flow import json_schema_from_flow_data
+from langflow.services.base import Service
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.mcp_tool_catalog.crud import (
+    find_flows_by_tool_name,
+    get_tool_catalog_entries,
+    upsert_tool_catalog_entries,
+)
+from langflow.services.database.models.mcp_tool_catalog.model import MCPToolCatalogTable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@dataclass(frozen=True)
+class MCPToolCatalogEntry:
+    flow_id: UUID
+    fingerprint: str
+    tool_name: str
+    action_tool_name: str
+    input_schema: dict | None
+
+
+def flow_fingerprint(flow: Any) -> str:
+    """Identify the version of a flow that tool metadata is derived from.
+
+    Every save bumps ``updated_at``; the name, action name and owner are included as well so that updates which do
+    not touch the timestamp still invalidate the entry. Only needs the light columns, not the flow data.
+    """
+    updated_at = flow.updated_at
+    if isinstance(updated_at, datetime) and updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    payload = f"{updated_at}|{flow.name}|{flow.action_name}|{flow.user_id}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def tool_names_for_flow(flow: Any) -> tuple[str, str]:
+    """Return the sanitized tool name and action tool name of a flow."""
+    tool_name = sanitize_mcp_name(flow.name)
+    action_tool_name = sanitize_mcp_name(flow.action_name) if flow.action_name else tool_name
+    return tool_name, action_tool_name
+
+
+class MCPToolCatalogService(Service):
+    """Catalog of the MCP tool metadata of flow-backed tools.
+
+    Deriving the input schema of a flow requires building its graph, so the sanitized tool names and the input
+    schema of every flow are stored in the ``mcp_tool_catalog`` table and kept in memory. An entry is recomputed
+    only when the fingerprint of its flow changes, i.e. after the flow has been saved.
+    """
+
+    name = "mcp_tool_catalog_service"
+
+    def __init__(self) -> None:
+        self._entries: dict[UUID, MCPToolCatalogEntry] = {}
+
+    async def get_entries(self, session: AsyncSession, flows: Sequence[Any]) -> dict[UUID, MCPToolCatalogEntry]:
+        """Return the catalog entries of the given flows, computing the missing or outdated ones.
+
+        ``flows`` only need the ``id``, ``name``, ``action_name``, ``user_id`` and ``updated_at`` attributes, so
+        callers can select those columns instead of loading the flow data.
+        """
+        fingerprints = {flow.id: flow_fingerprint(flow) for flow in flows}
+        entries: dict[UUID, MCPToolCatalogEntry] = {}
+        for flow_id, fingerprint in fingerprints.items():
+            entry = self._entries.get(flow_id)
+            if entry is not None and entry.fingerprint == fingerprint:
+                entries[flow_id] = entry
+
+        missing = [flow_id for flow_id in fingerprints if flow_id not in entries]
+        for row in await get_tool_catalog_entries(session, missing):
+            if row.fingerprint == fingerprints[row.flow_id]:
+                entries[row.flow_id] = self._remember(row)
+
+        stale = [flow_id for flow_id in fingerprints if flow_id not in entries]
+        if stale:
+            stmt = select(Flow).where(col(Flow.id).in_(stale))
+            rows = [self.build_entry(flow) for flow in (await session.exec(stmt)).all()]
+            await self._store(session, rows)
+            for row in rows:
+                entries[row.flow_id] = self._remember(row)
+        return entries
+
+    async def find_flow(self, session: AsyncSession, name: str, user_id: UUID | str, *, is_action: bool = False):
+        """Resolve a tool name to a flow of the user through the name index.
+
+        Flows that are not cataloged yet, or were renamed since, are found by scanning the user's flows; the
+        result is then added to the catalog.
+        """
+        user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+        for flow in await find_flows_by_tool_name(session, user_id, name, is_action=is_action):
+            tool_name, action_tool_name = tool_names_for_flow(flow)
+            if (action_tool_name if is_action else tool_name) == name:
+                return flow
+
+        flow = await get_flow_snake_case(name, user_id, session, is_action=is_action)
+        if flow is not None:
+            row = self.build_entry(flow)
+            await self._store(session, [row])
+            self._remember(row)
+        return flow
+
+    def build_entry(self, flow: Flow) -> MCPToolCatalogTable:
+        tool_name, action_tool_name = tool_names_for_flow(flow)
+        try:
+            input_schema = json_schema_from_flow_data(flow.data or {})
+        except Exception as e:  # noqa: BLE001
+            # Cache the failure as well so the graph of a broken flow is not rebuilt on every listing
+            logger.warning(f"Error in building the tool input schema: {e!s} from flow: {tool_name}")
+            input_schema = None
+        return MCPToolCatalogTable(
+            flow_id=flow.id,
+            user_id=flow.user_id,
+            tool_name=tool_name,
+            action_tool_name=action_tool_name,
+            input_schema=input_schema,
+            fingerprint=flow_fingerprint(flow),
+        )
+
+    def invalidate(self, flow_id: UUID | None = None) -> None:
+        """Forget the in-memory entry of a flow, or all entries if no flow is given."""
+        if flow_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(flow_id, None)
+
+    async def _store(self, session: AsyncSession, rows: list[MCPToolCatalogTable]) -> None:
+        try:
+            async with session.begin_nested():
+                await upsert_tool_catalog_entries(session, rows)
+        except IntegrityError:
+            # A concurrent request stored the same entries first
+            await logger.adebug("MCP tool catalog entries were already stored by another request")
+
+    def _remember(self, row: MCPToolCatalogTable) -> MCPToolCatalogEntry:
+        entry = MCPToolCatalogEntry(
+            flow_id=row.flow_id,
+            fingerprint=row.fingerprint,
+            tool_name=row.tool_name,
+            action_tool_name=row.action_tool_name,
+            input_schema=row.input_schema,
+        )
+        self._entries[row.flow_id] = entry
+        return entry
+
+    async def teardown(self) -> None:
+        self._entries.clear()
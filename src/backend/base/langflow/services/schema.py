@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
+    MCP_TOOL_CATALOG_SERVICE = "mcp_tool_catalog_service"
+    WEBHOOK_INBOX_SERVICE = "webhook_inbox_service"
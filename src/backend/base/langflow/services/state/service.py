@@ -1,12 +1,19 @@
-from collections import defaultdict
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping
 from threading import Lock
+from types import MappingProxyType
 
 from lfx.log.logger import logger
 from lfx.services.settings.service import SettingsService
 
 from langflow.services.base import Service
 
+DEFAULT_SHARD_COUNT = 16
+# Expired runs of a shard are looked for at most this often, on writes to that shard
+SWEEP_INTERVAL = 60.0
+
+_EMPTY_STATE: Mapping = MappingProxyType({})
+
 
 class StateService(Service):
     name = "state_service"
@@ -20,6 +27,9 @@ class StateService(Service):
     def get_state(self, key, run_id: str):
         raise NotImplementedError
 
+    def clear_state(self, run_id: str) -> None:
+        raise NotImplementedError
+
     def subscribe(self, key, observer: Callable) -> None:
         raise NotImplementedError
 
@@ -30,54 +40,125 @@ class StateService(Service):
         raise NotImplementedError
 
 
+class _AppendedValues(tuple):
+    """Values collected by ``append_state``, returned as a list by ``get_state``."""
+
+    __slots__ = ()
+
+
+class _Shard:
+    __slots__ = ("last_sweep", "lock", "runs")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # run_id -> (state, time of the last write). States are replaced on every write, never mutated.
+        self.runs: dict[str, tuple[Mapping, float]] = {}
+        self.last_sweep = time.monotonic()
+
+
 class InMemoryStateService(StateService):
-    def __init__(self, settings_service: SettingsService):
+    """Run state kept in memory and sharded by run id.
+
+    Writers only lock the shard of their run and swap in an updated copy of the run state, so readers never lock
+    and always see a consistent snapshot. Observers are called synchronously by the writer, once the shard lock is
+    released, so they see the write that notified them. The state of a run is dropped by ``clear_state``, called when
+    the graph of the run ends, or after ``state_run_ttl`` seconds without writes.
+    """
+
+    def __init__(self, settings_service: SettingsService, shard_count: int = DEFAULT_SHARD_COUNT):
         self.settings_service = settings_service
-        self.states: dict[str, dict] = {}
-        self.observers: dict[str, list[Callable]] = defaultdict(list)
+        self.ttl: float = getattr(settings_service.settings, "state_run_ttl", 0) or 0
+        self._shards = tuple(_Shard() for _ in range(shard_count))
+        # key -> observers. Replaced on every change so notifications can iterate without locking.
+        self.observers: dict[str, tuple[Callable, ...]] = {}
         self.lock = Lock()
 
+    def _shard(self, run_id: str) -> _Shard:
+        return self._shards[hash(run_id) % len(self._shards)]
+
+    def _is_expired(self, written_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - written_at > self.ttl
+
+    def _write(self, run_id: str, key, update: Callable) -> None:
+        shard = self._shard(run_id)
+        now = time.monotonic()
+        with shard.lock:
+            if self.ttl > 0 and now - shard.last_sweep > min(self.ttl, SWEEP_INTERVAL):
+                self._sweep(shard, now)
+            entry = shard.runs.get(run_id)
+            state = entry[0] if entry is not None and not self._is_expired(entry[1], now) else _EMPTY_STATE
+            shard.runs[run_id] = (MappingProxyType({**state, key: update(state.get(key))}), now)
+
+    def _sweep(self, shard: _Shard, now: float) -> None:
+        expired = [run_id for run_id, (_, written_at) in shard.runs.items() if self._is_expired(written_at, now)]
+        for run_id in expired:
+            del shard.runs[run_id]
+        shard.last_sweep = now
+        if expired:
+            logger.debug(f"Dropped the state of {len(expired)} stale runs")
+
     def append_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            if key not in self.states[run_id]:
-                self.states[run_id][key] = []
-            elif not isinstance(self.states[run_id][key], list):
-                self.states[run_id][key] = [self.states[run_id][key]]
-            self.states[run_id][key].append(new_state)
-            self.notify_append_observers(key, new_state)
+        def append(value):
+            if value is None:
+                return _AppendedValues((new_state,))
+            if isinstance(value, list | tuple):
+                return _AppendedValues((*value, new_state))
+            return _AppendedValues((value, new_state))
+
+        self._write(run_id, key, append)
+        self.notify_append_observers(key, new_state)
 
     def update_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            self.states[run_id][key] = new_state
-            self.notify_observers(key, new_state)
+        self._write(run_id, key, lambda _: new_state)
+        self.notify_observers(key, new_state)
+
+    def get_snapshot(self, run_id: str) -> Mapping:
+        """Return a read-only view of the whole state of a run as of now."""
+        entry = self._shard(run_id).runs.get(run_id)
+        if entry is None or self._is_expired(entry[1], time.monotonic()):
+            return _EMPTY_STATE
+        return entry[0]
 
     def get_state(self, key, run_id: str):
-        with self.lock:
-            return self.states.get(run_id, {}).get(key, "")
+        value = self.get_snapshot(run_id).get(key, "")
+        return list(value) if isinstance(value, _AppendedValues) else value
+
+    def clear_state(self, run_id: str) -> None:
+        """Drop the state of a finished run."""
+        shard = self._shard(run_id)
+        with shard.lock:
+            shard.runs.pop(run_id, None)
 
     def subscribe(self, key, observer: Callable) -> None:
         with self.lock:
-            if observer not in self.observers[key]:
-                self.observers[key].append(observer)
+            observers = self.observers.get(key, ())
+            if observer not in observers:
+                self.observers[key] = (*observers, observer)
 
     def notify_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
-            callback(key, new_state, append=False)
+        self._notify(key, new_state, append=False)
 
     def notify_append_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        self._notify(key, new_state, append=True)
+
+    def _notify(self, key, new_state, *, append: bool) -> None:
+        for callback in self.observers.get(key, ()):
             try:
-                callback(key, new_state, append=True)
+                callback(key, new_state, append=append)
             except Exception:  # noqa: BLE001
                 logger.exception(f"Error in observer {callback} for key {key}")
-                logger.warning("Callbacks not implemented yet")
 
     def unsubscribe(self, key, observer: Callable) -> None:
         with self.lock:
-            if observer in self.observers[key]:
-                # Use list.remove() since observers[key] is a list
-                self.observers[key].remove(observer)
+            observers = self.observers.get(key, ())
+            if observer in observers:
+                remaining = tuple(callback for callback in observers if callback != observer)
+                if remaining:
+                    self.observers[key] = remaining
+                else:
+                    del self.observers[key]
+
+    async def teardown(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.runs.clear()
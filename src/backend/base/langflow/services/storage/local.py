@@ -1,3 +1,6 @@
+import shutil
+from pathlib import Path
+
 import anyio
 from aiofile import async_open
 from lfx.log.logger import logger
@@ -109,6 +112,24 @@ class LocalStorageService(StorageService):
         else:
             await logger.awarning(f"Attempted to delete non-existent file {file_name} in flow {flow_id}.")
 
+    async def delete_flow_files(self, flow_ids: list[str]) -> None:
+        """Delete the directories of the flows of ``flow_ids`` in a single worker thread."""
+        flow_dirs = [Path(self.data_dir / str(flow_id)) for flow_id in flow_ids]
+
+        def remove_dirs() -> list[str]:
+            failed = []
+            for flow_dir in flow_dirs:
+                try:
+                    shutil.rmtree(flow_dir)
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    failed.append(flow_dir.name)
+            return failed
+
+        if failed := await anyio.to_thread.run_sync(remove_dirs):
+            await logger.aerror(f"Failed to delete the files of flows {', '.join(failed)}")
+
     async def teardown(self) -> None:
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
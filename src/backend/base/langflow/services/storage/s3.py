@@ -1,3 +1,5 @@
+import asyncio
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from lfx.log.logger import logger
@@ -96,6 +98,31 @@ class S3StorageService(StorageService):
             await logger.aexception(f"Error deleting file {file_name} from folder {folder}")
             raise
 
+    async def delete_flow_files(self, flow_ids: list[str]) -> None:
+        """Delete every object of the folders of ``flow_ids`` with batched delete requests.
+
+        Raises:
+            Exception: If an error occurs while listing or deleting the objects.
+        """
+
+        def delete_folders() -> int:
+            keys = []
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            for flow_id in flow_ids:
+                for page in paginator.paginate(Bucket=self.bucket, Prefix=f"{flow_id}/"):
+                    keys.extend({"Key": item["Key"]} for item in page.get("Contents", []))
+            # A delete request takes at most 1000 keys
+            for start in range(0, len(keys), 1000):
+                self.s3_client.delete_objects(Bucket=self.bucket, Delete={"Objects": keys[start : start + 1000]})
+            return len(keys)
+
+        try:
+            deleted = await asyncio.to_thread(delete_folders)
+        except ClientError:
+            await logger.aexception(f"Error deleting the files of {len(flow_ids)} flows")
+            raise
+        await logger.ainfo(f"Deleted {deleted} files of {len(flow_ids)} flows.")
+
     async def teardown(self) -> None:
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for S3 storage at the moment.
@@ -48,5 +48,18 @@ class StorageService(Service):
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         raise NotImplementedError
 
+    async def delete_flow_files(self, flow_ids: list[str]) -> None:
+        """Delete every file of the flows of ``flow_ids``.
+
+        Storages that can remove whole folders at once override this.
+        """
+        for flow_id in flow_ids:
+            try:
+                files = await self.list_files(flow_id)
+            except FileNotFoundError:
+                continue
+            for file_name in files:
+                await self.delete_file(flow_id, file_name)
+
     async def teardown(self) -> None:
         raise NotImplementedError
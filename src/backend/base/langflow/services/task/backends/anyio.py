@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import time
 import traceback
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 import anyio
 
@@ -11,18 +17,38 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from types import TracebackType
 
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RESULT_TTL = 3600.0
+DEFAULT_MAX_RESULTS = 1000
+
+
+class TaskPriority(IntEnum):
+    """Lanes of the queued tasks. A task only starts when the lanes of higher priority are empty."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
 
 class AnyIOTaskResult:
-    def __init__(self) -> None:
+    def __init__(self, task_id: str | None = None, priority: TaskPriority = TaskPriority.NORMAL) -> None:
+        self.task_id = task_id or uuid4().hex
+        self.priority = priority
         self._status = "PENDING"
         self._result = None
         self._exception: Exception | None = None
         self._traceback: TracebackType | None = None
+        self._cancelled = False
         self.cancel_scope: anyio.CancelScope | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
 
     @property
     def status(self) -> str:
         if self._status == "DONE":
+            if self._cancelled:
+                return "REVOKED"
             return "FAILURE" if self._exception is not None else "SUCCESS"
         return self._status
 
@@ -39,36 +65,76 @@ class AnyIOTaskResult:
     def ready(self) -> bool:
         return self._status == "DONE"
 
+    def revoke(self) -> None:
+        """Mark a task that never started as cancelled."""
+        self._cancelled = True
+        self._status = "DONE"
+        self.finished_at = time.time()
+
     async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._status = "STARTED"
+        self.started_at = time.time()
         try:
-            async with anyio.CancelScope() as scope:
+            with anyio.CancelScope() as scope:
                 self.cancel_scope = scope
                 self._result = await func(*args, **kwargs)
+            self._cancelled = scope.cancelled_caught
         except Exception as e:  # noqa: BLE001
             self._exception = e
             self._traceback = e.__traceback__
         finally:
+            self.cancel_scope = None
             self._status = "DONE"
+            self.finished_at = time.time()
+
+
+@dataclass
+class _QueuedTask:
+    task_result: AnyIOTaskResult
+    func: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any] = field(default_factory=dict)
 
 
 class AnyIOBackend(TaskBackend):
-    """Backend for handling asynchronous tasks using AnyIO."""
+    """Backend running asynchronous tasks in the event loop of this process.
+
+    At most ``max_concurrency`` tasks run at the same time, the others wait in the lane of their
+    :class:`TaskPriority`. Finished tasks are kept ``result_ttl`` seconds, and at most ``max_results`` of them.
+    """
 
     name = "anyio"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ) -> None:
         """Initialize the AnyIO backend with an empty task dictionary."""
+        self.max_concurrency = max_concurrency
+        self.result_ttl = result_ttl
+        self.max_results = max_results
         self.tasks: dict[str, AnyIOTaskResult] = {}
-        self._run_tasks: list[anyio.TaskGroup] = []
+        self._lanes: dict[TaskPriority, deque[_QueuedTask]] = {priority: deque() for priority in TaskPriority}
+        self._running: set[asyncio.Task] = set()
+        # IDs of the finished tasks, in the order they finished
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self._counters = {"succeeded": 0, "failed": 0, "cancelled": 0}
 
     async def launch_task(
-        self, task_func: Callable[..., Any], *args: Any, **kwargs: Any
+        self,
+        task_func: Callable[..., Any],
+        *args: Any,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        **kwargs: Any,
     ) -> tuple[str, AnyIOTaskResult]:
-        """Launch a new task in an asynchronous manner.
+        """Queue a new task, started as soon as a slot is free.
 
         Args:
             task_func: The asynchronous function to run.
             *args: Positional arguments to pass to task_func.
+            priority: The lane the task waits in.
             **kwargs: Keyword arguments to pass to task_func.
 
         Returns:
@@ -78,21 +144,15 @@ class AnyIOBackend(TaskBackend):
             RuntimeError: If task creation fails.
         """
         try:
-            task_result = AnyIOTaskResult()
-
-            # Create task ID before starting the task
-            task_id = str(id(task_result))
-            self.tasks[task_id] = task_result
-
-            # Start the task in the background using TaskGroup
-            async with anyio.create_task_group() as tg:
-                tg.start_soon(task_result.run, task_func, *args, **kwargs)
-                self._run_tasks.append(tg)
-
+            task_result = AnyIOTaskResult(priority=TaskPriority(priority))
+            self.tasks[task_result.task_id] = task_result
+            self._lanes[task_result.priority].append(_QueuedTask(task_result, task_func, args, kwargs))
+            self._prune()
+            self._dispatch()
         except Exception as e:
             msg = f"Failed to launch task: {e!s}"
             raise RuntimeError(msg) from e
-        return task_id, task_result
+        return task_result.task_id, task_result
 
     def get_task(self, task_id: str) -> AnyIOTaskResult | None:
         """Retrieve a task by its ID.
@@ -103,15 +163,100 @@ class AnyIOBackend(TaskBackend):
         Returns:
             AnyIOTaskResult | None: The task result object if found, None otherwise.
         """
+        self._prune()
         return self.tasks.get(task_id)
 
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a queued or running task.
+
+        A queued task is removed from its lane. A running task is cancelled through its cancel scope and is
+        ``REVOKED`` once it has stopped.
+
+        Args:
+            task_id: The unique identifier of the task to cancel.
+
+        Returns:
+            bool: Whether the task was cancelled, False if it is unknown or already finished.
+        """
+        task = self.tasks.get(task_id)
+        if task is None or task.ready():
+            return False
+        if task.cancel_scope is not None:
+            task.cancel_scope.cancel()
+            return True
+
+        lane = self._lanes[task.priority]
+        for queued in lane:
+            if queued.task_result is task:
+                lane.remove(queued)
+                break
+        task.revoke()
+        self._record_finished(task)
+        return True
+
     async def cleanup_task(self, task_id: str) -> None:
         """Clean up a completed task and its resources.
 
         Args:
             task_id: The unique identifier of the task to clean up.
         """
-        if task := self.tasks.get(task_id):
-            if task.cancel_scope:
-                task.cancel_scope.cancel()
+        if task_id in self.tasks:
+            self.cancel_task(task_id)
+            self.tasks.pop(task_id, None)
+            self._finished.pop(task_id, None)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return the number of queued, running and finished tasks."""
+        self._prune()
+        return {
+            "backend": self.name,
+            "max_concurrency": self.max_concurrency,
+            "queued": sum(len(lane) for lane in self._lanes.values()),
+            "queued_by_priority": {priority.name.lower(): len(lane) for priority, lane in self._lanes.items()},
+            "running": len(self._running),
+            "finished": len(self._finished),
+            **self._counters,
+        }
+
+    def _dispatch(self) -> None:
+        """Start queued tasks, highest priority first, while slots are free."""
+        while len(self._running) < self.max_concurrency:
+            lane = next((lane for lane in self._lanes.values() if lane), None)
+            if lane is None:
+                return
+            queued = lane.popleft()
+            task = asyncio.create_task(self._execute(queued))
+            self._running.add(task)
+            task.add_done_callback(self._on_task_done)
+
+    async def _execute(self, queued: _QueuedTask) -> None:
+        if queued.task_result.ready():
+            # Cancelled between leaving its lane and starting
+            return
+        await queued.task_result.run(queued.func, *queued.args, **queued.kwargs)
+        self._record_finished(queued.task_result)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._dispatch()
+
+    def _record_finished(self, task: AnyIOTaskResult) -> None:
+        status = task.status
+        if status == "REVOKED":
+            self._counters["cancelled"] += 1
+        elif status == "FAILURE":
+            self._counters["failed"] += 1
+        else:
+            self._counters["succeeded"] += 1
+        self._finished[task.task_id] = time.monotonic()
+        self._prune()
+
+    def _prune(self) -> None:
+        """Drop the expired results of finished tasks and the oldest ones beyond ``max_results``."""
+        expire_before = time.monotonic() - self.result_ttl
+        while self._finished:
+            task_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > expire_before and len(self._finished) <= self.max_results:
+                return
+            self._finished.popitem(last=False)
             self.tasks.pop(task_id, None)
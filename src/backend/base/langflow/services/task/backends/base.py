@@ -13,3 +13,10 @@ class TaskBackend(ABC):
     @abstractmethod
     def get_task(self, task_id: str) -> Any:
         pass
+
+    def cancel_task(self, task_id: str) -> bool:
+        msg = f"The {self.name} backend cannot cancel tasks"
+        raise NotImplementedError(msg)
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {"backend": self.name}
@@ -27,3 +27,7 @@ class CeleryBackend(TaskBackend):
 
     def get_task(self, task_id: str) -> Any:
         return AsyncResult(task_id, app=self.celery_app)
+
+    def cancel_task(self, task_id: str) -> bool:
+        AsyncResult(task_id, app=self.celery_app).revoke(terminate=True)
+        return True
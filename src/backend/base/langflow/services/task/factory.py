@@ -1,14 +1,18 @@
+from typing import TYPE_CHECKING
+
 from typing_extensions import override
 
 from langflow.services.factory import ServiceFactory
 from langflow.services.task.service import TaskService
 
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
 
 class TaskServiceFactory(ServiceFactory):
     def __init__(self) -> None:
         super().__init__(TaskService)
 
     @override
-    def create(self):
-        # Here you would have logic to create and configure a TaskService
-        return TaskService()
+    def create(self, settings_service: "SettingsService"):
+        return TaskService(settings_service)
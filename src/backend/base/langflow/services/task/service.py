@@ -25,7 +25,12 @@ class TaskService(Service):
         return self.backend.name
 
     def get_backend(self) -> TaskBackend:
-        return AnyIOBackend()
+        settings = self.settings_service.settings
+        return AnyIOBackend(
+            max_concurrency=settings.task_max_concurrency,
+            result_ttl=settings.task_result_ttl,
+            max_results=settings.task_max_results,
+        )
 
     # In your TaskService class
     async def launch_and_await_task(
@@ -39,3 +44,13 @@ class TaskService(Service):
     async def launch_task(self, task_func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         task = self.backend.launch_task(task_func, *args, **kwargs)
         return await task if isinstance(task, Coroutine) else task
+
+    def get_task(self, task_id: str) -> Any:
+        return self.backend.get_task(task_id)
+
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a queued or running task, returns False if it is unknown or already finished."""
+        return self.backend.cancel_task(task_id)
+
+    def get_metrics(self) -> dict[str, Any]:
+        return self.backend.get_metrics()
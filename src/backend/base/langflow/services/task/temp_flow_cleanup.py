@@ -1,79 +1,169 @@
+"""Removal of the records and files left behind by deleted flows.
+
+Deleting a flow records a tombstone (see :class:`FlowTombstoneTable`) and wakes the cleanup worker. The worker
+removes the messages, transactions and vertex builds of the tombstoned flows in batches of
+``orphan_cleanup_batch_size`` rows, walking the ``(flow_id, id)`` index of each table, then deletes the storage
+folders of all the cleaned up flows at once.
+
+Records can also outlive their flow without a tombstone, for example the messages of public flows, which run under a
+flow id that is never stored. A full scan of the tables finds them at most every ``orphan_full_scan_interval``
+seconds and turns them into tombstones.
+"""
+
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
+from sqlalchemy import exists
 from sqlmodel import col, delete, select
 
+from langflow.services.database.models.flow_tombstone.crud import (
+    add_flow_tombstones,
+    delete_flow_tombstones,
+    get_flow_tombstones,
+)
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 
 if TYPE_CHECKING:
-    from langflow.services.storage.service import StorageService
-
+    from uuid import UUID
 
-async def cleanup_orphaned_records() -> None:
-    """Clean up all records that reference non-existent flows."""
-    from langflow.services.database.models.flow.model import Flow
+    from langflow.services.storage.service import StorageService
 
+# Tables that have flow_id columns, with their primary key
+DEPENDENT_TABLES: list[tuple[type[MessageTable | TransactionTable | VertexBuildTable], str]] = [
+    (MessageTable, "id"),
+    (TransactionTable, "id"),
+    (VertexBuildTable, "build_id"),
+]
+TOMBSTONES_PER_RUN = 100
+MAX_BATCHES_PER_RUN = 100
+ORPHAN_SCAN_LIMIT = 1000
+# Lets the transaction that deleted a flow commit, and groups the flows deleted together
+WAKEUP_DELAY = 1.0
+
+
+async def _delete_flow_records(
+    table: type[MessageTable | TransactionTable | VertexBuildTable],
+    primary_key: str,
+    flow_id: UUID,
+    batch_size: int,
+    max_batches: int,
+) -> bool:
+    """Delete the rows of ``table`` that belong to ``flow_id``, ``batch_size`` rows per transaction.
+
+    Returns:
+        Whether all the rows were deleted, False if ``max_batches`` was reached first.
+    """
+    key = getattr(table, primary_key)
+    last_key = None
+    for _ in range(max_batches):
+        stmt = select(key).where(col(table.flow_id) == flow_id).order_by(key).limit(batch_size)
+        if last_key is not None:
+            stmt = stmt.where(col(key) > last_key)
+        async with session_scope() as session:
+            keys = list((await session.exec(stmt)).all())
+            if keys:
+                await session.exec(delete(table).where(col(key).in_(keys)))
+        if len(keys) < batch_size:
+            return True
+        last_key = keys[-1]
+        # Give the other tasks of the event loop a turn between two batches
+        await asyncio.sleep(0)
+    return False
+
+
+async def reconcile_flow_tombstones() -> bool:
+    """Remove the records and files of the tombstoned flows, oldest first.
+
+    Returns:
+        Whether tombstones are left to process because this run reached its limits.
+    """
+    settings = get_settings_service().settings
     async with session_scope() as session:
-        # Create a subquery of existing flow IDs
-        flow_ids_subquery = select(Flow.id)
+        flow_ids = [tombstone.flow_id for tombstone in await get_flow_tombstones(session, TOMBSTONES_PER_RUN)]
+    if not flow_ids:
+        return False
+
+    truncated = False
+    cleaned: list[UUID] = []
+    for flow_id in flow_ids:
+        complete = True
+        for table, primary_key in DEPENDENT_TABLES:
+            try:
+                if not await _delete_flow_records(
+                    table, primary_key, flow_id, settings.orphan_cleanup_batch_size, MAX_BATCHES_PER_RUN
+                ):
+                    complete = False
+                    truncated = True
+            except Exception as exc:  # noqa: BLE001
+                complete = False
+                await logger.aerror(f"Error deleting the {table.__name__} records of flow {flow_id}: {exc!s}")
+        if complete:
+            cleaned.append(flow_id)
+
+    if cleaned:
+        storage_service: StorageService = get_storage_service()
+        try:
+            await storage_service.delete_flow_files([str(flow_id) for flow_id in cleaned])
+        except Exception as exc:  # noqa: BLE001
+            # The tombstones are kept so the files are deleted by a later run
+            await logger.aerror(f"Failed to delete the files of {len(cleaned)} deleted flows: {exc!s}")
+            return truncated
+        async with session_scope() as session:
+            await delete_flow_tombstones(session, cleaned)
+        await logger.adebug(f"Cleaned up the records of {len(cleaned)} deleted flows")
+        # More tombstones may be waiting behind this run
+        truncated = truncated or len(flow_ids) == TOMBSTONES_PER_RUN
+    return truncated
+
+
+async def find_orphaned_flows() -> int:
+    """Scan the dependent tables for records of flows that do not exist and record tombstones for those flows.
+
+    Returns:
+        The number of flows found.
+    """
+    from langflow.services.database.models.flow.model import Flow
 
-        # Tables that have flow_id foreign keys
-        tables: list[type[VertexBuildTable | MessageTable | TransactionTable]] = [
-            MessageTable,
-            VertexBuildTable,
-            TransactionTable,
-        ]
+    orphaned_flow_ids: set[UUID] = set()
+    for table, _ in DEPENDENT_TABLES:
+        stmt = (
+            select(col(table.flow_id).distinct())
+            .where(col(table.flow_id).is_not(None), ~exists().where(col(Flow.id) == col(table.flow_id)))
+            .limit(ORPHAN_SCAN_LIMIT)
+        )
+        try:
+            async with session_scope() as session:
+                orphaned_flow_ids.update((await session.exec(stmt)).all())
+        except Exception as exc:  # noqa: BLE001
+            await logger.aerror(f"Error scanning {table.__name__} for orphaned records: {exc!s}")
+
+    if orphaned_flow_ids:
+        await logger.adebug(f"Found {len(orphaned_flow_ids)} orphaned flow IDs")
+        async with session_scope() as session:
+            await add_flow_tombstones(session, orphaned_flow_ids)
+    return len(orphaned_flow_ids)
 
-        for table in tables:
-            try:
-                # Get distinct orphaned flow IDs from the table
-                orphaned_flow_ids = (
-                    await session.exec(
-                        select(col(table.flow_id).distinct()).where(col(table.flow_id).not_in(flow_ids_subquery))
-                    )
-                ).all()
-
-                if orphaned_flow_ids:
-                    logger.debug(f"Found {len(orphaned_flow_ids)} orphaned flow IDs in {table.__name__}")
-
-                    # Delete all orphaned records in a single query
-                    await session.exec(delete(table).where(col(table.flow_id).in_(orphaned_flow_ids)))
-
-                    # Clean up any associated storage files
-                    storage_service: StorageService = get_storage_service()
-                    for flow_id in orphaned_flow_ids:
-                        try:
-                            files = await storage_service.list_files(str(flow_id))
-                            for file in files:
-                                try:
-                                    await storage_service.delete_file(str(flow_id), file)
-                                except Exception as exc:  # noqa: BLE001
-                                    logger.error(f"Failed to delete file {file} for flow {flow_id}: {exc!s}")
-                            # Delete the flow directory after all files are deleted
-                            flow_dir = storage_service.data_dir / str(flow_id)
-                            if await flow_dir.exists():
-                                await flow_dir.rmdir()
-                        except Exception as exc:  # noqa: BLE001
-                            logger.error(f"Failed to list files for flow {flow_id}: {exc!s}")
-
-                    await session.commit()
-                    logger.debug(f"Successfully deleted orphaned records from {table.__name__}")
 
-            except Exception as exc:  # noqa: BLE001
-                logger.error(f"Error cleaning up orphaned records in {table.__name__}: {exc!s}")
-                await session.rollback()
+async def cleanup_orphaned_records() -> None:
+    """Clean up all records that reference non-existent flows."""
+    await find_orphaned_flows()
+    pending = True
+    while pending:
+        pending = await reconcile_flow_tombstones()
 
 
 class CleanupWorker:
     def __init__(self) -> None:
         self._stop_event = asyncio.Event()
+        self._wakeup_event = asyncio.Event()
         self._task: asyncio.Task | None = None
 
     async def start(self):
@@ -82,6 +172,9 @@ class CleanupWorker:
             await logger.awarning("Cleanup worker is already running")
             return
 
+        # The events of a previous run may belong to another event loop
+        self._stop_event = asyncio.Event()
+        self._wakeup_event = asyncio.Event()
         self._task = asyncio.create_task(self._run())
         await logger.adebug("Started database cleanup worker")
 
@@ -97,40 +190,60 @@ class CleanupWorker:
         self._task = None
         await logger.adebug("Database cleanup worker stopped")
 
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    def notify(self) -> None:
+        """Wake the worker up because flows were deleted."""
+        self._wakeup_event.set()
+
     async def _run(self):
         """Run the cleanup worker until stopped."""
         settings = get_settings_service().settings
+        # Tombstones are processed right away, the first full scan waits for a whole interval
+        last_full_scan = time.monotonic()
         while not self._stop_event.is_set():
+            pending = False
             try:
-                # Clean up any orphaned records
-                await cleanup_orphaned_records()
+                pending = await reconcile_flow_tombstones()
+                if time.monotonic() - last_full_scan >= settings.orphan_full_scan_interval:
+                    last_full_scan = time.monotonic()
+                    pending = await find_orphaned_flows() > 0 or pending
             except Exception as exc:  # noqa: BLE001
                 await logger.aerror(f"Error in cleanup worker: {exc!s}")
 
             try:
-                # Create a task for the timeout
-                sleep_task = asyncio.create_task(asyncio.sleep(settings.public_flow_cleanup_interval))
-                # Create a task for the stop event
-                stop_task = asyncio.create_task(self._stop_event.wait())
-
-                # Wait for either the timeout or the stop event
-                done, pending = await asyncio.wait([sleep_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
-
-                # Cancel any pending tasks
-                for task in pending:
-                    task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await task
-
-                # If the stop event completed, break the loop
-                if stop_task in done:
+                timeout = WAKEUP_DELAY if pending else settings.public_flow_cleanup_interval
+                if await self._wait(timeout):
                     break
-
+                if self._wakeup_event.is_set():
+                    self._wakeup_event.clear()
+                    if await self._wait(WAKEUP_DELAY, wakeup=False):
+                        break
             except Exception as exc:  # noqa: BLE001
                 logger.error(f"Error in cleanup worker sleep: {exc!s}")
                 # Sleep a minimum amount in case of errors
                 await asyncio.sleep(60)
 
+    async def _wait(self, timeout: float, *, wakeup: bool = True) -> bool:
+        """Wait for ``timeout`` seconds, the stop event or, if ``wakeup``, the wakeup event.
+
+        Returns:
+            Whether the worker was stopped.
+        """
+        waiters = [asyncio.create_task(self._stop_event.wait())]
+        if wakeup:
+            waiters.append(asyncio.create_task(self._wakeup_event.wait()))
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await waiter
+        return self._stop_event.is_set()
+
 
 # Create a global instance of the worker
 cleanup_worker = CleanupWorker()
@@ -237,6 +237,7 @@ def register_all_service_factories() -> None:
     from langflow.services.chat import factory as chat_factory
     from langflow.services.database import factory as database_factory
     from langflow.services.job_queue import factory as job_queue_factory
+    from langflow.services.mcp_tool_catalog import factory as mcp_tool_catalog_factory
     from langflow.services.session import factory as session_factory
     from langflow.services.shared_component_cache import factory as shared_component_cache_factory
     from langflow.services.state import factory as state_factory
@@ -246,6 +247,7 @@ def register_all_service_factories() -> None:
     from langflow.services.telemetry import factory as telemetry_factory
     from langflow.services.tracing import factory as tracing_factory
     from langflow.services.variable import factory as variable_factory
+    from langflow.services.webhook_inbox import factory as webhook_inbox_factory
 
     # Register all factories
     service_manager.register_factory(settings_factory.SettingsServiceFactory())
@@ -264,6 +266,8 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(shared_component_cache_factory.SharedComponentCacheServiceFactory())
     service_manager.register_factory(auth_factory.AuthServiceFactory())
     service_manager.register_factory(mcp_composer_factory.MCPComposerServiceFactory())
+    service_manager.register_factory(mcp_tool_catalog_factory.MCPToolCatalogServiceFactory())
+    service_manager.register_factory(webhook_inbox_factory.WebhookInboxServiceFactory())
     service_manager.set_factory_registered()
 
 
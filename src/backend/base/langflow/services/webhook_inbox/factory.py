@@ -0,0 +1,14 @@
+from lfx.services.settings.service import SettingsService
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.webhook_inbox.service import WebhookInboxService
+
+
+class WebhookInboxServiceFactory(ServiceFactory):
+    def __init__(self):
+        super().__init__(WebhookInboxService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return WebhookInboxService(settings_service)
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from lfx.log.logger import logger
+from sqlmodel import col, select
+
+from langflow.services.base import Service
+from langflow.services.database.models.user.crud import get_user_by_id
+from langflow.services.database.models.user.model import UserRead
+from langflow.services.database.models.webhook_delivery.crud import (
+    claim_webhook_delivery,
+    create_webhook_delivery,
+    delete_finished_webhook_deliveries,
+    get_due_webhook_deliveries,
+)
+from langflow.services.database.models.webhook_delivery.model import WebhookDeliveryStatus, WebhookDeliveryTable
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+# Seconds between two looks for retries, replays and deliveries orphaned by a dead worker
+POLL_INTERVAL = 5.0
+# Seconds between two deletions of finished deliveries that are out of the deduplication window
+PRUNE_INTERVAL = 3600.0
+
+
+class WebhookDeliveryNotFoundError(Exception):
+    """Raised when a webhook delivery does not exist or belongs to another user."""
+
+
+class WebhookInboxService(Service):
+    """Durable inbox of webhook requests.
+
+    Accepted webhooks are stored in the ``webhook_delivery`` table before they are acknowledged, deduplicated on an
+    idempotency key per flow. The request that accepted a webhook runs it right away when a slot is free. A
+    dispatcher retries failed deliveries with exponential backoff, runs replayed ones and takes over deliveries whose
+    worker died, once their lease has expired. Each worker runs at most ``webhook_max_concurrency`` deliveries, and
+    at most ``webhook_max_concurrency_per_flow`` of the same flow. Finished deliveries are kept for
+    ``webhook_deduplication_window`` seconds, then the dispatcher deletes them.
+    """
+
+    name = "webhook_inbox_service"
+
+    def __init__(self, settings_service: SettingsService):
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.idempotency_header = settings.webhook_idempotency_header
+        self.deduplication_window = settings.webhook_deduplication_window
+        self.max_concurrency = max(1, settings.webhook_max_concurrency)
+        self.max_concurrency_per_flow = max(1, settings.webhook_max_concurrency_per_flow)
+        self.max_attempts = max(1, settings.webhook_max_attempts)
+        self.retry_backoff = settings.webhook_retry_backoff
+        self.retry_max_backoff = settings.webhook_retry_max_backoff
+        self.delivery_timeout = settings.webhook_delivery_timeout
+        self._running: Counter[UUID] = Counter()
+        self._slot_released = asyncio.Condition()
+        self._wakeup = asyncio.Event()
+        self._in_flight: set[UUID] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._dispatcher: asyncio.Task | None = None
+        self._last_prune: float | None = None
+
+    def idempotency_key(self, headers, body: bytes) -> str:
+        """Return the idempotency header of a webhook request, or a hash of its body when it has none."""
+        if key := headers.get(self.idempotency_header):
+            return f"header:{key}"
+        return f"sha256:{hashlib.sha256(body).hexdigest()}"
+
+    async def accept(
+        self, flow_id: UUID, user_id: UUID | None, body: bytes, idempotency_key: str
+    ) -> tuple[WebhookDeliveryTable, bool]:
+        """Store a webhook request.
+
+        Returns:
+            The delivery and whether it is new. An existing delivery means the request is a duplicate.
+        """
+        delivery = WebhookDeliveryTable(
+            flow_id=flow_id,
+            user_id=user_id,
+            idempotency_key=idempotency_key,
+            payload=body.decode(errors="replace"),
+        )
+        async with session_scope() as session:
+            delivery, created = await create_webhook_delivery(session, delivery)
+            if not created and self._outside_deduplication_window(delivery):
+                # The key is reused long after the previous delivery finished, run it as a new one
+                now = datetime.now(timezone.utc)
+                delivery.user_id = user_id
+                delivery.payload = body.decode(errors="replace")
+                delivery.status = WebhookDeliveryStatus.PENDING
+                delivery.attempts = 0
+                delivery.last_error = None
+                delivery.created_at = delivery.updated_at = delivery.next_attempt_at = now
+                session.add(delivery)
+                created = True
+        if not created:
+            await logger.adebug(f"Ignoring duplicate webhook delivery {delivery.id} of flow {flow_id}")
+        return delivery, created
+
+    def _outside_deduplication_window(self, delivery: WebhookDeliveryTable) -> bool:
+        if delivery.status not in {WebhookDeliveryStatus.SUCCEEDED, WebhookDeliveryStatus.FAILED}:
+            return False
+        created_at = delivery.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - created_at > timedelta(seconds=self.deduplication_window)
+
+    async def deliver(self, delivery: WebhookDeliveryTable) -> None:
+        """Run a delivery once a slot is free, unless another worker already took it."""
+        self._in_flight.add(delivery.id)
+        try:
+            await self._acquire_slot(delivery.flow_id)
+            try:
+                if await self._claim(delivery.id):
+                    await self._run(delivery)
+            finally:
+                await self._release_slot(delivery.flow_id)
+        finally:
+            self._in_flight.discard(delivery.id)
+
+    async def replay(self, delivery_id: UUID, flow_ids: list[UUID]) -> WebhookDeliveryTable:
+        """Queue a finished delivery of one of ``flow_ids`` to run again.
+
+        Raises:
+            WebhookDeliveryNotFoundError: If the delivery does not exist or does not belong to ``flow_ids``.
+            ValueError: If the delivery is still pending or running.
+        """
+        async with session_scope() as session:
+            delivery = await session.get(WebhookDeliveryTable, delivery_id)
+            if delivery is None or delivery.flow_id not in flow_ids:
+                msg = f"Webhook delivery {delivery_id} not found"
+                raise WebhookDeliveryNotFoundError(msg)
+            if delivery.status in {WebhookDeliveryStatus.PENDING, WebhookDeliveryStatus.RUNNING}:
+                msg = f"Webhook delivery {delivery_id} is {delivery.status.value}"
+                raise ValueError(msg)
+            now = datetime.now(timezone.utc)
+            delivery.status = WebhookDeliveryStatus.PENDING
+            delivery.attempts = 0
+            delivery.last_error = None
+            delivery.locked_until = None
+            delivery.next_attempt_at = now
+            delivery.updated_at = now
+            session.add(delivery)
+        self._wakeup.set()
+        return delivery
+
+    def start(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def teardown(self) -> None:
+        tasks = [*self._tasks, *([self._dispatcher] if self._dispatcher else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            try:
+                await self._dispatch_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error dispatching webhook deliveries")
+            try:
+                await self._prune_finished()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error deleting finished webhook deliveries")
+            self._wakeup.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL)
+
+    async def _dispatch_due(self) -> None:
+        free = self.max_concurrency - len(self._tasks)
+        if free <= 0:
+            return
+        async with session_scope() as session:
+            due = await get_due_webhook_deliveries(session, datetime.now(timezone.utc), limit=free * 4)
+        scheduled: Counter[UUID] = Counter()
+        for delivery in due:
+            if len(self._tasks) >= self.max_concurrency:
+                break
+            if delivery.id in self._in_flight:
+                continue
+            if self._running[delivery.flow_id] + scheduled[delivery.flow_id] >= self.max_concurrency_per_flow:
+                continue
+            scheduled[delivery.flow_id] += 1
+            task = asyncio.create_task(self.deliver(delivery))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _prune_finished(self) -> None:
+        now = time.monotonic()
+        if self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        finished_before = datetime.now(timezone.utc) - timedelta(seconds=self.deduplication_window)
+        async with session_scope() as session:
+            deleted = await delete_finished_webhook_deliveries(session, finished_before)
+        if deleted:
+            await logger.adebug(f"Deleted {deleted} finished webhook deliveries")
+
+    def _has_slot(self, flow_id: UUID) -> bool:
+        return self._running.total() < self.max_concurrency and self._running[flow_id] < self.max_concurrency_per_flow
+
+    async def _acquire_slot(self, flow_id: UUID) -> None:
+        async with self._slot_released:
+            await self._slot_released.wait_for(lambda: self._has_slot(flow_id))
+            self._running[flow_id] += 1
+
+    async def _release_slot(self, flow_id: UUID) -> None:
+        async with self._slot_released:
+            self._running[flow_id] -= 1
+            if self._running[flow_id] <= 0:
+                del self._running[flow_id]
+            self._slot_released.notify_all()
+
+    async def _claim(self, delivery_id: UUID) -> bool:
+        now = datetime.now(timezone.utc)
+        async with session_scope() as session:
+            return await claim_webhook_delivery(
+                session, delivery_id, now, now + timedelta(seconds=self.delivery_timeout)
+            )
+
+    async def _run(self, delivery: WebhookDeliveryTable) -> None:
+        try:
+            await asyncio.wait_for(self._run_flow(delivery), timeout=self.delivery_timeout)
+        except asyncio.CancelledError:
+            # Shutting down: hand the delivery back so the next worker does not wait for the lease to expire
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._finish(delivery.id, error="Worker stopped", retry_now=True))
+            raise
+        except Exception as exc:  # noqa: BLE001
+            await logger.awarning(f"Webhook delivery {delivery.id} of flow {delivery.flow_id} failed: {exc}")
+            await self._finish(delivery.id, error=str(exc) or type(exc).__name__)
+        else:
+            await self._finish(delivery.id)
+
+    async def _run_flow(self, delivery: WebhookDeliveryTable) -> None:
+        from langflow.api.v1.endpoints import simple_run_flow
+        from langflow.api.v1.schemas import SimplifiedAPIRequest
+        from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+        from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
+        from langflow.services.deps import get_telemetry_service
+        from langflow.services.telemetry.schema import RunPayload
+
+        try:
+            flow = await get_flow_by_id_or_endpoint_name(str(delivery.flow_id))
+        except HTTPException as exc:
+            msg = f"Flow {delivery.flow_id} not found"
+            raise ValueError(msg) from exc
+        user = None
+        if delivery.user_id is not None:
+            async with session_scope() as session:
+                if (db_user := await get_user_by_id(session, delivery.user_id)) is not None:
+                    user = UserRead.model_validate(db_user, from_attributes=True)
+
+        tweaks = {
+            component["id"]: {"data": delivery.payload}
+            for component in get_all_webhook_components_in_flow(flow.data or {})
+        }
+        input_request = SimplifiedAPIRequest(
+            input_value="", input_type="chat", output_type="chat", tweaks=tweaks, session_id=None
+        )
+        telemetry_service = get_telemetry_service()
+        start_time = time.perf_counter()
+        run_id = str(uuid4())
+        try:
+            await simple_run_flow(flow=flow, input_request=input_request, api_key_user=user, run_id=run_id)
+        except Exception as exc:
+            await telemetry_service.log_package_run(
+                RunPayload(
+                    run_is_webhook=True,
+                    run_seconds=int(time.perf_counter() - start_time),
+                    run_success=False,
+                    run_error_message=str(exc),
+                    run_id=run_id,
+                )
+            )
+            raise
+        await telemetry_service.log_package_run(
+            RunPayload(
+                run_is_webhook=True,
+                run_seconds=int(time.perf_counter() - start_time),
+                run_success=True,
+                run_error_message="",
+                run_id=run_id,
+            )
+        )
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.retry_backoff * 2 ** max(attempts - 1, 0), self.retry_max_backoff)
+
+    async def _finish(self, delivery_id: UUID, *, error: str | None = None, retry_now: bool = False) -> None:
+        now = datetime.now(timezone.utc)
+        async with session_scope() as session:
+            delivery = (
+                await session.exec(select(WebhookDeliveryTable).where(col(WebhookDeliveryTable.id) == delivery_id))
+            ).first()
+            if delivery is None:
+                return
+            delivery.locked_until = None
+            delivery.updated_at = now
+            delivery.last_error = error
+            if error is None:
+                delivery.status = WebhookDeliveryStatus.SUCCEEDED
+            elif retry_now:
+                delivery.status = WebhookDeliveryStatus.PENDING
+                delivery.attempts = max(delivery.attempts - 1, 0)
+                delivery.next_attempt_at = now
+            elif delivery.attempts >= self.max_attempts:
+                delivery.status = WebhookDeliveryStatus.FAILED
+            else:
+                delivery.status = WebhookDeliveryStatus.PENDING
+                delivery.next_attempt_at = now + timedelta(seconds=self._backoff(delivery.attempts))
+            session.add(delivery)
+        # A slot is free again
+        self._wakeup.set()
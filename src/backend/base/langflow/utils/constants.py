@@ -15,12 +15,14 @@ from lfx.utils.constants import (
 
 # Langflow-specific constants
 LANGFLOW_GLOBAL_VAR_HEADER_PREFIX = "x-langflow-global-var-"
+LANGFLOW_CACHE_BYPASS_HEADER = "x-langflow-cache-bypass"
 
 __all__ = [
     "ANTHROPIC_MODELS",
     "CHAT_OPENAI_MODELS",
     "DEFAULT_PYTHON_FUNCTION",
     "DIRECT_TYPES",
+    "LANGFLOW_CACHE_BYPASS_HEADER",
     "LANGFLOW_GLOBAL_VAR_HEADER_PREFIX",
     "LOADERS_INFO",
     "MESSAGE_SENDER_AI",
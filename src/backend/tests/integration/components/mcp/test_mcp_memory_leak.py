@@ -331,17 +331,11 @@ async def test_session_manager_connectivity_validation():
         def __init__(self, should_fail=False):  # noqa: FBT002
             self.should_fail = should_fail
 
-        async def list_tools(self):
+        async def send_ping(self):
             if self.should_fail:
                 msg = "Connection failed"
                 raise Exception(msg)  # noqa: TRY002
 
-            class MockResponse:
-                def __init__(self):
-                    self.tools = ["tool1", "tool2"]
-
-            return MockResponse()
-
     # Test healthy session
     healthy_session = MockSession(should_fail=False)
     is_healthy = await session_manager._validate_session_connectivity(healthy_session)
@@ -352,7 +346,7 @@ async def test_session_manager_connectivity_validation():
     is_healthy = await session_manager._validate_session_connectivity(unhealthy_session)
     assert is_healthy is False
 
-    # Test session that returns None
+    # Test session that cannot be pinged
     class MockNoneSession:
         async def list_tools(self):
             return None
@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from lfx.base.processing.template_renderer import CompiledTemplate
+from lfx.components.processing.parser import ParserComponent
+from lfx.schema.dataframe import DataFrame
+
+TEMPLATE = "Name: {name}, Age: {age}, Score: {score:.2f}, City: {city}"
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "name": [f"user-{i}" for i in range(rows)],
+            "age": rng.integers(18, 90, rows),
+            "score": rng.random(rows),
+            "city": rng.choice(["Paris", "Lisbon", "Recife", "Osaka"], rows),
+        }
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "rows",
+    [10_000, 100_000, pytest.param(1_000_000, marks=pytest.mark.slow)],
+)
+def test_render_dataframe(rows):
+    """Benchmark rendering a template over the rows of a DataFrame."""
+    df = make_frame(rows)
+    compiled = CompiledTemplate(TEMPLATE)
+
+    started = time.perf_counter()
+    text = compiled.render_text(df)
+    elapsed = time.perf_counter() - started
+
+    lines = text.split("\n")
+    assert len(lines) == rows
+    assert lines[-1] == TEMPLATE.format(**df.iloc[-1].to_dict())
+    print(f"{rows} rows rendered in {elapsed:.3f}s")  # noqa: T201
+
+
+@pytest.mark.benchmark
+def test_parser_component_parses_large_dataframes():
+    """Benchmark the Parser component on a 200k-row DataFrame."""
+    df = DataFrame(make_frame(200_000))
+    component = ParserComponent(input_data=df, pattern=TEMPLATE, sep="\n", mode="Parser")
+
+    started = time.perf_counter()
+    message = component.parse_combined_text()
+    elapsed = time.perf_counter() - started
+
+    assert message.text.count("\n") == len(df) - 1
+    print(f"{len(df)} rows parsed in {elapsed:.3f}s")  # noqa: T201
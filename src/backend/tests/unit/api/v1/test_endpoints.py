@@ -108,6 +108,56 @@ async def test_update_component_model_name_options(client: AsyncClient, logged_i
     assert "model_name" not in result["template"]
 
 
+async def test_update_component_reuses_build_config_for_identical_updates(client: AsyncClient, logged_in_headers: dict):
+    code = """
+from lfx.custom import Component
+from lfx.inputs import DropdownInput
+from lfx.template.field.base import Output
+
+UPDATE_CALLS = []
+
+class MemoizedUpdateComponent(Component):
+    display_name = "Memoized Update"
+
+    inputs = [
+        DropdownInput(name="provider", display_name="Provider", options=["a", "b"], value="a", real_time_refresh=True),
+    ]
+    outputs = [
+        Output(display_name="Output", name="output", method="build_output"),
+    ]
+
+    def update_build_config(self, build_config, field_value, field_name=None):
+        UPDATE_CALLS.append(field_value)
+        build_config["provider"]["info"] = f"{field_value}:{len(UPDATE_CALLS)}"
+        return build_config
+
+    def build_output(self) -> str:
+        return self.provider
+"""
+    response = await client.post(
+        "api/v1/custom_component", json=CustomComponentRequest(code=code).model_dump(), headers=logged_in_headers
+    )
+    template = response.json()["data"]["template"]
+    template["provider"]["value"] = "b"
+    request = UpdateCustomComponentRequest(
+        code=code, frontend_node={}, field="provider", field_value="b", template=template
+    )
+
+    async def update(headers: dict) -> str:
+        response = await client.post("api/v1/custom_component/update", json=request.model_dump(), headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        return response.json()["template"]["provider"]["info"]
+
+    first = await update(logged_in_headers)
+    assert await update(logged_in_headers) == first
+    assert await update({**logged_in_headers, "x-langflow-cache-bypass": "1"}) != first
+
+    template["provider"]["value"] = "a"
+    request.field_value = "a"
+    request.template = template
+    assert (await update(logged_in_headers)).startswith("a:")
+
+
 async def test_custom_component_endpoint_returns_metadata(client: AsyncClient, logged_in_headers: dict):
     """Test that the /custom_component endpoint returns metadata with module and code_hash."""
     component_code = """
@@ -194,3 +244,8 @@ class ConsistencyTestComponent(Component):
 
     # assert metadata1["module"] == metadata2["module"], "Module names should be consistent"
     # assert metadata1["code_hash"] == metadata2["code_hash"], "Code hashes should be consistent for identical code"
+
+
+async def test_deprecated_task_status(client: AsyncClient):
+    response = await client.get("api/v1/task/some-task")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
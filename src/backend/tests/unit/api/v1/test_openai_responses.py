@@ -0,0 +1,121 @@
+import json
+import time
+
+import pytest
+from langflow.api.v1.openai_responses import ResponsesStreamTranslator
+from langflow.events.event_manager import StreamEvent
+from langflow.schema import OpenAIResponsesRequest
+
+
+def make_translator(**request_kwargs):
+    request = OpenAIResponsesRequest(model="flow-id", input="Hi", stream=True, **request_kwargs)
+    return ResponsesStreamTranslator(request, "response-id", 0)
+
+
+def message_event(text, *, message_id="message-1", state="partial", content_blocks=None):
+    return StreamEvent(
+        "add_message",
+        {
+            "id": message_id,
+            "text": text,
+            "sender": "Machine",
+            "sender_name": "AI",
+            "properties": {"state": state},
+            "content_blocks": content_blocks or [],
+        },
+    )
+
+
+def token_event(chunk, message_id="message-1"):
+    return StreamEvent("token", {"chunk": chunk, "id": message_id})
+
+
+def streamed_content(sse_events):
+    return "".join(
+        json.loads(event.removeprefix("data: "))["delta"]["content"]
+        for event in sse_events
+        if event.startswith("data: ")
+    )
+
+
+def translate_all(translator, events):
+    return [sse_event for event in events for sse_event in translator.translate(event)]
+
+
+def test_tokens_are_not_duplicated_by_the_first_message_update():
+    translator = make_translator()
+    events = [message_event("Hel"), token_event("Hel"), token_event("lo"), message_event("Hello", state="complete")]
+
+    assert streamed_content(translate_all(translator, events)) == "Hello"
+    assert translator.total_sent == len("Hello")
+
+
+def test_message_updates_only_send_new_content():
+    translator = make_translator()
+    events = [message_event("Step 1"), message_event("Step 1, step 2"), message_event("Other", message_id="message-2")]
+
+    sse_events = translate_all(translator, events)
+
+    assert [json.loads(event.removeprefix("data: "))["delta"]["content"] for event in sse_events] == [
+        "Step 1",
+        ", step 2",
+        "Other",
+    ]
+
+
+def test_user_messages_are_not_streamed():
+    translator = make_translator()
+    event = StreamEvent("add_message", {"id": "1", "text": "Hi", "sender": "User", "sender_name": "User"})
+
+    assert translator.translate(event) == []
+
+
+def test_tool_calls_are_emitted_once():
+    translator = make_translator()
+    steps = [
+        {
+            "title": "Agent Steps",
+            "contents": [{"type": "tool_use", "name": "search", "tool_input": {"q": "x"}, "output": "result"}],
+        }
+    ]
+
+    first = translator.translate(message_event("", content_blocks=steps))
+    second = translator.translate(message_event("", content_blocks=steps))
+
+    assert [event.split("\n", 1)[0] for event in first] == [
+        "event: response.output_item.added",
+        "event: response.function_call_arguments.delta",
+        "event: response.function_call_arguments.done",
+        "event: response.output_item.done",
+    ]
+    done = json.loads(first[-1].split("data: ", 1)[1])
+    assert done["item"] == {
+        "id": "fc_1",
+        "type": "function_call",
+        "status": "completed",
+        "arguments": '{"q": "x"}',
+        "call_id": "call_1",
+        "name": "search",
+    }
+    assert second == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_tokens", [2_000, 8_000])
+def test_long_generation_throughput(num_tokens):
+    """Stream a long generation as an agent does: a token per word plus a growing message update per token."""
+    translator = make_translator()
+    words = [f"word{index} " for index in range(num_tokens)]
+    events = []
+    text = ""
+    for word in words:
+        text += word
+        events.append(token_event(word))
+        events.append(message_event(text))
+
+    start = time.perf_counter()
+    sse_events = translate_all(translator, events)
+    elapsed = time.perf_counter() - start
+
+    assert streamed_content(sse_events) == text
+    print(f"{num_tokens} tokens: {num_tokens / elapsed:,.0f} tokens/s")  # noqa: T201
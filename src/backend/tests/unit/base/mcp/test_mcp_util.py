@@ -121,6 +121,162 @@ class TestMCPSessionManager:
             assert session1 != session2
             assert mock_create.call_count == 2
 
+    async def test_session_ids_are_not_reused(self, session_manager):
+        """A new session must not take the id of a live one after an older session was cleaned up."""
+        connection_params = MagicMock()
+        tasks = [MagicMock(done=MagicMock(return_value=False)) for _ in range(3)]
+
+        with (
+            patch.object(session_manager, "_create_stdio_session") as mock_create,
+            patch.object(session_manager, "_validate_session_connectivity", return_value=False),
+        ):
+            mock_create.side_effect = [(AsyncMock(), task) for task in tasks]
+            await session_manager.get_session("a", connection_params, "stdio")
+            server_key = session_manager._get_server_key(connection_params, "stdio")
+            first_id = next(iter(session_manager.sessions_by_server[server_key]["sessions"]))
+
+            await session_manager.get_session("b", connection_params, "stdio")
+
+        session_ids = list(session_manager.sessions_by_server[server_key]["sessions"])
+        assert len(session_ids) == 1
+        assert session_ids[0] != first_id
+        assert session_manager.get_metrics()[server_key]["sessions_failed"] == 1
+
+    async def test_connectivity_trusts_recently_used_sessions(self, session_manager):
+        session = AsyncMock()
+        now = util.asyncio.get_event_loop().time()
+
+        with patch.object(util, "get_session_ping_interval", return_value=30):
+            assert await session_manager._validate_session_connectivity(session, now) is True
+            session.send_ping.assert_not_called()
+
+            assert await session_manager._validate_session_connectivity(session, now - 60) is True
+            session.send_ping.assert_awaited_once()
+        session.list_tools.assert_not_called()
+
+    async def test_connectivity_rejects_closed_transport(self, session_manager):
+        import anyio
+
+        write_stream, transport_reader = anyio.create_memory_object_stream(0)
+        read_stream = anyio.create_memory_object_stream(0)[1]
+        session = util._PooledClientSession(
+            read_stream, write_stream, limiter=util._RequestLimiter(0), on_tools_changed=lambda: None
+        )
+        assert not session.transport_closed
+
+        # The transport went away
+        transport_reader.close()
+        assert session.transport_closed
+        assert await session_manager._validate_session_connectivity(session) is False
+
+    async def test_connectivity_ping_failures(self, session_manager):
+        from mcp.types import ErrorData
+
+        session = AsyncMock()
+
+        session.send_ping.side_effect = TimeoutError()
+        assert await session_manager._validate_session_connectivity(session) is False
+
+        session.send_ping.side_effect = util.McpError(ErrorData(code=-32601, message="Method not found"))
+        assert await session_manager._validate_session_connectivity(session) is True
+
+        session.send_ping.side_effect = util.McpError(ErrorData(code=-32000, message="Connection closed"))
+        assert await session_manager._validate_session_connectivity(session) is False
+
+        # Any other error means the session cannot be used either
+        session.send_ping.side_effect = util.McpError(ErrorData(code=408, message="Timed out"))
+        assert await session_manager._validate_session_connectivity(session) is False
+        session.send_ping.side_effect = util.ClosedResourceError()
+        assert await session_manager._validate_session_connectivity(session) is False
+
+    async def test_tool_list_is_cached_per_server(self, session_manager):
+        session = AsyncMock()
+        session.list_tools.return_value = MagicMock(tools=["tool"])
+        params = {"url": "http://server", "headers": {}}
+        other_params = {"url": "http://server", "headers": {"authorization": "Bearer other"}}
+
+        with patch.object(util, "get_tool_cache_ttl", return_value=60):
+            assert await session_manager.list_tools(session, params, "streamable_http") == ["tool"]
+            assert await session_manager.list_tools(session, params, "streamable_http") == ["tool"]
+            assert session.list_tools.await_count == 1
+
+            await session_manager.list_tools(session, other_params, "streamable_http")
+            assert session.list_tools.await_count == 2
+
+            session_manager.invalidate_tools(params, "streamable_http")
+            await session_manager.list_tools(session, params, "streamable_http")
+            assert session.list_tools.await_count == 3
+
+        metrics = session_manager.get_metrics()[session_manager._get_server_key(params, "streamable_http")]
+        assert metrics["tool_cache_hits"] == 1
+        assert metrics["tool_cache_misses"] == 2
+
+    async def test_tool_list_cache_can_be_disabled(self, session_manager):
+        session = AsyncMock()
+        session.list_tools.return_value = MagicMock(tools=[])
+        params = {"url": "http://server", "headers": {}}
+
+        with patch.object(util, "get_tool_cache_ttl", return_value=0):
+            await session_manager.list_tools(session, params, "streamable_http")
+            await session_manager.list_tools(session, params, "streamable_http")
+
+        assert session.list_tools.await_count == 2
+
+    async def test_tool_list_changed_notification_invalidates_cache(self, session_manager):
+        import anyio
+        from mcp import types
+
+        session = AsyncMock()
+        session.list_tools.return_value = MagicMock(tools=["tool"])
+        params = {"url": "http://server", "headers": {}}
+        server_key = session_manager._get_server_key(params, "streamable_http")
+        with patch.object(util, "get_tool_cache_ttl", return_value=60):
+            await session_manager.list_tools(session, params, "streamable_http")
+
+        send_stream, receive_stream = anyio.create_memory_object_stream(1)
+        async with send_stream, receive_stream:
+            pooled = session_manager._new_client_session(server_key, receive_stream, send_stream)
+            await pooled._on_message(
+                types.ServerNotification(types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+            )
+
+        assert session_manager.get_cached_tools(params, "streamable_http") is None
+        assert session_manager.get_metrics()[server_key]["tool_cache_invalidations"] == 1
+
+    async def test_request_limiter_caps_requests_in_flight(self):
+        limiter = util._RequestLimiter(1)
+        release = util.asyncio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                await release.wait()
+
+        holder = util.asyncio.create_task(hold())
+        await util.asyncio.sleep(0)
+        waiter = util.asyncio.create_task(hold())
+        await util.asyncio.sleep(0)
+
+        assert (limiter.in_flight, limiter.waiting) == (1, 1)
+        release.set()
+        await util.asyncio.gather(holder, waiter)
+        assert (limiter.in_flight, limiter.waiting) == (0, 0)
+
+    async def test_pings_bypass_the_request_limit(self, session_manager):
+        from mcp import types
+
+        with patch.object(util, "get_max_concurrent_requests_per_server", return_value=1):
+            limiter = session_manager._get_limiter("server")
+        session = util._PooledClientSession(MagicMock(), MagicMock(), limiter=limiter, on_tools_changed=MagicMock())
+
+        with patch.object(util.ClientSession, "send_request", new=AsyncMock(return_value="result")) as send:
+            async with limiter.slot():
+                ping = types.ClientRequest(types.PingRequest(method="ping"))
+                assert await session.send_request(ping, types.EmptyResult) == "result"
+                list_tools = types.ClientRequest(types.ListToolsRequest(method="tools/list"))
+                with pytest.raises(TimeoutError):
+                    await util.asyncio.wait_for(session.send_request(list_tools, types.ListToolsResult), 0.05)
+        assert send.await_count == 1
+
 
 class TestHeaderValidation:
     """Test the header validation functionality."""
@@ -1159,6 +1315,25 @@ class TestMCPSseClientUnit:
             assert sse_client._connection_params["headers"] == expected_headers
             assert sse_client._connection_params["url"] == test_url
 
+    async def test_connect_reuses_cached_tool_list(self, sse_client):
+        """Reconnecting to a server whose tool list is cached neither lists tools nor opens a session."""
+        mock_session = AsyncMock()
+        mock_tool = MagicMock()
+        mock_tool.name = "test_tool"
+        mock_session.list_tools = AsyncMock(return_value=MagicMock(tools=[mock_tool]))
+
+        with (
+            patch.object(sse_client, "validate_url", return_value=(True, "")),
+            patch.object(sse_client, "_get_or_create_session", return_value=mock_session) as mock_get_session,
+            patch.object(util, "get_tool_cache_ttl", return_value=60),
+        ):
+            first = await sse_client.connect_to_server("http://test.url")
+            second = await sse_client.connect_to_server("http://test.url")
+
+        assert [tool.name for tool in first] == [tool.name for tool in second] == ["test_tool"]
+        mock_get_session.assert_awaited_once()
+        mock_session.list_tools.assert_awaited_once()
+
     async def test_headers_passed_to_session_manager(self, sse_client):
         """Test that headers are properly passed to the session manager."""
         test_url = "http://test.url"
@@ -1,4 +1,6 @@
-from unittest.mock import Mock, patch
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 from lfx.components.data_source.url import URLComponent
@@ -7,6 +9,11 @@ from lfx.schema import DataFrame
 from tests.base import ComponentTestBaseWithoutClient
 
 
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
 class TestURLComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
     def component_class(self):
@@ -35,175 +42,123 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         ]
 
     @pytest.fixture
-    def mock_recursive_loader(self):
-        """Mock the RecursiveUrlLoader.load method."""
-        with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
-            yield mock
-
-    def test_url_component_basic_functionality(self, mock_recursive_loader):
+    def site(self, tmp_path, monkeypatch):
+        """Serve the files of a directory from a local HTTP server."""
+        monkeypatch.setattr("lfx.components.data_source.url.DEFAULT_CACHE_DIR", tmp_path / "cache")
+        root = tmp_path / "site"
+        root.mkdir()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(root)))
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        yield root, f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    async def test_url_component_basic_functionality(self, site):
         """Test basic URLComponent functionality."""
-        component = URLComponent()
-        component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
-
-        mock_doc = Mock(
-            page_content="test content",
-            metadata={
-                "source": "https://example.com",
-                "title": "Test Page",
-                "description": "Test Description",
-                "content_type": "text/html",
-                "language": "en",
-            },
+        root, base_url = site
+        (root / "index.html").write_text(
+            "<html lang='en'><head><title>Test Page</title>"
+            "<meta name='description' content='Test Description'></head>"
+            "<body><p>test content</p></body></html>"
         )
-        mock_recursive_loader.return_value = [mock_doc]
+        component = URLComponent()
+        component.set_attributes({"urls": [f"{base_url}/index.html"], "max_depth": 2})
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert isinstance(data_frame, DataFrame)
         assert len(data_frame) == 1
 
         row = data_frame.iloc[0]
-        assert row["text"] == "test content"
-        assert row["url"] == "https://example.com"
+        assert "test content" in row["text"]
+        assert row["url"] == f"{base_url}/index.html"
         assert row["title"] == "Test Page"
         assert row["description"] == "Test Description"
         assert row["content_type"] == "text/html"
         assert row["language"] == "en"
 
-    def test_url_component_multiple_urls(self, mock_recursive_loader):
+    async def test_url_component_multiple_urls(self, site):
         """Test URLComponent with multiple URL inputs."""
-        # Setup component with multiple URLs
+        root, base_url = site
+        (root / "first.html").write_text("<html><head><title>First Page</title></head><body>Content from first URL")
+        (root / "second.html").write_text("<html><head><title>Second Page</title></head><body>Content from second")
         component = URLComponent()
-        urls = ["https://example1.com", "https://example2.com"]
-        component.set_attributes({"urls": urls})
-
-        # Create mock documents for each URL
-        mock_docs = [
-            Mock(
-                page_content="Content from first URL",
-                metadata={
-                    "source": "https://example1.com",
-                    "title": "First Page",
-                    "description": "First Description",
-                    "content_type": "text/html",
-                    "language": "en",
-                },
-            ),
-            Mock(
-                page_content="Content from second URL",
-                metadata={
-                    "source": "https://example2.com",
-                    "title": "Second Page",
-                    "description": "Second Description",
-                    "content_type": "text/html",
-                    "language": "en",
-                },
-            ),
-        ]
-
-        # Configure mock to return both documents
-        mock_recursive_loader.return_value = mock_docs
+        component.set_attributes(
+            {"urls": [f"{base_url}/first.html", f"{base_url}/second.html", f"{base_url}/first.html"]}
+        )
 
-        # Execute component
-        result = component.fetch_content()
+        result = await component.fetch_content()
 
-        # Verify results
         assert isinstance(result, DataFrame)
-        assert len(result) == 4
-
-        # Verify first URL content
-        first_row = result.iloc[0]
-        assert first_row["text"] == "Content from first URL"
-        assert first_row["url"] == "https://example1.com"
-        assert first_row["title"] == "First Page"
-        assert first_row["description"] == "First Description"
-
-        # Verify second URL content
-        second_row = result.iloc[1]
-        assert second_row["text"] == "Content from second URL"
-        assert second_row["url"] == "https://example2.com"
-        assert second_row["title"] == "Second Page"
-        assert second_row["description"] == "Second Description"
-
-    def test_url_component_format_options(self, mock_recursive_loader):
+        assert list(result["title"]) == ["First Page", "Second Page"]
+        assert list(result["url"]) == [f"{base_url}/first.html", f"{base_url}/second.html"]
+
+    async def test_url_component_follows_links_up_to_max_depth(self, site):
+        """Test that links are followed up to the configured depth."""
+        root, base_url = site
+        (root / "index.html").write_text("<html><body><a href='/a.html'>A</a></body></html>")
+        (root / "a.html").write_text("<html><body><a href='/b.html'>B</a></body></html>")
+        (root / "b.html").write_text("<html><body>Page B</body></html>")
+        component = URLComponent()
+
+        component.set_attributes({"urls": [f"{base_url}/"], "max_depth": 1})
+        assert len(await component.fetch_content()) == 1
+
+        component.set_attributes({"urls": [f"{base_url}/"], "max_depth": 3})
+        result = await component.fetch_content()
+        assert list(result["url"]) == [f"{base_url}/", f"{base_url}/a.html", f"{base_url}/b.html"]
+
+        # Only the links starting with the root URL are followed
+        component.set_attributes({"urls": [f"{base_url}/index.html"], "max_depth": 3})
+        assert list((await component.fetch_content())["url"]) == [f"{base_url}/index.html"]
+
+    async def test_url_component_format_options(self, site):
         """Test URLComponent with different format options."""
+        root, base_url = site
+        (root / "index.html").write_text("<html><body>extracted text</body></html>")
         component = URLComponent()
 
-        # Test with Text format
-        component.set_attributes({"urls": ["https://example.com"], "format": "Text"})
-        mock_recursive_loader.return_value = [
-            Mock(
-                page_content="extracted text",
-                metadata={
-                    "source": "https://example.com",
-                    "title": "Test Page",
-                    "description": "Test Description",
-                    "content_type": "text/html",
-                    "language": "en",
-                },
-            )
-        ]
-        data_frame = component.fetch_content()
+        component.set_attributes({"urls": [f"{base_url}/index.html"], "format": "Text"})
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "extracted text"
-        assert data_frame.iloc[0]["content_type"] == "text/html"
 
-        # Test with HTML format
-        component.set_attributes({"urls": ["https://example.com"], "format": "HTML"})
-        mock_recursive_loader.return_value = [
-            Mock(
-                page_content="<html>raw html</html>",
-                metadata={
-                    "source": "https://example.com",
-                    "title": "Test Page",
-                    "description": "Test Description",
-                    "content_type": "text/html",
-                    "language": "en",
-                },
-            )
-        ]
-        data_frame = component.fetch_content()
-        assert data_frame.iloc[0]["text"] == "<html>raw html</html>"
+        component.set_attributes({"urls": [f"{base_url}/index.html"], "format": "HTML"})
+        data_frame = await component.fetch_content()
+        assert data_frame.iloc[0]["text"] == "<html><body>extracted text</body></html>"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
-    def test_url_component_missing_metadata(self, mock_recursive_loader):
-        """Test URLComponent with missing metadata fields."""
+    async def test_url_component_as_message(self, site):
+        """Test the raw content output."""
+        root, base_url = site
+        (root / "index.html").write_text("<html><body>test content</body></html>")
         component = URLComponent()
-        component.set_attributes({"urls": ["https://example.com"]})
+        component.set_attributes({"urls": [f"{base_url}/index.html"]})
 
-        mock_doc = Mock(
-            page_content="test content",
-            metadata={"source": "https://example.com"},  # Only source is provided
-        )
-        mock_recursive_loader.return_value = [mock_doc]
+        message = await component.fetch_content_as_message()
+        assert message.text == "test content"
+        assert message.data["data"][0]["url"] == f"{base_url}/index.html"
 
-        data_frame = component.fetch_content()
-        row = data_frame.iloc[0]
-        assert row["text"] == "test content"
-        assert row["url"] == "https://example.com"
-        assert row["title"] == ""  # Default empty string
-        assert row["description"] == ""  # Default empty string
-        assert row["content_type"] == ""  # Default empty string
-        assert row["language"] == ""  # Default empty string
-
-    def test_url_component_error_handling(self, mock_recursive_loader):
+    async def test_url_component_error_handling(self, site):
         """Test error handling in URLComponent."""
+        _, base_url = site
         component = URLComponent()
 
         # Test empty URLs
         component.set_attributes({"urls": []})
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
-
-        # Test request exception
-        component.set_attributes({"urls": ["https://example.com"]})
-        mock_recursive_loader.side_effect = Exception("Connection error")
-        with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test no documents found
-        mock_recursive_loader.side_effect = None
-        mock_recursive_loader.return_value = []
+        component.set_attributes({"urls": [f"{base_url}/missing.html"], "check_response_status": True})
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
+
+        # Test request failure when not continuing on failure
+        component.set_attributes(
+            {"urls": [f"{base_url}/missing.html"], "check_response_status": True, "continue_on_failure": False}
+        )
+        with pytest.raises(ValueError, match="Failed to fetch"):
+            await component.fetch_content()
 
     def test_url_component_ensure_url(self):
         """Test URLComponent's ensure_url method."""
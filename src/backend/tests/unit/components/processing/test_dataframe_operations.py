@@ -1,7 +1,8 @@
 import pandas as pd
 import pytest
 from lfx.components.processing.dataframe_operations import DataFrameOperationsComponent
-from lfx.schema.dataframe import DataFrame
+from lfx.graph import Graph
+from lfx.schema.dataframe import DataFrame, LazyDataFrame
 
 
 @pytest.fixture
@@ -385,6 +386,65 @@ class TestDataTypes:
         assert len(result) == 2  # "text" and "more_text"
 
 
+class TestLazyExecution:
+    """Test chains of operations computed by the last component of the chain."""
+
+    def test_operations_of_a_lazy_input_run_first(self, component, sample_dataframe):
+        upstream = DataFrameOperationsComponent()
+        upstream.df = sample_dataframe
+        upstream.operation = [{"name": "Filter", "icon": "filter"}]
+        upstream.column_name = "department"
+        upstream.filter_operator = "equals"
+        upstream.filter_value = "IT"
+
+        component.df = LazyDataFrame(sample_dataframe).then(upstream._operation_step("Filter"))
+        component.operation = [{"name": "Sort", "icon": "arrow-up-down"}]
+        component.column_name = "age"
+        component.ascending = False
+
+        result = component.perform_operation()
+
+        assert isinstance(result, DataFrame)
+        assert result["name"].tolist() == ["Alice Brown", "John Doe"]
+        assert len(sample_dataframe) == 5
+
+    async def test_chained_components_defer_to_the_last_one(self, sample_dataframe):
+        add_column = DataFrameOperationsComponent(
+            _id="add_column",
+            df=sample_dataframe,
+            operation=[{"name": "Add Column", "icon": "plus"}],
+            new_column_name="source",
+            new_column_value="crm",
+            lazy_execution=True,
+        )
+        filter_rows = DataFrameOperationsComponent(
+            _id="filter_rows",
+            operation=[{"name": "Filter", "icon": "filter"}],
+            column_name="age",
+            filter_operator="greater than",
+            filter_value="27",
+            lazy_execution=True,
+        )
+        filter_rows.set(df=add_column.perform_operation)
+        head = DataFrameOperationsComponent(
+            _id="head", operation=[{"name": "Head", "icon": "arrow-up"}], num_rows=2, lazy_execution=True
+        )
+        head.set(df=filter_rows.perform_operation)
+
+        graph = Graph(add_column, head)
+        async for _ in graph.async_start():
+            pass
+        results = {vertex.id: vertex.results["output"] for vertex in graph.vertices}
+
+        assert isinstance(results["add_column"], LazyDataFrame)
+        assert [step.name for step in results["filter_rows"].steps] == ["Add Column", "Filter"]
+        output = results["head"]
+        assert isinstance(output, DataFrame)
+        assert output["name"].tolist() == ["Jane Smith", "Bob Johnson"]
+        assert output["source"].tolist() == ["crm", "crm"]
+        assert "source" not in sample_dataframe.columns
+
+
 # Integration test to verify all operators work together
 def test_all_filter_operators_comprehensive():
     """Comprehensive test of all filter operators on the same dataset."""
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from langflow.initial_setup.startup import StartupOrchestrator
+
+
+async def test_independent_phases_run_concurrently():
+    orchestrator = StartupOrchestrator()
+    running: set[str] = set()
+    overlaps: list[set[str]] = []
+
+    def make_phase(name: str):
+        async def phase():
+            running.add(name)
+            await asyncio.sleep(0.05)
+            overlaps.append(set(running))
+            running.discard(name)
+
+        return phase
+
+    orchestrator.add_phase("services", make_phase("services"))
+    orchestrator.add_phase("a", make_phase("a"), depends_on=["services"])
+    orchestrator.add_phase("b", make_phase("b"), depends_on=["services"])
+
+    await orchestrator.run_critical()
+
+    assert {"a", "b"} in overlaps
+    assert all("services" not in overlap or overlap == {"services"} for overlap in overlaps)
+    report = orchestrator.report()
+    assert report.status == "ready"
+    assert [phase.status for phase in report.phases] == ["completed"] * 3
+    assert all(phase.duration is not None for phase in report.phases)
+
+
+async def test_dependencies_run_in_order_and_sync_phases_are_supported():
+    orchestrator = StartupOrchestrator()
+    order: list[str] = []
+
+    async def first():
+        await asyncio.sleep(0.01)
+        order.append("first")
+
+    orchestrator.add_phase("first", first)
+    orchestrator.add_phase("second", lambda: order.append("second"), depends_on=["first"])
+
+    await orchestrator.run_critical()
+
+    assert order == ["first", "second"]
+
+
+async def test_deferred_phases_run_in_background():
+    orchestrator = StartupOrchestrator()
+    release = asyncio.Event()
+    done: list[str] = []
+
+    async def slow():
+        await release.wait()
+        done.append("slow")
+
+    orchestrator.add_phase("critical", lambda: done.append("critical"))
+    orchestrator.add_phase("slow", slow, depends_on=["critical"], critical=False)
+
+    await orchestrator.run_critical()
+    task = orchestrator.start_deferred()
+    await asyncio.sleep(0)
+
+    assert done == ["critical"]
+    assert orchestrator.report().status == "ready"
+
+    release.set()
+    await task
+
+    assert done == ["critical", "slow"]
+    report = orchestrator.report()
+    assert report.status == "completed"
+    assert report.total_duration is not None
+
+
+async def test_critical_failure_is_raised_and_dependents_are_skipped():
+    orchestrator = StartupOrchestrator()
+
+    def broken():
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    orchestrator.add_phase("broken", broken)
+    orchestrator.add_phase("dependent", lambda: None, depends_on=["broken"])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await orchestrator.run_critical()
+
+    phases = {phase.name: phase for phase in orchestrator.report().phases}
+    assert phases["broken"].status == "failed"
+    assert phases["broken"].error == "boom"
+    assert phases["dependent"].status in {"skipped", "pending"}
+    assert orchestrator.report().status == "failed"
+
+
+async def test_deferred_failure_does_not_raise():
+    orchestrator = StartupOrchestrator()
+
+    async def broken():
+        msg = "deferred boom"
+        raise RuntimeError(msg)
+
+    orchestrator.add_phase("broken", broken, critical=False)
+
+    await orchestrator.run_critical()
+    await orchestrator.start_deferred()
+
+    assert orchestrator.report().status == "failed"
+
+
+def test_invalid_dependencies_are_rejected():
+    orchestrator = StartupOrchestrator()
+    orchestrator.add_phase("deferred", lambda: None, critical=False)
+
+    with pytest.raises(ValueError, match="unknown phase"):
+        orchestrator.add_phase("a", lambda: None, depends_on=["missing"])
+    with pytest.raises(ValueError, match="cannot depend on deferred phase"):
+        orchestrator.add_phase("b", lambda: None, depends_on=["deferred"])
+    with pytest.raises(ValueError, match="already registered"):
+        orchestrator.add_phase("deferred", lambda: None)
@@ -0,0 +1,110 @@
+from langflow.interface.editor_sessions import EditorSession, EditorSessionCache
+
+COMPONENT_CODE = """
+from lfx.custom import Component
+from lfx.inputs import MessageTextInput
+from lfx.template.field.base import Output
+
+class EditorSessionComponent(Component):
+    display_name = "Editor Session Component"
+
+    inputs = [
+        MessageTextInput(display_name="Input", name="input_value"),
+    ]
+    outputs = [
+        Output(display_name="Output", name="output", method="build_output"),
+    ]
+
+    def build_output(self) -> str:
+        return self.input_value
+"""
+
+
+def test_get_reuses_session_per_user_and_code():
+    cache = EditorSessionCache(max_sessions=4, ttl=60)
+
+    session = cache.get(COMPONENT_CODE, "user-1")
+
+    assert cache.get(COMPONENT_CODE, "user-1") is session
+    assert cache.get(COMPONENT_CODE, "user-2") is not session
+    assert cache.get(COMPONENT_CODE + "\n", "user-1") is not session
+    assert len(cache) == 3
+
+
+def test_disabled_cache_builds_component_every_time():
+    cache = EditorSessionCache(max_sessions=0)
+
+    assert cache.get(COMPONENT_CODE, "user-1") is not cache.get(COMPONENT_CODE, "user-1")
+    assert len(cache) == 0
+
+
+def test_discard_and_invalidate_user():
+    cache = EditorSessionCache(max_sessions=4, ttl=60)
+    session = cache.get(COMPONENT_CODE, "user-1")
+    other_user_session = cache.get(COMPONENT_CODE, "user-2")
+
+    cache.discard(COMPONENT_CODE, "user-1")
+    assert cache.get(COMPONENT_CODE, "user-1") is not session
+
+    cache.invalidate_user("user-1")
+    assert len(cache) == 1
+    assert cache.get(COMPONENT_CODE, "user-2") is other_user_session
+
+
+def test_changed_fields_only_reports_updates_since_last_applied():
+    session = EditorSessionCache(max_sessions=1).get(COMPONENT_CODE, "user-1")
+    template = {"input_value": {"value": "a"}, "api_key": {"value": "KEY", "load_from_db": True}, "_type": "x"}
+
+    assert session.changed_fields(template) == ["input_value", "api_key"]
+    session.mark_applied(template, ["input_value", "api_key"])
+    assert session.changed_fields(template) == []
+
+    template["api_key"]["load_from_db"] = False
+    template["input_value"]["value"] = "b"
+    assert session.changed_fields(template) == ["input_value", "api_key"]
+
+
+def test_session_is_rebuilt_when_template_lacks_applied_fields():
+    cache = EditorSessionCache(max_sessions=1)
+    template = {"input_value": {"value": "a"}, "api_key": {"value": "KEY"}, "_type": "x"}
+    session = cache.get(COMPONENT_CODE, "user-1", template)
+    session.mark_applied(template, ["input_value", "api_key"])
+
+    assert cache.get(COMPONENT_CODE, "user-1", template) is session
+    assert cache.get(COMPONENT_CODE, "user-1", {**template, "extra": {"value": 1}}) is session
+
+    del template["api_key"]
+    rebuilt = cache.get(COMPONENT_CODE, "user-1", template)
+    assert rebuilt is not session
+    assert rebuilt.changed_fields(template) == ["input_value"]
+    assert cache.get(COMPONENT_CODE, "user-1", template) is rebuilt
+
+
+def test_build_configs_are_memoized_by_field_value_and_other_fields():
+    session = EditorSessionCache(max_sessions=1).get(COMPONENT_CODE, "user-1")
+    template = {"provider": {"value": "OpenAI", "options": ["OpenAI"]}, "model": {"value": "gpt"}}
+    key = EditorSession.build_config_key(template, "provider", "OpenAI")
+
+    assert session.get_build_config(key) is None
+    session.set_build_config(key, {"model": {"value": "gpt", "options": ["gpt"]}})
+
+    cached = session.get_build_config(key)
+    assert cached == {"model": {"value": "gpt", "options": ["gpt"]}}
+    cached["model"]["options"].append("mutated")
+    assert session.get_build_config(key)["model"]["options"] == ["gpt"]
+
+    assert EditorSession.build_config_key(template, "provider", "OpenAI") == key
+    assert EditorSession.build_config_key(template, "provider", "Anthropic") != key
+    # The options and other attributes of the fields are part of the key, like their values
+    template["provider"]["options"] = ["OpenAI", "Anthropic"]
+    assert EditorSession.build_config_key(template, "provider", "OpenAI") != key
+    template["model"]["value"] = "other"
+    assert EditorSession.build_config_key(template, "provider", "OpenAI") != key
+    assert EditorSession.build_config_key({"x": {"value": object()}}, "x", None) is None
+
+
+def test_refresh_button_updates_are_not_memoized():
+    template = {"model": {"value": "gpt", "options": ["gpt"], "refresh_button": True}, "api_key": {"value": ""}}
+
+    assert EditorSession.build_config_key(template, "model", "gpt") is None
+    assert EditorSession.build_config_key(template, "api_key", "") is not None
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langflow.services.cache import warm_start
+from langflow.services.cache.disk import AsyncDiskCache
+from lfx.interface.components import component_cache
+from lfx.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+async def disk_cache(cache_dir):
+    cache = AsyncDiskCache(cache_dir)
+    yield cache
+    await cache.teardown()
+
+
+class TestAsyncDiskCache:
+    async def test_entries_survive_restarts(self, disk_cache, cache_dir):
+        await disk_cache.set("key", {"value": 1})
+        await disk_cache.teardown()
+
+        restarted = AsyncDiskCache(cache_dir)
+        assert await restarted.get("key") == {"value": 1}
+        await restarted.teardown()
+
+    async def test_entries_of_another_version_are_skipped_not_cleared(self, disk_cache, cache_dir):
+        await disk_cache.set("key", "value")
+
+        other_version = AsyncDiskCache(cache_dir)
+        other_version.version = "0:other"
+        assert await other_version.get("key") is CACHE_MISS
+        await other_version.teardown()
+
+        assert await AsyncDiskCache(cache_dir).get("key") == "value"
+
+    async def test_namespaces_are_isolated(self, disk_cache):
+        other = disk_cache.namespaced("other")
+        await disk_cache.set("key", "default")
+        await other.set("key", "other")
+
+        await other.clear()
+
+        assert await other.get("key") is CACHE_MISS
+        assert await disk_cache.get("key") == "default"
+        assert await disk_cache.contains("key")
+        assert not await other.contains("key")
+
+    async def test_expired_entries(self, cache_dir):
+        cache = AsyncDiskCache(cache_dir, expiration_time=0)
+        await cache.set("key", "value")
+
+        assert await cache.get("key") is CACHE_MISS
+        assert await cache.namespaced("langflow", expiration_time=None).get("key") is CACHE_MISS
+        await cache.teardown()
+
+    async def test_hot_tier_skips_the_disk(self, cache_dir):
+        cache = AsyncDiskCache(cache_dir, hot_entries=1)
+        value = {"value": 1}
+        await cache.set("a", value)
+
+        with patch.object(cache.cache, "get", side_effect=AssertionError("read from disk")):
+            assert await cache.get("a") is value
+
+        await cache.set("b", "other")
+        assert await cache.get("a") == value
+        assert await cache.get("a") is not value
+        await cache.teardown()
+
+    async def test_byte_budget_bounds_the_directory(self, cache_dir):
+        cache = AsyncDiskCache(cache_dir, size_limit=400_000, hot_entries=0)
+        payload = b"x" * 100_000
+
+        for index in range(10):
+            await cache.set(f"key-{index}", payload)
+
+        assert await cache.get("key-9") == payload
+        assert await cache.get("key-0") is CACHE_MISS
+        assert cache.cache.volume() <= 500_000
+        await cache.teardown()
+
+    async def test_unpicklable_values_are_kept_in_memory(self, disk_cache):
+        value = {"lock": threading.Lock()}
+
+        await disk_cache.set("key", value)
+
+        assert await disk_cache.get("key") is value
+        assert "langflow:key" not in disk_cache.cache
+
+    async def test_upsert_merges_dicts(self, disk_cache):
+        await disk_cache.set("key", {"a": 1})
+
+        await asyncio.wait_for(disk_cache.upsert("key", {"b": 2}), timeout=5)
+
+        assert await disk_cache.get("key") == {"a": 1, "b": 2}
+
+
+class TestWarmStart:
+    @pytest.fixture
+    def settings_service(self, tmp_path):
+        components = tmp_path / "components"
+        components.mkdir()
+        (components / "custom.py").write_text("# component")
+        return SimpleNamespace(
+            settings=SimpleNamespace(
+                components_path=[str(components)],
+                components_index_path=None,
+                lazy_load_components=False,
+            )
+        )
+
+    @pytest.fixture(autouse=True)
+    def reset_component_cache(self):
+        previous = component_cache.all_types_dict
+        component_cache.all_types_dict = None
+        yield
+        component_cache.all_types_dict = previous
+
+    async def test_types_are_loaded_from_the_disk_cache(self, disk_cache, settings_service):
+        types = {"inputs": {"ChatInput": {"template": {}}}}
+
+        async def build(*_args):
+            component_cache.all_types_dict = types
+            return types
+
+        with (
+            patch.object(warm_start, "get_cache_service", return_value=disk_cache),
+            patch.object(warm_start, "get_and_cache_all_types_dict", AsyncMock(side_effect=build)) as mock_build,
+        ):
+            assert await warm_start.warm_start_types_dict(settings_service) == types
+            component_cache.all_types_dict = None
+            restarted = AsyncDiskCache(disk_cache.cache.directory)
+            mock_get_cache = patch.object(warm_start, "get_cache_service", return_value=restarted)
+            with mock_get_cache:
+                assert await warm_start.warm_start_types_dict(settings_service) == types
+            await restarted.teardown()
+
+        mock_build.assert_awaited_once()
+        assert component_cache.all_types_dict == types
+
+    def test_fingerprint_follows_component_files(self, settings_service):
+        before = warm_start.component_types_fingerprint(settings_service)
+        component_file = f"{settings_service.settings.components_path[0]}/custom.py"
+        with open(component_file, "a") as file:  # noqa: PTH123
+            file.write("\n# changed")
+
+        assert warm_start.component_types_fingerprint(settings_service) != before
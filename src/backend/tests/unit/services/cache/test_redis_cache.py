@@ -0,0 +1,146 @@
+import pickle
+
+import dill
+import pytest
+from langflow.services.cache import codec as codec_module
+from langflow.services.cache.codec import CacheCodec, CacheCodecError, IncompatibleCacheEntryError
+from langflow.services.cache.service import RedisCache
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph.graph.base import Graph
+from lfx.services.cache.utils import CACHE_MISS
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_cache():
+    cache = RedisCache(compression="zstd", compression_threshold=64)
+    cache._client = fakeredis.aioredis.FakeRedis()
+    return cache
+
+
+@pytest.fixture
+def graph():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output, flow_id="flow", flow_name="Flow", user_id="user")
+    graph.session_id = "session"
+    return graph.prepare()
+
+
+class TestCacheCodec:
+    @pytest.mark.parametrize("value", [None, True, 1, 1.5, "text", [1, "a"], {"a": {"b": [None]}}])
+    def test_plain_values_use_json(self, value):
+        codec = CacheCodec()
+
+        payload = codec.encode(value)
+
+        assert payload[4] == codec_module.FORMAT_JSON
+        assert codec.decode(payload) == value
+
+    @pytest.mark.parametrize("value", [(1, 2), {1: "a"}, {"a": {1, 2}}, b"bytes"])
+    def test_other_values_are_pickled(self, value):
+        codec = CacheCodec()
+
+        payload = codec.encode(value)
+
+        assert payload[4] == codec_module.FORMAT_PICKLE
+        assert codec.decode(payload) == value
+
+    @pytest.mark.parametrize("compression", ["zstd", "lz4"])
+    def test_large_payloads_are_compressed(self, compression):
+        codec = CacheCodec(compression=compression, compression_threshold=64)
+        value = {"text": "x" * 10_000}
+
+        payload = codec.encode(value)
+
+        assert len(payload) < 1_000
+        assert CacheCodec().decode(payload) == value
+        metrics = codec.get_metrics()["encoded_json"]
+        assert metrics["count"] == 1
+        assert metrics["stored_bytes"] < metrics["raw_bytes"]
+
+    def test_pickles_of_another_version_are_incompatible(self):
+        payload = CacheCodec().encode((1, 2))
+        other_version = CacheCodec()
+        other_version.version = b"1:0.0.0"
+
+        with pytest.raises(IncompatibleCacheEntryError):
+            other_version.decode(payload)
+
+    def test_legacy_and_corrupted_payloads(self):
+        codec = CacheCodec()
+
+        with pytest.raises(IncompatibleCacheEntryError):
+            codec.decode(dill.dumps({"a": 1}))
+        with pytest.raises(CacheCodecError):
+            codec.decode(codec.encode({"a": 1})[:-2])
+
+    def test_unpicklable_values(self):
+        with pytest.raises(TypeError):
+            CacheCodec().encode({"generator": (item for item in [1]), "key": (1,)})
+
+    def test_graph_round_trip(self, graph):
+        codec = CacheCodec()
+
+        decoded = codec.decode(codec.encode({"result": graph, "type": Graph}))
+
+        restored = decoded["result"]
+        assert decoded["type"] is Graph
+        assert [vertex.id for vertex in restored.vertices] == [vertex.id for vertex in graph.vertices]
+        assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+        assert restored.flow_id == "flow"
+        assert restored.session_id == "session"
+        assert restored._run_queue == graph._run_queue
+
+    def test_graph_outlives_its_vertex_results(self, graph):
+        vertex = graph.get_vertex("chat_input")
+        vertex.built = True
+        vertex.results = {"message": "hello"}
+        payload = CacheCodec().encode(graph)
+
+        assert CacheCodec().decode(payload).get_vertex("chat_input").results == {"message": "hello"}
+
+        other_version = CacheCodec()
+        other_version.version = b"1:0.0.0"
+        restored = other_version.decode(payload)
+        assert not restored.get_vertex("chat_input").built
+        assert restored.get_vertex("chat_input").results == {}
+
+
+class TestRedisCache:
+    async def test_set_and_get(self, redis_cache):
+        await redis_cache.set("plain", {"a": [1, 2]})
+        await redis_cache.set("pickled", {"a": (1, 2)})
+
+        assert await redis_cache.get("plain") == {"a": [1, 2]}
+        assert await redis_cache.get("pickled") == {"a": (1, 2)}
+        assert await redis_cache.get("missing") is CACHE_MISS
+        assert set(redis_cache.get_metrics()) == {"encoded_json", "encoded_pickle", "decoded_json", "decoded_pickle"}
+
+    async def test_large_values_are_decoded_off_the_event_loop(self, redis_cache):
+        redis_cache.offload_threshold = 0
+        await redis_cache.set("key", {"a": "b" * 1_000})
+
+        assert await redis_cache.get("key") == {"a": "b" * 1_000}
+
+    async def test_incompatible_entries_are_discarded(self, redis_cache):
+        await redis_cache._client.set("legacy", pickle.dumps({"a": 1}))
+
+        assert await redis_cache.get("legacy") is CACHE_MISS
+        assert not await redis_cache.contains("legacy")
+
+    async def test_upsert_merges_dicts(self, redis_cache):
+        await redis_cache.set("key", {"a": 1})
+        await redis_cache.upsert("key", {"b": 2})
+
+        assert await redis_cache.get("key") == {"a": 1, "b": 2}
+
+    async def test_graph_is_cached(self, redis_cache, graph):
+        await redis_cache.set("flow", {"result": graph, "type": Graph})
+
+        cached = await redis_cache.get("flow")
+
+        assert [vertex.id for vertex in cached["result"].vertices] == ["chat_input", "chat_output"]
+        assert redis_cache.get_metrics()["encoded_graph"]["count"] == 1
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.mcp_tool_catalog.model import MCPToolCatalogTable
+from langflow.services.deps import session_scope
+from langflow.services.mcp_tool_catalog import service as catalog_module
+from langflow.services.mcp_tool_catalog.service import MCPToolCatalogService
+from sqlmodel import delete, select
+
+
+@pytest.fixture
+def schema_builds(monkeypatch):
+    calls = []
+
+    def fake_schema(flow_data):
+        calls.append(flow_data)
+        if flow_data.get("broken"):
+            msg = "broken flow"
+            raise ValueError(msg)
+        return {"type": "object", "properties": {}, "required": []}
+
+    monkeypatch.setattr(catalog_module, "json_schema_from_flow_data", fake_schema)
+    return calls
+
+
+@pytest.fixture
+async def flows(active_user):
+    async with session_scope() as session:
+        created = [
+            Flow(name="Weather Report", user_id=active_user.id, data={"nodes": [], "edges": []}),
+            Flow(name="Summarizer", action_name="summarize text", user_id=active_user.id, data={"nodes": []}),
+            Flow(name="Broken", user_id=active_user.id, data={"broken": True}),
+        ]
+        session.add_all(created)
+        await session.commit()
+        for flow in created:
+            await session.refresh(flow)
+    yield created
+    async with session_scope() as session:
+        await session.exec(delete(MCPToolCatalogTable))
+        for flow in created:
+            await session.exec(delete(Flow).where(Flow.id == flow.id))
+
+
+async def load_light_flows(session, flows):
+    stmt = select(Flow.id, Flow.name, Flow.action_name, Flow.user_id, Flow.updated_at).where(
+        Flow.id.in_([flow.id for flow in flows])
+    )
+    return (await session.exec(stmt)).all()
+
+
+async def test_entries_are_computed_once_and_persisted(flows, schema_builds):
+    service = MCPToolCatalogService()
+    async with session_scope() as session:
+        entries = await service.get_entries(session, await load_light_flows(session, flows))
+
+    assert len(schema_builds) == 3
+    weather, summarizer, broken = (entries[flow.id] for flow in flows)
+    assert (weather.tool_name, weather.action_tool_name) == ("weather_report", "weather_report")
+    assert (summarizer.tool_name, summarizer.action_tool_name) == ("summarizer", "summarize_text")
+    assert broken.input_schema is None
+
+    async with session_scope() as session:
+        await service.get_entries(session, await load_light_flows(session, flows))
+        # A fresh service instance reads the persisted entries instead of rebuilding the schemas
+        await MCPToolCatalogService().get_entries(session, await load_light_flows(session, flows))
+    assert len(schema_builds) == 3
+
+
+async def test_saved_flow_is_recomputed(flows, schema_builds):
+    service = MCPToolCatalogService()
+    async with session_scope() as session:
+        await service.get_entries(session, await load_light_flows(session, flows))
+
+    async with session_scope() as session:
+        flow = await session.get(Flow, flows[0].id)
+        flow.name = "Forecast"
+        flow.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+        session.add(flow)
+
+    async with session_scope() as session:
+        entries = await service.get_entries(session, await load_light_flows(session, flows))
+
+    assert len(schema_builds) == 4
+    assert entries[flows[0].id].tool_name == "forecast"
+
+
+async def test_find_flow_uses_index_and_falls_back_to_scan(flows, active_user, schema_builds):
+    service = MCPToolCatalogService()
+    async with session_scope() as session:
+        # Not cataloged yet: found by scanning and added to the catalog
+        flow = await service.find_flow(session, "summarize_text", active_user.id, is_action=True)
+        assert flow.id == flows[1].id
+        assert len(schema_builds) == 1
+
+    async with session_scope() as session:
+        flow = await service.find_flow(session, "summarize_text", str(active_user.id), is_action=True)
+        assert flow.id == flows[1].id
+        assert await service.find_flow(session, "summarize_text", active_user.id) is None
+        assert (await service.find_flow(session, "summarizer", active_user.id)).id == flows[1].id
+    assert len(schema_builds) == 1
+
+
+def test_entries_are_deleted_with_their_flow():
+    (foreign_key,) = MCPToolCatalogTable.__table__.c.flow_id.foreign_keys
+
+    assert foreign_key.ondelete == "CASCADE"
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.state import service as state_module
+from langflow.services.state.service import InMemoryStateService
+
+
+def make_service(ttl: int = 0, **kwargs) -> InMemoryStateService:
+    return InMemoryStateService(SimpleNamespace(settings=SimpleNamespace(state_run_ttl=ttl)), **kwargs)
+
+
+class TestInMemoryStateService:
+    def test_update_and_append(self):
+        service = make_service()
+
+        service.update_state("answer", 1, run_id="run")
+        service.append_state("answer", 2, run_id="run")
+        service.append_state("items", "a", run_id="run")
+
+        assert service.get_state("answer", "run") == [1, 2]
+        assert service.get_state("items", "run") == ["a"]
+        assert service.get_state("missing", "run") == ""
+        assert service.get_state("answer", "other-run") == ""
+
+    def test_snapshots_are_immutable(self):
+        service = make_service()
+        service.append_state("items", "a", run_id="run")
+
+        snapshot = service.get_snapshot("run")
+        service.get_state("items", "run").append("mutated")
+        service.append_state("items", "b", run_id="run")
+
+        assert list(snapshot["items"]) == ["a"]
+        assert service.get_state("items", "run") == ["a", "b"]
+        with pytest.raises(TypeError):
+            snapshot["items"] = ()
+
+    def test_concurrent_appends_are_not_lost(self):
+        service = make_service(shard_count=4)
+        run_ids = [f"run-{i}" for i in range(8)]
+
+        def append_many(run_id):
+            for value in range(200):
+                service.append_state("values", value, run_id=run_id)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append_many, run_ids * 2))
+
+        for run_id in run_ids:
+            assert len(service.get_state("values", run_id)) == 400
+
+    def test_observers(self):
+        service = make_service()
+        observer = MagicMock()
+        service.subscribe("key", observer)
+        service.subscribe("key", observer)
+
+        service.update_state("key", "value", run_id="run")
+        service.append_state("key", "more", run_id="run")
+        service.unsubscribe("key", observer)
+        service.update_state("key", "ignored", run_id="run")
+
+        assert observer.call_args_list == [
+            (("key", "value"), {"append": False}),
+            (("key", "more"), {"append": True}),
+        ]
+
+    def test_observers_are_called_after_the_write(self):
+        service = make_service()
+        seen = []
+
+        def observer(key, new_state, *, append):
+            seen.append((new_state, append, service.get_state(key, "run")))
+
+        def failing_observer(*_args, **_kwargs):
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        service.subscribe("key", failing_observer)
+        service.subscribe("key", observer)
+        service.update_state("key", 1, run_id="run")
+        assert seen == [(1, False, 1)]
+        service.append_state("key", 2, run_id="run")
+        assert seen == [(1, False, 1), (2, True, [1, 2])]
+
+    def test_clear_state(self):
+        service = make_service()
+        service.update_state("key", "value", run_id="run")
+
+        service.clear_state("run")
+
+        assert service.get_state("key", "run") == ""
+
+    def test_stale_runs_are_dropped(self):
+        now = 1000.0
+        with patch.object(state_module.time, "monotonic", side_effect=lambda: now):
+            service = make_service(ttl=10, shard_count=1)
+            service.update_state("key", "old", run_id="stale")
+            now += 5
+            service.update_state("key", "value", run_id="active")
+            now += 6
+
+            assert service.get_state("key", "stale") == ""
+            assert service.get_state("key", "active") == "value"
+
+            service.append_state("key", "new", run_id="stale")
+            assert service.get_state("key", "stale") == ["new"]
+
+            now += state_module.SWEEP_INTERVAL
+            service.update_state("key", "value", run_id="other")
+            assert set(service._shards[0].runs) == {"other"}
+
+
+async def test_run_state_is_cleared_when_the_graph_ends(monkeypatch):
+    from lfx.graph.graph import base as graph_module
+    from lfx.graph.graph.base import Graph
+
+    service = make_service()
+    monkeypatch.setattr(graph_module, "get_state_service", lambda: service)
+    graph = Graph()
+    graph.set_run_id("run")
+    service.update_state("key", "value", run_id="run")
+    service.update_state("key", "value", run_id="other-run")
+
+    await graph.end_all_traces()
+
+    assert service.get_state("key", "run") == ""
+    assert service.get_state("key", "other-run") == "value"
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+from langflow.services.task.backends.anyio import AnyIOBackend, TaskPriority
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("Timed out waiting for the tasks")
+
+
+async def test_tasks_run_at_most_max_concurrency_at_once():
+    backend = AnyIOBackend(max_concurrency=2)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return "done"
+
+    task_ids = [(await backend.launch_task(job))[0] for _ in range(5)]
+    await wait_for(lambda: running == 2)
+    metrics = backend.get_metrics()
+    assert metrics["queued"] == 3
+    assert metrics["queued_by_priority"]["normal"] == 3
+
+    release.set()
+    await wait_for(lambda: all(backend.get_task(task_id).ready() for task_id in task_ids))
+    assert peak == 2
+    assert {backend.get_task(task_id).status for task_id in task_ids} == {"SUCCESS"}
+    assert backend.get_task(task_ids[0]).result == "done"
+    assert backend.get_metrics()["succeeded"] == 5
+
+
+async def test_higher_priority_lanes_start_first():
+    backend = AnyIOBackend(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def blocker():
+        await release.wait()
+
+    async def job(name):
+        order.append(name)
+
+    await backend.launch_task(blocker)
+    await backend.launch_task(job, "low", priority=TaskPriority.LOW)
+    await backend.launch_task(job, "normal")
+    _, last = await backend.launch_task(job, "high", priority=TaskPriority.HIGH)
+
+    release.set()
+    await wait_for(last.ready)
+    await wait_for(lambda: len(order) == 3)
+    assert order == ["high", "normal", "low"]
+
+
+async def test_cancel_queued_and_running_tasks():
+    backend = AnyIOBackend(max_concurrency=1)
+
+    async def job():
+        await asyncio.sleep(60)
+
+    running_id, running = await backend.launch_task(job)
+    queued_id, queued = await backend.launch_task(job)
+    await wait_for(lambda: running.status == "STARTED")
+
+    assert backend.cancel_task(queued_id) is True
+    assert queued.status == "REVOKED"
+    assert backend.get_metrics()["queued"] == 0
+
+    assert backend.cancel_task(running_id) is True
+    await wait_for(running.ready)
+    assert running.status == "REVOKED"
+    assert backend.cancel_task(running_id) is False
+    assert backend.get_metrics()["cancelled"] == 2
+
+
+async def test_failed_tasks_keep_their_traceback():
+    backend = AnyIOBackend()
+
+    async def job():
+        msg = "boom"
+        raise ValueError(msg)
+
+    task_id, task = await backend.launch_task(job)
+    await wait_for(task.ready)
+    assert backend.get_task(task_id).status == "FAILURE"
+    assert "raise ValueError" in task.traceback
+    assert backend.get_metrics()["failed"] == 1
+
+
+@pytest.mark.parametrize(("result_ttl", "max_results", "kept"), [(3600.0, 2, 2), (0.0, 10, 0)])
+async def test_finished_results_are_dropped_by_ttl_and_count(result_ttl, max_results, kept):
+    backend = AnyIOBackend(result_ttl=result_ttl, max_results=max_results)
+
+    async def job():
+        return 1
+
+    launched = [await backend.launch_task(job) for _ in range(4)]
+    await wait_for(lambda: all(task.ready() for _, task in launched))
+
+    remaining = [task_id for task_id, _ in launched if backend.get_task(task_id) is not None]
+    assert remaining == [task_id for task_id, _ in launched][len(launched) - kept :]
+    assert backend.get_metrics()["finished"] == kept
+    assert len(backend.tasks) == kept
@@ -5,13 +5,22 @@ from datetime import timezone
 from uuid import uuid4
 
 import pytest
+from langflow.api.utils import cascade_delete_flow
+from langflow.api.utils import core as api_utils_core
 from langflow.services.database.models.flow import Flow as FlowTable
+from langflow.services.database.models.flow_tombstone import FlowTombstoneTable
+from langflow.services.database.models.folder.model import Folder
 from langflow.services.database.models.message.model import MessageTable
+from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 from langflow.services.task.temp_flow_cleanup import (
     CleanupWorker,
+    _delete_flow_records,
     cleanup_orphaned_records,
+    find_orphaned_flows,
+    reconcile_flow_tombstones,
 )
+from sqlmodel import select
 
 
 @pytest.mark.usefixtures("client")
@@ -117,3 +126,126 @@ async def test_cleanup_worker_run_with_exception(mocker):
     mock_logger.adebug.assert_any_call("Started database cleanup worker")
     mock_logger.adebug.assert_any_call("Stopping database cleanup worker...")
     mock_logger.adebug.assert_any_call("Database cleanup worker stopped")
+
+
+def make_message(flow_id) -> MessageTable:
+    return MessageTable(
+        id=uuid4(),
+        flow_id=flow_id,
+        sender="test_user",
+        sender_name="Test User",
+        timestamp=datetime.datetime.now(timezone.utc),
+        session_id=str(uuid4()),
+    )
+
+
+@pytest.mark.usefixtures("client")
+async def test_cascade_delete_flow_records_a_tombstone_cleaned_up_by_the_reconciler():
+    storage_service = get_storage_service()
+    flow_id = uuid4()
+
+    async with session_scope() as session:
+        session.add(FlowTable(id=flow_id, name="Deleted Flow", data="null"))
+        messages = [make_message(flow_id) for _ in range(3)]
+        session.add_all(messages)
+    await storage_service.save_file(str(flow_id), "test.json", b"test data")
+
+    async with session_scope() as session:
+        await cascade_delete_flow(session, flow_id)
+    async with session_scope() as session:
+        assert await session.get(FlowTombstoneTable, flow_id) is not None
+
+    assert await reconcile_flow_tombstones() is False
+
+    async with session_scope() as session:
+        assert await session.get(FlowTombstoneTable, flow_id) is None
+        for message in messages:
+            assert await session.get(MessageTable, message.id) is None
+    assert not await (storage_service.data_dir / str(flow_id)).exists()
+
+
+@pytest.mark.usefixtures("client")
+async def test_cascade_delete_flow_deletes_messages_without_cleanup_worker(monkeypatch):
+    # e.g. flows deleted by the flow runner, outside the server
+    monkeypatch.setattr(api_utils_core, "cleanup_worker", CleanupWorker())
+    flow_id = uuid4()
+    async with session_scope() as session:
+        session.add(FlowTable(id=flow_id, name="Deleted Flow", data="null"))
+        message = make_message(flow_id)
+        session.add(message)
+
+    async with session_scope() as session:
+        await cascade_delete_flow(session, flow_id)
+    async with session_scope() as session:
+        assert await session.get(MessageTable, message.id) is None
+        assert await session.get(FlowTombstoneTable, flow_id) is not None
+
+
+async def test_deleting_a_user_records_tombstones_for_their_flows(client, logged_in_headers_super_user):
+    flow_id = uuid4()
+    async with session_scope() as session:
+        user = User(username=f"deleted-{uuid4()}", password="password")  # noqa: S106
+        session.add(user)
+        await session.flush()
+        folder = Folder(name="Deleted Folder", user_id=user.id)
+        session.add(folder)
+        await session.flush()
+        session.add(FlowTable(id=flow_id, name="Deleted Flow", data="null", user_id=user.id, folder_id=folder.id))
+        message = make_message(flow_id)
+        session.add(message)
+        user_id = user.id
+
+    response = await client.delete(f"api/v1/users/{user_id}", headers=logged_in_headers_super_user)
+    assert response.status_code == 200
+
+    async with session_scope() as session:
+        assert await session.get(FlowTable, flow_id) is None
+        assert await session.get(FlowTombstoneTable, flow_id) is not None
+    await reconcile_flow_tombstones()
+    async with session_scope() as session:
+        assert await session.get(MessageTable, message.id) is None
+
+
+@pytest.mark.usefixtures("client")
+async def test_flow_records_are_deleted_in_bounded_batches():
+    flow_id = uuid4()
+    other_flow_id = uuid4()
+    async with session_scope() as session:
+        session.add_all([make_message(flow_id) for _ in range(5)])
+        kept = make_message(other_flow_id)
+        session.add(kept)
+
+    assert await _delete_flow_records(MessageTable, "id", flow_id, batch_size=2, max_batches=2) is False
+    async with session_scope() as session:
+        remaining = (await session.exec(select(MessageTable).where(MessageTable.flow_id == flow_id))).all()
+        assert len(remaining) == 1
+
+    assert await _delete_flow_records(MessageTable, "id", flow_id, batch_size=2, max_batches=2) is True
+    async with session_scope() as session:
+        assert (await session.exec(select(MessageTable).where(MessageTable.flow_id == flow_id))).all() == []
+        assert await session.get(MessageTable, kept.id) is not None
+
+
+@pytest.mark.usefixtures("client")
+async def test_full_scan_records_tombstones_for_orphaned_flows():
+    orphaned_flow_id = uuid4()
+    async with session_scope() as session:
+        session.add(make_message(orphaned_flow_id))
+
+    assert await find_orphaned_flows() >= 1
+    async with session_scope() as session:
+        assert await session.get(FlowTombstoneTable, orphaned_flow_id) is not None
+
+
+@pytest.mark.usefixtures("client")
+async def test_local_storage_deletes_flow_folders_in_bulk():
+    storage_service = get_storage_service()
+    flow_ids = [str(uuid4()) for _ in range(3)]
+    for flow_id in flow_ids:
+        await storage_service.save_file(flow_id, "a.txt", b"a")
+        await storage_service.save_file(flow_id, "b.txt", b"b")
+
+    await storage_service.delete_flow_files([*flow_ids, str(uuid4())])
+
+    for flow_id in flow_ids:
+        assert not await (storage_service.data_dir / flow_id).exists()
@@ -0,0 +1,253 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.webhook_delivery.model import WebhookDeliveryStatus, WebhookDeliveryTable
+from langflow.services.deps import session_scope
+from langflow.services.webhook_inbox.service import WebhookDeliveryNotFoundError, WebhookInboxService
+from sqlmodel import delete
+
+
+def make_inbox(**overrides) -> WebhookInboxService:
+    settings = {
+        "webhook_idempotency_header": "Idempotency-Key",
+        "webhook_deduplication_window": 3600,
+        "webhook_max_concurrency": 4,
+        "webhook_max_concurrency_per_flow": 1,
+        "webhook_max_attempts": 2,
+        "webhook_retry_backoff": 10.0,
+        "webhook_retry_max_backoff": 60.0,
+        "webhook_delivery_timeout": 5.0,
+    } | overrides
+    return WebhookInboxService(SimpleNamespace(settings=SimpleNamespace(**settings)))
+
+
+@pytest.fixture
+async def flow(active_user):
+    async with session_scope() as session:
+        flow = Flow(name="Webhook Inbox", user_id=active_user.id, data={"nodes": [], "edges": []})
+        session.add(flow)
+        await session.commit()
+        await session.refresh(flow)
+    yield flow
+    async with session_scope() as session:
+        await session.exec(delete(WebhookDeliveryTable).where(WebhookDeliveryTable.flow_id == flow.id))
+        await session.exec(delete(Flow).where(Flow.id == flow.id))
+
+
+async def get_delivery(delivery_id) -> WebhookDeliveryTable:
+    async with session_scope() as session:
+        return await session.get(WebhookDeliveryTable, delivery_id)
+
+
+async def test_idempotency_key():
+    inbox = make_inbox()
+
+    assert inbox.idempotency_key({"Idempotency-Key": "abc"}, b"body") == "header:abc"
+    assert inbox.idempotency_key({}, b"body") == inbox.idempotency_key({}, b"body")
+    assert inbox.idempotency_key({}, b"body") != inbox.idempotency_key({}, b"other")
+
+
+async def test_duplicates_are_not_stored_twice(flow):
+    inbox = make_inbox()
+
+    first, created = await inbox.accept(flow.id, flow.user_id, b'{"a": 1}', "key")
+    duplicate, duplicate_created = await inbox.accept(flow.id, flow.user_id, b'{"a": 1}', "key")
+
+    assert created
+    assert not duplicate_created
+    assert duplicate.id == first.id
+
+
+async def test_key_is_reused_after_the_deduplication_window(flow):
+    inbox = make_inbox(webhook_deduplication_window=0)
+    first, _ = await inbox.accept(flow.id, flow.user_id, b"one", "key")
+    async with session_scope() as session:
+        delivery = await session.get(WebhookDeliveryTable, first.id)
+        delivery.status = WebhookDeliveryStatus.SUCCEEDED
+        delivery.created_at = datetime.now(timezone.utc) - timedelta(seconds=10)
+        session.add(delivery)
+
+    again, created = await inbox.accept(flow.id, flow.user_id, b"two", "key")
+
+    assert created
+    assert again.id == first.id
+    stored = await get_delivery(first.id)
+    assert stored.status == WebhookDeliveryStatus.PENDING
+    assert stored.payload == "two"
+
+
+async def test_finished_deliveries_are_pruned_after_the_deduplication_window(flow):
+    inbox = make_inbox()
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(seconds=7200)
+    deliveries = {}
+    for name, status, updated_at in [
+        ("old succeeded", WebhookDeliveryStatus.SUCCEEDED, old),
+        ("old failed", WebhookDeliveryStatus.FAILED, old),
+        ("recent succeeded", WebhookDeliveryStatus.SUCCEEDED, now),
+        ("old pending", WebhookDeliveryStatus.PENDING, old),
+    ]:
+        delivery, _ = await inbox.accept(flow.id, flow.user_id, b"{}", name)
+        async with session_scope() as session:
+            stored = await session.get(WebhookDeliveryTable, delivery.id)
+            stored.status = status
+            stored.updated_at = updated_at
+            session.add(stored)
+        deliveries[name] = delivery.id
+
+    await inbox._prune_finished()
+
+    kept = {name for name, delivery_id in deliveries.items() if await get_delivery(delivery_id) is not None}
+    assert kept == {"recent succeeded", "old pending"}
+
+
+async def test_deleting_a_flow_deletes_its_deliveries(flow):
+    from langflow.api.utils import cascade_delete_flow
+
+    delivery, _ = await make_inbox().accept(flow.id, flow.user_id, b"{}", "key")
+
+    async with session_scope() as session:
+        await cascade_delete_flow(session, flow.id)
+
+    assert await get_delivery(delivery.id) is None
+
+
+async def test_failed_deliveries_are_retried_with_backoff(flow, monkeypatch):
+    inbox = make_inbox()
+    runs = []
+
+    async def failing_run(delivery):
+        runs.append(delivery.id)
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(inbox, "_run_flow", failing_run)
+    delivery, _ = await inbox.accept(flow.id, flow.user_id, b"payload", "key")
+
+    await inbox.deliver(delivery)
+
+    stored = await get_delivery(delivery.id)
+    assert stored.status == WebhookDeliveryStatus.PENDING
+    assert stored.attempts == 1
+    assert stored.last_error == "boom"
+    assert stored.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc) + timedelta(seconds=5)
+
+    # Not due yet, then due once the backoff has passed
+    await inbox._dispatch_due()
+    assert not inbox._tasks
+    async with session_scope() as session:
+        due = await session.get(WebhookDeliveryTable, delivery.id)
+        due.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.add(due)
+    await inbox._dispatch_due()
+    await asyncio.gather(*inbox._tasks)
+
+    stored = await get_delivery(delivery.id)
+    assert runs == [delivery.id, delivery.id]
+    assert stored.status == WebhookDeliveryStatus.FAILED
+    assert stored.attempts == 2
+
+
+async def test_successful_delivery(flow, monkeypatch):
+    inbox = make_inbox()
+
+    async def run(_delivery):
+        return None
+
+    monkeypatch.setattr(inbox, "_run_flow", run)
+    delivery, _ = await inbox.accept(flow.id, flow.user_id, b"payload", "key")
+
+    await inbox.deliver(delivery)
+    # A delivery only runs once, even when it is delivered again
+    await inbox.deliver(delivery)
+
+    stored = await get_delivery(delivery.id)
+    assert stored.status == WebhookDeliveryStatus.SUCCEEDED
+    assert stored.attempts == 1
+    assert stored.locked_until is None
+
+
+async def test_deliveries_of_a_flow_respect_the_concurrency_cap(flow, monkeypatch):
+    inbox = make_inbox(webhook_max_concurrency_per_flow=1)
+    running = 0
+    max_running = 0
+
+    async def run(_delivery):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    monkeypatch.setattr(inbox, "_run_flow", run)
+    deliveries = [(await inbox.accept(flow.id, flow.user_id, b"payload", f"key-{index}"))[0] for index in range(3)]
+
+    await asyncio.gather(*(inbox.deliver(delivery) for delivery in deliveries))
+
+    assert max_running == 1
+    for delivery in deliveries:
+        assert (await get_delivery(delivery.id)).status == WebhookDeliveryStatus.SUCCEEDED
+
+
+async def test_deliveries_of_a_dead_worker_are_taken_over(flow):
+    inbox = make_inbox()
+    delivery, _ = await inbox.accept(flow.id, flow.user_id, b"payload", "key")
+    assert await inbox._claim(delivery.id)
+    assert not await inbox._claim(delivery.id)
+
+    async with session_scope() as session:
+        stale = await session.get(WebhookDeliveryTable, delivery.id)
+        stale.locked_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.add(stale)
+
+    assert await inbox._claim(delivery.id)
+
+
+async def test_replay(flow, monkeypatch):
+    inbox = make_inbox(webhook_max_attempts=1)
+
+    async def failing_run(_delivery):
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(inbox, "_run_flow", failing_run)
+    delivery, _ = await inbox.accept(flow.id, flow.user_id, b"payload", "key")
+    with pytest.raises(ValueError, match="pending"):
+        await inbox.replay(delivery.id, [flow.id])
+    await inbox.deliver(delivery)
+    assert (await get_delivery(delivery.id)).status == WebhookDeliveryStatus.FAILED
+
+    with pytest.raises(WebhookDeliveryNotFoundError):
+        await inbox.replay(delivery.id, [])
+    replayed = await inbox.replay(delivery.id, [flow.id])
+
+    assert replayed.status == WebhookDeliveryStatus.PENDING
+    assert replayed.attempts == 0
+
+
+async def test_list_and_replay_api(client, flow, logged_in_headers):
+    from langflow.services.deps import get_webhook_inbox_service
+
+    inbox = get_webhook_inbox_service()
+    delivery, _ = await inbox.accept(flow.id, flow.user_id, b"payload", "key")
+    async with session_scope() as session:
+        failed = await session.get(WebhookDeliveryTable, delivery.id)
+        failed.status = WebhookDeliveryStatus.FAILED
+        session.add(failed)
+
+    response = await client.get(
+        "api/v1/monitor/webhooks", params={"flow_id": str(flow.id), "status": "failed"}, headers=logged_in_headers
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [str(delivery.id)]
+    assert "payload" not in response.json()[0]
+
+    response = await client.post(f"api/v1/monitor/webhooks/{delivery.id}/replay", headers=logged_in_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+    response = await client.post(f"api/v1/monitor/webhooks/{delivery.id}/replay", headers=logged_in_headers)
+    assert response.status_code == 409
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone
 from urllib.parse import quote
 from uuid import UUID
@@ -235,3 +236,58 @@ async def test_get_messages_empty_result_with_encoded_nonexistent_session(client
     assert response.status_code == 200, response.text
     messages = response.json()
     assert len(messages) == 0
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_keyset_pagination(client: AsyncClient, logged_in_headers, created_messages):
+    params = {"session_id": "session_id2", "limit": 2}
+    response = await client.get("api/v1/monitor/messages", params=params, headers=logged_in_headers)
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    assert len(first_page) == 2
+    cursor = response.headers.get("X-Next-Cursor")
+    assert cursor
+
+    response = await client.get(
+        "api/v1/monitor/messages", params={**params, "cursor": cursor}, headers=logged_in_headers
+    )
+    assert response.status_code == 200, response.text
+    second_page = response.json()
+    assert "X-Next-Cursor" not in response.headers
+    ids = [message["id"] for message in first_page + second_page]
+    assert sorted(ids) == sorted(str(message.id) for message in created_messages)
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_without_limit_returns_all_messages(
+    client: AsyncClient, logged_in_headers, created_messages, monkeypatch
+):
+    from langflow.api.v1 import monitor
+
+    monkeypatch.setattr(monitor, "DEFAULT_PAGE_LIMIT", 1)
+    response = await client.get(
+        "api/v1/monitor/messages", params={"session_id": "session_id2"}, headers=logged_in_headers
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == len(created_messages)
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_stream_ndjson(client: AsyncClient, logged_in_headers, created_messages):
+    response = await client.get(
+        "api/v1/monitor/messages",
+        params={"session_id": "session_id2", "limit": 2, "stream": True},
+        headers=logged_in_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["text"] for line in lines[:2]] == [message.text for message in created_messages[:2]]
+    assert "next_cursor" in lines[-1]
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_invalid_cursor(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/monitor/messages", params={"cursor": "not-a-cursor"}, headers=logged_in_headers)
+    assert response.status_code == 400, response.text
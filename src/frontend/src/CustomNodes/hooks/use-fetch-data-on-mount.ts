@@ -37,6 +37,7 @@ const useFetchDataOnMount = (
           name,
           () => {},
           node.tool_mode,
+          true,
         );
       }
     }
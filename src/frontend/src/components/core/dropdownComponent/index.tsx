@@ -271,6 +271,10 @@ export default function Dropdown({
       handleNodeClass,
       postTemplateValue,
       setErrorData,
+      undefined,
+      undefined,
+      undefined,
+      true,
     )?.then(() => {
       setTimeout(() => {
         setRefreshOptions(false);
@@ -49,3 +49,6 @@ export function getURL(
 }
 
 export type URLsType = typeof URLs;
+
+// Header asking the backend not to serve memoized build configs
+export const CACHE_BYPASS_HEADER = "x-langflow-cache-bypass";
@@ -6,12 +6,14 @@ import type {
   useMutationFunctionType,
 } from "@/types/api";
 import { api } from "../../api";
-import { getURL } from "../../helpers/constants";
+import { CACHE_BYPASS_HEADER, getURL } from "../../helpers/constants";
 import { UseRequestProcessor } from "../../services/request-processor";
 
 interface IPostTemplateValue {
   value: any;
   tool_mode?: boolean;
+  // Skip the memoized build configs, e.g. to fetch the options of a field again
+  bypass_cache?: boolean;
 }
 
 interface IPostTemplateValueParams {
@@ -45,6 +47,9 @@ export const usePostTemplateValue: useMutationFunctionType<
         field_value: payload.value,
         tool_mode: payload.tool_mode,
       },
+      payload.bypass_cache
+        ? { headers: { [CACHE_BYPASS_HEADER]: "true" } }
+        : undefined,
     );
     const newTemplate = response.data;
     newTemplate.last_updated = lastUpdated;
@@ -0,0 +1,240 @@
+"""On-disk catalog of Composio toolkits shared by all Composio components.
+
+Listing the actions of a toolkit means fetching every tool schema from the Composio API, flattening it and turning
+it into Langflow inputs. The result only depends on the toolkit and on the installed Composio SDK, so it is stored
+as one JSON file per toolkit and reused by every component instance, worker process and restart. Catalog files are
+loaded lazily the first time a toolkit is needed and are ignored when they were written by another SDK version or
+catalog format, or when they are older than the configured time-to-live.
+
+The cache is configured through the settings service:
+
+- ``composio_catalog_cache_enabled``: turn the cache off globally
+- ``composio_catalog_cache_ttl``: seconds after which a toolkit catalog is fetched again (0 keeps it until the SDK
+  version changes)
+- ``composio_catalog_cache_path``: directory of the catalog files (defaults to the user cache directory)
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lfx.inputs.inputs import instantiate_input
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_DIR
+
+if TYPE_CHECKING:
+    from lfx.inputs.inputs import InputTypes
+
+CATALOG_FORMAT_VERSION = 1
+DEFAULT_TTL = 24 * 60 * 60
+CATALOG_DIR_NAME = "composio_catalog"
+_FILE_NAME_SANITIZER = re.compile(r"[^a-z0-9_-]")
+
+
+def get_composio_sdk_version() -> str:
+    try:
+        return version("composio")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def serialize_input(lf_input: InputTypes) -> dict[str, Any]:
+    """Return a JSON-compatible representation of a Langflow input that :func:`deserialize_input` can rebuild.
+
+    Only the fields that were set explicitly are kept, so validators produce the same defaults when rebuilding.
+    """
+    return lf_input.model_dump(mode="json", exclude_unset=True)
+
+
+def deserialize_input(data: dict[str, Any]) -> InputTypes:
+    data = dict(data)
+    return instantiate_input(data.pop("_input_type"), data)
+
+
+@dataclass
+class ToolkitCatalog:
+    """Actions of a toolkit as built by ``ComposioBaseComponent._populate_actions_data``.
+
+    ``actions`` maps each action key to its display name, fields and versions, ``schemas`` holds the raw tool
+    schemas, ``bool_fields`` the names of the boolean parameters and ``inputs`` the serialized Langflow inputs
+    generated for each action so far.
+    """
+
+    toolkit: str
+    actions: dict[str, dict[str, Any]]
+    schemas: dict[str, dict[str, Any]]
+    bool_fields: list[str] = field(default_factory=list)
+    inputs: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    sdk_version: str = ""
+    created_at: float = 0.0
+    format_version: int = CATALOG_FORMAT_VERSION
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        for action in data["actions"].values():
+            if isinstance(action.get("file_upload_fields"), set):
+                action["file_upload_fields"] = sorted(action["file_upload_fields"])
+        return json.dumps(data, default=str)
+
+    @classmethod
+    def from_json(cls, text: str) -> ToolkitCatalog:
+        data = json.loads(text)
+        for action in data["actions"].values():
+            action["file_upload_fields"] = set(action.get("file_upload_fields") or ())
+        return cls(**data)
+
+
+class ComposioCatalogCache:
+    """Directory of toolkit catalogs with an in-memory layer in front of it.
+
+    Catalogs are immutable once returned: use :meth:`put` and :meth:`add_inputs` to change them, and deep-copy the
+    parts a component mutates.
+    """
+
+    def __init__(self, directory: str | Path, *, sdk_version: str | None = None, ttl: float = DEFAULT_TTL) -> None:
+        self.directory = Path(directory)
+        self.sdk_version = sdk_version or get_composio_sdk_version()
+        self.ttl = ttl
+        self._catalogs: dict[str, ToolkitCatalog] = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, toolkit: str) -> Path:
+        return self.directory / f"{_FILE_NAME_SANITIZER.sub('_', toolkit.lower())}.json"
+
+    def get(self, toolkit: str) -> ToolkitCatalog | None:
+        """Return the catalog of ``toolkit``, reading its file on first use. Stale or invalid catalogs are None."""
+        toolkit = toolkit.lower()
+        with self._lock:
+            catalog = self._catalogs.get(toolkit)
+            if catalog is None:
+                catalog = self._read(toolkit)
+            if catalog is None or self._is_expired(catalog):
+                self._catalogs.pop(toolkit, None)
+                return None
+            self._catalogs[toolkit] = catalog
+            return catalog
+
+    def put(self, catalog: ToolkitCatalog) -> None:
+        """Store the catalog of a freshly fetched toolkit, replacing any previous one."""
+        catalog.toolkit = catalog.toolkit.lower()
+        catalog.sdk_version = self.sdk_version
+        catalog.format_version = CATALOG_FORMAT_VERSION
+        catalog.created_at = time.time()
+        with self._lock:
+            self._catalogs[catalog.toolkit] = catalog
+            self._write(catalog)
+
+    def add_inputs(self, toolkit: str, inputs: dict[str, list[InputTypes]]) -> None:
+        """Remember the Langflow inputs generated for some actions of an already cached toolkit."""
+        toolkit = toolkit.lower()
+        with self._lock:
+            catalog = self._catalogs.get(toolkit)
+            if catalog is None:
+                return
+            for action_key, lf_inputs in inputs.items():
+                if action_key in catalog.schemas:
+                    catalog.inputs[action_key] = [serialize_input(lf_input) for lf_input in lf_inputs]
+            self._write(catalog)
+
+    def get_inputs(self, toolkit: str, action_key: str) -> list[InputTypes] | None:
+        """Return fresh copies of the cached inputs of an action, or None if they were not generated yet."""
+        catalog = self.get(toolkit)
+        if catalog is None or action_key not in catalog.inputs:
+            return None
+        try:
+            return [deserialize_input(data) for data in catalog.inputs[action_key]]
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.debug(f"Ignoring cached Composio inputs for {toolkit}/{action_key}: {exc}")
+            return None
+
+    def invalidate(self, toolkit: str | None = None) -> None:
+        """Forget one toolkit, or all of them, in memory and on disk."""
+        with self._lock:
+            toolkits = [toolkit.lower()] if toolkit else [path.stem for path in self.directory.glob("*.json")]
+            for name in toolkits:
+                self._catalogs.pop(name, None)
+                self.path_for(name).unlink(missing_ok=True)
+            if toolkit is None:
+                self._catalogs.clear()
+
+    def _is_expired(self, catalog: ToolkitCatalog) -> bool:
+        return bool(self.ttl) and catalog.created_at + self.ttl <= time.time()
+
+    def _read(self, toolkit: str) -> ToolkitCatalog | None:
+        path = self.path_for(toolkit)
+        try:
+            catalog = ToolkitCatalog.from_json(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError, KeyError, AttributeError) as exc:
+            logger.debug(f"Ignoring unreadable Composio catalog {path}: {exc}")
+            return None
+        if catalog.format_version != CATALOG_FORMAT_VERSION or catalog.sdk_version != self.sdk_version:
+            logger.debug(f"Ignoring Composio catalog {path} written by SDK {catalog.sdk_version}")
+            return None
+        return catalog
+
+    def _write(self, catalog: ToolkitCatalog) -> None:
+        path = self.path_for(catalog.toolkit)
+        temp_path: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that other processes never read a partial catalog
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp", delete=False
+            ) as file:
+                temp_path = Path(file.name)
+                file.write(catalog.to_json())
+            temp_path.replace(path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning(f"Could not write the Composio catalog {path}: {exc}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+
+_catalog_cache: ComposioCatalogCache | None = None
+_catalog_cache_lock = threading.Lock()
+_catalog_cache_created = False
+
+
+def get_composio_catalog_cache() -> ComposioCatalogCache | None:
+    """Return the process-wide catalog cache, or None if it is disabled."""
+    global _catalog_cache, _catalog_cache_created  # noqa: PLW0603
+    if _catalog_cache_created:
+        return _catalog_cache
+    with _catalog_cache_lock:
+        if not _catalog_cache_created:
+            _catalog_cache = _create_composio_catalog_cache()
+            _catalog_cache_created = True
+    return _catalog_cache
+
+
+def set_composio_catalog_cache(cache: ComposioCatalogCache | None) -> None:
+    """Replace the process-wide catalog cache. Passing ``None`` recreates it from the settings on next use."""
+    global _catalog_cache, _catalog_cache_created  # noqa: PLW0603
+    with _catalog_cache_lock:
+        _catalog_cache = cache
+        _catalog_cache_created = cache is not None
+
+
+def _create_composio_catalog_cache() -> ComposioCatalogCache | None:
+    from lfx.services.deps import get_settings_service
+
+    ttl: float = DEFAULT_TTL
+    path: str | None = None
+    settings_service = get_settings_service()
+    if settings_service is not None:
+        settings = settings_service.settings
+        if not getattr(settings, "composio_catalog_cache_enabled", True):
+            return None
+        ttl = getattr(settings, "composio_catalog_cache_ttl", ttl)
+        path = getattr(settings, "composio_catalog_cache_path", path)
+    return ComposioCatalogCache(Path(path) if path else Path(CACHE_DIR) / CATALOG_DIR_NAME, ttl=ttl)
@@ -8,6 +8,7 @@ from composio import Composio
 from composio_langchain import LangchainProvider
 from langchain_core.tools import Tool
 
+from lfx.base.composio.catalog_cache import ToolkitCatalog, get_composio_catalog_cache
 from lfx.base.mcp.util import create_input_schema_from_json_schema
 from lfx.custom.custom_component.component import Component
 from lfx.inputs.inputs import (
@@ -426,6 +427,20 @@ class ComposioBaseComponent(Component):
             logger.debug(f"Loaded actions for {toolkit_slug} from in-process cache")
             return
 
+        # Then from the catalog cache shared with other processes and previous runs
+        catalog_cache = get_composio_catalog_cache()
+        catalog = catalog_cache.get(toolkit_slug) if catalog_cache is not None else None
+        if catalog is not None:
+            self._actions_data = copy.deepcopy(catalog.actions)
+            self._action_schemas = copy.deepcopy(catalog.schemas)
+            self._bool_variables.update(catalog.bool_fields)
+            self._all_fields = {f for d in self._actions_data.values() for f in d["action_fields"]}
+            self._build_action_maps()
+            self.__class__.get_actions_cache()[toolkit_slug] = copy.deepcopy(self._actions_data)
+            self.__class__.get_action_schema_cache()[toolkit_slug] = copy.deepcopy(self._action_schemas)
+            logger.debug(f"Loaded actions for {toolkit_slug} from the Composio catalog cache")
+            return
+
         api_key = getattr(self, "api_key", None)
         if not api_key:
             logger.warning("API key is missing. Cannot populate actions data.")
@@ -683,11 +698,44 @@ class ComposioBaseComponent(Component):
             # can reuse them without hitting the Composio API again.
             self.__class__.get_actions_cache()[toolkit_slug] = copy.deepcopy(self._actions_data)
             self.__class__.get_action_schema_cache()[toolkit_slug] = copy.deepcopy(self._action_schemas)
+            if catalog_cache is not None and self._actions_data:
+                catalog_cache.put(
+                    ToolkitCatalog(
+                        toolkit=toolkit_slug,
+                        actions=copy.deepcopy(self._actions_data),
+                        schemas=self._to_plain_dict(self._action_schemas),
+                        bool_fields=sorted(self._bool_variables),
+                    )
+                )
 
         except ValueError as e:
             logger.debug(f"Could not populate Composio actions for {self.app_name}: {e}")
 
     def _validate_schema_inputs(self, action_key: str) -> list[InputTypes]:
+        """Return the Langflow inputs for *action_key*, reusing the ones stored in the catalog cache."""
+        return self._get_schema_inputs([action_key])[action_key]
+
+    def _get_schema_inputs(self, action_keys: list[str]) -> dict[str, list[InputTypes]]:
+        """Return the Langflow inputs of several actions, generating and caching the missing ones in one go."""
+        toolkit_slug = getattr(self, "app_name", "").lower()
+        catalog_cache = get_composio_catalog_cache()
+        result: dict[str, list[InputTypes]] = {}
+        generated: dict[str, list[InputTypes]] = {}
+        for action_key in action_keys:
+            cached = catalog_cache.get_inputs(toolkit_slug, action_key) if catalog_cache is not None else None
+            if cached is None:
+                result[action_key] = generated[action_key] = self._generate_schema_inputs(action_key)
+                continue
+            # Same filtering as when the inputs were generated, which depends on this instance's entity_id
+            entity_id = getattr(self, "entity_id", None)
+            result[action_key] = [
+                inp for inp in cached if not (inp.name == "user_id" and entity_id == getattr(inp, "value", None))
+            ]
+        if generated and catalog_cache is not None:
+            catalog_cache.add_inputs(toolkit_slug, generated)
+        return result
+
+    def _generate_schema_inputs(self, action_key: str) -> list[InputTypes]:
         """Convert the JSON schema for *action_key* into Langflow input objects."""
         # Skip validation for default/placeholder values
         if action_key in ("disabled", "placeholder", ""):
@@ -970,10 +1018,7 @@ class ComposioBaseComponent(Component):
 
     def _get_inputs_for_all_actions(self) -> dict[str, list[InputTypes]]:
         """Return a mapping action_key → list[InputTypes] for every action."""
-        result: dict[str, list[InputTypes]] = {}
-        for key in self._actions_data:
-            result[key] = self._validate_schema_inputs(key)
-        return result
+        return self._get_schema_inputs(list(self._actions_data))
 
     def _remove_inputs_from_build_config(self, build_config: dict, keep_for_action: str) -> None:
         """Remove parameter UI fields that belong to other actions."""
@@ -1483,7 +1528,10 @@ class ComposioBaseComponent(Component):
         # Check if we need to populate actions - but also check cache availability
         actions_available = bool(self._actions_data)
         toolkit_slug = getattr(self, "app_name", "").lower()
-        cached_actions_available = toolkit_slug in self.__class__.get_actions_cache()
+        catalog_cache = get_composio_catalog_cache()
+        cached_actions_available = toolkit_slug in self.__class__.get_actions_cache() or (
+            bool(toolkit_slug) and catalog_cache is not None and catalog_cache.get(toolkit_slug) is not None
+        )
 
         should_populate = False
 
@@ -0,0 +1,476 @@
+"""Asynchronous crawler of the URL component.
+
+Pages are downloaded with ``httpx`` in the event loop, so a crawl never blocks the other flows of the worker, and
+several pages are downloaded at once:
+
+- at most ``max_concurrency`` requests run at the same time, and at most ``max_concurrency_per_host`` per host
+- ``max_pages`` is the fetch budget of the whole crawl, shared by all the root URLs
+- links are followed up to ``max_depth`` (1 only fetches the root URLs), only under their root URL (the links
+  starting with it, as ``RecursiveUrlLoader`` did) when ``prevent_outside`` is set, and only where ``robots.txt``
+  allows it when ``respect_robots`` is set
+- responses carrying an ``ETag`` or ``Last-Modified`` header are kept in an :class:`HTTPCache` on disk and requested
+  again with ``If-None-Match`` / ``If-Modified-Since``, so unchanged pages come back as an empty ``304``
+- pages whose content was already extracted from another URL are dropped
+
+Parsing the pages and running the content extractor happen in worker threads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urldefrag, urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
+
+import anyio
+import httpx
+
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from anyio.abc import TaskGroup
+
+DEFAULT_MAX_PAGES = 500
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 4
+DEFAULT_CACHE_MAX_ENTRIES = 10_000
+DEFAULT_CACHE_DIR = Path(CACHE_DIR) / "url_crawler"
+CACHE_FORMAT_VERSION = 1
+
+# Links to files that are never worth downloading as pages
+SKIPPED_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".ico",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".svg",
+    ".webp",
+    ".mp3",
+    ".mp4",
+    ".zip",
+    ".gz",
+    ".bz2",
+    ".tar",
+    ".pdf",
+    ".epub",
+    ".mobi",
+    ".woff",
+    ".woff2",
+)
+# Requests carrying these headers are never cached, their responses may be private
+_PRIVATE_HEADERS = ("authorization", "cookie")
+
+
+class CrawlError(Exception):
+    """A page could not be fetched and the crawl does not continue on failures."""
+
+
+@dataclass
+class CrawlConfig:
+    max_depth: int = 1
+    prevent_outside: bool = True
+    max_pages: int = DEFAULT_MAX_PAGES
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_concurrency_per_host: int = DEFAULT_MAX_CONCURRENCY_PER_HOST
+    timeout: float = 30.0
+    headers: dict[str, str] = field(default_factory=dict)
+    respect_robots: bool = True
+    check_response_status: bool = False
+    continue_on_failure: bool = True
+    filter_text_html: bool = True
+    autoset_encoding: bool = True
+    cache_dir: Path | None = None
+    """Directory of the :class:`HTTPCache`, for example :data:`DEFAULT_CACHE_DIR`. None disables conditional
+    requests."""
+
+
+@dataclass
+class CrawledPage:
+    url: str
+    content: str
+    title: str = ""
+    description: str = ""
+    content_type: str = ""
+    language: str = ""
+    depth: int = 0
+
+
+class _PageParser(HTMLParser):
+    """Collects the links and the metadata of an HTML page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: list[str] = []
+        self.title = ""
+        self.description = ""
+        self.language = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "a" and attributes.get("href"):
+            self.links.append(attributes["href"])
+        elif tag == "title" and not self.title:
+            self._in_title = True
+        elif tag == "meta" and attributes.get("name", "").lower() == "description" and not self.description:
+            self.description = attributes.get("content", "")
+        elif tag == "html" and not self.language:
+            self.language = attributes.get("lang", "")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+
+
+def _is_html(content_type: str) -> bool:
+    return not content_type or "html" in content_type
+
+
+def _is_text(content_type: str) -> bool:
+    """Whether a page of ``content_type`` is kept when filtering on text and HTML."""
+    mime_type = content_type.split(";", 1)[0].strip().lower()
+    if mime_type == "text/css":
+        return False
+    return not mime_type or mime_type.startswith("text/") or mime_type.endswith(("+xml", "/xml", "/json"))
+
+
+def _decode(response: httpx.Response, *, autoset_encoding: bool) -> str:
+    if response.charset_encoding or not autoset_encoding:
+        return response.text
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return response.text
+    match = from_bytes(response.content).best()
+    return str(match) if match is not None else response.text
+
+
+def _find_crawl_error(exc: BaseException) -> CrawlError | None:
+    if isinstance(exc, CrawlError):
+        return exc
+    for inner in getattr(exc, "exceptions", ()):
+        if (crawl_error := _find_crawl_error(inner)) is not None:
+            return crawl_error
+    return None
+
+
+def normalize_url(url: str) -> str:
+    """Drop the fragment of ``url``, which never changes the page downloaded."""
+    return urldefrag(url).url
+
+
+class HTTPCache:
+    """Validators and bodies of the pages downloaded by the crawler, one JSON file per URL.
+
+    Entries are written atomically and ignored when they were written in another format. Once there are more than
+    ``max_entries`` files, the least recently written ones are deleted by :meth:`prune`.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def load(self, url: str) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_FORMAT_VERSION or entry.get("url") != url:
+            return None
+        return entry
+
+    def store(self, url: str, *, etag: str | None, last_modified: str | None, content_type: str, text: str) -> None:
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "text": text,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                json.dump(entry, file)
+            Path(file.name).replace(self._path(url))
+        except OSError as exc:
+            logger.debug(f"Could not cache {url}: {exc}")
+
+    @staticmethod
+    def validators(entry: dict[str, Any]) -> dict[str, str]:
+        """Return the headers of a conditional request for the page of ``entry``."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def prune(self) -> None:
+        try:
+            files = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(self.directory) if entry.is_file()]
+        except OSError:
+            return
+        if len(files) <= self.max_entries:
+            return
+        files.sort()
+        for _, path in files[: len(files) - self.max_entries]:
+            Path(path).unlink(missing_ok=True)
+
+
+@dataclass
+class _ParsedPage:
+    content: str
+    title: str = ""
+    description: str = ""
+    language: str = ""
+    links: list[str] = field(default_factory=list)
+
+
+def _parse_page(text: str, content_type: str, base_url: str, extractor: Callable[[str], str]) -> _ParsedPage:
+    if not _is_html(content_type):
+        return _ParsedPage(content=extractor(text))
+    parser = _PageParser()
+    parser.feed(text)
+    parser.close()
+    return _ParsedPage(
+        content=extractor(text),
+        title=parser.title.strip(),
+        description=parser.description,
+        language=parser.language,
+        links=[normalize_url(urljoin(base_url, link)) for link in parser.links],
+    )
+
+
+class URLCrawler:
+    """Crawls web pages from root URLs, following their links, according to a :class:`CrawlConfig`.
+
+    Args:
+        config: Limits and options of the crawl.
+        extractor: Turns the text of a page into the content returned, the page is returned as is by default.
+        client: Client used for the requests, a client is created for each crawl by default.
+    """
+
+    def __init__(
+        self,
+        config: CrawlConfig,
+        *,
+        extractor: Callable[[str], str] | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.config = config
+        self.extractor = extractor or (lambda text: text)
+        self._client = client
+        self._cache = HTTPCache(config.cache_dir) if config.cache_dir is not None else None
+        self._use_cache = self._cache is not None and not any(
+            name.lower() in _PRIVATE_HEADERS for name in config.headers
+        )
+        self._user_agent = next(
+            (value for name, value in config.headers.items() if name.lower() == "user-agent" and value), "*"
+        )
+        self.fetched = 0
+        self.not_modified = 0
+        self.duplicates = 0
+
+    async def crawl(self, urls: list[str]) -> list[CrawledPage]:
+        """Crawl ``urls`` and the pages they link to.
+
+        Returns:
+            The pages crawled, root URLs first, then in the order their links were found.
+
+        Raises:
+            CrawlError: If a page could not be fetched and ``continue_on_failure`` is not set.
+        """
+        self._seen: set[str] = set()
+        self._scheduled = 0
+        self._content_hashes: set[str] = set()
+        self._results: dict[int, CrawledPage] = {}
+        self._limit = anyio.Semaphore(max(1, self.config.max_concurrency))
+        self._host_limits: dict[str, anyio.Semaphore] = {}
+        self._robots: dict[str, RobotFileParser | None] = {}
+        self._robots_locks: dict[str, anyio.Lock] = {}
+
+        try:
+            async with self._open_client() as client, anyio.create_task_group() as task_group:
+                for url in urls:
+                    self._schedule(task_group, client, url, url, 0)
+        except Exception as exc:
+            # The task group wraps the errors of the pages in an exception group
+            crawl_error = _find_crawl_error(exc)
+            if crawl_error is None:
+                raise
+            raise crawl_error from crawl_error.__cause__
+
+        if self._cache is not None and self._use_cache:
+            await anyio.to_thread.run_sync(self._cache.prune)
+        await logger.adebug(
+            f"Crawled {len(self._results)} pages with {self.fetched} requests "
+            f"({self.not_modified} not modified, {self.duplicates} duplicates)"
+        )
+        return [self._results[index] for index in sorted(self._results)]
+
+    @asynccontextmanager
+    async def _open_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient(
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max(1, self.config.max_concurrency)),
+        ) as client:
+            yield client
+
+    def _in_scope(self, url: str, root: str) -> bool:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or parts.path.lower().endswith(SKIPPED_EXTENSIONS):
+            return False
+        # Like RecursiveUrlLoader(base_url=root), a crawl of site/docs/ stays under site/docs/
+        return not self.config.prevent_outside or normalize_url(url).startswith(root)
+
+    def _schedule(self, task_group: TaskGroup, client: httpx.AsyncClient, url: str, root: str, depth: int) -> None:
+        url = normalize_url(url)
+        if url in self._seen or self._scheduled >= self.config.max_pages:
+            return
+        self._seen.add(url)
+        index = self._scheduled
+        self._scheduled += 1
+        task_group.start_soon(self._crawl_page, task_group, client, index, url, root, depth)
+
+    def _host_limit(self, url: str) -> anyio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = anyio.Semaphore(max(1, self.config.max_concurrency_per_host))
+        return self._host_limits[host]
+
+    async def _crawl_page(
+        self,
+        task_group: TaskGroup,
+        client: httpx.AsyncClient,
+        index: int,
+        url: str,
+        root: str,
+        depth: int,
+    ) -> None:
+        # Root URLs were asked for explicitly, robots.txt only restricts the links followed
+        if depth > 0 and self.config.respect_robots and not await self._allowed(client, url):
+            await logger.adebug(f"Skipping {url}, disallowed by robots.txt")
+            return
+        try:
+            fetched = await self._fetch(client, url)
+        except httpx.HTTPError as exc:
+            if not self.config.continue_on_failure:
+                msg = f"Failed to fetch {url}: {exc}"
+                raise CrawlError(msg) from exc
+            await logger.awarning(f"Failed to fetch {url}: {exc}")
+            return
+        if fetched is None:
+            return
+
+        final_url, text, content_type = fetched
+        page = await anyio.to_thread.run_sync(_parse_page, text, content_type, final_url, self.extractor)
+        digest = hashlib.sha256(page.content.encode()).hexdigest()
+        if digest in self._content_hashes:
+            self.duplicates += 1
+            return
+        self._content_hashes.add(digest)
+        self._results[index] = CrawledPage(
+            url=url,
+            content=page.content,
+            title=page.title,
+            description=page.description,
+            content_type=content_type,
+            language=page.language,
+            depth=depth,
+        )
+
+        if depth + 1 < self.config.max_depth:
+            for link in page.links:
+                if self._in_scope(link, root):
+                    self._schedule(task_group, client, link, root, depth + 1)
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> tuple[str, str, str] | None:
+        """Download ``url``.
+
+        Returns:
+            The URL after redirects, the text and the content type of the page, or None if the page is filtered out.
+        """
+        cached = None
+        if self._use_cache:
+            cached = await anyio.to_thread.run_sync(self._cache.load, url)
+        headers = HTTPCache.validators(cached) if cached else None
+
+        async with self._host_limit(url), self._limit:
+            response = await client.get(url, headers=headers)
+        self.fetched += 1
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self.not_modified += 1
+            return str(response.url), cached["text"], cached["content_type"]
+        if self.config.check_response_status:
+            response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        if self.config.filter_text_html and not _is_text(content_type):
+            return None
+        text = _decode(response, autoset_encoding=self.config.autoset_encoding)
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        cacheable = "no-store" not in response.headers.get("cache-control", "").lower()
+        if self._use_cache and response.status_code == httpx.codes.OK and (etag or last_modified) and cacheable:
+            store = partial(
+                self._cache.store, url, etag=etag, last_modified=last_modified, content_type=content_type, text=text
+            )
+            await anyio.to_thread.run_sync(store)
+        return str(response.url), text, content_type
+
+    async def _allowed(self, client: httpx.AsyncClient, url: str) -> bool:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        lock = self._robots_locks.setdefault(origin, anyio.Lock())
+        async with lock:
+            if origin not in self._robots:
+                self._robots[origin] = await self._load_robots(client, origin)
+        parser = self._robots[origin]
+        return parser is None or parser.can_fetch(self._user_agent, url)
+
+    async def _load_robots(self, client: httpx.AsyncClient, origin: str) -> RobotFileParser | None:
+        """Fetch the robots.txt of ``origin``, None allows every URL."""
+        try:
+            async with self._host_limit(origin), self._limit:
+                response = await client.get(f"{origin}/robots.txt")
+        except httpx.HTTPError:
+            return None
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        if response.status_code in {httpx.codes.UNAUTHORIZED, httpx.codes.FORBIDDEN}:
+            parser.disallow_all = True
+        elif response.status_code != httpx.codes.OK:
+            return None
+        else:
+            parser.parse(response.text.splitlines())
+        return parser
@@ -0,0 +1,295 @@
+"""Content-addressed embedding cache shared by embedding, vector store and knowledge base components.
+
+:class:`CachedEmbeddings` wraps any langchain :class:`~langchain_core.embeddings.Embeddings` and stores document
+vectors in a local SQLite database keyed by the embedding model id and the SHA-256 of the text. Re-indexing a
+mostly unchanged corpus therefore only sends the new or changed chunks to the embedding provider.
+
+The cache is configured through the settings service:
+
+- ``embedding_cache_enabled``: turn the cache off globally
+- ``embedding_cache_max_entries``: maximum number of vectors kept before least recently used ones are evicted
+- ``embedding_cache_path``: location of the SQLite database (defaults to the user cache directory)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.embeddings import Embeddings
+
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_BATCH_SIZE = 256
+SQLITE_FILE_NAME = "embedding_cache.sqlite"
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_CHUNK_SIZE = 500
+_MODEL_ID_ATTRIBUTES = ("model", "model_name", "model_id", "deployment", "repo_id")
+# Where the model is served from, e.g. a self-hosted or Azure endpoint with its own deployment of a model name
+_ENDPOINT_ATTRIBUTES = ("base_url", "openai_api_base", "azure_endpoint", "endpoint", "endpoint_url", "api_url")
+# Options passed to the model that change the vectors it returns
+_OPTIONS_ATTRIBUTES = ("model_kwargs", "encode_kwargs")
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def get_embedding_model_id(embeddings: Embeddings) -> str | None:
+    """Return an identifier for the embedding model, e.g. ``OpenAIEmbeddings:text-embedding-3-small``.
+
+    The identifier also covers the deployment, the endpoint, the dimensions and the options of the model, so that
+    two configurations returning different vectors never share cache entries. Returns None when the model cannot be
+    identified, in which case its embeddings must not be cached.
+    """
+    parts = [type(embeddings).__name__]
+    model_ids: list[str] = []
+    for attribute in _MODEL_ID_ATTRIBUTES:
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str) and value and value not in model_ids:
+            parts.append(value if not model_ids else f"{attribute}={value}")
+            model_ids.append(value)
+    if not model_ids:
+        return None
+    for attribute in _ENDPOINT_ATTRIBUTES:
+        value = getattr(embeddings, attribute, None)
+        if isinstance(value, str) and value:
+            parts.append(f"{attribute}={value.rstrip('/')}")
+    if (dimensions := getattr(embeddings, "dimensions", None)) is not None:
+        parts.append(f"dim={dimensions}")
+    for attribute in _OPTIONS_ATTRIBUTES:
+        if options := getattr(embeddings, attribute, None):
+            try:
+                serialized = json.dumps(options, sort_keys=True)
+            except (TypeError, ValueError):
+                return None
+            parts.append(f"{attribute}={hash_text(serialized)[:16]}")
+    return ":".join(parts)
+
+
+class EmbeddingCacheStore:
+    """Local key-value store of embedding vectors backed by SQLite.
+
+    Vectors are stored as packed float32 arrays. Least recently accessed entries are evicted once
+    ``max_entries`` is exceeded. All methods are blocking and meant to be called from a worker thread.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "model_id TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, accessed_at REAL NOT NULL, "
+            "PRIMARY KEY (model_id, text_hash))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embedding_cache_accessed_at ON embedding_cache (accessed_at)"
+        )
+
+    def get_many(self, model_id: str, text_hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return the cached vectors for the given hashes. Missing hashes are absent from the result."""
+        found: dict[str, list[float]] = {}
+        unique_hashes = list(dict.fromkeys(text_hashes))
+        now = time.time()
+        with self._lock, closing(self._connection.cursor()) as cursor:
+            for start in range(0, len(unique_hashes), _LOOKUP_CHUNK_SIZE):
+                chunk = unique_hashes[start : start + _LOOKUP_CHUNK_SIZE]
+                condition = f"model_id = ? AND text_hash IN ({','.join('?' * len(chunk))})"
+                rows = cursor.execute(
+                    f"SELECT text_hash, vector FROM embedding_cache WHERE {condition}",  # noqa: S608
+                    (model_id, *chunk),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = array("f", blob).tolist()
+                if rows:
+                    condition = f"model_id = ? AND text_hash IN ({','.join('?' * len(rows))})"
+                    cursor.execute(
+                        f"UPDATE embedding_cache SET accessed_at = ? WHERE {condition}",  # noqa: S608
+                        (now, model_id, *[row[0] for row in rows]),
+                    )
+        return found
+
+    def set_many(self, model_id: str, items: Iterable[tuple[str, Sequence[float]]]) -> None:
+        now = time.time()
+        rows = [(model_id, text_hash, array("f", vector).tobytes(), now) for text_hash, vector in items]
+        if not rows:
+            return
+        with self._lock, closing(self._connection.cursor()) as cursor:
+            cursor.execute("BEGIN")
+            cursor.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (model_id, text_hash, vector, accessed_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            cursor.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN ("
+                "SELECT rowid FROM embedding_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            cursor.execute("COMMIT")
+
+    def clear(self, model_id: str | None = None) -> None:
+        with self._lock:
+            if model_id is None:
+                self._connection.execute("DELETE FROM embedding_cache")
+            else:
+                self._connection.execute("DELETE FROM embedding_cache WHERE model_id = ?", (model_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only embeds documents whose text is not cached yet.
+
+    Query embeddings are not cached and are delegated to the wrapped model. Attributes that are not defined by
+    the wrapper are looked up on the wrapped model, so components can keep inspecting ``model`` and friends.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        store: EmbeddingCacheStore,
+        *,
+        model_id: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.embeddings = embeddings
+        self.store = store
+        model_id = model_id or get_embedding_model_id(embeddings)
+        if model_id is None:
+            msg = f"Cannot identify the model of {type(embeddings).__name__}, pass its model_id"
+            raise ValueError(msg)
+        self.model_id = model_id
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute is not found on the wrapper itself
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes = [hash_text(text) for text in texts]
+        cached = self.store.get_many(self.model_id, hashes)
+        missing = self._missing_texts(texts, hashes, cached)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            vectors = self.embeddings.embed_documents([text for _, text in batch])
+            self._store_batch(batch, vectors, cached)
+        return [cached[text_hash] for text_hash in hashes]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        hashes = [hash_text(text) for text in texts]
+        cached = await asyncio.to_thread(self.store.get_many, self.model_id, hashes)
+        missing = self._missing_texts(texts, hashes, cached)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            vectors = await self.embeddings.aembed_documents([text for _, text in batch])
+            await asyncio.to_thread(self._store_batch, batch, vectors, cached)
+        return [cached[text_hash] for text_hash in hashes]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.embeddings.aembed_query(text)
+
+    def _missing_texts(
+        self, texts: list[str], hashes: list[str], cached: dict[str, list[float]]
+    ) -> list[tuple[str, str]]:
+        missing = dict(zip(hashes, texts, strict=True))
+        for text_hash in cached:
+            missing.pop(text_hash, None)
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        return list(missing.items())
+
+    def _store_batch(
+        self, batch: list[tuple[str, str]], vectors: list[list[float]], cached: dict[str, list[float]]
+    ) -> None:
+        items = [(text_hash, vector) for (text_hash, _), vector in zip(batch, vectors, strict=True)]
+        self.store.set_many(self.model_id, items)
+        cached.update(items)
+
+
+_store: EmbeddingCacheStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_embedding_cache_store() -> EmbeddingCacheStore | None:
+    """Return the process-wide embedding cache store, or None if the cache is disabled or unavailable."""
+    global _store  # noqa: PLW0603
+    if _store is not None:
+        return _store
+    with _store_lock:
+        if _store is None:
+            _store = _create_embedding_cache_store()
+    return _store
+
+
+def set_embedding_cache_store(store: EmbeddingCacheStore | None) -> None:
+    """Replace the process-wide embedding cache store. Passing ``None`` recreates it from the settings on next use."""
+    global _store  # noqa: PLW0603
+    with _store_lock:
+        _store = store
+
+
+def _create_embedding_cache_store() -> EmbeddingCacheStore | None:
+    from lfx.services.deps import get_settings_service
+
+    max_entries = DEFAULT_MAX_ENTRIES
+    path: str | None = None
+    settings_service = get_settings_service()
+    if settings_service is not None:
+        settings = settings_service.settings
+        if not getattr(settings, "embedding_cache_enabled", True):
+            return None
+        max_entries = getattr(settings, "embedding_cache_max_entries", max_entries)
+        path = getattr(settings, "embedding_cache_path", path)
+
+    sqlite_path = Path(path) if path else Path(CACHE_DIR) / SQLITE_FILE_NAME
+    try:
+        return EmbeddingCacheStore(sqlite_path, max_entries=max_entries)
+    except sqlite3.Error as exc:
+        logger.warning(f"Could not open the embedding cache at {sqlite_path}, embeddings will not be cached: {exc}")
+        return None
+
+
+def wrap_with_embedding_cache(embeddings: Any) -> Any:
+    """Wrap ``embeddings`` with :class:`CachedEmbeddings` if possible.
+
+    Objects that are not langchain ``Embeddings`` (e.g. server-side vectorize options), already wrapped models and
+    models that cannot be identified are returned unchanged, as are all models when the cache is disabled.
+    """
+    if not isinstance(embeddings, Embeddings) or isinstance(embeddings, CachedEmbeddings):
+        return embeddings
+    if (model_id := get_embedding_model_id(embeddings)) is None:
+        return embeddings
+    store = get_embedding_cache_store()
+    if store is None:
+        return embeddings
+    return CachedEmbeddings(embeddings, store, model_id=model_id)
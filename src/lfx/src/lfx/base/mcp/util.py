@@ -1,13 +1,17 @@
 import asyncio
 import contextlib
+import hashlib
 import inspect
+import itertools
 import json
 import os
 import platform
 import re
 import shutil
+import time
 import unicodedata
-from collections.abc import Awaitable, Callable
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
@@ -16,7 +20,7 @@ import httpx
 from anyio import ClosedResourceError
 from httpx import codes as httpx_codes
 from langchain_core.tools import StructuredTool
-from mcp import ClientSession
+from mcp import ClientSession, types
 from mcp.shared.exceptions import McpError
 from pydantic import BaseModel
 
@@ -62,6 +66,26 @@ def get_session_cleanup_interval() -> int:
     return _get_mcp_setting("mcp_session_cleanup_interval")
 
 
+def get_max_concurrent_requests_per_server() -> int:
+    """Get maximum number of in-flight requests per server (0 means unlimited)."""
+    return _get_mcp_setting("mcp_max_concurrent_requests_per_server", 0)
+
+
+def get_tool_cache_ttl() -> int:
+    """Get how long a server tool list is cached, in seconds."""
+    return _get_mcp_setting("mcp_tool_cache_ttl", 0)
+
+
+def get_session_ping_interval() -> int:
+    """Get how long a session may stay unused before it is pinged on reuse, in seconds."""
+    return _get_mcp_setting("mcp_session_ping_interval", 0)
+
+
+def get_session_ping_timeout() -> float:
+    """Get the timeout of the liveness ping, in seconds."""
+    return _get_mcp_setting("mcp_session_ping_timeout", 3.0)
+
+
 # RFC 7230 compliant header name pattern: token = 1*tchar
 # tchar = "!" / "#" / "$" / "%" / "&" / "'" / "*" / "+" / "-" / "." /
 #         "^" / "_" / "`" / "|" / "~" / DIGIT / ALPHA
@@ -456,6 +480,75 @@ async def _validate_connection_params(mode: str, command: str | None = None, url
         raise ValueError(msg)
 
 
+def _stable_hash(value: str) -> str:
+    """Hash that stays the same across processes, unlike ``hash()`` on strings."""
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+class _RequestLimiter:
+    """Caps the number of requests in flight to one MCP server across all of its sessions."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+        self.in_flight = 0
+        self.waiting = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore is not None:
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+class _PooledClientSession(ClientSession):
+    """Client session that shares a per-server request limit and reports tool list changes.
+
+    Pings bypass the limit so that liveness checks of a busy server do not queue behind tool calls.
+    """
+
+    def __init__(self, read_stream, write_stream, *, limiter: _RequestLimiter, on_tools_changed: Callable[[], None]):
+        super().__init__(read_stream, write_stream, message_handler=self._on_message)
+        self._limiter = limiter
+        self._on_tools_changed = on_tools_changed
+        self._transport_stream = write_stream
+
+    @property
+    def transport_closed(self) -> bool:
+        """Whether the transport shut down, checked without talking to the server.
+
+        The stream the session writes to is closed once the session shuts down, and nobody is left to receive from it
+        once the transport (subprocess pipe or HTTP connection) went away.
+        """
+        statistics = getattr(self._transport_stream, "statistics", None)
+        if statistics is None:
+            return False
+        stream_statistics = statistics()
+        return stream_statistics.open_send_streams == 0 or stream_statistics.open_receive_streams == 0
+
+    async def send_request(self, request, *args, **kwargs):
+        if isinstance(request.root, types.PingRequest):
+            return await super().send_request(request, *args, **kwargs)
+        async with self._limiter.slot():
+            return await super().send_request(request, *args, **kwargs)
+
+    async def _on_message(self, message) -> None:
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            self._on_tools_changed()
+
+
 class MCPSessionManager:
     """Manages persistent MCP sessions with proper context manager lifecycle.
 
@@ -465,6 +558,9 @@ class MCPSessionManager:
     3. Idle timeout for automatic session cleanup
     4. Periodic cleanup of stale sessions
     5. Transport preference caching to avoid retrying failed transports
+    6. Liveness checks from the transport state, with a ping only for sessions that sat idle
+    7. Tool lists cached per server, invalidated on ``notifications/tools/list_changed``
+    8. A per-server limit of requests in flight, and counters exposed through ``get_metrics``
     """
 
     def __init__(self):
@@ -478,6 +574,11 @@ class MCPSessionManager:
         # Cache which transport works for each server to avoid retrying failed transports
         # server_key -> "streamable_http" | "sse"
         self._transport_preference: dict[str, str] = {}
+        # server_key -> (expiry on the monotonic clock, tools)
+        self._tool_cache: dict[str, tuple[float, list]] = {}
+        self._limiters: dict[str, _RequestLimiter] = {}
+        self._stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._session_ids = itertools.count()
         self._cleanup_task = None
         self._start_cleanup_task()
 
@@ -534,7 +635,7 @@ class MCPSessionManager:
                 command_str = f"{connection_params.command} {' '.join(connection_params.args or [])}"
                 env_str = str(sorted((connection_params.env or {}).items()))
                 key_input = f"{command_str}|{env_str}"
-                return f"stdio_{hash(key_input)}"
+                return f"stdio_{_stable_hash(key_input)}"
         elif transport_type == "streamable_http" and (
             isinstance(connection_params, dict) and "url" in connection_params
         ):
@@ -542,53 +643,38 @@ class MCPSessionManager:
             url = connection_params["url"]
             headers = str(sorted((connection_params.get("headers", {})).items()))
             key_input = f"{url}|{headers}"
-            return f"streamable_http_{hash(key_input)}"
+            return f"streamable_http_{_stable_hash(key_input)}"
 
         # Fallback to a generic key
-        return f"{transport_type}_{hash(str(connection_params))}"
+        return f"{transport_type}_{_stable_hash(str(connection_params))}"
 
-    async def _validate_session_connectivity(self, session) -> bool:
-        """Validate that the session is actually usable by testing a simple operation."""
-        try:
-            # Try to list tools as a connectivity test (this is a lightweight operation)
-            # Use a shorter timeout for the connectivity test to fail fast
-            response = await asyncio.wait_for(session.list_tools(), timeout=3.0)
-        except (asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
-            await logger.adebug(f"Session connectivity test failed (standard error): {e}")
+    async def _validate_session_connectivity(self, session, last_used: float | None = None) -> bool:
+        """Validate that the session is still usable without paying a round-trip when possible.
+
+        Sessions whose transport is closed are rejected right away. Sessions used within the ping interval are
+        trusted as is, older ones must answer a ping within the ping timeout. Any error other than a server
+        answering that it does not support pings means the session is dead.
+        """
+        if isinstance(session, _PooledClientSession) and session.transport_closed:
+            await logger.adebug("Session connectivity test failed: transport is closed")
             return False
-        except Exception as e:
-            # Handle MCP-specific errors that might not be in the standard list
-            error_str = str(e)
-            if (
-                "ClosedResourceError" in str(type(e))
-                or "Connection closed" in error_str
-                or "Connection lost" in error_str
-                or "Connection failed" in error_str
-                or "Transport closed" in error_str
-                or "Stream closed" in error_str
-            ):
-                await logger.adebug(f"Session connectivity test failed (MCP connection error): {e}")
-                return False
-            # Re-raise unexpected errors
-            await logger.awarning(f"Unexpected error in connectivity test: {e}")
-            raise
-        else:
-            # Validate that we got a meaningful response
-            if response is None:
-                await logger.adebug("Session connectivity test failed: received None response")
-                return False
-            try:
-                # Check if we can access the tools list (even if empty)
-                tools = getattr(response, "tools", None)
-                if tools is None:
-                    await logger.adebug("Session connectivity test failed: no tools attribute in response")
-                    return False
-            except (AttributeError, TypeError) as e:
-                await logger.adebug(f"Session connectivity test failed while validating response: {e}")
-                return False
-            else:
-                await logger.adebug(f"Session connectivity test passed: found {len(tools)} tools")
+        if last_used is not None and asyncio.get_event_loop().time() - last_used < get_session_ping_interval():
+            return True
+        try:
+            await asyncio.wait_for(session.send_ping(), timeout=get_session_ping_timeout())
+        except McpError as e:
+            if e.error.code == types.METHOD_NOT_FOUND:
+                # The server answered, even if only to say it does not support pings
+                await logger.adebug(f"Session connectivity test passed: server answered the ping with {e}")
                 return True
+            await logger.adebug(f"Session connectivity test failed (MCP error): {e}")
+            return False
+        except Exception as e:  # noqa: BLE001
+            # Timeouts, closed streams and connection errors alike
+            await logger.adebug(f"Session connectivity test failed: {e!r}")
+            return False
+        await logger.adebug("Session connectivity test passed: ping answered")
+        return True
 
     async def get_session(self, context_id: str, connection_params, transport_type: str):
         """Get or create a session with improved reuse strategy.
@@ -613,12 +699,14 @@ class MCPSessionManager:
 
             # Check if session is still alive
             if not task.done():
+                last_used = session_info["last_used"]
                 # Update last used time
                 session_info["last_used"] = asyncio.get_event_loop().time()
 
                 # Quick health check
-                if await self._validate_session_connectivity(session):
+                if await self._validate_session_connectivity(session, last_used):
                     await logger.adebug(f"Reusing existing session {session_id} for server {server_key}")
+                    self._stats[server_key]["sessions_reused"] += 1
                     # record mapping & bump ref-count for backwards compatibility
                     self._context_to_session[context_id] = (server_key, session_id)
                     self._session_refcount[(server_key, session_id)] = (
@@ -626,6 +714,7 @@ class MCPSessionManager:
                     )
                     return session
                 await logger.ainfo(f"Session {session_id} for server {server_key} failed health check, cleaning up")
+                self._stats[server_key]["sessions_failed"] += 1
                 await self._cleanup_session_by_id(server_key, session_id)
             else:
                 # Task is done, clean up
@@ -641,18 +730,18 @@ class MCPSessionManager:
             )
             await self._cleanup_session_by_id(server_key, oldest_session_id)
 
-        # Create new session
-        session_id = f"{server_key}_{len(sessions)}"
+        # Create new session. Ids are never reused so a new session cannot replace a live one.
+        session_id = f"{server_key}_{next(self._session_ids)}"
         await logger.ainfo(f"Creating new session {session_id} for server {server_key}")
 
         if transport_type == "stdio":
-            session, task = await self._create_stdio_session(session_id, connection_params)
+            session, task = await self._create_stdio_session(session_id, connection_params, server_key=server_key)
             actual_transport = "stdio"
         elif transport_type == "streamable_http":
             # Pass the cached transport preference if available
             preferred_transport = self._transport_preference.get(server_key)
             session, task, actual_transport = await self._create_streamable_http_session(
-                session_id, connection_params, preferred_transport
+                session_id, connection_params, preferred_transport, server_key=server_key
             )
             # Cache the transport that worked for future connections
             self._transport_preference[server_key] = actual_transport
@@ -671,10 +760,87 @@ class MCPSessionManager:
         # register mapping & initial ref-count for the new session
         self._context_to_session[context_id] = (server_key, session_id)
         self._session_refcount[(server_key, session_id)] = 1
+        self._stats[server_key]["sessions_created"] += 1
 
         return session
 
-    async def _create_stdio_session(self, session_id: str, connection_params):
+    def _new_client_session(self, server_key: str | None, read, write) -> ClientSession:
+        """Create the client session of a pooled connection, bound to the request limiter of its server."""
+        if server_key is None:
+            return ClientSession(read, write)
+        return _PooledClientSession(
+            read,
+            write,
+            limiter=self._get_limiter(server_key),
+            on_tools_changed=lambda: self._on_tools_changed(server_key),
+        )
+
+    def _get_limiter(self, server_key: str) -> _RequestLimiter:
+        limiter = self._limiters.get(server_key)
+        if limiter is None:
+            limiter = self._limiters[server_key] = _RequestLimiter(get_max_concurrent_requests_per_server())
+        return limiter
+
+    def _on_tools_changed(self, server_key: str) -> None:
+        if self._tool_cache.pop(server_key, None) is not None:
+            self._stats[server_key]["tool_cache_invalidations"] += 1
+        logger.debug(f"Tool list of server {server_key} changed")
+
+    def get_cached_tools(self, connection_params, transport_type: str) -> list | None:
+        """Return the cached tool list of a server, or None if it is missing or expired."""
+        server_key = self._get_server_key(connection_params, transport_type)
+        cached = self._tool_cache.get(server_key)
+        if cached is None or cached[0] <= time.monotonic():
+            self._tool_cache.pop(server_key, None)
+            return None
+        self._stats[server_key]["tool_cache_hits"] += 1
+        return list(cached[1])
+
+    async def list_tools(self, session, connection_params, transport_type: str) -> list:
+        """List the tools of a server through ``session``, reusing the cached list while it is fresh."""
+        cached = self.get_cached_tools(connection_params, transport_type)
+        if cached is not None:
+            return cached
+        server_key = self._get_server_key(connection_params, transport_type)
+        self._stats[server_key]["tool_cache_misses"] += 1
+        response = await session.list_tools()
+        tools = list(response.tools)
+        ttl = get_tool_cache_ttl()
+        if ttl > 0:
+            self._tool_cache[server_key] = (time.monotonic() + ttl, tools)
+        return list(tools)
+
+    def invalidate_tools(self, connection_params=None, transport_type: str | None = None) -> None:
+        """Forget the cached tool list of one server, or of every server when called without arguments."""
+        if connection_params is None:
+            self._tool_cache.clear()
+            return
+        if transport_type is None:
+            msg = "transport_type is required to invalidate the tools of a single server"
+            raise ValueError(msg)
+        self._tool_cache.pop(self._get_server_key(connection_params, transport_type), None)
+
+    def get_metrics(self) -> dict[str, dict[str, int]]:
+        """Return pool gauges and counters per server key.
+
+        Gauges are ``sessions``, ``in_flight`` and ``waiting`` (requests queued behind the concurrency limit).
+        Counters are ``sessions_created``, ``sessions_reused``, ``sessions_failed``, ``tool_cache_hits``,
+        ``tool_cache_misses`` and ``tool_cache_invalidations``.
+        """
+        server_keys = set(self.sessions_by_server) | set(self._limiters) | set(self._stats)
+        metrics = {}
+        for server_key in sorted(server_keys):
+            limiter = self._limiters.get(server_key)
+            server_data = self.sessions_by_server.get(server_key, {})
+            metrics[server_key] = {
+                "sessions": len(server_data.get("sessions", {})),
+                "in_flight": limiter.in_flight if limiter else 0,
+                "waiting": limiter.waiting if limiter else 0,
+                **self._stats.get(server_key, {}),
+            }
+        return metrics
+
+    async def _create_stdio_session(self, session_id: str, connection_params, *, server_key: str | None = None):
         """Create a new stdio session as a background task to avoid context issues."""
         import asyncio
 
@@ -687,7 +853,7 @@ class MCPSessionManager:
             """Background task that keeps the session alive."""
             try:
                 async with stdio_client(connection_params) as (read, write):
-                    session = ClientSession(read, write)
+                    session = self._new_client_session(server_key, read, write)
                     async with session:
                         await session.initialize()
                         # Signal that session is ready
@@ -729,7 +895,12 @@ class MCPSessionManager:
         return session, task
 
     async def _create_streamable_http_session(
-        self, session_id: str, connection_params, preferred_transport: str | None = None
+        self,
+        session_id: str,
+        connection_params,
+        preferred_transport: str | None = None,
+        *,
+        server_key: str | None = None,
     ):
         """Create a new Streamable HTTP session with SSE fallback as a background task to avoid context issues.
 
@@ -737,6 +908,7 @@ class MCPSessionManager:
             session_id: Unique identifier for this session
             connection_params: Connection parameters including URL, headers, timeouts, verify_ssl
             preferred_transport: If set to "sse", skip Streamable HTTP and go directly to SSE
+            server_key: Key of the server in the pool, used to share its request limit
 
         Returns:
             tuple: (session, task, transport_used) where transport_used is "streamable_http" or "sse"
@@ -780,7 +952,7 @@ class MCPSessionManager:
                         timeout=connection_params["timeout_seconds"],
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write, _):
-                        session = ClientSession(read, write)
+                        session = self._new_client_session(server_key, read, write)
                         async with session:
                             # Initialize with a timeout to fail fast
                             await asyncio.wait_for(session.initialize(), timeout=2.0)
@@ -821,7 +993,7 @@ class MCPSessionManager:
                         sse_read_timeout,
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write):
-                        session = ClientSession(read, write)
+                        session = self._new_client_session(server_key, read, write)
                         async with session:
                             await session.initialize()
                             used_transport.append("sse")
@@ -1060,11 +1232,15 @@ class MCPStdioClient:
             param_hash = uuid.uuid4().hex[:8]
             self._session_context = f"default_{param_hash}"
 
-        # Get or create a persistent session
-        session = await self._get_or_create_session()
-        response = await session.list_tools()
+        # Reuse the tool list of this server while it is fresh; the session is then only created for tool calls
+        session_manager = self._get_session_manager()
+        tools = session_manager.get_cached_tools(self._connection_params, "stdio")
+        if tools is None:
+            # Get or create a persistent session
+            session = await self._get_or_create_session()
+            tools = await session_manager.list_tools(session, self._connection_params, "stdio")
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using stdio transport (SDK style)."""
@@ -1309,11 +1485,15 @@ class MCPStreamableHttpClient:
             param_hash = uuid.uuid4().hex[:8]
             self._session_context = f"default_http_{param_hash}"
 
-        # Get or create a persistent session (will try Streamable HTTP, then SSE fallback)
-        session = await self._get_or_create_session()
-        response = await session.list_tools()
+        # Reuse the tool list of this server while it is fresh; the session is then only created for tool calls
+        session_manager = self._get_session_manager()
+        tools = session_manager.get_cached_tools(self._connection_params, "streamable_http")
+        if tools is None:
+            # Get or create a persistent session (will try Streamable HTTP, then SSE fallback)
+            session = await self._get_or_create_session()
+            tools = await session_manager.list_tools(session, self._connection_params, "streamable_http")
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(
         self,
@@ -7,12 +7,15 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.language_models.llms import LLM
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import RunnableBinding
 
 from lfx.base.constants import STREAM_INFO_TEXT
+from lfx.base.models.response_cache import get_llm_response_cache
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import LanguageModel
-from lfx.inputs.inputs import BoolInput, InputTypes, MessageInput, MultilineInput
+from lfx.inputs.inputs import BoolInput, InputTypes, IntInput, MessageInput, MultilineInput
 from lfx.schema.message import Message
+from lfx.services.cache.utils import CACHE_MISS
 from lfx.template.field.base import Output
 from lfx.utils.constants import MESSAGE_SENDER_AI
 
@@ -47,6 +50,20 @@ class LCModelComponent(Component):
             advanced=False,
         ),
         BoolInput(name="stream", display_name="Stream", info=STREAM_INFO_TEXT, advanced=True),
+        BoolInput(
+            name="cache_responses",
+            display_name="Cache Responses",
+            info="Reuse the response of previous calls with the same model, parameters and messages.",
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL",
+            info="Seconds a cached response stays valid. Use 0 for the server default.",
+            value=0,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -215,6 +232,9 @@ class LCModelComponent(Component):
             raise ValueError(msg)
         system_message_added = False
         message = None
+        model = runnable
+        use_cache = getattr(self, "output_parser", None) is None and self._response_cache_enabled()
+        prompt_messages: list[BaseMessage] | None = None
         if input_value:
             if isinstance(input_value, Message):
                 with warnings.catch_warnings():
@@ -227,6 +247,11 @@ class LCModelComponent(Component):
                                 *prompt.messages,  # type: ignore[has-type]
                             ]
                             system_message_added = True
+                        if use_cache:
+                            try:
+                                prompt_messages = prompt.format_messages()
+                            except (KeyError, ValueError):
+                                prompt_messages = None
                         runnable = prompt | runnable
                     else:
                         messages.append(input_value.to_lc_message(self.name))
@@ -237,6 +262,14 @@ class LCModelComponent(Component):
             messages.insert(0, SystemMessage(content=system_message))
         inputs: list | dict = messages or {}
         lf_message = None
+        cache_key = None
+        if use_cache:
+            cache_key = self._get_response_cache_key(model, prompt_messages or messages)
+            if cache_key is not None:
+                cached = await get_llm_response_cache().aget(cache_key)
+                if cached is not CACHE_MISS:
+                    self.status = cached["content"]
+                    return Message(text=cached["content"])
         try:
             # TODO: Depreciated Feature to be removed in upcoming release
             if hasattr(self, "output_parser") and self.output_parser is not None:
@@ -266,8 +299,45 @@ class LCModelComponent(Component):
             if message := self._get_exception_message(e):
                 raise ValueError(message) from e
             raise
+        if cache_key is not None and isinstance(result, str):
+            await get_llm_response_cache().aset(cache_key, {"content": result}, ttl=getattr(self, "cache_ttl", 0))
         return lf_message or Message(text=result)
 
+    def _response_cache_enabled(self) -> bool:
+        """Whether responses should be served from and stored in the LLM response cache.
+
+        The cache is opt-in per component and can be bypassed for a single run with the
+        ``llm_cache_bypass`` key of the graph context.
+        """
+        if not getattr(self, "cache_responses", False):
+            return False
+        try:
+            bypass = bool(self.graph.context.get("llm_cache_bypass"))
+        except AttributeError:
+            bypass = False
+        if bypass:
+            get_llm_response_cache().record_bypass()
+        return not bypass
+
+    def _get_response_cache_key(self, model: LanguageModel, messages: list[BaseMessage]) -> str | None:
+        """Build the response cache key, or return None if the model cannot be identified reliably.
+
+        Arguments bound to the model, such as the tools of ``bind_tools``, ``tool_choice`` or ``stop``, are part of
+        the key: ``RunnableBinding`` forwards ``_get_llm_string`` to the bound model, which does not know them.
+        """
+        bound_kwargs: dict = {}
+        while isinstance(model, RunnableBinding):
+            bound_kwargs = {**model.kwargs, **bound_kwargs}
+            model = model.bound
+        get_llm_string = getattr(model, "_get_llm_string", None)
+        if get_llm_string is None or not messages:
+            return None
+        try:
+            llm_string = get_llm_string()
+        except (TypeError, ValueError, AttributeError):
+            return None
+        return get_llm_response_cache().build_key(llm_string, messages, bound_kwargs)
+
     async def _handle_stream(self, runnable, inputs):
         """Handle streaming responses from the language model.
 
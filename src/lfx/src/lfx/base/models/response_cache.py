@@ -0,0 +1,294 @@
+"""Response cache for language model components.
+
+Components derived from :class:`~lfx.base.models.model.LCModelComponent` can opt in to caching their responses
+with the ``cache_responses`` input. Entries are keyed on the model identity and parameters (the same
+``llm_string`` langchain uses for its global cache), the arguments bound to the model (tools, ``tool_choice``,
+``stop``...) and the normalized prompt messages, and are stored in an
+in-memory LRU tier optionally backed by a local SQLite database so that cached responses survive restarts.
+
+The cache is configured through the settings service:
+
+- ``llm_response_cache_backend``: ``"memory"`` or ``"sqlite"``
+- ``llm_response_cache_max_entries``: maximum number of entries kept per tier
+- ``llm_response_cache_ttl``: default time-to-live of an entry in seconds
+- ``llm_response_cache_path``: location of the SQLite database (defaults to the user cache directory)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_DIR, CACHE_MISS
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from langchain_core.messages import BaseMessage
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL = 60 * 60
+SQLITE_FILE_NAME = "llm_response_cache.sqlite"
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    bypasses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class InMemoryResponseCache:
+    """Thread-safe LRU of cached responses with per-entry expiration."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return CACHE_MISS
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return CACHE_MISS
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict, ttl: float | None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache:
+    """Persistent response cache stored in a local SQLite database.
+
+    Least recently accessed entries are evicted once ``max_entries`` is exceeded. All methods are blocking and
+    are meant to be called from a worker thread.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_accessed_at ON llm_response_cache (accessed_at)"
+        )
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock, closing(self._connection.cursor()) as cursor:
+            row = cursor.execute("SELECT value, expires_at FROM llm_response_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return CACHE_MISS
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                cursor.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                return CACHE_MISS
+            cursor.execute("UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return orjson.loads(value)
+
+    def set(self, key: str, value: dict, ttl: float | None) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock, closing(self._connection.cursor()) as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, orjson.dumps(value), expires_at, now),
+            )
+            cursor.execute("DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            cursor.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                "SELECT key FROM llm_response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_response_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+
+class LLMResponseCache:
+    """Two-tier response cache: an in-memory LRU in front of an optional persistent SQLite tier."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float | None = DEFAULT_TTL,
+        persistent: SQLiteResponseCache | None = None,
+    ) -> None:
+        self.memory = InMemoryResponseCache(max_entries=max_entries)
+        self.persistent = persistent
+        self.default_ttl = default_ttl
+        self.stats = ResponseCacheStats()
+
+    @staticmethod
+    def build_key(
+        llm_string: str, messages: Sequence[BaseMessage], bound_kwargs: Mapping[str, Any] | None = None
+    ) -> str:
+        """Build a cache key from the model identity/parameters, its bound arguments and the normalized messages."""
+        normalized = [normalize_message(message) for message in messages]
+        bound = normalize_bound_value(dict(bound_kwargs or {}))
+        payload = orjson.dumps([llm_string, bound, normalized], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    async def aget(self, key: str):
+        value = self.memory.get(key)
+        if value is CACHE_MISS and self.persistent is not None:
+            value = await asyncio.to_thread(self.persistent.get, key)
+            if value is not CACHE_MISS:
+                self.memory.set(key, value, self.default_ttl)
+        if value is CACHE_MISS:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def aset(self, key: str, value: dict, ttl: float | None = None) -> None:
+        ttl = ttl or self.default_ttl
+        self.memory.set(key, value, ttl)
+        if self.persistent is not None:
+            await asyncio.to_thread(self.persistent.set, key, value, ttl)
+        self.stats.writes += 1
+
+    def record_bypass(self) -> None:
+        self.stats.bypasses += 1
+
+    async def aclear(self) -> None:
+        self.memory.clear()
+        if self.persistent is not None:
+            await asyncio.to_thread(self.persistent.clear)
+        self.stats = ResponseCacheStats()
+
+
+def normalize_message(message: BaseMessage) -> dict[str, Any]:
+    """Reduce a message to the fields that influence the model response.
+
+    Message ids, response metadata and surrounding whitespace of text content are ignored.
+    """
+    content = message.content
+    if isinstance(content, str):
+        content = content.strip()
+    normalized: dict[str, Any] = {"type": message.type, "content": content}
+    if name := getattr(message, "name", None):
+        normalized["name"] = name
+    if tool_calls := getattr(message, "tool_calls", None):
+        normalized["tool_calls"] = [{"name": call["name"], "args": call["args"]} for call in tool_calls]
+    if tool_call_id := getattr(message, "tool_call_id", None):
+        normalized["tool_call_id"] = tool_call_id
+    return normalized
+
+
+def normalize_bound_value(value: Any) -> Any:
+    """Reduce an argument bound to a model, such as a tool or a response format, to JSON serializable data."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, dict):
+        return {str(key): normalize_bound_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [normalize_bound_value(item) for item in value]
+        return sorted(items, key=repr) if isinstance(value, set | frozenset) else items
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+
+    try:
+        # Tools, functions and pydantic models bound with bind_tools or with_structured_output
+        return convert_to_openai_tool(value)
+    except (TypeError, ValueError, AttributeError):
+        return f"{type(value).__module__}.{type(value).__qualname__}:{value!r}"
+
+
+_response_cache: LLMResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the process-wide response cache, creating it from the settings on first use."""
+    global _response_cache  # noqa: PLW0603
+    if _response_cache is not None:
+        return _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = _create_llm_response_cache()
+    return _response_cache
+
+
+def set_llm_response_cache(cache: LLMResponseCache | None) -> None:
+    """Replace the process-wide response cache. Passing ``None`` recreates it from the settings on next use."""
+    global _response_cache  # noqa: PLW0603
+    with _response_cache_lock:
+        _response_cache = cache
+
+
+def _create_llm_response_cache() -> LLMResponseCache:
+    from lfx.services.deps import get_settings_service
+
+    backend = "memory"
+    max_entries = DEFAULT_MAX_ENTRIES
+    ttl: float | None = DEFAULT_TTL
+    path: str | None = None
+    settings_service = get_settings_service()
+    if settings_service is not None:
+        settings = settings_service.settings
+        backend = getattr(settings, "llm_response_cache_backend", backend)
+        max_entries = getattr(settings, "llm_response_cache_max_entries", max_entries)
+        ttl = getattr(settings, "llm_response_cache_ttl", ttl)
+        path = getattr(settings, "llm_response_cache_path", path)
+
+    persistent = None
+    if backend == "sqlite":
+        sqlite_path = Path(path) if path else Path(CACHE_DIR) / SQLITE_FILE_NAME
+        try:
+            persistent = SQLiteResponseCache(sqlite_path, max_entries=max_entries)
+        except sqlite3.Error as exc:
+            logger.warning(f"Could not open the LLM response cache at {sqlite_path}, using memory only: {exc}")
+    return LLMResponseCache(max_entries=max_entries, default_ttl=ttl or None, persistent=persistent)
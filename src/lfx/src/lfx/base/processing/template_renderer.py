@@ -0,0 +1,137 @@
+"""Rendering of ``str.format`` templates over the rows of a DataFrame.
+
+Formatting a template row by row with ``DataFrame.iterrows`` builds a pandas ``Series`` and a dictionary for every
+row. :class:`CompiledTemplate` parses the template once into literal and field segments, converts each referenced
+column to strings in bulk and concatenates the columns as arrays, so the per-row work is a few string
+concatenations done by numpy.
+
+- fields naming a column, like ``{Name}``, are converted with a single ``astype(str)`` of the column
+- fields with a conversion, a format spec or an attribute or index lookup, like ``{Age:>3}`` or ``{meta[id]}``,
+  are formatted value by value, for their column only
+- templates ``str.format`` cannot map to columns (positional fields, nested format specs) fall back to formatting
+  each row, still without building a ``Series`` per row
+
+:meth:`CompiledTemplate.iter_render` renders the rows in chunks of ``chunk_size``, bounding the intermediate
+arrays of very large frames to one chunk.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# dtype kinds whose ``astype(str)`` matches ``str()`` of every value: bool, integers, floats, complex and objects
+_STR_COMPATIBLE_KINDS = frozenset("biufcOSU")
+_FIELD_KEY = re.compile(r"[^.\[]*")
+_formatter = string.Formatter()
+
+
+@dataclass(frozen=True)
+class _Field:
+    field_name: str
+    key: str
+    conversion: str | None
+    format_spec: str
+
+    @property
+    def is_column(self) -> bool:
+        """Whether the field is the plain value of a column."""
+        return self.field_name == self.key and not self.conversion and not self.format_spec
+
+    def format_value(self, value: Any) -> str:
+        obj, _ = _formatter.get_field(self.field_name, (), {self.key: value})
+        obj = _formatter.convert_field(obj, self.conversion)
+        return format(obj, self.format_spec)
+
+
+class CompiledTemplate:
+    """A ``str.format`` template parsed once and rendered over whole DataFrames.
+
+    Rendering a row gives the same text as ``template.format(**row)``, except that the values of a column keep the
+    dtype of the column instead of the common dtype of the row.
+
+    Args:
+        template: The template, with replacement fields naming the columns, e.g. ``"Name: {Name}"``.
+    """
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.segments: list[str | _Field] = []
+        # Whether every field maps to a column, otherwise rows are formatted one by one
+        self.vectorized = True
+        for literal, field_name, format_spec, conversion in _formatter.parse(template):
+            if literal:
+                self.segments.append(literal)
+            if field_name is None:
+                continue
+            key = _FIELD_KEY.match(field_name).group()
+            if not key or key.isdigit() or "{" in (format_spec or ""):
+                self.vectorized = False
+            self.segments.append(_Field(field_name, key, conversion, format_spec or ""))
+
+    @property
+    def fields(self) -> list[str]:
+        """The columns referenced by the template, in order of first use."""
+        return list(dict.fromkeys(segment.key for segment in self.segments if isinstance(segment, _Field)))
+
+    def render(self, df: pd.DataFrame) -> list[str]:
+        """Return the rendered text of every row of ``df``.
+
+        Raises:
+            KeyError: If the template references a column missing from ``df``.
+        """
+        if not self.vectorized:
+            return [self.template.format(**record) for record in df.to_dict("records")]
+
+        rendered: np.ndarray | None = None
+        for segment in self.segments:
+            part = segment if isinstance(segment, str) else self._render_field(df, segment)
+            rendered = part if rendered is None else rendered + part
+        if rendered is None:
+            return [""] * len(df)
+        if isinstance(rendered, str):
+            # A template without fields
+            return [rendered] * len(df)
+        return rendered.tolist()
+
+    def iter_render(self, df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[str]]:
+        """Render ``df`` by chunks of ``chunk_size`` rows."""
+        for start in range(0, len(df), chunk_size):
+            yield self.render(df.iloc[start : start + chunk_size])
+
+    def render_text(self, df: pd.DataFrame, sep: str = "\n", chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """Render every row of ``df`` and join them with ``sep``."""
+        return sep.join(sep.join(lines) for lines in self.iter_render(df, chunk_size))
+
+    @staticmethod
+    def _render_field(df: pd.DataFrame, field: _Field) -> np.ndarray:
+        if field.key not in df.columns:
+            raise KeyError(field.key)
+        column = df[field.key]
+        if column.ndim > 1:
+            # Duplicated column names, ``format(**row)`` keeps the last one
+            column = column.iloc[:, -1]
+        if not field.is_column:
+            return np.array([field.format_value(value) for value in column.tolist()], dtype=object)
+        if column.dtype.kind in _STR_COMPATIBLE_KINDS:
+            return column.astype(str).to_numpy(dtype=object)
+        # Datetimes, timedeltas, categoricals... are formatted like the scalars of the row
+        return np.array([str(value) for value in column.tolist()], dtype=object)
+
+
+@lru_cache(maxsize=128)
+def compile_template(template: str) -> CompiledTemplate:
+    """Return the compiled ``template``, compiled once per distinct template."""
+    return CompiledTemplate(template)
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from lfx.base.embeddings.cache import wrap_with_embedding_cache
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import Text, VectorStore
 from lfx.helpers.data import docs_to_data
@@ -30,6 +31,9 @@ def check_cached_vector_store(f):
         if should_cache and self._cached_vector_store is not None:
             return self._cached_vector_store
 
+        if getattr(self, "cache_embeddings", False) and "embedding" in self._attributes:
+            self._attributes["embedding"] = wrap_with_embedding_cache(self._attributes["embedding"])
+
         result = f(self, *args, **kwargs)
         self._cached_vector_store = result
         return result
@@ -78,6 +82,14 @@ class LCVectorStoreComponent(Component):
             info="If True, the vector store will be cached for the current build of the component. "
             "This is useful for components that have multiple output methods and want to share the same vector store.",
         ),
+        BoolInput(
+            name="cache_embeddings",
+            display_name="Cache Embeddings",
+            value=True,
+            advanced=True,
+            info="If True, document embeddings are cached locally by model and text, "
+            "so re-ingesting unchanged documents does not embed them again.",
+        ),
     ]
 
     outputs = [
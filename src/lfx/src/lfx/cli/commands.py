@@ -23,6 +23,7 @@ from lfx.cli.common import (
     is_port_in_use,
     load_graph_from_path,
 )
+from lfx.cli.graph_pool import DEFAULT_MAX_OVERFLOW, DEFAULT_POOL_SIZE, DEFAULT_POOL_TIMEOUT
 from lfx.cli.serve_app import FlowMeta, create_multi_serve_app
 
 # Initialize console
@@ -69,6 +70,21 @@ def serve_command(
         "--check-variables/--no-check-variables",
         help="Check global variables for environment compatibility",
     ),
+    pool_size: int = typer.Option(
+        DEFAULT_POOL_SIZE,
+        "--pool-size",
+        help="Number of pre-built graph replicas used to run concurrent requests",
+    ),
+    pool_max_overflow: int = typer.Option(
+        DEFAULT_MAX_OVERFLOW,
+        "--pool-max-overflow",
+        help="Extra graph replicas created when all pooled ones are busy (-1 for no limit)",
+    ),
+    pool_timeout: float = typer.Option(
+        DEFAULT_POOL_TIMEOUT,
+        "--pool-timeout",
+        help="Seconds a request waits for a graph replica once the overflow limit is reached",
+    ),
 ) -> None:
     """Serve LFX flows as a web API.
 
@@ -269,6 +285,9 @@ def serve_command(
             graphs=graphs,
             metas=metas,
             verbose_print=verbose_print,
+            pool_size=pool_size,
+            pool_max_overflow=pool_max_overflow,
+            pool_timeout=pool_timeout,
         )
 
         verbose_print("🚀 Starting single-flow server...")
@@ -12,12 +12,14 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import uuid
 import zipfile
+from contextvars import ContextVar
 from io import StringIO
 from pathlib import Path
 from shutil import which
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 from urllib.parse import urlparse
 
 import httpx
@@ -32,8 +34,11 @@ from lfx.load import load_flow_from_json
 from lfx.schema.schema import InputValueRequest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import ModuleType
 
+    from lfx.events.event_manager import EventManager
+
 # Attempt to import tomllib (3.11+) else fall back to tomli
 _toml_parser: ModuleType | None = None
 try:
@@ -293,12 +298,77 @@ def prepare_graph(graph, verbose_print):
         raise typer.Exit(1) from e
 
 
-async def execute_graph_with_capture(graph, input_value: str | None):
+class _ContextCapturingStream:
+    """Stand-in for ``sys.stdout``/``sys.stderr`` that writes to the capture buffer of the current context.
+
+    Output written outside of :func:`execute_graph_with_capture` goes to the wrapped stream, so concurrent graph runs
+    each capture their own output instead of swapping the process-wide streams under each other.
+    """
+
+    def __init__(self, stream: TextIO, buffer: ContextVar[StringIO | None]) -> None:
+        self.stream = stream
+        self._buffer = buffer
+
+    def write(self, text: str) -> int:
+        return (self._buffer.get() or self.stream).write(text)
+
+    def writelines(self, lines) -> None:
+        (self._buffer.get() or self.stream).writelines(lines)
+
+    def flush(self) -> None:
+        (self._buffer.get() or self.stream).flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)
+
+
+_captured_stdout: ContextVar[StringIO | None] = ContextVar("lfx_captured_stdout", default=None)
+_captured_stderr: ContextVar[StringIO | None] = ContextVar("lfx_captured_stderr", default=None)
+_capture_lock = threading.Lock()
+_active_captures = 0
+
+
+@contextlib.contextmanager
+def _capture_output() -> Iterator[tuple[StringIO, StringIO]]:
+    """Capture what the current context writes to stdout and stderr."""
+    global _active_captures  # noqa: PLW0603
+    with _capture_lock:
+        if not isinstance(sys.stdout, _ContextCapturingStream):
+            sys.stdout = _ContextCapturingStream(sys.stdout, _captured_stdout)
+        if not isinstance(sys.stderr, _ContextCapturingStream):
+            sys.stderr = _ContextCapturingStream(sys.stderr, _captured_stderr)
+        _active_captures += 1
+
+    captured_stdout = StringIO()
+    captured_stderr = StringIO()
+    stdout_token = _captured_stdout.set(captured_stdout)
+    stderr_token = _captured_stderr.set(captured_stderr)
+    try:
+        yield captured_stdout, captured_stderr
+    finally:
+        _captured_stdout.reset(stdout_token)
+        _captured_stderr.reset(stderr_token)
+        with _capture_lock:
+            _active_captures -= 1
+            # Put the original streams back once the last capture ends
+            if not _active_captures:
+                if isinstance(sys.stdout, _ContextCapturingStream):
+                    sys.stdout = sys.stdout.stream
+                if isinstance(sys.stderr, _ContextCapturingStream):
+                    sys.stderr = sys.stderr.stream
+
+
+async def execute_graph_with_capture(graph, input_value: str | None, *, event_manager: EventManager | None = None):
     """Execute a graph and capture output.
 
+    Output is captured per context rather than by swapping the process-wide streams, so graphs executed
+    concurrently on the same event loop (or in threads started from it) do not mix their logs.
+
     Args:
         graph: Graph object to execute
         input_value: Input value to pass to the graph
+        event_manager: Optional event manager receiving the events of the run as they happen (messages and tokens
+            sent by components, plus an ``end_vertex`` event each time a vertex finished building)
 
     Returns:
         Tuple of (results, captured_logs)
@@ -309,29 +379,22 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     # Create input request
     inputs = InputValueRequest(input_value=input_value) if input_value else None
 
-    # Capture output during execution
-    captured_stdout = StringIO()
-    captured_stderr = StringIO()
-
-    # Redirect stdout and stderr during graph execution
-    original_stdout = sys.stdout
-    original_stderr = sys.stderr
-
-    try:
-        sys.stdout = captured_stdout
-        sys.stderr = captured_stderr
-        results = [result async for result in graph.async_start(inputs)]
-    except Exception as exc:
-        # Capture any error output that was written to stderr
-        error_output = captured_stderr.getvalue()
-        if error_output:
-            # Add error output to the exception for better debugging
-            exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
-        raise
-    finally:
-        # Restore original stdout/stderr
-        sys.stdout = original_stdout
-        sys.stderr = original_stderr
+    with _capture_output() as (captured_stdout, captured_stderr):
+        try:
+            if event_manager is None:
+                results = [result async for result in graph.async_start(inputs)]
+            else:
+                results = []
+                async for result in graph.async_start(inputs, event_manager=event_manager):
+                    results.append(result)
+                    _send_end_vertex_event(event_manager, result)
+        except Exception as exc:
+            # Capture any error output that was written to stderr
+            error_output = captured_stderr.getvalue()
+            if error_output:
+                # Add error output to the exception for better debugging
+                exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
+            raise
 
     # Get captured logs
     captured_logs = captured_stdout.getvalue() + captured_stderr.getvalue()
@@ -339,6 +402,21 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     return results, captured_logs
 
 
+def _send_end_vertex_event(event_manager: EventManager, result) -> None:
+    vertex = getattr(result, "vertex", None)
+    if vertex is None:
+        return
+    event_manager.on_end_vertex(
+        data={
+            "build_data": {
+                "id": vertex.id,
+                "display_name": vertex.display_name,
+                "valid": getattr(result, "valid", True),
+            }
+        }
+    )
+
+
 def extract_result_data(results, captured_logs: str) -> dict:
     """Extract structured result data from graph execution results.
 
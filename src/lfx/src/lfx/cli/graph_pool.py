@@ -0,0 +1,204 @@
+"""Pool of reusable graph replicas for ``lfx serve``.
+
+Every request needs its own copy of the served graph because running a graph mutates it (built vertices, results,
+run queue, component state...). Deep-copying the graph on each request rebuilds every vertex and component and is
+the dominant per-request cost for larger flows, so the serve app keeps a few pre-built replicas instead and resets
+them to their pristine state after each run.
+
+A replica is reset by restoring the attribute dictionaries of the graph, its run manager, vertices, edges and
+component instances (and their inputs and outputs) captured right after the replica was built. Containers held in
+those attributes are copied so in-place mutations are undone too, while the objects they reference are kept.
+
+When every replica is busy the pool behaves like a database connection pool: up to ``max_overflow`` temporary
+replicas are deep-copied (``-1`` means no limit, which is what ``lfx serve`` did before the pool existed), and once
+that limit is reached requests wait up to ``timeout`` seconds for a replica to be released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from lfx.graph import Graph
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_OVERFLOW = -1
+DEFAULT_POOL_TIMEOUT = 30.0
+
+# Attributes holding the serialized flow definition. Runs never modify them, so they are restored without copying.
+_DEFINITION_ATTRIBUTES = frozenset(
+    {"_data", "_edges", "_graph_data", "_vertices", "data", "full_data", "raw_graph_data"}
+)
+
+
+class GraphPoolTimeoutError(TimeoutError):
+    """Raised when no graph replica became available within the pool timeout."""
+
+
+def _copy_state(state: dict[str, Any]) -> dict[str, Any]:
+    return {name: value if name in _DEFINITION_ATTRIBUTES else _copy_containers(value) for name, value in state.items()}
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy nested dicts, lists, sets and deques, keeping every other object shared."""
+    if isinstance(value, dict):
+        copied = copy.copy(value)
+        for key, item in value.items():
+            if isinstance(item, dict | list | set | deque):
+                copied[key] = _copy_containers(item)
+        return copied
+    if isinstance(value, list):
+        return [_copy_containers(item) if isinstance(item, dict | list | set | deque) else item for item in value]
+    if isinstance(value, set | deque):
+        return copy.copy(value)
+    return value
+
+
+class GraphSnapshot:
+    """Pristine state of a graph that can be restored after the graph ran."""
+
+    def __init__(self, graph: Graph) -> None:
+        self._states = [(obj, _copy_state(vars(obj))) for obj in self._tracked_objects(graph)]
+
+    @staticmethod
+    def _tracked_objects(graph: Graph) -> list[Any]:
+        objects: list[Any] = [graph, getattr(graph, "run_manager", None)]
+        objects.extend(getattr(graph, "edges", None) or ())
+        for vertex in getattr(graph, "vertices", None) or ():
+            objects.append(vertex)
+            component = getattr(vertex, "custom_component", None)
+            if component is not None:
+                objects.append(component)
+                objects.extend(getattr(component, "_inputs", {}).values())
+                objects.extend(getattr(component, "_outputs_map", {}).values())
+        seen: set[int] = set()
+        tracked = []
+        for obj in objects:
+            if obj is not None and hasattr(obj, "__dict__") and id(obj) not in seen:
+                seen.add(id(obj))
+                tracked.append(obj)
+        return tracked
+
+    def restore(self) -> None:
+        for obj, state in self._states:
+            attributes = vars(obj)
+            attributes.clear()
+            attributes.update(_copy_state(state))
+
+
+class _Replica:
+    __slots__ = ("graph", "overflow", "snapshot")
+
+    def __init__(self, graph: Graph, *, overflow: bool) -> None:
+        self.graph = graph
+        self.snapshot = GraphSnapshot(graph)
+        self.overflow = overflow
+
+
+class GraphPool:
+    """Pre-built replicas of a graph handed out to one run at a time.
+
+    Args:
+        graph: The prepared graph to replicate. It is never run itself.
+        size: Number of replicas built upfront and kept in the pool.
+        max_overflow: Number of temporary replicas created when all pooled ones are busy. ``-1`` means no limit.
+        timeout: Seconds to wait for a replica once the overflow limit is reached. ``None`` waits forever.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        timeout: float | None = DEFAULT_POOL_TIMEOUT,
+    ) -> None:
+        if size < 0:
+            msg = "size must be zero or positive"
+            raise ValueError(msg)
+        self.graph = graph
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self._idle: deque[_Replica] = deque(self._create_replica(overflow=False) for _ in range(size))
+        self._waiters: deque[asyncio.Future[_Replica]] = deque()
+        self._overflow = 0
+
+    @property
+    def idle(self) -> int:
+        """Number of replicas ready to be used."""
+        return len(self._idle)
+
+    @property
+    def overflow(self) -> int:
+        """Number of temporary replicas currently in use."""
+        return self._overflow
+
+    def _create_replica(self, *, overflow: bool) -> _Replica:
+        return _Replica(copy.deepcopy(self.graph), overflow=overflow)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Graph]:
+        """Lend a pristine replica of the graph for the duration of the context."""
+        replica = await self._checkout()
+        try:
+            yield replica.graph
+        finally:
+            self._checkin(replica)
+
+    async def _checkout(self) -> _Replica:
+        if self._idle:
+            return self._idle.popleft()
+        if self.max_overflow < 0 or self._overflow < self.max_overflow:
+            self._overflow += 1
+            try:
+                return self._create_replica(overflow=True)
+            except BaseException:
+                self._overflow -= 1
+                raise
+
+        waiter: asyncio.Future[_Replica] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # A replica was handed over while we were giving up; pass it on
+                self._checkin(waiter.result())
+            else:
+                waiter.cancel()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            msg = f"No graph replica became available within {self.timeout} seconds"
+            raise GraphPoolTimeoutError(msg) from None
+        finally:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(waiter)
+
+    def _checkin(self, replica: _Replica) -> None:
+        try:
+            replica.snapshot.restore()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Could not reset graph replica, discarding it: {exc}")
+            if replica.overflow:
+                self._overflow -= 1
+                return
+            replica = self._create_replica(overflow=False)
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(replica)
+                return
+        if replica.overflow:
+            self._overflow -= 1
+        else:
+            self._idle.append(replica)
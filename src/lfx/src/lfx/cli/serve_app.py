@@ -18,8 +18,8 @@ endpoints require the ``x-api-key`` header (or query parameter) validated by
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security
@@ -28,6 +28,14 @@ from fastapi.security import APIKeyHeader, APIKeyQuery
 from pydantic import BaseModel, Field
 
 from lfx.cli.common import execute_graph_with_capture, extract_result_data, get_api_key
+from lfx.cli.graph_pool import (
+    DEFAULT_MAX_OVERFLOW,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TIMEOUT,
+    GraphPool,
+    GraphPoolTimeoutError,
+)
+from lfx.events.stream import consume_and_yield
 from lfx.log.logger import logger
 
 if TYPE_CHECKING:
@@ -36,6 +44,9 @@ if TYPE_CHECKING:
 
     from lfx.graph import Graph
 
+# Number of events the stream endpoint buffers for a slow client before token producers have to wait
+DEFAULT_STREAM_BUFFER_SIZE = 256
+
 # Security - use the same pattern as Langflow main API
 API_KEY_NAME = "x-api-key"
 api_key_query = APIKeyQuery(name=API_KEY_NAME, scheme_name="API key query", auto_error=False)
@@ -258,39 +269,70 @@ class ErrorResponse(BaseModel):
 # -----------------------------------------------------------------------------
 
 
-async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
-    """Consumes events from a queue and yields them to the client while tracking timing metrics.
-
-    This coroutine continuously pulls events from the input queue and yields them to the client.
-    It tracks timing metrics for how long events spend in the queue and how long the client takes
-    to process them.
-
-    Args:
-        queue (asyncio.Queue): The queue containing events to be consumed and yielded
-        client_consumed_queue (asyncio.Queue): A queue for tracking when the client has consumed events
+class BoundedEventQueue:
+    """Queue between a graph run and its SSE response that buffers a bounded number of events.
 
-    Yields:
-        The value from each event in the queue
+    Components send tokens from worker threads (``asyncio.to_thread``). Those ``put_nowait`` calls wait for room in
+    the buffer, so a slow client slows the model stream down instead of letting events pile up in memory. Events put
+    from the event loop thread cannot wait and are always accepted; they are few (messages, vertex and end events).
+    Once :meth:`close` is called, for instance because the client disconnected, new events are dropped and waiting
+    producers are released.
 
-    Notes:
-        - Events are tuples of (event_id, value, put_time)
-        - Breaks the loop when receiving a None value, signaling completion
-        - Tracks and logs timing metrics for queue time and client processing time
-        - Notifies client consumption via client_consumed_queue
+    Items are ``(event_id, value, put_time)`` tuples as produced by :class:`~lfx.events.event_manager.EventManager`.
     """
-    while True:
-        event_id, value, put_time = await queue.get()
-        if value is None:
-            break
-        get_time = time.time()
-        yield value
-        get_time_yield = time.time()
-        client_consumed_queue.put_nowait(event_id)
-        logger.debug(
-            f"consumed event {event_id} "
-            f"(time in queue, {get_time - put_time:.4f}, "
-            f"client {get_time_yield - get_time:.4f})"
-        )
+
+    def __init__(self, maxsize: int = DEFAULT_STREAM_BUFFER_SIZE) -> None:
+        self.maxsize = maxsize
+        self._queue: asyncio.Queue[tuple[bool, tuple]] = asyncio.Queue()
+        self._slots = threading.Semaphore(maxsize)
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def put_nowait(self, item: tuple) -> None:
+        if self._closed:
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            self._queue.put_nowait((False, item))
+            return
+        self._slots.acquire()
+        if self._closed:
+            # Woken up by close(): let the next waiting producer go as well
+            self._slots.release()
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, (True, item))
+        except RuntimeError:
+            # The event loop is closed, nobody is listening anymore
+            self._slots.release()
+
+    async def put(self, item: tuple) -> None:
+        self.put_nowait(item)
+
+    async def get(self) -> tuple:
+        counted, item = await self._queue.get()
+        if counted:
+            self._slots.release()
+        return item
+
+    def get_nowait(self) -> tuple:
+        counted, item = self._queue.get_nowait()
+        if counted:
+            self._slots.release()
+        return item
+
+    def close(self) -> None:
+        """Stop accepting events and release the producers waiting for room."""
+        if not self._closed:
+            self._closed = True
+            self._slots.release()
 
 
 async def run_flow_generator_for_serve(
@@ -298,7 +340,6 @@ async def run_flow_generator_for_serve(
     input_request: StreamRequest,
     flow_id: str,
     event_manager,
-    client_consumed_queue: asyncio.Queue,
 ) -> None:
     """Executes a flow asynchronously and manages event streaming to the client.
 
@@ -310,30 +351,26 @@ async def run_flow_generator_for_serve(
         input_request (StreamRequest): The input parameters for the flow
         flow_id (str): The ID of the flow being executed
         event_manager: Manages the streaming of events to the client
-        client_consumed_queue (asyncio.Queue): Tracks client consumption of events
 
     Events Generated:
         - "add_message": Sent when new messages are added during flow execution
         - "token": Sent for each token generated during streaming
+        - "end_vertex": Sent each time a component finished building
         - "end": Sent when flow execution completes, includes final result
         - "error": Sent if an error occurs during execution
 
     Notes:
-        - Runs the flow with streaming enabled via execute_graph_with_capture()
+        - Events are sent while the flow runs, through the event manager handed to execute_graph_with_capture()
         - On success, sends the final result via event_manager.on_end()
         - On error, logs the error and sends it via event_manager.on_error()
         - Always sends a final None event to signal completion
     """
     try:
-        # For the serve app, we'll use execute_graph_with_capture with streaming
-        # Note: This is a simplified version. In a full implementation, you might want
-        # to integrate with the full LFX streaming pipeline from endpoints.py
-        results, logs = await execute_graph_with_capture(graph, input_request.input_value)
+        results, logs = await execute_graph_with_capture(graph, input_request.input_value, event_manager=event_manager)
         result_data = extract_result_data(results, logs)
 
         # Send the final result
         event_manager.on_end(data={"result": result_data})
-        await client_consumed_queue.get()
     except Exception as e:  # noqa: BLE001
         logger.error(f"Error running flow {flow_id}: {e}")
         event_manager.on_error(data={"error": str(e)})
@@ -341,6 +378,17 @@ async def run_flow_generator_for_serve(
         await event_manager.queue.put((None, None, time.time()))
 
 
+async def stream_events(queue: BoundedEventQueue, run_task: asyncio.Task) -> AsyncGenerator:
+    """Yield the events of a flow run and cancel the run if the client goes away before it finished."""
+    try:
+        async for value in consume_and_yield(queue):
+            yield value
+    finally:
+        queue.close()
+        if not run_task.done():
+            run_task.cancel()
+
+
 # -----------------------------------------------------------------------------
 # Application factory
 # -----------------------------------------------------------------------------
@@ -352,6 +400,10 @@ def create_multi_serve_app(
     graphs: dict[str, Graph],
     metas: dict[str, FlowMeta],
     verbose_print: Callable[[str], None],  # noqa: ARG001
+    pool_size: int = DEFAULT_POOL_SIZE,
+    pool_max_overflow: int = DEFAULT_MAX_OVERFLOW,
+    pool_timeout: float | None = DEFAULT_POOL_TIMEOUT,
+    stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
 ) -> FastAPI:
     """Create a FastAPI app exposing multiple LFX flows.
 
@@ -366,6 +418,15 @@ def create_multi_serve_app(
         Mapping ``flow_id -> FlowMeta`` containing metadata for each flow.
     verbose_print
         Diagnostic printer inherited from the CLI (unused, kept for backward compatibility).
+    pool_size
+        Number of pre-built replicas kept for each flow. Requests run on a replica instead of a fresh deep copy of
+        the graph, see :class:`lfx.cli.graph_pool.GraphPool`.
+    pool_max_overflow
+        Number of temporary replicas created per flow when all pooled ones are busy (``-1`` for no limit).
+    pool_timeout
+        Seconds a request waits for a replica once the overflow limit is reached.
+    stream_buffer_size
+        Number of events buffered per ``/stream`` request before token producers wait for the client.
     """
     if set(graphs) != set(metas):  # pragma: no cover - sanity check
         msg = "graphs and metas must contain the same keys"
@@ -401,6 +462,7 @@ def create_multi_serve_app(
         """Create a router for a specific flow to avoid loop variable binding issues."""
         analysis = _analyze_graph_structure(graph)
         run_description = _generate_dynamic_run_description(graph)
+        graph_pool = GraphPool(graph, size=pool_size, max_overflow=pool_max_overflow, timeout=pool_timeout)
 
         router = APIRouter(
             prefix=f"/flows/{flow_id}",
@@ -419,8 +481,8 @@ def create_multi_serve_app(
             request: RunRequest,
         ) -> RunResponse:
             try:
-                graph_copy = deepcopy(graph)
-                results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
+                async with graph_pool.acquire() as graph_replica:
+                    results, logs = await execute_graph_with_capture(graph_replica, request.input_value)
                 result_data = extract_result_data(results, logs)
 
                 # Debug logging
@@ -454,6 +516,8 @@ def create_multi_serve_app(
                     type=result_data.get("type", "message"),
                     component=result_data.get("component", ""),
                 )
+            except GraphPoolTimeoutError as exc:
+                raise HTTPException(status_code=503, detail=str(exc)) from exc
             except Exception as exc:  # noqa: BLE001
                 import traceback
 
@@ -488,26 +552,34 @@ def create_multi_serve_app(
                 # Import here to avoid potential circular imports
                 from lfx.events.event_manager import create_stream_tokens_event_manager
 
-                asyncio_queue: asyncio.Queue = asyncio.Queue()
-                asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
+                asyncio_queue = BoundedEventQueue(stream_buffer_size)
                 event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
-
-                main_task = asyncio.create_task(
-                    run_flow_generator_for_serve(
-                        graph=graph,
-                        input_request=request,
-                        flow_id=flow_id,
-                        event_manager=event_manager,
-                        client_consumed_queue=asyncio_queue_client_consumed,
-                    )
-                )
+                event_manager.register_event("on_end_vertex", "end_vertex")
+                event_manager.register_event("on_error", "error")
+
+                async def run_on_replica() -> None:
+                    try:
+                        async with graph_pool.acquire() as graph_replica:
+                            await run_flow_generator_for_serve(
+                                graph=graph_replica,
+                                input_request=request,
+                                flow_id=flow_id,
+                                event_manager=event_manager,
+                            )
+                    except GraphPoolTimeoutError as exc:
+                        logger.error(f"Error running flow {flow_id}: {exc}")
+                        event_manager.on_error(data={"error": str(exc)})
+                        await asyncio_queue.put((None, None, time.time()))
+
+                main_task = asyncio.create_task(run_on_replica())
 
                 async def on_disconnect() -> None:
                     logger.debug(f"Client disconnected from flow {flow_id}, closing tasks")
+                    asyncio_queue.close()
                     main_task.cancel()
 
                 return StreamingResponse(
-                    consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
+                    stream_events(asyncio_queue, main_task),
                     background=on_disconnect,
                     media_type="text/event-stream",
                 )
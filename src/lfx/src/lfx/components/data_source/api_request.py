@@ -27,6 +27,7 @@ from lfx.io import (
 from lfx.schema.data import Data
 from lfx.schema.dotdict import dotdict
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
+from lfx.utils.http_client_pool import CACHE_EXTENSION, MAX_RETRIES_EXTENSION, get_http_client_pool
 from lfx.utils.ssrf_protection import SSRFProtectionError, validate_url_for_ssrf
 
 # Define fields for each mode
@@ -172,6 +173,26 @@ class APIRequestComponent(Component):
             ),
             advanced=True,
         ),
+        BoolInput(
+            name="cache_responses",
+            display_name="Cache Responses",
+            value=False,
+            info=(
+                "Reuse GET responses while the server marks them as fresh (Cache-Control, Expires) "
+                "and revalidate them with ETag or Last-Modified once stale."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            value=0,
+            info=(
+                "Number of times GET, PUT and DELETE requests are retried after a connection error "
+                "or a 429, 502, 503 or 504 response, with exponential backoff."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -306,6 +327,8 @@ class APIRequestComponent(Component):
         follow_redirects: bool = True,
         save_to_file: bool = False,
         include_httpx_metadata: bool = False,
+        cache_responses: bool = False,
+        max_retries: int = 0,
     ) -> Data:
         method = method.upper()
         if method not in {"GET", "POST", "PATCH", "PUT", "DELETE"}:
@@ -324,6 +347,7 @@ class APIRequestComponent(Component):
                 "json": processed_body,
                 "timeout": timeout,
                 "follow_redirects": follow_redirects,
+                "extensions": {CACHE_EXTENSION: cache_responses, MAX_RETRIES_EXTENSION: max_retries},
             }
             response = await client.request(**request_params)
 
@@ -471,7 +495,8 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
+        # Connections to the origin are kept alive and shared with the other components of the process
+        async with get_http_client_pool().client(url) as client:
             result = await self.make_request(
                 client,
                 method,
@@ -482,6 +507,8 @@ class APIRequestComponent(Component):
                 follow_redirects=follow_redirects,
                 save_to_file=save_to_file,
                 include_httpx_metadata=include_httpx_metadata,
+                cache_responses=self.cache_responses,
+                max_retries=self.max_retries,
             )
         self.status = result
         return result
@@ -1,10 +1,16 @@
 import importlib
 import re
 
-import requests
 from bs4 import BeautifulSoup
-from langchain_community.document_loaders import RecursiveUrlLoader
 
+from lfx.base.data.url_crawler import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY_PER_HOST,
+    DEFAULT_MAX_PAGES,
+    CrawlConfig,
+    URLCrawler,
+)
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing.range_spec import RangeSpec
 from lfx.helpers.data import safe_convert
@@ -39,11 +45,13 @@ class URLComponent(Component):
     """A component that loads and parses content from web pages recursively.
 
     This component allows fetching content from one or more URLs, with options to:
-    - Control crawl depth
-    - Prevent crawling outside the root domain
-    - Use async loading for better performance
+    - Control crawl depth and the number of pages fetched
+    - Prevent crawling outside the root domain and respect robots.txt
+    - Fetch several pages at once, with a limit per host
     - Extract either raw HTML or clean text
     - Configure request headers and timeouts
+
+    Pages are crawled by :class:`~lfx.base.data.url_crawler.URLCrawler` without blocking the event loop.
     """
 
     display_name = "URL"
@@ -86,8 +94,8 @@ class URLComponent(Component):
             name="prevent_outside",
             display_name="Prevent Outside",
             info=(
-                "If enabled, only crawls URLs within the same domain as the root URL. "
-                "This helps prevent the crawler from going to external websites."
+                "If enabled, only crawls URLs under the root URL, i.e. starting with it. "
+                "This helps prevent the crawler from going to external websites or other sections of the site."
             ),
             value=True,
             required=False,
@@ -97,13 +105,37 @@ class URLComponent(Component):
             name="use_async",
             display_name="Use Async",
             info=(
-                "If enabled, uses asynchronous loading which can be significantly faster "
-                "but might use more system resources."
+                "If enabled, fetches several pages at the same time, which can be significantly faster "
+                "but might use more system resources. If disabled, pages are fetched one at a time."
             ),
             value=True,
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="max_pages",
+            display_name="Max Pages",
+            info="Maximum number of pages fetched by the whole crawl, across all the URLs.",
+            value=DEFAULT_MAX_PAGES,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency_per_host",
+            display_name="Max Requests per Host",
+            info="Maximum number of pages fetched at the same time from the same host.",
+            value=DEFAULT_MAX_CONCURRENCY_PER_HOST,
+            required=False,
+            advanced=True,
+        ),
+        BoolInput(
+            name="respect_robots",
+            display_name="Respect robots.txt",
+            info="If enabled, links disallowed by the robots.txt of their site are not followed.",
+            value=True,
+            required=False,
+            advanced=True,
+        ),
         DropdownInput(
             name="format",
             display_name="Output Format",
@@ -215,35 +247,33 @@ class URLComponent(Component):
 
         return url
 
-    def _create_loader(self, url: str) -> RecursiveUrlLoader:
-        """Creates a RecursiveUrlLoader instance with the configured settings.
-
-        Args:
-            url: The URL to load
+    def _create_crawler(self) -> URLCrawler:
+        """Creates a URLCrawler instance with the configured settings.
 
         Returns:
-            RecursiveUrlLoader: Configured loader instance
+            URLCrawler: Configured crawler instance
         """
         headers_dict = {header["key"]: header["value"] for header in self.headers if header["value"] is not None}
         extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
 
-        return RecursiveUrlLoader(
-            url=url,
+        config = CrawlConfig(
             max_depth=self.max_depth,
             prevent_outside=self.prevent_outside,
-            use_async=self.use_async,
-            extractor=extractor,
+            max_pages=self.max_pages,
+            max_concurrency=DEFAULT_MAX_CONCURRENCY if self.use_async else 1,
+            max_concurrency_per_host=self.max_concurrency_per_host,
             timeout=self.timeout,
             headers=headers_dict,
+            respect_robots=self.respect_robots,
             check_response_status=self.check_response_status,
             continue_on_failure=self.continue_on_failure,
-            base_url=url,  # Add base_url to ensure consistent domain crawling
-            autoset_encoding=self.autoset_encoding,  # Enable automatic encoding detection
-            exclude_dirs=[],  # Allow customization of excluded directories
-            link_regex=None,  # Allow customization of link filtering
+            filter_text_html=self.filter_text_html,
+            autoset_encoding=self.autoset_encoding,
+            cache_dir=DEFAULT_CACHE_DIR,
         )
+        return URLCrawler(config, extractor=extractor)
 
-    def fetch_url_contents(self) -> list[dict]:
+    async def fetch_url_contents(self) -> list[dict]:
         """Load documents from the configured URLs.
 
         Returns:
@@ -253,59 +283,40 @@ class URLComponent(Component):
             ValueError: If no valid URLs are provided or if there's an error loading documents
         """
         try:
-            urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
-            logger.debug(f"URLs: {urls}")
+            urls = list(dict.fromkeys(self.ensure_url(url) for url in self.urls if url.strip()))
+            await logger.adebug(f"URLs: {urls}")
             if not urls:
                 msg = "No valid URLs provided."
                 raise ValueError(msg)
 
-            all_docs = []
-            for url in urls:
-                logger.debug(f"Loading documents from {url}")
-
-                try:
-                    loader = self._create_loader(url)
-                    docs = loader.load()
-
-                    if not docs:
-                        logger.warning(f"No documents found for {url}")
-                        continue
-
-                    logger.debug(f"Found {len(docs)} documents from {url}")
-                    all_docs.extend(docs)
-
-                except requests.exceptions.RequestException as e:
-                    logger.exception(f"Error loading documents from {url}: {e}")
-                    continue
-
-            if not all_docs:
+            pages = await self._create_crawler().crawl(urls)
+            if not pages:
                 msg = "No documents were successfully loaded from any URL"
                 raise ValueError(msg)
 
-            # data = [Data(text=doc.page_content, **doc.metadata) for doc in all_docs]
             data = [
                 {
-                    "text": safe_convert(doc.page_content, clean_data=True),
-                    "url": doc.metadata.get("source", ""),
-                    "title": doc.metadata.get("title", ""),
-                    "description": doc.metadata.get("description", ""),
-                    "content_type": doc.metadata.get("content_type", ""),
-                    "language": doc.metadata.get("language", ""),
+                    "text": safe_convert(page.content, clean_data=True),
+                    "url": page.url,
+                    "title": page.title,
+                    "description": page.description,
+                    "content_type": page.content_type,
+                    "language": page.language,
                 }
-                for doc in all_docs
+                for page in pages
             ]
         except Exception as e:
             error_msg = e.message if hasattr(e, "message") else e
             msg = f"Error loading documents: {error_msg!s}"
-            logger.exception(msg)
+            await logger.aexception(msg)
             raise ValueError(msg) from e
         return data
 
-    def fetch_content(self) -> DataFrame:
+    async def fetch_content(self) -> DataFrame:
         """Convert the documents to a DataFrame."""
-        return DataFrame(data=self.fetch_url_contents())
+        return DataFrame(data=await self.fetch_url_contents())
 
-    def fetch_content_as_message(self) -> Message:
+    async def fetch_content_as_message(self) -> Message:
         """Convert the documents to a Message."""
-        url_contents = self.fetch_url_contents()
+        url_contents = await self.fetch_url_contents()
         return Message(text="\n\n".join([x["text"] for x in url_contents]), data={"data": url_contents})
@@ -17,6 +17,7 @@ from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
+from lfx.base.embeddings.cache import wrap_with_embedding_cache
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from lfx.components.processing.converter import convert_to_dataframe
@@ -384,7 +385,8 @@ class KnowledgeIngestionComponent(Component):
             vector_store_dir.mkdir(parents=True, exist_ok=True)
 
             # Create embeddings model
-            embedding_function = self._build_embeddings(embedding_model, api_key)
+            # Cached so that re-ingesting unchanged rows does not embed them again
+            embedding_function = wrap_with_embedding_cache(self._build_embeddings(embedding_model, api_key))
 
             # Convert DataFrame to Data objects (following Local DB pattern)
             data_objects = await self._convert_df_to_data_objects(df_source, config_list)
@@ -87,12 +87,8 @@ class LoopComponent(Component):
 
     def update_dependency(self):
         item_dependency_id = self.get_incoming_edge_by_target_param("item")
-        if item_dependency_id not in self.graph.run_manager.run_predecessors[self._id]:
-            self.graph.run_manager.run_predecessors[self._id].append(item_dependency_id)
-            # CRITICAL: Also update run_map so remove_from_predecessors() works correctly
-            # run_map[predecessor] = list of vertices that depend on predecessor
-            if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
-                self.graph.run_manager.run_map[item_dependency_id].append(self._id)
+        # Also updates run_map so remove_from_predecessors() works correctly
+        self.graph.run_manager.add_predecessor(self._id, item_dependency_id)
 
     def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
@@ -15,7 +15,7 @@ from lfx.base.models.model_utils import get_ollama_models, is_valid_ollama_url
 from lfx.base.models.openai_constants import OPENAI_CHAT_MODEL_NAMES, OPENAI_REASONING_MODEL_NAMES
 from lfx.field_typing import LanguageModel
 from lfx.field_typing.range_spec import RangeSpec
-from lfx.inputs.inputs import BoolInput, MessageTextInput, StrInput
+from lfx.inputs.inputs import BoolInput, IntInput, MessageTextInput, StrInput
 from lfx.io import DropdownInput, MessageInput, MultilineInput, SecretStrInput, SliderInput
 from lfx.log.logger import logger
 from lfx.schema.dotdict import dotdict
@@ -140,6 +140,20 @@ class LanguageModelComponent(LCModelComponent):
             value=False,
             advanced=True,
         ),
+        BoolInput(
+            name="cache_responses",
+            display_name="Cache Responses",
+            info="Reuse the response of previous calls with the same model, parameters and messages.",
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL",
+            info="Seconds a cached response stays valid. Use 0 for the server default.",
+            value=0,
+            advanced=True,
+        ),
         SliderInput(
             name="temperature",
             display_name="Temperature",
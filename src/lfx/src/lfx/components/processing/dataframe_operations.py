@@ -1,10 +1,12 @@
+from functools import partial
+
 import pandas as pd
 
 from lfx.custom.custom_component.component import Component
 from lfx.inputs import SortableListInput
 from lfx.io import BoolInput, DataFrameInput, DropdownInput, IntInput, MessageTextInput, Output, StrInput
 from lfx.log.logger import logger
-from lfx.schema.dataframe import DataFrame
+from lfx.schema.dataframe import DataFrame, DataFrameStep, LazyDataFrame
 
 
 class DataFrameOperationsComponent(Component):
@@ -138,6 +140,17 @@ class DataFrameOperationsComponent(Component):
             dynamic=True,
             show=False,
         ),
+        BoolInput(
+            name="lazy_execution",
+            display_name="Lazy Execution",
+            info=(
+                "When the output only feeds another DataFrame Operations component, leave the operation to it, "
+                "so chained operations run together and their intermediate DataFrames are not kept. "
+                "The component then shows the pending operations instead of the rows."
+            ),
+            advanced=True,
+            value=False,
+        ),
     ]
 
     outputs = [
@@ -205,7 +218,8 @@ class DataFrameOperationsComponent(Component):
         return build_config
 
     def perform_operation(self) -> DataFrame:
-        df_copy = self.df.copy()
+        # Operations left by a lazy upstream component run together with this one
+        plan = self.df if isinstance(self.df, LazyDataFrame) else LazyDataFrame(self.df)
 
         # Handle SortableListInput format for operation
         operation_input = getattr(self, "operation", [])
@@ -214,100 +228,160 @@ class DataFrameOperationsComponent(Component):
         else:
             op = ""
 
-        # If no operation selected, return original DataFrame
-        if not op:
-            return df_copy
+        # If no operation selected, the original DataFrame is returned
+        if op:
+            plan = plan.then(self._operation_step(op))
+
+        if self._can_defer():
+            self.status = f"Deferred to the next component: {', '.join(step.name for step in plan.steps)}"
+            return plan
+        return plan.collect()
 
+    def _operation_step(self, op: str) -> DataFrameStep:
+        """Return the step running ``op`` with the current parameters of the component."""
         if op == "Filter":
-            return self.filter_rows_by_value(df_copy)
+            # Handle regular DropdownInput format (just a string value)
+            operator = getattr(self, "filter_operator", "equals")  # Default to equals for backward compatibility
+            func = partial(_filter_rows, column=self.column_name, operator=operator, value=self.filter_value)
+            return DataFrameStep(op, func)
         if op == "Sort":
-            return self.sort_by_column(df_copy)
+            return DataFrameStep(op, partial(_sort, column=self.column_name, ascending=self.ascending))
         if op == "Drop Column":
-            return self.drop_column(df_copy)
+            return DataFrameStep(op, partial(_drop_column, column=self.column_name))
         if op == "Rename Column":
-            return self.rename_column(df_copy)
+            return DataFrameStep(op, partial(_rename_column, column=self.column_name, new_name=self.new_column_name))
         if op == "Add Column":
-            return self.add_column(df_copy)
+            func = partial(_add_column, name=self.new_column_name, value=self.new_column_value)
+            return DataFrameStep(op, func, in_place=True)
         if op == "Select Columns":
-            return self.select_columns(df_copy)
+            columns = [col.strip() for col in self.columns_to_select]
+            return DataFrameStep(op, partial(_select_columns, columns=columns))
         if op == "Head":
-            return self.head(df_copy)
+            return DataFrameStep(op, partial(_head, num_rows=self.num_rows), copies=False)
         if op == "Tail":
-            return self.tail(df_copy)
+            return DataFrameStep(op, partial(_tail, num_rows=self.num_rows), copies=False)
         if op == "Replace Value":
-            return self.replace_values(df_copy)
+            func = partial(_replace_values, column=self.column_name, old=self.replace_value, new=self.replacement_value)
+            return DataFrameStep(op, func, in_place=True)
         if op == "Drop Duplicates":
-            return self.drop_duplicates(df_copy)
+            return DataFrameStep(op, partial(_drop_duplicates, column=self.column_name))
+
         msg = f"Unsupported operation: {op}"
         logger.error(msg)
         raise ValueError(msg)
 
-    def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
-        column = df[self.column_name]
-        filter_value = self.filter_value
-
-        # Handle regular DropdownInput format (just a string value)
-        operator = getattr(self, "filter_operator", "equals")  # Default to equals for backward compatibility
-
-        if operator == "equals":
-            mask = column == filter_value
-        elif operator == "not equals":
-            mask = column != filter_value
-        elif operator == "contains":
-            mask = column.astype(str).str.contains(str(filter_value), na=False)
-        elif operator == "not contains":
-            mask = ~column.astype(str).str.contains(str(filter_value), na=False)
-        elif operator == "starts with":
-            mask = column.astype(str).str.startswith(str(filter_value), na=False)
-        elif operator == "ends with":
-            mask = column.astype(str).str.endswith(str(filter_value), na=False)
-        elif operator == "greater than":
-            try:
-                # Try to convert filter_value to numeric for comparison
-                numeric_value = pd.to_numeric(filter_value)
-                mask = column > numeric_value
-            except (ValueError, TypeError):
-                # If conversion fails, compare as strings
-                mask = column.astype(str) > str(filter_value)
-        elif operator == "less than":
-            try:
-                # Try to convert filter_value to numeric for comparison
-                numeric_value = pd.to_numeric(filter_value)
-                mask = column < numeric_value
-            except (ValueError, TypeError):
-                # If conversion fails, compare as strings
-                mask = column.astype(str) < str(filter_value)
-        else:
-            mask = column == filter_value  # Fallback to equals
+    def _can_defer(self) -> bool:
+        """Whether the output only feeds another DataFrame Operations component running in this build."""
+        if not getattr(self, "lazy_execution", False) or self._vertex is None:
+            return False
+        graph = self._vertex.graph
+        edges = self._vertex.outgoing_edges
+        # With several consumers, each of them would run the deferred operations again
+        if len(edges) != 1:
+            return False
+        target = graph.get_vertex(edges[0].target_id)
+        return target.vertex_type == self.name and target.id in graph.vertices_to_run
 
-        return DataFrame(df[mask])
+    def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
+        return self._operation_step("Filter").func(df)
 
     def sort_by_column(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.sort_values(by=self.column_name, ascending=self.ascending))
+        return self._operation_step("Sort").func(df)
 
     def drop_column(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.drop(columns=[self.column_name]))
+        return self._operation_step("Drop Column").func(df)
 
     def rename_column(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.rename(columns={self.column_name: self.new_column_name}))
+        return self._operation_step("Rename Column").func(df)
 
     def add_column(self, df: DataFrame) -> DataFrame:
-        df[self.new_column_name] = [self.new_column_value] * len(df)
-        return DataFrame(df)
+        return self._operation_step("Add Column").func(df)
 
     def select_columns(self, df: DataFrame) -> DataFrame:
-        columns = [col.strip() for col in self.columns_to_select]
-        return DataFrame(df[columns])
+        return self._operation_step("Select Columns").func(df)
 
     def head(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.head(self.num_rows))
+        return self._operation_step("Head").func(df)
 
     def tail(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.tail(self.num_rows))
+        return self._operation_step("Tail").func(df)
 
     def replace_values(self, df: DataFrame) -> DataFrame:
-        df[self.column_name] = df[self.column_name].replace(self.replace_value, self.replacement_value)
-        return DataFrame(df)
+        return self._operation_step("Replace Value").func(df)
 
     def drop_duplicates(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df.drop_duplicates(subset=self.column_name))
+        return self._operation_step("Drop Duplicates").func(df)
+
+
+def _filter_rows(df: pd.DataFrame, *, column: str, operator: str, value) -> DataFrame:
+    series = df[column]
+    if operator == "equals":
+        mask = series == value
+    elif operator == "not equals":
+        mask = series != value
+    elif operator == "contains":
+        mask = series.astype(str).str.contains(str(value), na=False)
+    elif operator == "not contains":
+        mask = ~series.astype(str).str.contains(str(value), na=False)
+    elif operator == "starts with":
+        mask = series.astype(str).str.startswith(str(value), na=False)
+    elif operator == "ends with":
+        mask = series.astype(str).str.endswith(str(value), na=False)
+    elif operator == "greater than":
+        try:
+            # Try to convert value to numeric for comparison
+            numeric_value = pd.to_numeric(value)
+            mask = series > numeric_value
+        except (ValueError, TypeError):
+            # If conversion fails, compare as strings
+            mask = series.astype(str) > str(value)
+    elif operator == "less than":
+        try:
+            # Try to convert value to numeric for comparison
+            numeric_value = pd.to_numeric(value)
+            mask = series < numeric_value
+        except (ValueError, TypeError):
+            # If conversion fails, compare as strings
+            mask = series.astype(str) < str(value)
+    else:
+        mask = series == value  # Fallback to equals
+
+    return DataFrame(df[mask])
+
+
+def _sort(df: pd.DataFrame, *, column: str, ascending: bool) -> DataFrame:
+    return DataFrame(df.sort_values(by=column, ascending=ascending))
+
+
+def _drop_column(df: pd.DataFrame, *, column: str) -> DataFrame:
+    return DataFrame(df.drop(columns=[column]))
+
+
+def _rename_column(df: pd.DataFrame, *, column: str, new_name: str) -> DataFrame:
+    return DataFrame(df.rename(columns={column: new_name}))
+
+
+def _add_column(df: pd.DataFrame, *, name: str, value) -> DataFrame:
+    df[name] = [value] * len(df)
+    return DataFrame(df)
+
+
+def _select_columns(df: pd.DataFrame, *, columns: list[str]) -> DataFrame:
+    return DataFrame(df[columns])
+
+
+def _head(df: pd.DataFrame, *, num_rows: int) -> DataFrame:
+    return DataFrame(df.head(num_rows))
+
+
+def _tail(df: pd.DataFrame, *, num_rows: int) -> DataFrame:
+    return DataFrame(df.tail(num_rows))
+
+
+def _replace_values(df: pd.DataFrame, *, column: str, old, new) -> DataFrame:
+    df[column] = df[column].replace(old, new)
+    return DataFrame(df)
+
+
+def _drop_duplicates(df: pd.DataFrame, *, column: str) -> DataFrame:
+    return DataFrame(df.drop_duplicates(subset=column))
@@ -1,3 +1,4 @@
+from lfx.base.processing.template_renderer import compile_template
 from lfx.custom.custom_component.component import Component
 from lfx.helpers.data import safe_convert
 from lfx.inputs.inputs import BoolInput, HandleInput, MessageTextInput, MultilineInput, TabInput
@@ -118,9 +119,8 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            # Renders whole columns at once instead of formatting the template row by row
+            lines.append(compile_template(self.pattern).render_text(df, self.sep))
         elif data is not None:
             # Use format_map with a dict that returns default_value for missing keys
             class DefaultDict(dict):
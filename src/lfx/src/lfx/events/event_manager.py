@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import time
 import uuid
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
@@ -88,6 +90,47 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+@dataclass(frozen=True, slots=True)
+class StreamEvent:
+    """An event passed through the queue as a Python object rather than as serialized JSON."""
+
+    event_type: str
+    data: Any
+
+
+class TypedEventManager(EventManager):
+    """Event manager for in-process consumers that puts :class:`StreamEvent` objects on the queue.
+
+    The event data is neither JSON encoded here nor decoded by the consumer. Components send events from worker
+    threads, so events sent outside of the queue's event loop are handed over with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, queue, loop: asyncio.AbstractEventLoop | None = None):
+        super().__init__(queue)
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self.loop = loop
+
+    def send_event(self, *, event_type: str, data: LoggableType):
+        if not self.queue:
+            return
+        item = (f"{event_type}-{uuid.uuid4()}", StreamEvent(event_type, data), time.time())
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        try:
+            if self.loop is not None and running_loop is not self.loop:
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+            else:
+                self.queue.put_nowait(item)
+        except Exception:  # noqa: BLE001
+            logger.debug("Queue not available for event")
+
+
 def create_default_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -108,3 +151,11 @@ def create_stream_tokens_event_manager(queue=None):
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
     return manager
+
+
+def create_typed_stream_tokens_event_manager(queue=None):
+    manager = TypedEventManager(queue)
+    manager.register_event("on_message", "add_message")
+    manager.register_event("on_token", "token")
+    manager.register_event("on_end", "end")
+    return manager
@@ -0,0 +1,160 @@
+"""Consumption of the event queues streamed to clients.
+
+Event managers put ``(event_id, value, put_time)`` tuples on a queue and a ``None`` value marks the end of the
+stream. Streaming endpoints drain that queue with :func:`iter_event_batches`: every event already waiting in the
+queue is taken at once, so that a burst of tokens becomes a single write to the client instead of one write per
+token. Timing is measured once per batch and aggregated in :data:`stream_metrics`:
+
+* ``queue_residency``: seconds an event waited in the queue before being sent.
+* ``client_lag``: seconds the client took to accept a batch, i.e. how long the generator was suspended.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+DEFAULT_MAX_BATCH_SIZE = 64
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Counts of durations in seconds per bucket of :data:`LATENCY_BUCKETS`."""
+
+    __slots__ = ("_lock", "bounds", "count", "counts", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.observe_many((value,))
+
+    def observe_many(self, values) -> None:
+        with self._lock:
+            for value in values:
+                self.counts[bisect_left(self.bounds, value)] += 1
+                self.count += 1
+                self.total += value
+                self.max = max(value, self.max)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{bound}": count for bound, count in zip(self.bounds, self.counts, strict=False)}
+            buckets["le_inf"] = self.counts[-1]
+            return {"count": self.count, "sum": self.total, "max": self.max, "buckets": buckets}
+
+
+class StreamMetrics:
+    """Aggregated queue residency and client lag of the streamed events of this process."""
+
+    def __init__(self) -> None:
+        self.queue_residency = LatencyHistogram()
+        self.client_lag = LatencyHistogram()
+        self.events = 0
+        self.batches = 0
+
+    def record_batch(self, sent_at: float, put_times: list[float]) -> None:
+        self.events += len(put_times)
+        self.batches += 1
+        self.queue_residency.observe_many(sent_at - put_time for put_time in put_times)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "events": self.events,
+            "batches": self.batches,
+            "queue_residency_seconds": self.queue_residency.snapshot(),
+            "client_lag_seconds": self.client_lag.snapshot(),
+        }
+
+    def reset(self) -> None:
+        self.events = 0
+        self.batches = 0
+        self.queue_residency.reset()
+        self.client_lag.reset()
+
+
+stream_metrics = StreamMetrics()
+
+
+def get_stream_metrics() -> dict[str, Any]:
+    """Return the streaming metrics of this process."""
+    return stream_metrics.snapshot()
+
+
+async def iter_event_batches(
+    queue: asyncio.Queue,
+    *,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    metrics: StreamMetrics | None = stream_metrics,
+) -> AsyncGenerator[list, None]:
+    """Yield the values of the events of ``queue`` in batches until the end of the stream.
+
+    A batch holds the next event and every event already waiting behind it, up to ``max_batch_size``.
+
+    Args:
+        queue: Queue of ``(event_id, value, put_time)`` tuples, ended by a ``None`` value.
+        max_batch_size: Maximum number of events in a batch.
+        metrics: Where queue residency and client lag are recorded. None disables the measurements.
+    """
+    finished = False
+    while not finished:
+        _, value, put_time = await queue.get()
+        if value is None:
+            break
+        batch = [value]
+        put_times = [put_time]
+        while len(batch) < max_batch_size:
+            try:
+                _, value, put_time = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if value is None:
+                finished = True
+                break
+            batch.append(value)
+            put_times.append(put_time)
+
+        if metrics is None:
+            yield batch
+            continue
+        sent_at = time.time()
+        metrics.record_batch(sent_at, put_times)
+        yield batch
+        metrics.client_lag.observe(time.time() - sent_at)
+
+
+async def consume_and_yield(
+    queue: asyncio.Queue,
+    *,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    metrics: StreamMetrics | None = stream_metrics,
+) -> AsyncGenerator[Any, None]:
+    """Yield the values of the events of ``queue`` until the end of the stream.
+
+    Batches of ``bytes`` or ``str`` values are joined into a single value, so that they are written to the client at
+    once. Other values are yielded one by one.
+    """
+    async for batch in iter_event_batches(queue, max_batch_size=max_batch_size, metrics=metrics):
+        if len(batch) == 1:
+            yield batch[0]
+        elif all(type(value) is bytes for value in batch):
+            yield b"".join(batch)
+        elif all(type(value) is str for value in batch):
+            yield "".join(batch)
+        else:
+            for value in batch:
+                yield value
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, cast
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.index import GraphIndex
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
@@ -38,7 +39,7 @@ from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from lfx.services.cache.utils import CacheMiss
-from lfx.services.deps import get_chat_service, get_tracing_service
+from lfx.services.deps import get_chat_service, get_state_service, get_tracing_service
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -53,6 +54,9 @@ if TYPE_CHECKING:
     from lfx.services.chat.schema import GetCache, SetCache
     from lfx.services.tracing.service import TracingService
 
+# Bump when the layout returned by Graph.dump_run_state changes
+GRAPH_RUN_STATE_VERSION = 1
+
 
 class Graph:
     """A class representing a graph of vertices and edges."""
@@ -124,6 +128,8 @@ class Graph:
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
+        self._graph_index: GraphIndex | None = None
+        self._graph_index_source: tuple[list[Vertex], list[CycleEdge], int, int] | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
@@ -651,6 +657,17 @@ class Graph:
                 session_id=self.session_id,
             )
 
+    def _clear_run_state(self) -> None:
+        """Drop the state kept for this run by the state service, the run is over."""
+        if not self._run_id:
+            return
+        try:
+            state_service = get_state_service()
+            if state_service is not None:
+                state_service.clear_state(self._run_id)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error clearing the run state")
+
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
         self._end_trace_tasks.add(task)
@@ -670,6 +687,7 @@ class Graph:
         return async_end_traces_func
 
     async def end_all_traces(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        self._clear_run_state()
         if not self.tracing_service:
             return
         self._end_time = datetime.now(timezone.utc)
@@ -1116,9 +1134,100 @@ class Graph:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._graph_index = None
+        self._graph_index_source = None
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
+    def dump_run_state(self) -> dict[str, Any]:
+        """Return the structure and run progress of the graph as JSON-compatible data.
+
+        Unlike pickling, the result does not depend on the component classes, so it can be loaded by another
+        version of Langflow with :meth:`from_run_state`. Built vertex results are not included.
+        """
+        run_manager = self.run_manager.to_dict()
+        return {
+            "version": GRAPH_RUN_STATE_VERSION,
+            "data": self.dump()["data"],
+            "flow_id": self.flow_id,
+            "flow_name": self.flow_name,
+            "description": self.description,
+            "user_id": self.user_id,
+            "session_id": self._session_id,
+            "run_id": self._run_id,
+            "prepared": self._prepared,
+            "run_manager": {
+                key: sorted(value) if isinstance(value, set) else dict(value) for key, value in run_manager.items()
+            },
+            "vertices_to_run": sorted(self.vertices_to_run),
+            "inactivated_vertices": sorted(self.inactivated_vertices),
+            "inactive_vertices": sorted(self.inactive_vertices),
+            "activated_vertices": self.activated_vertices,
+            "conditionally_excluded_vertices": sorted(self.conditionally_excluded_vertices),
+            "conditional_exclusion_sources": {
+                source: sorted(excluded) for source, excluded in self.conditional_exclusion_sources.items()
+            },
+            "stop_vertex": self.stop_vertex,
+            "vertices_layers": self.vertices_layers,
+            "sorted_vertices_layers": self._sorted_vertices_layers,
+            "first_layer": self._first_layer,
+            "run_queue": list(self._run_queue),
+        }
+
+    @classmethod
+    def from_run_state(cls, state: dict[str, Any]) -> Graph:
+        """Create a graph from the output of :meth:`dump_run_state`.
+
+        Raises:
+            ValueError: If the state was written with another layout.
+        """
+        if state.get("version") != GRAPH_RUN_STATE_VERSION:
+            msg = f"Unsupported graph run state version: {state.get('version')}"
+            raise ValueError(msg)
+        graph = cls.from_payload(
+            state["data"], flow_id=state["flow_id"], flow_name=state["flow_name"], user_id=state["user_id"]
+        )
+        graph.load_run_state(state)
+        return graph
+
+    def load_run_state(self, state: dict[str, Any]) -> None:
+        """Restore the run progress saved by :meth:`dump_run_state` on a graph built from the same data."""
+        self.description = state["description"]
+        if session_id := state["session_id"]:
+            self.session_id = session_id
+            for vertex_id in self.has_session_id_vertices:
+                vertex = self.vertex_map[vertex_id]
+                if not vertex.raw_params.get("session_id"):
+                    vertex.update_raw_params({"session_id": session_id}, overwrite=True)
+        if state["run_id"]:
+            self.set_run_id(state["run_id"])
+        run_manager = state["run_manager"]
+        cycle_vertices = self.run_manager.cycle_vertices
+        self.run_manager = RunnableVerticesManager.from_dict(
+            {
+                "run_map": defaultdict(list, run_manager["run_map"]),
+                "run_predecessors": defaultdict(list, run_manager["run_predecessors"]),
+                "vertices_to_run": set(run_manager["vertices_to_run"]),
+                "vertices_being_run": set(run_manager["vertices_being_run"]),
+                "ran_at_least_once": set(run_manager["ran_at_least_once"]),
+            }
+        )
+        self.run_manager.cycle_vertices = cycle_vertices
+        self._prepared = state["prepared"]
+        self.vertices_to_run = set(state["vertices_to_run"])
+        self.inactivated_vertices = set(state["inactivated_vertices"])
+        self.inactive_vertices = set(state["inactive_vertices"])
+        self.activated_vertices = state["activated_vertices"]
+        self.conditionally_excluded_vertices = set(state["conditionally_excluded_vertices"])
+        self.conditional_exclusion_sources = {
+            source: set(excluded) for source, excluded in state["conditional_exclusion_sources"].items()
+        }
+        self.stop_vertex = state["stop_vertex"]
+        self.vertices_layers = state["vertices_layers"]
+        self._sorted_vertices_layers = state["sorted_vertices_layers"]
+        self._first_layer = state["first_layer"]
+        self._run_queue = deque(state["run_queue"])
+
     @classmethod
     def from_payload(
         cls,
@@ -1331,10 +1440,8 @@ class Graph:
 
     def _set_cache_to_vertices_in_cycle(self) -> None:
         """Sets the cache to the vertices in cycle."""
-        edges = self._get_edges_as_list_of_tuples()
-        cycle_vertices = set(find_cycle_vertices(edges))
         for vertex in self.vertices:
-            if vertex.id in cycle_vertices:
+            if vertex.id in self.cycle_vertices:
                 vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
 
     def _instantiate_components_in_vertices(self) -> None:
@@ -1598,12 +1705,10 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        positions = self.graph_index.edge_positions(
+            vertex_id, outgoing=is_source is not False, incoming=is_target is not False
+        )
+        return [self.edges[position] for position in positions]
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
@@ -1981,6 +2086,25 @@ class Graph:
             self._cycle_vertices = set(find_cycle_vertices(edges))
         return self._cycle_vertices
 
+    @property
+    def graph_index(self) -> GraphIndex:
+        """Adjacency index of the current vertices and edges, rebuilt when either list is replaced or resized."""
+        source = (self.vertices, self.edges, len(self.vertices), len(self.edges))
+        cached = self._graph_index_source
+        if (
+            self._graph_index is None
+            or cached is None
+            or cached[0] is not source[0]
+            or cached[1] is not source[1]
+            or cached[2:] != source[2:]
+        ):
+            self._graph_index = GraphIndex(
+                (vertex.id for vertex in self.vertices),
+                ((edge.source_id, edge.target_id) for edge in self.edges),
+            )
+            self._graph_index_source = source
+        return self._graph_index
+
     def _build_edges(self) -> list[CycleEdge]:
         """Builds the edges of the graph."""
         # Edge takes two vertices as arguments, so we need to build the vertices first
@@ -2142,13 +2266,13 @@ class Graph:
             cycle_vertices=self.cycle_vertices,
             stop_component_id=stop_component_id,
             start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
             in_degree_map=self.in_degree_map,
             successor_map=self.successor_map,
             predecessor_map=self.predecessor_map,
             is_input_vertex=self.get_vertex_input_status,
             get_vertex_predecessors=self.get_vertex_predecessors_ids,
             get_vertex_successors=self.get_vertex_successors_ids,
+            graph_index=self.graph_index,
             is_cyclic=self.is_cyclic,
         )
 
@@ -2227,9 +2351,11 @@ class Graph:
                 return
             visited.add(predecessor_id)
 
-            if self.is_vertex_runnable(predecessor_id):
+            # A running predecessor is never runnable, skip the lookups of is_vertex_runnable for the many
+            # predecessors of a fan-in still running
+            if predecessor_id not in self.run_manager.vertices_being_run and self.is_vertex_runnable(predecessor_id):
                 runnable_vertices.append(predecessor_id)
-            else:
+            elif self.run_manager.pending_count(predecessor_id):
                 for pred_pred_id in self.run_manager.run_predecessors.get(predecessor_id, []):
                     find_runnable_predecessors(pred_pred_id)
 
@@ -2283,13 +2409,3 @@ class Graph:
             predecessor_map[edge.target_id].append(edge.source_id)
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
-
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
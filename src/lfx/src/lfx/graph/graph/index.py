@@ -0,0 +1,298 @@
+"""Compact adjacency index used by graph sorting, filtering and cycle detection.
+
+Vertices are mapped to dense integer positions and the edges are stored in CSR (compressed sparse row) form: for
+each direction an ``offsets`` array of length ``n + 1`` and a ``neighbors`` array, so the neighbors of vertex ``i``
+are ``neighbors[offsets[i]:offsets[i + 1]]``. Sets of vertices are represented as bitsets (plain Python ints where
+bit ``i`` stands for the vertex at position ``i``), which makes unions and intersections of reachability sets cheap.
+
+The index is immutable. Build a new one whenever the edges of the graph change.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+VertexId = TypeVar("VertexId", bound="Hashable")
+
+_TO_BITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _build_csr(size: int, sources: array, targets: array) -> tuple[array, array, array]:
+    """Group ``targets`` by ``sources`` with a stable counting sort.
+
+    Returns the offsets, the neighbors and, for each neighbor slot, the position of the edge it came from.
+    """
+    offsets = array("l", bytes(8 * (size + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for position in range(size):
+        offsets[position + 1] += offsets[position]
+    cursor = array("l", offsets[:-1])
+    neighbors = array("l", bytes(8 * len(targets)))
+    edge_positions = array("l", bytes(8 * len(targets)))
+    for edge_position, (source, target) in enumerate(zip(sources, targets, strict=True)):
+        slot = cursor[source]
+        neighbors[slot] = target
+        edge_positions[slot] = edge_position
+        cursor[source] = slot + 1
+    return offsets, neighbors, edge_positions
+
+
+class GraphIndex(Generic[VertexId]):
+    """Immutable CSR adjacency of a directed graph with bitset reachability queries.
+
+    Args:
+        vertex_ids: The vertices of the graph. Vertices that only appear in ``edges`` are appended after them.
+        edges: ``(source, target)`` pairs. Duplicates are kept, and their position in the iterable is what
+            :meth:`edge_positions` returns.
+    """
+
+    __slots__ = (
+        "_ancestors",
+        "_descendants",
+        "_ids",
+        "_in_edges",
+        "_in_offsets",
+        "_out_edges",
+        "_out_offsets",
+        "_positions",
+        "_predecessors",
+        "_successors",
+        "edge_count",
+    )
+
+    def __init__(self, vertex_ids: Iterable[VertexId], edges: Iterable[tuple[VertexId, VertexId]]) -> None:
+        self._positions: dict[VertexId, int] = {}
+        self._ids: list[VertexId] = []
+        for vertex_id in vertex_ids:
+            self._position_for(vertex_id)
+        sources = array("l")
+        targets = array("l")
+        for source_id, target_id in edges:
+            sources.append(self._position_for(source_id))
+            targets.append(self._position_for(target_id))
+        self.edge_count = len(sources)
+        size = len(self._ids)
+        self._out_offsets, self._successors, self._out_edges = _build_csr(size, sources, targets)
+        self._in_offsets, self._predecessors, self._in_edges = _build_csr(size, targets, sources)
+        self._descendants: dict[int, int] = {}
+        self._ancestors: dict[int, int] = {}
+
+    def _position_for(self, vertex_id: VertexId) -> int:
+        position = self._positions.get(vertex_id)
+        if position is None:
+            position = self._positions[vertex_id] = len(self._ids)
+            self._ids.append(vertex_id)
+        return position
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, vertex_id: object) -> bool:
+        return vertex_id in self._positions
+
+    @property
+    def vertex_ids(self) -> list[VertexId]:
+        return list(self._ids)
+
+    def successor_ids(self, vertex_id: VertexId) -> list[VertexId]:
+        position = self._positions.get(vertex_id)
+        if position is None:
+            return []
+        ids = self._ids
+        return [ids[i] for i in self._successors[self._out_offsets[position] : self._out_offsets[position + 1]]]
+
+    def predecessor_ids(self, vertex_id: VertexId) -> list[VertexId]:
+        position = self._positions.get(vertex_id)
+        if position is None:
+            return []
+        ids = self._ids
+        return [ids[i] for i in self._predecessors[self._in_offsets[position] : self._in_offsets[position + 1]]]
+
+    def edge_positions(self, vertex_id: VertexId, *, outgoing: bool = True, incoming: bool = True) -> list[int]:
+        """Return the positions, in input order, of the edges leaving and/or entering ``vertex_id``.
+
+        Self-loops are only reported once.
+        """
+        position = self._positions.get(vertex_id)
+        if position is None:
+            return []
+        edge_positions: set[int] = set()
+        if outgoing:
+            edge_positions.update(self._out_edges[self._out_offsets[position] : self._out_offsets[position + 1]])
+        if incoming:
+            edge_positions.update(self._in_edges[self._in_offsets[position] : self._in_offsets[position + 1]])
+        return sorted(edge_positions)
+
+    # Bitsets
+
+    def mask(self, vertex_ids: Iterable[VertexId]) -> int:
+        """Return the bitset of the given vertices. Unknown vertices are ignored."""
+        positions = self._positions
+        flags = bytearray(len(self._ids))
+        for vertex_id in vertex_ids:
+            position = positions.get(vertex_id)
+            if position is not None:
+                flags[position] = 1
+        return self._pack(flags)
+
+    def ids(self, mask: int) -> list[VertexId]:
+        """Return the vertices of a bitset in index order."""
+        ids = self._ids
+        bits = format(mask, "b")[::-1]
+        result = []
+        position = bits.find("1")
+        while position != -1:
+            result.append(ids[position])
+            position = bits.find("1", position + 1)
+        return result
+
+    @staticmethod
+    def _pack(flags: bytearray) -> int:
+        return int(flags.translate(_TO_BITS)[::-1] or b"0", 2)
+
+    def _unpack(self, mask: int) -> bytearray:
+        flags = bytearray(format(mask, "b")[::-1].encode().translate(_FROM_BITS))
+        flags.extend(bytes(len(self._ids) - len(flags)))
+        return flags
+
+    # Reachability
+
+    def descendants(self, sources: Iterable[VertexId], *, within: int | None = None) -> int:
+        """Return the bitset of the vertices reachable from ``sources``, the sources included.
+
+        If ``within`` is given, the traversal only enters vertices of that bitset. The result for a single source
+        without restriction is computed once and reused.
+        """
+        return self._reachable(sources, self._out_offsets, self._successors, self._descendants, within)
+
+    def ancestors(self, sources: Iterable[VertexId], *, within: int | None = None) -> int:
+        """Return the bitset of the vertices that can reach ``sources``, the sources included.
+
+        See :meth:`descendants` for the meaning of ``within``.
+        """
+        return self._reachable(sources, self._in_offsets, self._predecessors, self._ancestors, within)
+
+    def _reachable(
+        self,
+        sources: Iterable[VertexId],
+        offsets: array,
+        neighbors: array,
+        cache: dict[int, int],
+        within: int | None,
+    ) -> int:
+        positions = self._positions
+        starts = list(dict.fromkeys(positions[source] for source in sources if source in positions))
+        cacheable = within is None and len(starts) == 1
+        if cacheable and starts[0] in cache:
+            return cache[starts[0]]
+
+        allowed = None if within is None else self._unpack(within)
+        seen = bytearray(len(self._ids))
+        stack = []
+        for start in starts:
+            if allowed is None or allowed[start]:
+                seen[start] = 1
+                stack.append(start)
+        while stack:
+            current = stack.pop()
+            for neighbor in neighbors[offsets[current] : offsets[current + 1]]:
+                if not seen[neighbor] and (allowed is None or allowed[neighbor]):
+                    seen[neighbor] = 1
+                    stack.append(neighbor)
+
+        mask = self._pack(seen)
+        if cacheable:
+            cache[starts[0]] = mask
+        return mask
+
+    # Cycles
+
+    def cycle_mask(self) -> int:
+        """Return the bitset of the vertices that belong to a cycle, self-loops included.
+
+        Uses an iterative version of Tarjan's strongly connected components algorithm.
+        """
+        offsets = self._out_offsets
+        successors = self._successors
+        size = len(self._ids)
+        unvisited = -1
+        order = array("l", [unvisited]) * size
+        low = array("l", bytes(8 * size))
+        on_stack = bytearray(size)
+        in_cycle = bytearray(size)
+        component_stack: list[int] = []
+        counter = 0
+
+        for root in range(size):
+            if order[root] != unvisited:
+                continue
+            call_stack = [(root, offsets[root])]
+            order[root] = low[root] = counter
+            counter += 1
+            component_stack.append(root)
+            on_stack[root] = 1
+            while call_stack:
+                vertex, slot = call_stack[-1]
+                if slot < offsets[vertex + 1]:
+                    call_stack[-1] = (vertex, slot + 1)
+                    successor = successors[slot]
+                    if successor == vertex:
+                        in_cycle[vertex] = 1
+                    if order[successor] == unvisited:
+                        order[successor] = low[successor] = counter
+                        counter += 1
+                        component_stack.append(successor)
+                        on_stack[successor] = 1
+                        call_stack.append((successor, offsets[successor]))
+                    elif on_stack[successor]:
+                        low[vertex] = min(low[vertex], order[successor])
+                    continue
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    low[parent] = min(low[parent], low[vertex])
+                if low[vertex] == order[vertex]:
+                    member = component_stack.pop()
+                    on_stack[member] = 0
+                    if member != vertex:
+                        in_cycle[member] = in_cycle[vertex] = 1
+                        while member != vertex:
+                            member = component_stack.pop()
+                            on_stack[member] = 0
+                            in_cycle[member] = 1
+        return self._pack(in_cycle)
+
+    def cycle_edges(self, entry_id: VertexId) -> list[tuple[VertexId, VertexId]]:
+        """Return the back edges found by a depth-first search from ``entry_id``, in discovery order."""
+        entry = self._positions.get(entry_id)
+        if entry is None:
+            return []
+        ids = self._ids
+        offsets = self._out_offsets
+        successors = self._successors
+        visited = bytearray(len(ids))
+        on_path = bytearray(len(ids))
+        cycle_edges: list[tuple[VertexId, VertexId]] = []
+
+        visited[entry] = on_path[entry] = 1
+        call_stack = [(entry, offsets[entry])]
+        while call_stack:
+            vertex, slot = call_stack[-1]
+            if slot == offsets[vertex + 1]:
+                call_stack.pop()
+                on_path[vertex] = 0
+                continue
+            call_stack[-1] = (vertex, slot + 1)
+            successor = successors[slot]
+            if not visited[successor]:
+                visited[successor] = on_path[successor] = 1
+                call_stack.append((successor, offsets[successor]))
+            elif on_path[successor]:
+                cycle_edges.append((ids[vertex], ids[successor]))
+        return cycle_edges
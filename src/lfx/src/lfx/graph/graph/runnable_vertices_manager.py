@@ -1,14 +1,114 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+
+
+class _PredecessorList(list):
+    """Pending predecessors of a vertex, re-syncing the countdown of the vertex when changed in place.
+
+    Loop components saved in older flows append to ``run_predecessors[vertex_id]`` directly instead of calling
+    :meth:`RunnableVerticesManager.add_predecessor`.
+    """
+
+    __slots__ = ("_manager", "_vertex_id")
+
+    def __init__(self, manager: "RunnableVerticesManager", vertex_id: str, predecessors: Iterable[str] = ()) -> None:
+        super().__init__(predecessors)
+        self._manager = manager
+        self._vertex_id = vertex_id
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _resyncing(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self: _PredecessorList, *args):
+        result = method(self, *args)
+        self._manager._sync(self._vertex_id)  # noqa: SLF001
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "__setitem__", "__delitem__", "__iadd__"):
+    setattr(_PredecessorList, _name, _resyncing(_name))
+
+
+class _PredecessorMap(dict):
+    """``run_predecessors``, creating missing entries like ``defaultdict(list)`` and keeping the countdowns in sync."""
+
+    def __init__(self, manager: "RunnableVerticesManager", predecessor_map: Mapping[str, Iterable[str]]) -> None:
+        super().__init__()
+        self._manager = manager
+        self.update(predecessor_map)
+
+    def __missing__(self, vertex_id: str) -> _PredecessorList:
+        predecessors = _PredecessorList(self._manager, vertex_id)
+        dict.__setitem__(self, vertex_id, predecessors)
+        return predecessors
+
+    def __setitem__(self, vertex_id: str, predecessors: Iterable[str]) -> None:
+        dict.__setitem__(self, vertex_id, _PredecessorList(self._manager, vertex_id, predecessors))
+        self._manager._sync(vertex_id)  # noqa: SLF001
+
+    def __delitem__(self, vertex_id: str) -> None:
+        dict.__delitem__(self, vertex_id)
+        self._manager._sync(vertex_id)  # noqa: SLF001
+
+    def __reduce__(self):
+        return dict, ({vertex_id: list(predecessors) for vertex_id, predecessors in self.items()},)
+
+    def update(self, *args, **kwargs) -> None:
+        for vertex_id, predecessors in dict(*args, **kwargs).items():
+            self[vertex_id] = predecessors
+
+    def setdefault(self, vertex_id: str, default: Iterable[str] = ()) -> _PredecessorList:
+        if vertex_id not in self:
+            self[vertex_id] = default
+        return self[vertex_id]
+
+    def pop(self, vertex_id: str, *default):
+        predecessors = dict.pop(self, vertex_id, *default)
+        self._manager._sync(vertex_id)  # noqa: SLF001
+        return predecessors
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._manager._index_predecessors()  # noqa: SLF001
 
 
 class RunnableVerticesManager:
+    """Run state of a graph: the predecessors each vertex still waits for and the vertices running.
+
+    ``run_predecessors`` lists the pending predecessors of each vertex. Alongside it, each vertex has a countdown of
+    its pending predecessors, decremented when one of them completes, so checking whether a vertex is ready or a
+    predecessor is pending costs the same for a prompt fed by hundreds of retrievers as for one fed by a single
+    vertex. ``run_predecessors`` stays the source of truth: changing it in place, or assigning it, re-syncs the
+    countdowns of the vertices changed.
+    """
+
     def __init__(self) -> None:
         self.run_map: dict[str, list[str]] = defaultdict(list)  # Tracks successors of each vertex
-        self.run_predecessors: dict[str, list[str]] = defaultdict(list)  # Tracks predecessors for each vertex
         self.vertices_to_run: set[str] = set()  # Set of vertices that are ready to run
         self.vertices_being_run: set[str] = set()  # Set of vertices that are currently running
         self.cycle_vertices: set[str] = set()  # Set of vertices that are in a cycle
         self.ran_at_least_once: set[str] = set()  # Set of vertices that have been run at least once
+        self._pending: dict[str, Counter[str]] = {}  # Pending predecessors of each vertex, with their multiplicity
+        self._remaining: dict[str, int] = {}  # Countdown of the pending predecessors of each vertex
+        self._waiting: set[str] = set()  # Vertices with at least one pending predecessor
+        self.run_predecessors: dict[str, list[str]] = {}  # Tracks predecessors for each vertex
+
+    @property
+    def run_predecessors(self) -> dict[str, list[str]]:
+        return self._run_predecessors
+
+    @run_predecessors.setter
+    def run_predecessors(self, predecessor_map: Mapping[str, Iterable[str]]) -> None:
+        self._run_predecessors = _PredecessorMap(self, {})
+        self._index_predecessors()
+        self._run_predecessors.update(predecessor_map)
 
     def to_dict(self) -> dict:
         return {
@@ -45,8 +145,44 @@ class RunnableVerticesManager:
         self.vertices_being_run = state["vertices_being_run"]
         self.ran_at_least_once = state["ran_at_least_once"]
 
+    def _index_predecessors(self) -> None:
+        """Rebuild the countdowns from ``run_predecessors``."""
+        self._pending = {}
+        self._remaining = {}
+        self._waiting = set()
+        for vertex_id in self.run_predecessors:
+            self._sync(vertex_id)
+
+    def _sync(self, vertex_id: str) -> None:
+        """Rebuild the countdown of ``vertex_id`` from ``run_predecessors``."""
+        predecessors = self.run_predecessors.get(vertex_id)
+        if predecessors:
+            self._pending[vertex_id] = Counter(predecessors)
+            self._remaining[vertex_id] = len(predecessors)
+            self._waiting.add(vertex_id)
+        else:
+            self._pending.pop(vertex_id, None)
+            self._remaining.pop(vertex_id, None)
+            self._waiting.discard(vertex_id)
+
     def all_predecessors_are_fulfilled(self) -> bool:
-        return all(not value for value in self.run_predecessors.values())
+        return not self._waiting
+
+    def pending_count(self, vertex_id: str) -> int:
+        """Return the number of predecessors ``vertex_id`` still waits for."""
+        return self._remaining.get(vertex_id, 0)
+
+    def add_predecessor(self, vertex_id: str, predecessor_id: str) -> None:
+        """Make ``vertex_id`` wait for ``predecessor_id`` again, for example before the next iteration of a loop."""
+        pending = self._pending.setdefault(vertex_id, Counter())
+        if pending[predecessor_id]:
+            return
+        pending[predecessor_id] += 1
+        self._remaining[vertex_id] = self._remaining.get(vertex_id, 0) + 1
+        self._waiting.add(vertex_id)
+        list.append(self.run_predecessors[vertex_id], predecessor_id)
+        if vertex_id not in self.run_map[predecessor_id]:
+            self.run_map[predecessor_id].append(vertex_id)
 
     def update_run_state(self, run_predecessors: dict, vertices_to_run: set) -> None:
         self.run_predecessors.update(run_predecessors)
@@ -78,15 +214,14 @@ class RunnableVerticesManager:
         Returns:
             bool: True if all predecessor conditions are met, False otherwise
         """
-        # Get pending predecessors, return True if none exist
-        pending = self.run_predecessors.get(vertex_id, [])
-        if not pending:
+        # Return True if no predecessor is pending
+        if not self._remaining.get(vertex_id):
             return True
 
         # For cycle vertices, check if any pending predecessors are also in cycle
         # Using set intersection is faster than iteration
         if vertex_id in self.cycle_vertices:
-            pending_set = set(pending)
+            pending_set = set(self._pending[vertex_id])
             running_predecessors = pending_set & self.vertices_being_run
 
             # If this vertex has already run at least once, be strict: wait until NOTHING is pending or running
@@ -99,12 +234,27 @@ class RunnableVerticesManager:
             return is_loop and pending_set <= self.cycle_vertices
         return False
 
-    def remove_from_predecessors(self, vertex_id: str) -> None:
-        """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
-        for predecessor in predecessors:
-            if vertex_id in self.run_predecessors[predecessor]:
-                self.run_predecessors[predecessor].remove(vertex_id)
+    def remove_from_predecessors(self, vertex_id: str) -> list[str]:
+        """Removes a vertex from the predecessor list of its successors.
+
+        Returns:
+            list[str]: The successors that no longer wait for any predecessor.
+        """
+        fulfilled = []
+        for successor in self.run_map.get(vertex_id, []):
+            pending = self._pending.get(successor)
+            if not pending or not pending[vertex_id]:
+                continue
+            # The countdown is updated below, skip the re-sync of the whole list
+            list.remove(self.run_predecessors[successor], vertex_id)
+            pending[vertex_id] -= 1
+            if not pending[vertex_id]:
+                del pending[vertex_id]
+            self._remaining[successor] -= 1
+            if not self._remaining[successor]:
+                self._waiting.discard(successor)
+                fulfilled.append(successor)
+        return fulfilled
 
     def build_run_map(self, predecessor_map, vertices_to_run) -> None:
         """Builds a map of vertices and their runnable successors."""
@@ -112,7 +262,7 @@ class RunnableVerticesManager:
         for vertex_id, predecessors in predecessor_map.items():
             for predecessor in predecessors:
                 self.run_map[predecessor].append(vertex_id)
-        self.run_predecessors = predecessor_map.copy()
+        self.run_predecessors = predecessor_map
         self.vertices_to_run = vertices_to_run
 
     def update_vertex_run_state(self, vertex_id: str, *, is_runnable: bool) -> None:
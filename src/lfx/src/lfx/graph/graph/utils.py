@@ -1,9 +1,9 @@
 import copy
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from collections.abc import Callable
 from typing import Any
 
-import networkx as nx
+from lfx.graph.graph.index import GraphIndex
 
 PRIORITY_LIST_OF_INPUTS = ["webhook", "chat"]
 MAX_CYCLE_APPEARANCES = 2
@@ -411,31 +411,7 @@ def find_all_cycle_edges(entry_point: str, edges: list[tuple[str, str]]) -> list
     Returns:
         list[tuple[str, str]]: A list of tuples representing edges that cause cycles.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack, cycle_edges):
-        visited.add(v)
-        rec_stack.add(v)
-
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                dfs(neighbor, visited, rec_stack, cycle_edges)
-            elif neighbor in rec_stack:
-                cycle_edges.append((v, neighbor))  # This edge causes a cycle
-
-        rec_stack.remove(v)
-
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    cycle_edges: list[tuple[str, str]] = []
-
-    dfs(entry_point, visited, rec_stack, cycle_edges)
-
-    return cycle_edges
+    return GraphIndex([], edges).cycle_edges(entry_point)
 
 
 def should_continue(yielded_counts: dict[str, int], max_iterations: int | None) -> bool:
@@ -445,17 +421,9 @@ def should_continue(yielded_counts: dict[str, int], max_iterations: int | None)
 
 
 def find_cycle_vertices(edges):
-    graph = nx.DiGraph(edges)
-
-    # Initialize a set to collect vertices part of any cycle
-    cycle_vertices = set()
-
-    # Utilize the strong component feature in NetworkX to find cycles
-    for component in nx.strongly_connected_components(graph):
-        if len(component) > 1 or graph.has_edge(tuple(component)[0], tuple(component)[0]):  # noqa: RUF015
-            cycle_vertices.update(component)
-
-    return sorted(cycle_vertices)
+    """Returns the sorted vertices that are part of a cycle, including vertices with a self-loop."""
+    index = GraphIndex([], edges)
+    return sorted(index.ids(index.cycle_mask()))
 
 
 def layered_topological_sort(
@@ -516,6 +484,8 @@ def layered_topological_sort(
             # or (is_input_vertex and is_input_vertex(vertex_id))
         )
 
+    # Number of pending occurrences of each vertex in the queue, so membership checks don't scan the queue
+    queued = Counter(queue)
     layers: list[list[str]] = []
     visited = set()
     cycle_counts = dict.fromkeys(vertices_ids, 0)
@@ -528,6 +498,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -545,17 +516,19 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
                         if (
-                            predecessor not in queue
+                            not queued[predecessor]
                             and predecessor not in first_layer_vertices
                             and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -565,6 +538,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -582,6 +556,7 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
                     # # If this is a cycle vertex, reset its in_degree to allow it to appear again
                     # if neighbor in cycle_vertices and neighbor in visited:
                     #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
@@ -590,11 +565,12 @@ def layered_topological_sort(
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
+                        if not queued[predecessor] and (
                             predecessor not in visited
                             or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -785,6 +761,7 @@ def get_sorted_vertices(
     is_input_vertex: Callable[[str], bool] | None = None,
     get_vertex_predecessors: Callable[[str], list[str]] | None = None,
     get_vertex_successors: Callable[[str], list[str]] | None = None,
+    graph_index: GraphIndex | None = None,
     *,
     is_cyclic: bool = False,
 ) -> tuple[list[str], list[list[str]]]:
@@ -802,6 +779,8 @@ def get_sorted_vertices(
         is_input_vertex: Function to check if a vertex is an input vertex
         get_vertex_predecessors: Function to get predecessors of a vertex
         get_vertex_successors: Function to get successors of a vertex
+        graph_index: Prebuilt index of the graph. When given, it is used instead of the
+            callables for filtering and for looking up successors and predecessors
         is_cyclic: Whether the graph is cyclic
 
     Returns:
@@ -812,6 +791,10 @@ def get_sorted_vertices(
         start_component_id = stop_component_id
         stop_component_id = None
 
+    if graph_index is not None:
+        get_vertex_predecessors = graph_index.predecessor_ids
+        get_vertex_successors = graph_index.successor_ids
+
     # Build in_degree_map if not provided
     if in_degree_map is None:
         in_degree_map = {}
@@ -839,42 +822,17 @@ def get_sorted_vertices(
             else:
                 predecessor_map[vertex_id] = []
 
-    # If we have a stop component, we need to filter out all vertices
-    # that are not predecessors of the stop component
-    if stop_component_id is not None:
-        filtered_vertices = filter_vertices_up_to_vertex(
+    if graph_index is not None:
+        vertices_ids = _filter_vertices_with_index(graph_index, vertices_ids, stop_component_id, start_component_id)
+    else:
+        vertices_ids = _filter_vertices(
             vertices_ids,
             stop_component_id,
-            get_vertex_predecessors=get_vertex_predecessors,
-            get_vertex_successors=get_vertex_successors,
-            graph_dict=graph_dict,
-        )
-        vertices_ids = list(filtered_vertices)
-
-    # If we have a start component, we need to filter out unconnected vertices
-    # but keep vertices that are connected to the graph even if not reachable from start
-    if start_component_id is not None:
-        # First get all vertices reachable from start
-        reachable_vertices = filter_vertices_from_vertex(
-            vertices_ids,
             start_component_id,
             get_vertex_predecessors=get_vertex_predecessors,
             get_vertex_successors=get_vertex_successors,
             graph_dict=graph_dict,
         )
-        # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
-            )
-        vertices_ids = list(connected_vertices)
 
     # Get the layers
     layers = layered_topological_sort(
@@ -913,6 +871,86 @@ def get_sorted_vertices(
     return all_layers[0], all_layers[1:]
 
 
+def _filter_vertices(
+    vertices_ids: list[str],
+    stop_component_id: str | None,
+    start_component_id: str | None,
+    get_vertex_predecessors: Callable[[str], list[str]] | None,
+    get_vertex_successors: Callable[[str], list[str]] | None,
+    graph_dict: dict[str, Any] | None,
+) -> list[str]:
+    """Restrict the vertices to the ones needed to run up to the stop component or from the start component."""
+    # If we have a stop component, we need to filter out all vertices
+    # that are not predecessors of the stop component
+    if stop_component_id is not None:
+        filtered_vertices = filter_vertices_up_to_vertex(
+            vertices_ids,
+            stop_component_id,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
+        vertices_ids = list(filtered_vertices)
+
+    # If we have a start component, we need to filter out unconnected vertices
+    # but keep vertices that are connected to the graph even if not reachable from start
+    if start_component_id is not None:
+        # First get all vertices reachable from start
+        reachable_vertices = filter_vertices_from_vertex(
+            vertices_ids,
+            start_component_id,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
+        # Then get all vertices that can reach any reachable vertex
+        connected_vertices = set()
+        for vertex in reachable_vertices:
+            connected_vertices.update(
+                filter_vertices_up_to_vertex(
+                    vertices_ids,
+                    vertex,
+                    get_vertex_predecessors=get_vertex_predecessors,
+                    get_vertex_successors=get_vertex_successors,
+                    graph_dict=graph_dict,
+                )
+            )
+        vertices_ids = list(connected_vertices)
+    return vertices_ids
+
+
+def _filter_vertices_with_index(
+    graph_index: GraphIndex,
+    vertices_ids: list[str],
+    stop_component_id: str | None,
+    start_component_id: str | None,
+) -> list[str]:
+    """Same as :func:`_filter_vertices`, using the reachability bitsets of the graph index.
+
+    The ancestors of every vertex reachable from the start component are found with a single
+    backward traversal from all of them instead of one traversal per vertex.
+    """
+    if stop_component_id is None and start_component_id is None:
+        return vertices_ids
+    selected = graph_index.mask(vertices_ids)
+    if stop_component_id is not None:
+        if not graph_index.mask([stop_component_id]) & selected:
+            return []
+        selected = graph_index.ancestors([stop_component_id], within=_restriction(graph_index, selected))
+    if start_component_id is not None:
+        if not graph_index.mask([start_component_id]) & selected:
+            return []
+        within = _restriction(graph_index, selected)
+        reachable = graph_index.descendants([start_component_id], within=within)
+        selected = graph_index.ancestors(graph_index.ids(reachable), within=within)
+    return graph_index.ids(selected)
+
+
+def _restriction(graph_index: GraphIndex, mask: int) -> int | None:
+    """Return ``mask`` as a traversal restriction, or None if it covers the whole graph so cached results apply."""
+    return None if mask == (1 << len(graph_index)) - 1 else mask
+
+
 def filter_vertices_up_to_vertex(
     vertices_ids: list[str],
     vertex_id: str,
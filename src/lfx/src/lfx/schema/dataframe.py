@@ -1,3 +1,5 @@
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
 import pandas as pd
@@ -63,6 +65,10 @@ class DataFrame(pandas_DataFrame):
         elif isinstance(data, dict | pd.DataFrame):  # Fixed type check syntax
             self._update(data, **kwargs)
 
+    def lazy(self) -> "LazyDataFrame":
+        """Return a :class:`LazyDataFrame` of this DataFrame, to chain operations computed all at once."""
+        return LazyDataFrame(self)
+
     def _update(self, data, **kwargs):
         """Helper method to update DataFrame with new data."""
         new_df = pd.DataFrame(data, **kwargs)
@@ -208,3 +214,60 @@ class DataFrame(pandas_DataFrame):
         processed_df = processed_df.map(lambda x: str(x).replace("\n", "<br/>") if isinstance(x, str) else x)
         # Convert to markdown and wrap in a Message
         return Message(text=processed_df.to_markdown(index=False))
+
+
+@dataclass(frozen=True)
+class DataFrameStep:
+    """An operation of a :class:`LazyDataFrame`.
+
+    Args:
+        name: The name of the operation, shown in the summary of the plan.
+        func: Returns the result of the operation on the DataFrame it is given.
+        in_place: Whether ``func`` modifies the DataFrame it is given.
+        copies: Whether the DataFrame returned by ``func`` shares no data with the one it is given.
+    """
+
+    name: str
+    func: Callable[[pd.DataFrame], pd.DataFrame]
+    in_place: bool = False
+    copies: bool = True
+
+
+class LazyDataFrame:
+    """Rows of a :class:`DataFrame` computed on demand from a source DataFrame and a chain of operations.
+
+    Chaining operations with :meth:`then` does no work. :meth:`collect` runs them all at once, so each intermediate
+    frame of the chain only lives while the next operation runs. The data is only copied before an operation
+    modifying its input in place when the input is not already a new frame returned by the previous operation.
+
+    Examples:
+        >>> plan = DataFrame({"name": ["b", "a"]}).lazy().then(DataFrameStep("Sort", lambda df: df.sort_values("name")))
+        >>> plan.collect()["name"].tolist()
+        ['a', 'b']
+    """
+
+    def __init__(self, source: pd.DataFrame, steps: tuple[DataFrameStep, ...] = ()) -> None:
+        self.source = source
+        self.steps = steps
+
+    def then(self, step: DataFrameStep) -> "LazyDataFrame":
+        """Return a new plan running ``step`` after the operations of this one."""
+        return LazyDataFrame(self.source, (*self.steps, step))
+
+    def collect(self) -> DataFrame:
+        """Run the operations and return the resulting DataFrame, which shares no data with the source."""
+        frame = self.source
+        # Whether ``frame`` shares no data with the source or with a frame it was sliced from
+        owned = False
+        for step in self.steps:
+            if step.in_place and not owned:
+                frame = frame.copy()
+            frame = step.func(frame)
+            owned = step.copies or step.in_place
+        if not owned:
+            frame = frame.copy()
+        return DataFrame(frame)
+
+    def __repr__(self) -> str:
+        steps = "".join(f" -> {step.name}" for step in self.steps)
+        return f"LazyDataFrame({len(self.source)} rows{steps})"
@@ -7,6 +7,7 @@ from platformdirs import user_cache_dir
 from pydantic import BaseModel
 
 from lfx.services.deps import get_storage_service
+from lfx.utils.image import create_data_url
 
 IMAGE_ENDPOINT = "/files/images/"
 
@@ -37,7 +38,12 @@ def get_file_paths(files: list[str | dict]):
             if not file:  # Skip empty/None files
                 continue
 
-            file_path = file["path"] if isinstance(file, dict) and "path" in file else file
+            if isinstance(file, dict) and "path" in file:
+                file_path = file["path"]
+            elif hasattr(file, "path"):
+                file_path = file.path
+            else:
+                file_path = file
             if not file_path:  # Skip empty paths
                 continue
 
@@ -164,11 +170,11 @@ class Image(BaseModel):
     def to_base64(self):
         """Convert image to base64 string."""
         if self.path:
-            files = get_files([self.path], convert_to_base64=True)
+            files = get_file_paths([self.path])
             if not files:
                 msg = f"No files found or file could not be converted to base64: {self.path}"
                 raise ValueError(msg)
-            return files[0]
+            return create_data_url(files[0]).split(",", 1)[1]
         msg = "Image path is not set."
         raise ValueError(msg)
 
@@ -204,7 +204,7 @@ class Message(Data):
         return value
 
     # Keep this async method for backwards compatibility
-    def get_file_content_dicts(self, model_name: str | None = None):
+    def get_file_content_dicts(self, model_name: str | None = None, max_image_dimension: int | None = None):
         content_dicts = []
         try:
             files = get_file_paths(self.files)
@@ -216,7 +216,7 @@ class Message(Data):
             if isinstance(file, Image):
                 content_dicts.append(file.to_content_dict())
             else:
-                content_dicts.append(create_image_content_dict(file, None, model_name))
+                content_dicts.append(create_image_content_dict(file, None, model_name, max_image_dimension))
         return content_dicts
 
     def load_lc_prompt(self):
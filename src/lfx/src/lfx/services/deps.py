@@ -101,6 +101,13 @@ def get_tracing_service() -> TracingServiceProtocol | None:
     return get_service(ServiceType.TRACING_SERVICE)
 
 
+def get_state_service():
+    """Retrieves the state service instance, None when no state service is registered."""
+    from lfx.services.schema import ServiceType
+
+    return get_service(ServiceType.STATE_SERVICE)
+
+
 @asynccontextmanager
 async def session_scope():
     """Session scope context manager.
@@ -108,6 +108,25 @@ class Settings(BaseSettings):
     """Frequency (in seconds) at which the background cleanup task wakes up to
     reap idle sessions."""
 
+    mcp_max_concurrent_requests_per_server: int = 16
+    """Maximum number of requests (tool calls, tool listings...) in flight to a
+    single MCP server across all of its sessions. Further requests wait for a
+    free slot. Set to 0 to disable the limit."""
+
+    mcp_tool_cache_ttl: int = 300  # seconds
+    """How long (in seconds) the tool list of an MCP server is reused before it
+    is listed again. Servers announcing a tool list change invalidate it
+    earlier. Set to 0 to list tools on every connection."""
+
+    mcp_session_ping_interval: int = 30  # seconds
+    """A reused MCP session that was used within this many seconds is handed out
+    without any check beyond its transport state. Older sessions are pinged
+    first."""
+
+    mcp_session_ping_timeout: float = 3.0  # seconds
+    """How long (in seconds) to wait for the ping of an idle MCP session before
+    it is considered dead and replaced."""
+
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL"}
     """SQLite pragmas to use when connecting to the database."""
@@ -147,6 +166,10 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_disk_size_limit: int = 1024**3
+    """Byte budget of the 'disk' cache. The least recently used entries are evicted once it is exceeded."""
+    cache_disk_hot_entries: int = 256
+    """Number of deserialized values the 'disk' cache keeps in memory in front of the disk. 0 disables it."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -166,6 +189,35 @@ class Settings(BaseSettings):
     to use a custom index.
     """
     langchain_cache: str = "InMemoryCache"
+    llm_response_cache_backend: Literal["memory", "sqlite"] = "memory"
+    """Storage of the response cache used by language model components with `Cache Responses` enabled.
+    'memory' keeps an in-process LRU, 'sqlite' adds a local SQLite tier that survives restarts."""
+    llm_response_cache_max_entries: int = 1000
+    """Maximum number of responses kept in each tier of the LLM response cache."""
+    llm_response_cache_ttl: int = 3600
+    """Default time in seconds a cached LLM response stays valid. 0 disables expiration."""
+    llm_response_cache_path: str | None = None
+    """Path of the SQLite LLM response cache. Defaults to a file in the user cache directory."""
+    embedding_cache_enabled: bool = True
+    """If set to False, vector store and knowledge base components will not cache document embeddings."""
+    embedding_cache_max_entries: int = 100_000
+    """Maximum number of embedding vectors kept in the local embedding cache."""
+    embedding_cache_path: str | None = None
+    """Path of the SQLite embedding cache. Defaults to a file in the user cache directory."""
+    composio_catalog_cache_enabled: bool = True
+    """If set to False, Composio components fetch the action catalog of their toolkit from the API on every start."""
+    composio_catalog_cache_ttl: int = 24 * 60 * 60
+    """Seconds after which a cached Composio toolkit catalog is fetched again. 0 keeps it until the SDK is upgraded."""
+    composio_catalog_cache_path: str | None = None
+    """Directory of the Composio toolkit catalogs. Defaults to a directory in the user cache directory."""
+    image_cache_max_bytes: int = 64 * 1024 * 1024
+    """Maximum size in bytes of the encoded images kept in memory for multimodal messages. 0 disables the cache."""
+    image_max_dimension: int | None = None
+    """If set, images attached to messages are downscaled so that their longest side does not exceed this many
+    pixels before being sent to a model."""
+    state_run_ttl: int = 3600
+    """Seconds after the last write before the in-memory state of a run is dropped. 0 keeps it until the run is
+    cleared explicitly."""
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
 
@@ -175,6 +227,10 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    redis_cache_compression: Literal["none", "zstd", "lz4"] = "none"
+    """Compression of large Redis cache values. 'zstd' needs the zstandard package and 'lz4' the lz4 package."""
+    redis_cache_compression_threshold: int = 1024
+    """Size in bytes from which Redis cache values are compressed."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -189,6 +245,14 @@ class Settings(BaseSettings):
     storage_type: str = "local"
 
     celery_enabled: bool = False
+    task_max_concurrency: int = Field(default=8, gt=0)
+    """Maximum number of background tasks run at the same time by the in-process task backend of each worker. Tasks
+    launched beyond that wait in their priority lane."""
+    task_result_ttl: float = 3600.0
+    """Seconds the result of a finished background task is kept by the in-process task backend."""
+    task_max_results: int = 1000
+    """Maximum number of finished background task results kept by the in-process task backend, oldest dropped
+    first."""
 
     fallback_to_env_var: bool = True
     """If set to True, Global Variables set in the UI will fallback to a environment variable
@@ -267,6 +331,30 @@ class Settings(BaseSettings):
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
+    webhook_idempotency_header: str = "Idempotency-Key"
+    """Request header identifying a webhook delivery. Webhooks without it are deduplicated on a hash of their body."""
+    webhook_deduplication_window: int = 86400
+    """Seconds during which a finished webhook delivery makes later requests with the same idempotency key
+    duplicates."""
+    webhook_max_concurrency: int = 8
+    """Maximum number of webhook deliveries run at the same time by each worker."""
+    webhook_max_concurrency_per_flow: int = 2
+    """Maximum number of webhook deliveries of the same flow run at the same time by each worker."""
+    webhook_max_attempts: int = 5
+    """Number of times a webhook delivery is run before it is marked as failed."""
+    webhook_retry_backoff: float = 2.0
+    """Seconds before the first retry of a failed webhook delivery, doubled on every further attempt."""
+    webhook_retry_max_backoff: float = 300.0
+    """Maximum number of seconds between two attempts of a webhook delivery."""
+    webhook_delivery_timeout: float = 600.0
+    """Seconds a webhook delivery may run. A delivery still running after that, for example because its worker
+    died, is picked up again."""
+    component_editor_cache_size: int = 128
+    """Number of custom components kept built between two field updates in the editor, per worker. 0 builds the
+    component from its code on every update."""
+    component_editor_cache_ttl: float = 300.0
+    """Seconds a component built for the editor, and the build configs computed for it, are kept without being
+    used."""
     fs_flows_polling_interval: int = 10000
     """The polling interval in milliseconds for synchronizing flows from the file system."""
     ssl_cert_file: str | None = None
@@ -300,6 +388,13 @@ class Settings(BaseSettings):
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
     """The interval in seconds at which public temporary flows will be cleaned up.
     Default is 1 hour (3600 seconds). Minimum is 600 seconds (10 minutes)."""
+    orphan_cleanup_batch_size: int = Field(default=1000, gt=0)
+    """Number of messages, transactions or vertex builds of a deleted flow removed per statement by the cleanup
+    worker."""
+    orphan_full_scan_interval: int = Field(default=21600, gt=600)
+    """The interval in seconds at which the cleanup worker scans the whole message, transaction and vertex build
+    tables for records of flows that do not exist. Deleted flows are cleaned up as soon as they are deleted, the scan
+    only finds the records left behind otherwise."""
     public_flow_expiration: int = Field(default=86400, gt=600)
     """The time in seconds after which a public temporary flow will be considered expired and eligible for cleanup.
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
@@ -317,6 +412,11 @@ class Settings(BaseSettings):
     update_starter_projects: bool = True
     """If set to True, Langflow will update starter projects."""
 
+    # Startup
+    defer_non_critical_startup: bool = True
+    """If set to True, non-critical startup phases (bundle downloads, starter projects, MCP servers) run in the
+    background after the server starts accepting traffic. If False, the server waits for them before starting."""
+
     # SSRF Protection
     ssrf_protection_enabled: bool = False
     """If set to True, Langflow will enable SSRF (Server-Side Request Forgery) protection.
@@ -334,6 +434,31 @@ class Settings(BaseSettings):
     Note: This setting only takes effect when ssrf_protection_enabled is True.
     When protection is disabled, all hosts are allowed regardless of this setting."""
 
+    # Outbound HTTP of components
+    http_client_max_connections: int = 100
+    """Maximum number of connections opened by the pooled HTTP client of each origin (scheme, host and port) called
+    by components such as API Request."""
+    http_client_max_keepalive_connections: int = 20
+    """Maximum number of idle connections kept open by the pooled HTTP client of each origin."""
+    http_client_keepalive_expiry: float = 30.0
+    """Seconds an idle pooled connection is kept open."""
+    http_client_http2: bool = True
+    """Whether the pooled HTTP clients negotiate HTTP/2 with the servers that support it."""
+    http_client_max_origins: int = 64
+    """Maximum number of origins with a pooled HTTP client, the least recently used client is closed beyond that."""
+    http_client_rate_limit: float = 0.0
+    """Maximum number of requests per second sent to each origin by the pooled HTTP clients. 0 disables the
+    limit."""
+    http_client_retry_backoff: float = 0.5
+    """Seconds before the first retry of a failed request, doubled on every further retry. The actual delay is
+    picked at random below that value."""
+    http_client_retry_max_backoff: float = 10.0
+    """Maximum number of seconds before a retry of a failed request."""
+    http_client_cache_max_entries: int = 512
+    """Maximum number of responses kept by the cache of the pooled HTTP clients."""
+    http_client_cache_max_bytes: int = 32 * 1024 * 1024
+    """Maximum total size in bytes of the responses kept by the cache of the pooled HTTP clients."""
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def validate_cors_origins(cls, value):
@@ -0,0 +1,593 @@
+"""Pooled HTTP clients of the components calling external APIs.
+
+Creating an ``httpx.AsyncClient`` for every request pays a TCP and a TLS handshake every time. :class:`HTTPClientPool`
+keeps one client per origin (scheme, host and port) and per event loop, so the connections, TLS sessions and HTTP/2
+streams of an origin are reused by every component of the process. The requests of these clients go through a
+:class:`PooledTransport`, which adds:
+
+- a rate limit of ``rate_limit`` requests per second per origin
+- retries of the idempotent requests failing with a connection error or a 429, 502, 503 or 504 status, with
+  exponential backoff and full jitter, honoring ``Retry-After``
+- a shared cache of ``GET`` responses following RFC 9111: freshness from ``Cache-Control`` and ``Expires``,
+  revalidation with ``ETag`` and ``Last-Modified``, ``Vary``, ``no-store``, ``private`` and invalidation by unsafe
+  methods. Requests carrying credentials (``Authorization``, ``Cookie``, API key or token headers) bypass the cache,
+  since it is keyed by URL and shared by every user of the process
+- counters of the requests, new and reused connections, retries and cache hits of each origin
+
+Retries and caching are opted into per request with the :data:`MAX_RETRIES_EXTENSION` and :data:`CACHE_EXTENSION`
+request extensions, for example ``client.get(url, extensions={CACHE_EXTENSION: True})``. Pooled clients never store
+cookies, since they are shared by every flow and user of the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import ipaddress
+import random
+import re
+import threading
+import time
+import urllib.request
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+CACHE_EXTENSION = "lfx.cache"
+MAX_RETRIES_EXTENSION = "lfx.max_retries"
+
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+UNSAFE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+CACHEABLE_STATUS_CODES = frozenset({200, 203})
+# Response headers describing the transfer of a body rather than the body itself
+_HOP_BY_HOP_HEADERS = frozenset({"connection", "keep-alive", "transfer-encoding"})
+# Request headers identifying the caller, whose responses must not be shared with other callers
+_CREDENTIAL_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie"})
+_CREDENTIAL_HEADER_PATTERN = re.compile(r"api[-_]?key|token|secret|auth|session|password", re.IGNORECASE)
+
+DEFAULT_MAX_ORIGINS = 64
+DEFAULT_CACHE_MAX_ENTRIES = 512
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def origin_of(url: httpx.URL | str) -> str:
+    """Return the scheme, host and port of ``url``."""
+    url = httpx.URL(url)
+    return f"{url.scheme}://{url.host}" + (f":{url.port}" if url.port else "")
+
+
+def has_credentials(request: httpx.Request) -> bool:
+    """Whether ``request`` carries a header identifying its caller."""
+    return any(name in _CREDENTIAL_HEADERS or _CREDENTIAL_HEADER_PATTERN.search(name) for name in request.headers)
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _seconds(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class OriginStats:
+    requests: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_revalidations: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        snapshot = asdict(self)
+        snapshot["reused_connections"] = max(0, self.requests - self.new_connections)
+        return snapshot
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` requests per second, in bursts of up to ``rate`` requests."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@dataclass
+class _CacheEntry:
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    vary: dict[str, str | None]
+    stored_at: float
+    initial_age: float
+    freshness_lifetime: float
+    validators: dict[str, str] = field(default_factory=dict)
+
+    def current_age(self, now: float) -> float:
+        return self.initial_age + max(0.0, now - self.stored_at)
+
+    def to_response(self, request: httpx.Request, now: float) -> httpx.Response:
+        headers = httpx.Headers(self.headers)
+        headers["age"] = str(int(self.current_age(now)))
+        return httpx.Response(self.status_code, headers=headers, content=self.content, request=request)
+
+
+def _freshness_lifetime(headers: httpx.Headers, directives: dict[str, str | None]) -> float:
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if (seconds := _seconds(directives.get(name))) is not None:
+            return float(seconds)
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        date = _http_date(headers.get("date")) or time.time()
+        return max(0.0, expires - date)
+    return 0.0
+
+
+class HTTPResponseCache:
+    """Responses to ``GET`` requests kept in memory, least recently used dropped first.
+
+    Args:
+        max_entries: Maximum number of responses kept.
+        max_bytes: Maximum total size of the bodies kept. Larger responses are not stored.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def lookup(self, request: httpx.Request) -> _CacheEntry | None:
+        key = str(request.url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if any(request.headers.get(name) != value for name, value in entry.vary.items()):
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def is_fresh(entry: _CacheEntry, request_directives: dict[str, str | None], now: float) -> bool:
+        """Whether ``entry`` can be returned without asking the origin server."""
+        if "no-cache" in request_directives:
+            return False
+        age = entry.current_age(now)
+        max_age = _seconds(request_directives.get("max-age"))
+        if max_age is not None and age > max_age:
+            return False
+        return age < entry.freshness_lifetime
+
+    @staticmethod
+    def storable(request: httpx.Request, response: httpx.Response) -> bool:
+        if request.method != "GET" or response.status_code not in CACHEABLE_STATUS_CODES:
+            return False
+        # Entries are keyed by URL only, the response to a caller must not be served to another one
+        if has_credentials(request):
+            return False
+        directives = _parse_cache_control(response.headers.get("cache-control", ""))
+        if "no-store" in directives or "private" in directives:
+            return False
+        if "*" in response.headers.get("vary", ""):
+            return False
+        has_validator = "etag" in response.headers or "last-modified" in response.headers
+        return has_validator or _freshness_lifetime(response.headers, directives) > 0
+
+    def store(self, request: httpx.Request, response: httpx.Response, content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+        headers = response.headers
+        vary_names = [name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()]
+        entry = _CacheEntry(
+            status_code=response.status_code,
+            headers=[(name, value) for name, value in headers.multi_items() if name not in _HOP_BY_HOP_HEADERS],
+            content=content,
+            vary={name: request.headers.get(name) for name in vary_names},
+            stored_at=time.time(),
+            initial_age=float(_seconds(headers.get("age")) or 0),
+            freshness_lifetime=_freshness_lifetime(headers, _parse_cache_control(headers.get("cache-control", ""))),
+        )
+        if etag := headers.get("etag"):
+            entry.validators["if-none-match"] = etag
+        if last_modified := headers.get("last-modified"):
+            entry.validators["if-modified-since"] = last_modified
+
+        key = str(request.url)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += len(content)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def refresh(self, entry: _CacheEntry, not_modified: httpx.Response) -> None:
+        """Update ``entry`` with the headers of the ``304`` response that revalidated it."""
+        headers = httpx.Headers(entry.headers)
+        for name, value in not_modified.headers.items():
+            if name not in _HOP_BY_HOP_HEADERS and name != "content-length":
+                headers[name] = value
+        entry.headers = list(headers.multi_items())
+        entry.stored_at = time.time()
+        entry.initial_age = float(_seconds(headers.get("age")) or 0)
+        entry.freshness_lifetime = _freshness_lifetime(headers, _parse_cache_control(headers.get("cache-control", "")))
+
+    def invalidate(self, url: httpx.URL | str) -> None:
+        with self._lock:
+            self._remove(str(url))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Transport adding rate limiting, retries, caching and metrics to the requests of a pooled client."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        stats: OriginStats,
+        rate_limiter: RateLimiter | None = None,
+        cache: HTTPResponseCache | None = None,
+        retry_backoff: float = 0.5,
+        retry_max_backoff: float = 10.0,
+    ) -> None:
+        self._transport = transport
+        self.stats = stats
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        use_cache = bool(request.extensions.pop(CACHE_EXTENSION, False)) and self.cache is not None
+        max_retries = int(request.extensions.pop(MAX_RETRIES_EXTENSION, 0) or 0)
+        self._trace_connections(request)
+
+        entry = None
+        revalidating = False
+        if use_cache and request.method == "GET":
+            request_directives = _parse_cache_control(request.headers.get("cache-control", ""))
+            if "no-store" in request_directives or has_credentials(request):
+                use_cache = False
+            elif (entry := self.cache.lookup(request)) is not None:
+                now = time.time()
+                if self.cache.is_fresh(entry, request_directives, now):
+                    self.stats.cache_hits += 1
+                    return entry.to_response(request, now)
+                # Only revalidate with our validators if the caller did not send conditional headers itself
+                if entry.validators and not any(name in request.headers for name in entry.validators):
+                    request.headers.update(entry.validators)
+                    revalidating = True
+
+        response = await self._send(request, max_retries if request.method in IDEMPOTENT_METHODS else 0)
+
+        if revalidating and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            self.cache.refresh(entry, response)
+            self.stats.cache_revalidations += 1
+            return entry.to_response(request, time.time())
+        if use_cache and self.cache.storable(request, response):
+            content = b"".join([chunk async for chunk in response.stream])
+            await response.aclose()
+            self.cache.store(request, response, content)
+            return httpx.Response(
+                response.status_code,
+                headers=[(name, value) for name, value in response.headers.multi_items()],
+                content=content,
+                request=request,
+                extensions={key: value for key, value in response.extensions.items() if key == "http_version"},
+            )
+        if (
+            self.cache is not None
+            and request.method in UNSAFE_METHODS
+            and response.status_code < httpx.codes.BAD_REQUEST
+        ):
+            self.cache.invalidate(request.url)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _trace_connections(self, request: httpx.Request) -> None:
+        """Count the connections and TLS handshakes opened to send ``request``."""
+        trace = request.extensions.get("trace")
+        stats = self.stats
+
+        async def count(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+            if trace is not None:
+                await trace(event_name, info)
+
+        request.extensions["trace"] = count
+
+    async def _send(self, request: httpx.Request, max_retries: int) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None and (wait := self.rate_limiter.reserve()) > 0:
+                self.stats.rate_limited += 1
+                await asyncio.sleep(wait)
+            self.stats.requests += 1
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                self.stats.errors += 1
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff(attempt, None)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                    return response
+                delay = self._backoff(attempt, response.headers.get("retry-after"))
+                await response.aclose()
+            attempt += 1
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        cap = min(self.retry_max_backoff, self.retry_backoff * 2**attempt)
+        delay = random.uniform(0, cap)  # noqa: S311
+        if retry_after is not None:
+            seconds = _seconds(retry_after)
+            if seconds is None and (date := _http_date(retry_after)) is not None:
+                seconds = max(0.0, date - time.time())
+            if seconds is not None:
+                delay = max(delay, min(float(seconds), self.retry_max_backoff))
+        return delay
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    # Number of callers currently holding the client
+    leases: int = 0
+    # Removed from the pool, closed once its last lease is released
+    evicted: bool = False
+
+
+def _environment_mounts(transport_for_proxy: Callable[[str], httpx.AsyncBaseTransport]) -> dict[str, Any]:
+    """Return the client mounts routing requests through the ``HTTP(S)_PROXY``, ``ALL_PROXY`` and ``NO_PROXY`` proxies.
+
+    ``httpx`` only reads these variables for clients without a custom transport, so the pooled clients mount the
+    proxies themselves, the same way ``httpx`` does. A ``None`` mount sends the requests to its hosts directly.
+    """
+    proxies = urllib.request.getproxies()
+    mounts: dict[str, Any] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy := proxies.get(scheme):
+            mounts[f"{scheme}://"] = transport_for_proxy(proxy if "://" in proxy else f"http://{proxy}")
+    for host in (host.strip() for host in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            mounts[f"all://{host}" if host.lower() == "localhost" else f"all://*{host}"] = None
+        else:
+            mounts[f"all://[{host}]" if isinstance(address, ipaddress.IPv6Address) else f"all://{host}"] = None
+    return mounts
+
+
+class HTTPClientPool:
+    """One pooled ``httpx.AsyncClient`` per origin and event loop, shared by the whole process.
+
+    Clients are bound to the event loop they were created in, so each running loop gets its own clients. The least
+    recently used client of a loop is removed from the pool once more than ``max_origins`` origins are in use, and
+    closed once the requests in flight on it are done.
+
+    Usage::
+
+        async with get_http_client_pool().client(url) as client:
+            response = await client.get(url)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        max_origins: int = DEFAULT_MAX_ORIGINS,
+        rate_limit: float = 0.0,
+        retry_backoff: float = 0.5,
+        retry_max_backoff: float = 10.0,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # HTTP/2 needs the optional h2 package
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.max_origins = max_origins
+        self.rate_limit = rate_limit
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self.cache = HTTPResponseCache(cache_max_entries, cache_max_bytes) if cache_max_entries > 0 else None
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[str, _PooledClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: dict[str, OriginStats] = {}
+        self._rate_limiters: dict[str, RateLimiter] = {}
+        self._closing: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def client(self, url: httpx.URL | str) -> AsyncIterator[httpx.AsyncClient]:
+        """Lease the client of the origin of ``url`` for the running event loop.
+
+        The client is not closed while it is leased, even if the pool evicts it in the meantime.
+        """
+        pooled = self._acquire(url)
+        try:
+            yield pooled.client
+        finally:
+            with self._lock:
+                pooled.leases -= 1
+                close = pooled.evicted and pooled.leases == 0
+            if close:
+                await pooled.client.aclose()
+
+    def _acquire(self, url: httpx.URL | str) -> _PooledClient:
+        origin = origin_of(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.setdefault(loop, OrderedDict())
+            pooled = clients.get(origin)
+            if pooled is not None and not pooled.client.is_closed:
+                clients.move_to_end(origin)
+            else:
+                pooled = clients[origin] = _PooledClient(self._create_client(origin))
+            pooled.leases += 1
+            while len(clients) > self.max_origins:
+                _, evicted = clients.popitem(last=False)
+                evicted.evicted = True
+                if evicted.leases == 0:
+                    task = loop.create_task(evicted.client.aclose())
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+        return pooled
+
+    def _create_client(self, origin: str) -> httpx.AsyncClient:
+        stats = self._stats.setdefault(origin, OriginStats())
+        rate_limiter = None
+        if self.rate_limit > 0:
+            rate_limiter = self._rate_limiters.setdefault(origin, RateLimiter(self.rate_limit))
+
+        def pooled_transport(proxy: str | None = None) -> PooledTransport:
+            return PooledTransport(
+                httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2, proxy=proxy),
+                stats=stats,
+                rate_limiter=rate_limiter,
+                cache=self.cache,
+                retry_backoff=self.retry_backoff,
+                retry_max_backoff=self.retry_max_backoff,
+            )
+
+        # Cookies set by a response must not leak into the requests of other flows and users
+        cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        return httpx.AsyncClient(
+            transport=pooled_transport(), mounts=_environment_mounts(pooled_transport), cookies=cookies
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        """Return the request, connection, retry and cache counters of each origin."""
+        with self._lock:
+            origins = {origin: stats.snapshot() for origin, stats in self._stats.items()}
+            open_clients = sum(len(clients) for clients in self._clients.values())
+        return {
+            "clients": open_clients,
+            "origins": origins,
+            "cache": {
+                "entries": len(self.cache) if self.cache is not None else 0,
+                "bytes": self.cache.size if self.cache is not None else 0,
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Close the clients of the running event loop."""
+        with self._lock:
+            clients = self._clients.pop(asyncio.get_running_loop(), OrderedDict())
+        for pooled in clients.values():
+            await pooled.client.aclose()
+
+
+_http_client_pool: HTTPClientPool | None = None
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the HTTP client pool of this process, configured from the settings."""
+    global _http_client_pool  # noqa: PLW0603
+    if _http_client_pool is None:
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+        if settings_service is None:
+            _http_client_pool = HTTPClientPool()
+        else:
+            settings = settings_service.settings
+            _http_client_pool = HTTPClientPool(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                keepalive_expiry=settings.http_client_keepalive_expiry,
+                http2=settings.http_client_http2,
+                max_origins=settings.http_client_max_origins,
+                rate_limit=settings.http_client_rate_limit,
+                retry_backoff=settings.http_client_retry_backoff,
+                retry_max_backoff=settings.http_client_retry_max_backoff,
+                cache_max_entries=settings.http_client_cache_max_entries,
+                cache_max_bytes=settings.http_client_cache_max_bytes,
+            )
+    return _http_client_pool
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import base64
-from functools import lru_cache
+import io
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+from PIL import Image as PILImage
+
 from lfx.utils.helpers import get_mime_type
 
+DEFAULT_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 def convert_image_to_base64(image_path: str | Path) -> str:
     """Convert an image file to a base64 encoded string.
@@ -30,12 +36,17 @@ def convert_image_to_base64(image_path: str | Path) -> str:
         return base64.b64encode(image_file.read()).decode("utf-8")
 
 
-def create_data_url(image_path: str | Path, mime_type: str | None = None) -> str:
+def create_data_url(image_path: str | Path, mime_type: str | None = None, max_dimension: int | None = None) -> str:
     """Create a data URL from an image file.
 
+    Encoded data URLs are served from the shared :class:`ImageContentCache`, so an image is only read and encoded
+    again when the file changes.
+
     Args:
         image_path: Path to the image file
         mime_type: MIME type of the image. If None, will be auto-detected
+        max_dimension: If set, the image is downscaled so that its longest side does not exceed this many pixels.
+            Defaults to the ``image_max_dimension`` setting.
 
     Returns:
         Data URL string in format: data:mime/type;base64,{base64_data}
@@ -43,21 +54,14 @@ def create_data_url(image_path: str | Path, mime_type: str | None = None) -> str
     Raises:
         FileNotFoundError: If the image file doesn't exist
     """
-    image_path = Path(image_path)
-    if not image_path.exists():
-        msg = f"Image file not found: {image_path}"
-        raise FileNotFoundError(msg)
-
-    if mime_type is None:
-        mime_type = get_mime_type(image_path)
+    return get_image_content_cache().get_data_url(image_path, mime_type, max_dimension)
 
-    base64_data = convert_image_to_base64(image_path)
-    return f"data:{mime_type};base64,{base64_data}"
 
-
-@lru_cache(maxsize=50)
 def create_image_content_dict(
-    image_path: str | Path, mime_type: str | None = None, model_name: str | None = None
+    image_path: str | Path,
+    mime_type: str | None = None,
+    model_name: str | None = None,
+    max_dimension: int | None = None,
 ) -> dict:
     """Create a content dictionary for multimodal inputs from an image file.
 
@@ -65,6 +69,7 @@ def create_image_content_dict(
         image_path: Path to the image file
         mime_type: MIME type of the image. If None, will be auto-detected
         model_name: Optional model parameter to determine content dict structure
+        max_dimension: Optional maximum length in pixels of the longest side of the image
 
     Returns:
         Content dictionary with type and image_url fields
@@ -72,8 +77,133 @@ def create_image_content_dict(
     Raises:
         FileNotFoundError: If the image file doesn't exist
     """
-    data_url = create_data_url(image_path, mime_type)
+    data_url = create_data_url(image_path, mime_type, max_dimension)
 
     if model_name == "OllamaModel":
         return {"type": "image_url", "source_type": "url", "image_url": data_url}
     return {"type": "image", "source_type": "url", "url": data_url}
+
+
+def downscale_image(data: bytes, max_dimension: int) -> tuple[bytes, str | None]:
+    """Shrink an encoded image so that its longest side is at most ``max_dimension`` pixels.
+
+    Returns the (possibly unchanged) image bytes and the MIME type of the re-encoded image, or None if the image
+    was left untouched. Images Pillow cannot decode or re-encode are returned as they are.
+    """
+    try:
+        with PILImage.open(io.BytesIO(data)) as image:
+            if max(image.size) <= max_dimension:
+                return data, None
+            image_format = image.format or "PNG"
+            image.thumbnail((max_dimension, max_dimension))
+            buffer = io.BytesIO()
+            image.save(buffer, format=image_format)
+    except (OSError, ValueError):
+        return data, None
+    return buffer.getvalue(), PILImage.MIME.get(image_format)
+
+
+class ImageContentCache:
+    """Byte-budget LRU of image data URLs keyed by file path, modification time and size.
+
+    Chat history attaches the same images to every turn; caching the encoded data URL avoids reading and base64
+    encoding each of them again. A modified file gets a new key, stale entries age out of the LRU.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_IMAGE_CACHE_MAX_BYTES, max_dimension: int | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_dimension = max_dimension
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total length in bytes of the cached data URLs."""
+        return self._size
+
+    def get_data_url(
+        self, image_path: str | Path, mime_type: str | None = None, max_dimension: int | None = None
+    ) -> str:
+        image_path = Path(image_path)
+        try:
+            stat = image_path.stat()
+        except FileNotFoundError:
+            msg = f"Image file not found: {image_path}"
+            raise FileNotFoundError(msg) from None
+        max_dimension = max_dimension or self.max_dimension
+        key = (str(image_path.resolve()), stat.st_mtime_ns, stat.st_size, mime_type, max_dimension)
+        with self._lock:
+            data_url = self._entries.get(key)
+            if data_url is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data_url
+            self.misses += 1
+
+        data = image_path.read_bytes()
+        if max_dimension:
+            data, resized_mime_type = downscale_image(data, max_dimension)
+            mime_type = mime_type or resized_mime_type
+        if mime_type is None:
+            mime_type = get_mime_type(image_path)
+        data_url = f"data:{mime_type};base64,{base64.b64encode(data).decode('utf-8')}"
+        self._put(key, data_url)
+        return data_url
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _put(self, key: tuple, data_url: str) -> None:
+        if len(data_url) > self.max_bytes:
+            return
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= len(previous)
+            self._entries[key] = data_url
+            self._size += len(data_url)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_image_content_cache: ImageContentCache | None = None
+_image_content_cache_lock = threading.Lock()
+
+
+def get_image_content_cache() -> ImageContentCache:
+    """Return the process-wide image content cache, creating it from the settings on first use."""
+    global _image_content_cache  # noqa: PLW0603
+    if _image_content_cache is not None:
+        return _image_content_cache
+    with _image_content_cache_lock:
+        if _image_content_cache is None:
+            _image_content_cache = _create_image_content_cache()
+    return _image_content_cache
+
+
+def set_image_content_cache(cache: ImageContentCache | None) -> None:
+    """Replace the process-wide image content cache. Passing ``None`` recreates it from the settings on next use."""
+    global _image_content_cache  # noqa: PLW0603
+    with _image_content_cache_lock:
+        _image_content_cache = cache
+
+
+def _create_image_content_cache() -> ImageContentCache:
+    from lfx.services.deps import get_settings_service
+
+    max_bytes = DEFAULT_IMAGE_CACHE_MAX_BYTES
+    max_dimension: int | None = None
+    settings_service = get_settings_service()
+    if settings_service is not None:
+        settings = settings_service.settings
+        max_bytes = getattr(settings, "image_cache_max_bytes", max_bytes)
+        max_dimension = getattr(settings, "image_max_dimension", max_dimension)
+    return ImageContentCache(max_bytes=max_bytes, max_dimension=max_dimension)
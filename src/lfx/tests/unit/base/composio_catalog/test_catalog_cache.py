@@ -0,0 +1,156 @@
+"""Tests for the on-disk Composio toolkit catalog."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from lfx.base.composio.catalog_cache import (
+    ComposioCatalogCache,
+    ToolkitCatalog,
+    deserialize_input,
+    serialize_input,
+    set_composio_catalog_cache,
+)
+from lfx.inputs.inputs import BoolInput, FileInput, IntInput, MessageTextInput, MultilineInput
+
+SNAPSHOT_PATH = Path(__file__).parents[3] / "data" / "composio_gmail_catalog.json"
+SNAPSHOT_SDK_VERSION = "snapshot"
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    directory = tmp_path / "composio_catalog"
+    directory.mkdir()
+    shutil.copy(SNAPSHOT_PATH, directory / "gmail.json")
+    return directory
+
+
+@pytest.fixture
+def catalog_cache(catalog_dir):
+    cache = ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION, ttl=0)
+    set_composio_catalog_cache(cache)
+    yield cache
+    set_composio_catalog_cache(None)
+
+
+def send_email_inputs():
+    return [
+        MessageTextInput(name="recipient_email", display_name="Recipient Email", required=True),
+        MultilineInput(name="body", display_name="Body", info="Body of the email.", required=True),
+        BoolInput(name="is_html", display_name="Is Html", value=False, advanced=True),
+        FileInput(name="attachment", display_name="Attachment", file_types=["pdf", "png"], is_list=True),
+        IntInput(name="max_results", display_name="Max Results", value=10),
+    ]
+
+
+class TestComposioCatalogCache:
+    def test_loads_snapshot_lazily(self, catalog_dir):
+        cache = ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION, ttl=0)
+        assert cache._catalogs == {}
+
+        catalog = cache.get("GMAIL")
+
+        assert set(catalog.actions) == {"GMAIL_SEND_EMAIL", "GMAIL_FETCH_EMAILS"}
+        assert catalog.actions["GMAIL_SEND_EMAIL"]["file_upload_fields"] == {"attachment"}
+        assert catalog.bool_fields == ["include_payload", "is_html"]
+        assert cache.get("gmail") is catalog
+
+    def test_missing_toolkit(self, catalog_dir):
+        cache = ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION)
+
+        assert cache.get("slack") is None
+        assert cache.get_inputs("slack", "SLACK_SEND_MESSAGE") is None
+
+    def test_other_sdk_version_is_ignored(self, catalog_dir):
+        assert ComposioCatalogCache(catalog_dir, sdk_version="0.8.0").get("gmail") is None
+
+    def test_expired_catalog_is_ignored(self, catalog_dir, monkeypatch):
+        writer = ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION, ttl=60)
+        writer.put(ToolkitCatalog.from_json(SNAPSHOT_PATH.read_text(encoding="utf-8")))
+        created_at = writer.get("gmail").created_at
+
+        monkeypatch.setattr("lfx.base.composio.catalog_cache.time.time", lambda: created_at + 61)
+
+        assert writer.get("gmail") is None
+        assert ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION, ttl=0).get("gmail") is not None
+
+    def test_put_is_shared_with_other_instances(self, tmp_path):
+        writer = ComposioCatalogCache(tmp_path, sdk_version="1.0.0")
+        writer.put(
+            ToolkitCatalog(
+                toolkit="Slack",
+                actions={"SLACK_SEND_MESSAGE": {"action_fields": ["channel"], "file_upload_fields": {"file"}}},
+                schemas={"SLACK_SEND_MESSAGE": {"slug": "SLACK_SEND_MESSAGE"}},
+            )
+        )
+
+        catalog = ComposioCatalogCache(tmp_path, sdk_version="1.0.0").get("slack")
+
+        assert catalog.actions["SLACK_SEND_MESSAGE"]["file_upload_fields"] == {"file"}
+        assert catalog.sdk_version == "1.0.0"
+        assert catalog.created_at > 0
+        assert ComposioCatalogCache(tmp_path, sdk_version="2.0.0").get("slack") is None
+
+    def test_generated_inputs_are_persisted(self, catalog_cache, catalog_dir):
+        catalog_cache.get("gmail")
+        catalog_cache.add_inputs("gmail", {"GMAIL_SEND_EMAIL": send_email_inputs(), "UNKNOWN": send_email_inputs()})
+
+        reader = ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION, ttl=0)
+        inputs = reader.get_inputs("gmail", "GMAIL_SEND_EMAIL")
+
+        assert inputs == send_email_inputs()
+        assert inputs is not reader.get_inputs("gmail", "GMAIL_SEND_EMAIL")
+        assert reader.get_inputs("gmail", "GMAIL_FETCH_EMAILS") is None
+        assert "UNKNOWN" not in reader.get("gmail").inputs
+
+    def test_add_inputs_requires_a_cached_catalog(self, tmp_path):
+        cache = ComposioCatalogCache(tmp_path, sdk_version="1.0.0")
+
+        cache.add_inputs("gmail", {"GMAIL_SEND_EMAIL": send_email_inputs()})
+
+        assert not cache.path_for("gmail").exists()
+
+    def test_unreadable_catalog_is_ignored(self, catalog_dir):
+        (catalog_dir / "gmail.json").write_text("{not json", encoding="utf-8")
+
+        assert ComposioCatalogCache(catalog_dir, sdk_version=SNAPSHOT_SDK_VERSION).get("gmail") is None
+
+    def test_invalidate(self, catalog_cache, catalog_dir):
+        catalog_cache.get("gmail")
+
+        catalog_cache.invalidate("gmail")
+
+        assert not (catalog_dir / "gmail.json").exists()
+        assert catalog_cache.get("gmail") is None
+
+
+def test_input_serialization_round_trip():
+    for lf_input in send_email_inputs():
+        data = serialize_input(lf_input)
+
+        assert data["_input_type"] == type(lf_input).__name__
+        assert deserialize_input(data) == lf_input
+
+
+@pytest.mark.usefixtures("catalog_cache")
+def test_component_uses_cached_catalog_without_api_key(monkeypatch):
+    pytest.importorskip("composio")
+    from lfx.base.composio.composio_base import ComposioBaseComponent
+
+    class GmailComponent(ComposioBaseComponent):
+        app_name = "gmail"
+
+    monkeypatch.setattr(GmailComponent, "_actions_cache", {})
+    monkeypatch.setattr(GmailComponent, "_action_schema_cache", {})
+    component = GmailComponent()
+    component._populate_actions_data()
+
+    assert set(component._actions_data) == {"GMAIL_SEND_EMAIL", "GMAIL_FETCH_EMAILS"}
+    generated = component._get_inputs_for_all_actions()
+
+    def fail(*_args, **_kwargs):
+        msg = "inputs should come from the catalog cache"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(GmailComponent, "_generate_schema_inputs", fail)
+    assert GmailComponent()._get_inputs_for_all_actions() == generated
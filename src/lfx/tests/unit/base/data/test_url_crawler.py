@@ -0,0 +1,237 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from lfx.base.data.url_crawler import CrawlConfig, CrawlError, HTTPCache, URLCrawler
+
+
+class Site:
+    """Pages served by the local HTTP server, with the requests it received."""
+
+    def __init__(self) -> None:
+        self.pages: dict[str, tuple[str, str]] = {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def add(self, path: str, body: str, content_type: str = "text/html; charset=utf-8") -> None:
+        self.pages[path] = (content_type, body)
+
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.requests if path != "/robots.txt"]
+
+
+def make_handler(site: Site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with site._lock:
+                site.requests.append((self.path, dict(self.headers)))
+                site.in_flight += 1
+                site.peak = max(site.peak, site.in_flight)
+            try:
+                if site.delay:
+                    time.sleep(site.delay)
+                if self.path not in site.pages:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                content_type, body = site.pages[self.path]
+                etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                data = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+            finally:
+                with site._lock:
+                    site.in_flight -= 1
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def site():
+    site = Site()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(site))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+def page(title: str, *links: str, body: str = "") -> str:
+    anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+    return f"<html lang='en'><head><title>{title}</title></head><body>{body or title}{anchors}</body></html>"
+
+
+def config(**kwargs) -> CrawlConfig:
+    return CrawlConfig(**kwargs)
+
+
+async def test_follows_links_up_to_max_depth_on_the_same_host(site):
+    outside = site.base_url.replace("127.0.0.1", "localhost") + "/outside"
+    site.add("/", page("Home", "/a", "/b#section", outside, "/style.css"))
+    site.add("/a", page("A", "/c"))
+    site.add("/b", page("B", "/"))
+    site.add("/c", page("C"))
+
+    pages = await URLCrawler(config(max_depth=2)).crawl([site.base_url + "/"])
+
+    assert [p.url for p in pages] == [site.base_url + path for path in ("/", "/a", "/b")]
+    assert [p.depth for p in pages] == [0, 1, 1]
+    assert pages[0].title == "Home"
+    assert pages[0].language == "en"
+    assert pages[0].content_type.startswith("text/html")
+    assert sorted(site.paths()) == ["/", "/a", "/b"]
+
+
+async def test_links_outside_the_root_path_are_not_followed(site):
+    site.add("/docs/", page("Docs", "/docs/guide", "/blog", "/docs-archive"))
+    site.add("/docs/guide", page("Guide", "/docs/"))
+    site.add("/blog", page("Blog"))
+    site.add("/docs-archive", page("Archive"))
+
+    pages = await URLCrawler(config(max_depth=3)).crawl([site.base_url + "/docs/"])
+    assert [p.url for p in pages] == [site.base_url + "/docs/", site.base_url + "/docs/guide"]
+
+    pages = await URLCrawler(config(max_depth=3, prevent_outside=False)).crawl([site.base_url + "/docs/"])
+    assert len(pages) == 4
+
+
+async def test_extracts_metadata_and_applies_the_extractor(site):
+    site.add("/", "<html><head><meta name='description' content='About us'><title> Home </title></head></html>")
+
+    pages = await URLCrawler(config(), extractor=str.upper).crawl([site.base_url + "/"])
+
+    assert pages[0].title == "Home"
+    assert pages[0].description == "About us"
+    assert pages[0].content.startswith("<HTML>")
+
+
+async def test_links_disallowed_by_robots_are_not_followed(site):
+    site.add("/robots.txt", "User-agent: *\nDisallow: /private\n", "text/plain")
+    site.add("/", page("Home", "/public", "/private"))
+    site.add("/public", page("Public"))
+    site.add("/private", page("Private"))
+
+    pages = await URLCrawler(config(max_depth=2)).crawl([site.base_url + "/"])
+    assert sorted(p.url for p in pages) == [site.base_url + "/", site.base_url + "/public"]
+
+    # Root URLs are fetched even when robots.txt disallows them
+    pages = await URLCrawler(config()).crawl([site.base_url + "/private"])
+    assert [p.title for p in pages] == ["Private"]
+
+    pages = await URLCrawler(config(max_depth=2, respect_robots=False)).crawl([site.base_url + "/"])
+    assert len(pages) == 3
+
+
+async def test_max_pages_is_a_budget_shared_by_all_root_urls(site):
+    site.add("/", page("Home", *[f"/{i}" for i in range(50)]))
+    site.add("/other", page("Other", *[f"/{i}" for i in range(50, 100)]))
+    for i in range(100):
+        site.add(f"/{i}", page(f"Page {i}"))
+
+    pages = await URLCrawler(config(max_depth=2, max_pages=10)).crawl([site.base_url + "/", site.base_url + "/other"])
+
+    assert len(pages) == 10
+    assert len(site.paths()) == 10
+
+
+async def test_requests_per_host_are_limited(site):
+    site.delay = 0.05
+    site.add("/", page("Home", *[f"/{i}" for i in range(12)]))
+    for i in range(12):
+        site.add(f"/{i}", page(f"Page {i}"))
+
+    started = time.perf_counter()
+    pages = await URLCrawler(config(max_depth=2, max_concurrency_per_host=3)).crawl([site.base_url + "/"])
+    elapsed = time.perf_counter() - started
+
+    assert len(pages) == 13
+    assert site.peak == 3
+    # Fetched three at a time instead of one after the other
+    assert elapsed < 13 * site.delay
+
+
+async def test_unchanged_pages_are_requested_conditionally(site, tmp_path):
+    site.add("/", page("Home", "/a"))
+    site.add("/a", page("A"))
+    crawl_config = config(max_depth=2, cache_dir=tmp_path)
+
+    first = await URLCrawler(crawl_config).crawl([site.base_url + "/"])
+    crawler = URLCrawler(crawl_config)
+    second = await crawler.crawl([site.base_url + "/"])
+
+    assert [(p.url, p.content, p.title) for p in second] == [(p.url, p.content, p.title) for p in first]
+    assert crawler.not_modified == 2
+    assert all("If-None-Match" in headers for path, headers in site.requests[-3:] if path != "/robots.txt")
+
+    # Private requests are not cached
+    site.requests.clear()
+    await URLCrawler(config(cache_dir=tmp_path, headers={"Authorization": "Bearer token"})).crawl([site.base_url + "/"])
+    assert "If-None-Match" not in site.requests[0][1]
+
+
+async def test_pages_with_the_same_content_are_returned_once(site):
+    site.add("/", page("Home", "/index.html", "/a"))
+    site.add("/index.html", page("Home", "/index.html", "/a"))
+    site.add("/a", page("A"))
+
+    crawler = URLCrawler(config(max_depth=2))
+    pages = await crawler.crawl([site.base_url + "/"])
+
+    assert [p.url for p in pages] == [site.base_url + "/", site.base_url + "/a"]
+    assert crawler.duplicates == 1
+
+
+async def test_non_text_content_is_filtered(site):
+    site.add("/", page("Home", "/styles", "/notes"))
+    site.add("/styles", "body {}", "text/css")
+    site.add("/notes", "plain notes", "text/plain")
+
+    pages = await URLCrawler(config(max_depth=2)).crawl([site.base_url + "/"])
+    assert [p.content for p in pages][1:] == ["plain notes"]
+
+    pages = await URLCrawler(config(max_depth=2, filter_text_html=False)).crawl([site.base_url + "/"])
+    assert len(pages) == 3
+
+
+async def test_failures_stop_the_crawl_unless_continue_on_failure(site):
+    site.add("/", page("Home", "/missing"))
+    urls = [site.base_url + "/"]
+
+    pages = await URLCrawler(config(max_depth=2, check_response_status=True)).crawl(urls)
+    assert [p.title for p in pages] == ["Home"]
+
+    with pytest.raises(CrawlError, match="/missing"):
+        await URLCrawler(config(max_depth=2, check_response_status=True, continue_on_failure=False)).crawl(urls)
+
+
+def test_http_cache_prunes_the_oldest_entries(tmp_path):
+    cache = HTTPCache(tmp_path, max_entries=2)
+    for i in range(4):
+        cache.store(f"https://example.com/{i}", etag=f'"{i}"', last_modified=None, content_type="text/html", text="x")
+        (tmp_path / f"{hashlib.sha256(f'https://example.com/{i}'.encode()).hexdigest()}.json").touch()
+        time.sleep(0.01)
+
+    cache.prune()
+
+    assert [cache.load(f"https://example.com/{i}") is not None for i in range(4)] == [False, False, True, True]
+    assert HTTPCache.validators(cache.load("https://example.com/3")) == {"If-None-Match": '"3"'}
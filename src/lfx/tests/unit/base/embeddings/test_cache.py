@@ -0,0 +1,163 @@
+"""Tests for the content-hash embedding cache."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from lfx.base.embeddings.cache import (
+    CachedEmbeddings,
+    EmbeddingCacheStore,
+    get_embedding_model_id,
+    set_embedding_cache_store,
+    wrap_with_embedding_cache,
+)
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "counting-model"):
+        self.model = model
+        self.embedded: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text)), 0.0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EmbeddingCacheStore(tmp_path / "embeddings.sqlite", max_entries=100)
+    yield store
+    store.close()
+
+
+def test_only_changed_texts_are_embedded(store):
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, store)
+
+    first = cached.embed_documents(["a", "bb", "ccc"])
+    second = cached.embed_documents(["a", "bb", "dddd"])
+
+    assert first == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert second == [[1.0, 1.0], [2.0, 1.0], [4.0, 1.0]]
+    assert model.embedded == [["a", "bb", "ccc"], ["dddd"]]
+    assert cached.hits == 2
+    assert cached.misses == 4
+
+
+def test_cache_is_keyed_by_model(store):
+    first_model = CountingEmbeddings("first")
+    second_model = CountingEmbeddings("second")
+
+    CachedEmbeddings(first_model, store).embed_documents(["a"])
+    CachedEmbeddings(second_model, store).embed_documents(["a"])
+
+    assert first_model.embedded == [["a"]]
+    assert second_model.embedded == [["a"]]
+
+
+def test_cache_persists_across_store_instances(tmp_path):
+    path = tmp_path / "embeddings.sqlite"
+    store = EmbeddingCacheStore(path)
+    CachedEmbeddings(CountingEmbeddings(), store).embed_documents(["persisted"])
+    store.close()
+
+    reopened = EmbeddingCacheStore(path)
+    model = CountingEmbeddings()
+    result = CachedEmbeddings(model, reopened).embed_documents(["persisted"])
+    reopened.close()
+
+    assert result == [[9.0, 1.0]]
+    assert model.embedded == []
+
+
+def test_missing_texts_are_embedded_in_batches(store):
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, store, batch_size=2)
+
+    cached.embed_documents(["a", "b", "c", "a"])
+
+    assert model.embedded == [["a", "b"], ["c"]]
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = EmbeddingCacheStore(tmp_path / "embeddings.sqlite", max_entries=2)
+    cached = CachedEmbeddings(CountingEmbeddings(), store)
+    for text in ("a", "b", "c"):
+        cached.embed_documents([text])
+
+    assert len(store) == 2
+    assert store.get_many(cached.model_id, ["a"]) == {}
+    store.close()
+
+
+async def test_async_embedding_uses_cache(store):
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, store)
+
+    await cached.aembed_documents(["a", "bb"])
+    result = await cached.aembed_documents(["bb", "a"])
+
+    assert result == [[2.0, 1.0], [1.0, 1.0]]
+    assert model.embedded == [["a", "bb"]]
+
+
+def test_queries_and_attributes_are_delegated(store):
+    cached = CachedEmbeddings(CountingEmbeddings("my-model"), store)
+
+    assert cached.embed_query("abc") == [3.0, 0.0]
+    assert cached.model == "my-model"
+    assert get_embedding_model_id(cached.embeddings) == "CountingEmbeddings:my-model"
+
+
+def test_model_id_covers_deployment_endpoint_and_options():
+    def model_id(**attributes):
+        model = CountingEmbeddings("text-embedding-3-small")
+        model.__dict__.update(attributes)
+        return get_embedding_model_id(model)
+
+    ids = [
+        model_id(),
+        model_id(deployment="embeddings-eu"),
+        model_id(deployment="embeddings-us"),
+        model_id(base_url="http://localhost:8000/v1"),
+        model_id(base_url="http://localhost:9000/v1"),
+        model_id(dimensions=256),
+        model_id(model_kwargs={"truncate": "END"}),
+        model_id(model_kwargs={"truncate": "START"}),
+    ]
+
+    assert len(set(ids)) == len(ids)
+    assert model_id(base_url="http://localhost:8000/v1/") == model_id(base_url="http://localhost:8000/v1")
+    assert model_id(model_kwargs={"a": 1, "b": 2}) == model_id(model_kwargs={"b": 2, "a": 1})
+
+
+def test_models_that_cannot_be_identified_are_not_cached(store):
+    set_embedding_cache_store(store)
+    try:
+        unnamed = CountingEmbeddings("")
+        with_opaque_options = CountingEmbeddings()
+        with_opaque_options.model_kwargs = {"client": object()}
+
+        assert get_embedding_model_id(unnamed) is None
+        assert wrap_with_embedding_cache(unnamed) is unnamed
+        assert wrap_with_embedding_cache(with_opaque_options) is with_opaque_options
+        with pytest.raises(ValueError, match="Cannot identify"):
+            CachedEmbeddings(unnamed, store)
+    finally:
+        set_embedding_cache_store(None)
+
+
+def test_wrap_with_embedding_cache(store):
+    set_embedding_cache_store(store)
+    try:
+        model = CountingEmbeddings()
+        wrapped = wrap_with_embedding_cache(model)
+
+        assert isinstance(wrapped, CachedEmbeddings)
+        assert wrap_with_embedding_cache(wrapped) is wrapped
+        assert wrap_with_embedding_cache({"collection_vector_service_options": {}}) == {
+            "collection_vector_service_options": {}
+        }
+    finally:
+        set_embedding_cache_store(None)
@@ -0,0 +1,186 @@
+"""Tests for the LLM response cache and its integration in LCModelComponent."""
+
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from lfx.base.models.model import LCModelComponent
+from lfx.base.models.response_cache import (
+    InMemoryResponseCache,
+    LLMResponseCache,
+    SQLiteResponseCache,
+    set_llm_response_cache,
+)
+from lfx.services.cache.utils import CACHE_MISS
+from pydantic import BaseModel
+
+
+class FakeModelComponent(LCModelComponent):
+    display_name = "Fake Model"
+    inputs = [*LCModelComponent._base_inputs]
+
+    def build_model(self):
+        return self._model
+
+
+def make_component(model, **attributes):
+    component = FakeModelComponent()
+    component._model = model
+    component.set_attributes(
+        {
+            "input_value": "Hello",
+            "system_message": "",
+            "stream": False,
+            "cache_responses": True,
+            "cache_ttl": 0,
+            **attributes,
+        }
+    )
+    return component
+
+
+@pytest.fixture
+def response_cache():
+    cache = LLMResponseCache(max_entries=10)
+    set_llm_response_cache(cache)
+    yield cache
+    set_llm_response_cache(None)
+
+
+class TestInMemoryResponseCache:
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryResponseCache(max_entries=2)
+        cache.set("a", {"content": "a"}, None)
+        cache.set("b", {"content": "b"}, None)
+        assert cache.get("a") == {"content": "a"}
+        cache.set("c", {"content": "c"}, None)
+
+        assert cache.get("b") is CACHE_MISS
+        assert cache.get("a") == {"content": "a"}
+        assert cache.get("c") == {"content": "c"}
+
+    def test_expires_entries(self, monkeypatch):
+        cache = InMemoryResponseCache()
+        cache.set("a", {"content": "a"}, 10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        assert cache.get("a") is CACHE_MISS
+
+
+class TestSQLiteResponseCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteResponseCache(path)
+        cache.set("a", {"content": "persisted"}, None)
+        cache.close()
+
+        reopened = SQLiteResponseCache(path)
+        assert reopened.get("a") == {"content": "persisted"}
+        reopened.close()
+
+    def test_evicts_beyond_max_entries(self, tmp_path):
+        cache = SQLiteResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"content": key}, None)
+
+        assert len(cache) == 2
+        assert cache.get("a") is CACHE_MISS
+        cache.close()
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = SQLiteResponseCache(tmp_path / "cache.sqlite")
+        cache.set("a", {"content": "a"}, 0.001)
+        time.sleep(0.01)
+
+        assert cache.get("a") is CACHE_MISS
+        cache.close()
+
+
+class TestLLMResponseCache:
+    def test_key_ignores_surrounding_whitespace_and_ids(self):
+        first = LLMResponseCache.build_key("model", [HumanMessage(content="Hi ", id="1")])
+        second = LLMResponseCache.build_key("model", [HumanMessage(content="Hi", id="2")])
+
+        assert first == second
+
+    def test_key_depends_on_model_and_messages(self):
+        base = LLMResponseCache.build_key("model", [HumanMessage(content="Hi")])
+
+        assert base != LLMResponseCache.build_key("other-model", [HumanMessage(content="Hi")])
+        assert base != LLMResponseCache.build_key("model", [SystemMessage(content="Hi")])
+        assert base != LLMResponseCache.build_key("model", [HumanMessage(content="Hi"), AIMessage(content="Hey")])
+
+    def test_key_depends_on_bound_arguments(self):
+        class Answer(BaseModel):
+            text: str
+
+        messages = [HumanMessage(content="Hi")]
+        base = LLMResponseCache.build_key("model", messages)
+
+        assert base == LLMResponseCache.build_key("model", messages, {})
+        assert base != LLMResponseCache.build_key("model", messages, {"tool_choice": "auto"})
+        assert base != LLMResponseCache.build_key("model", messages, {"stop": ["\n"]})
+        with_tools = LLMResponseCache.build_key("model", messages, {"tools": [Answer]})
+        assert with_tools != base
+        assert with_tools == LLMResponseCache.build_key("model", messages, {"tools": [Answer]})
+
+    async def test_persistent_tier_fills_memory_tier(self, tmp_path):
+        persistent = SQLiteResponseCache(tmp_path / "cache.sqlite")
+        persistent.set("key", {"content": "cached"}, None)
+        cache = LLMResponseCache(persistent=persistent)
+
+        assert await cache.aget("key") == {"content": "cached"}
+        assert cache.memory.get("key") == {"content": "cached"}
+        assert cache.stats.hits == 1
+        persistent.close()
+
+    async def test_stats(self):
+        cache = LLMResponseCache()
+        await cache.aget("missing")
+        await cache.aset("key", {"content": "value"})
+        await cache.aget("key")
+
+        assert cache.stats.to_dict() == {"hits": 1, "misses": 1, "writes": 1, "bypasses": 0, "hit_rate": 0.5}
+
+
+class TestLCModelComponentResponseCache:
+    async def test_identical_calls_are_served_from_cache(self, response_cache):
+        model = FakeListChatModel(responses=["first", "second"])
+
+        first = await make_component(model).text_response()
+        second = await make_component(model).text_response()
+
+        assert first.text == "first"
+        assert second.text == "first"
+        assert response_cache.stats.hits == 1
+        assert response_cache.stats.misses == 1
+
+    async def test_different_messages_are_not_shared(self, response_cache):
+        model = FakeListChatModel(responses=["first", "second"])
+
+        await make_component(model).text_response()
+        result = await make_component(model, input_value="Something else").text_response()
+
+        assert result.text == "second"
+        assert response_cache.stats.hits == 0
+
+    async def test_models_with_different_bound_arguments_are_not_shared(self, response_cache):
+        model = FakeListChatModel(responses=["plain", "with tools", "with stop"])
+        tool = {"type": "function", "function": {"name": "search", "parameters": {}}}
+
+        assert (await make_component(model).text_response()).text == "plain"
+        assert (await make_component(model.bind(tools=[tool])).text_response()).text == "with tools"
+        assert (await make_component(model.bind(stop=["\n"])).text_response()).text == "with stop"
+        assert (await make_component(model.bind(tools=[tool])).text_response()).text == "with tools"
+        assert response_cache.stats.hits == 1
+
+    async def test_cache_is_opt_in(self, response_cache):
+        model = FakeListChatModel(responses=["first", "second"])
+
+        await make_component(model, cache_responses=False).text_response()
+        result = await make_component(model, cache_responses=False).text_response()
+
+        assert result.text == "second"
+        assert response_cache.stats.writes == 0
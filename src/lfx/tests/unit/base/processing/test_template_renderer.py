@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+from lfx.base.processing.template_renderer import CompiledTemplate, compile_template
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "Name": ["John", "Jane", None],
+            "Age": [30, 25, 41],
+            "Score": [1.5, float("nan"), 0.1 + 0.2],
+            "Joined": pd.to_datetime(["2024-01-01 00:00:00", "2024-02-03 10:30:00", "2024-03-04 00:00:00"]),
+            "Meta": [{"id": 1}, {"id": 2}, {"id": 3}],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Name: {Name}, Score: {Score}",
+        "{Name}",
+        "{{literal}} {Name}!",
+        "no fields",
+        "",
+        "{Name!r} is {Age:>4}",
+        "{Meta[id]}: {Joined}",
+        "{Score:.2f} {Joined.year}",
+    ],
+)
+def test_renders_like_format_on_each_row(df, template):
+    records = df.to_dict("records")
+    expected = [template.format(**record) for record in records]
+
+    compiled = CompiledTemplate(template)
+
+    assert compiled.vectorized
+    assert compiled.render(df) == expected
+    assert compiled.render_text(df, sep="|", chunk_size=2) == "|".join(expected)
+
+
+def test_column_values_keep_the_dtype_of_the_column():
+    # iterrows would upcast the integers of a numeric row to floats
+    df = pd.DataFrame({"Age": [30, 25], "Score": [1.5, 2.0]})
+
+    assert CompiledTemplate("{Age} {Score}").render(df) == ["30 1.5", "25 2.0"]
+
+
+def test_templates_without_column_fields_format_each_row(df):
+    compiled = CompiledTemplate("{Name:{Age}}|")
+
+    assert not compiled.vectorized
+    assert compiled.render(df.head(1)) == ["John                          |"]
+
+
+def test_missing_columns_raise_key_error(df):
+    with pytest.raises(KeyError, match="Country"):
+        CompiledTemplate("{Name} {Country}").render(df)
+
+
+def test_fields_and_chunks(df):
+    compiled = compile_template("{Name} {Age} {Name}")
+
+    assert compile_template("{Name} {Age} {Name}") is compiled
+    assert compiled.fields == ["Name", "Age"]
+    assert [len(chunk) for chunk in compiled.iter_render(df, chunk_size=2)] == [2, 1]
+    assert compiled.render_text(df.iloc[0:0]) == ""
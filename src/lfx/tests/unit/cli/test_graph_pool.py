@@ -0,0 +1,161 @@
+"""Tests for the graph replica pool used by ``lfx serve``."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from lfx.cli.common import execute_graph_with_capture, extract_result_data
+from lfx.cli.graph_pool import GraphPool, GraphPoolTimeoutError, GraphSnapshot
+from lfx.graph import Graph
+
+
+@pytest.fixture
+def simple_chat_graph():
+    json_path = Path(__file__).parent.parent.parent / "data" / "simple_chat_no_llm.json"
+    with json_path.open() as f:
+        graph = Graph.from_payload(json.load(f), flow_id="test-flow-id")
+    graph.prepare()
+    return graph
+
+
+class FakeGraph:
+    def __init__(self):
+        self.vertices = [SimpleNamespace(id="a", results={}, custom_component=None)]
+        self.edges = []
+        self.run_queue = ["a"]
+        self.layers = [["a"], ["b", "c"]]
+
+
+class TestGraphSnapshot:
+    def test_restore_undoes_assignments_and_in_place_mutations(self):
+        graph = FakeGraph()
+        vertex = graph.vertices[0]
+        snapshot = GraphSnapshot(graph)
+
+        graph.run_queue.clear()
+        graph.layers[1].append("d")
+        graph.extra = "value"
+        vertex.results["text"] = "result"
+        vertex.built = True
+        snapshot.restore()
+
+        assert graph.run_queue == ["a"]
+        assert graph.layers == [["a"], ["b", "c"]]
+        assert not hasattr(graph, "extra")
+        assert graph.vertices[0] is vertex
+        assert vertex.results == {}
+        assert not hasattr(vertex, "built")
+
+    def test_restore_can_be_repeated(self):
+        graph = FakeGraph()
+        snapshot = GraphSnapshot(graph)
+
+        for _ in range(3):
+            graph.run_queue.append("b")
+            snapshot.restore()
+
+        assert graph.run_queue == ["a"]
+
+
+class TestGraphPool:
+    async def test_replicas_are_reused(self):
+        pool = GraphPool(FakeGraph(), size=1)
+
+        async with pool.acquire() as first:
+            first.run_queue.clear()
+        async with pool.acquire() as second:
+            assert second is first
+            assert second.run_queue == ["a"]
+
+    async def test_replicas_are_isolated_from_the_template(self):
+        template = FakeGraph()
+        pool = GraphPool(template, size=2)
+
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            assert template not in (first, second)
+            first.run_queue.append("b")
+            assert second.run_queue == ["a"]
+
+    async def test_overflow_replicas_are_discarded(self):
+        pool = GraphPool(FakeGraph(), size=1, max_overflow=1)
+
+        async with pool.acquire(), pool.acquire():
+            assert pool.overflow == 1
+            assert pool.idle == 0
+
+        assert pool.overflow == 0
+        assert pool.idle == 1
+
+    async def test_waits_for_a_released_replica(self):
+        pool = GraphPool(FakeGraph(), size=1, max_overflow=0, timeout=1)
+        released = asyncio.Event()
+
+        async def hold():
+            async with pool.acquire() as graph:
+                await released.wait()
+                graph.run_queue.clear()
+                return graph
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        async def borrow():
+            async with pool.acquire() as graph:
+                return graph, list(graph.run_queue)
+
+        waiter = asyncio.create_task(borrow())
+        await asyncio.sleep(0)
+        released.set()
+
+        held = await holder
+        borrowed, run_queue = await waiter
+        assert borrowed is held
+        assert run_queue == ["a"]
+
+    async def test_timeout(self):
+        pool = GraphPool(FakeGraph(), size=1, max_overflow=0, timeout=0.01)
+
+        async with pool.acquire():
+            with pytest.raises(GraphPoolTimeoutError):
+                async with pool.acquire():
+                    pass
+
+        async with pool.acquire():
+            assert pool.idle == 0
+
+    async def test_real_graph_runs_on_reset_replica(self, simple_chat_graph):
+        pool = GraphPool(simple_chat_graph, size=1, max_overflow=0)
+
+        texts = []
+        for input_value in ["first", "second", "third"]:
+            async with pool.acquire() as graph:
+                results, logs = await execute_graph_with_capture(graph, input_value)
+                texts.append(extract_result_data(results, logs)["result"])
+
+        assert texts == ["first", "second", "third"]
+
+
+async def test_concurrent_runs_capture_their_own_output():
+    class PrintingGraph:
+        def __init__(self, name):
+            self.name = name
+
+        async def async_start(self, inputs):  # noqa: ARG002
+            for step in range(3):
+                print(f"{self.name}-{step}")  # noqa: T201
+                await asyncio.sleep(0)
+                yield step
+
+    stdout = sys.stdout
+    (_, first_logs), (_, second_logs) = await asyncio.gather(
+        execute_graph_with_capture(PrintingGraph("first"), None),
+        execute_graph_with_capture(PrintingGraph("second"), None),
+    )
+
+    assert first_logs == "first-0\nfirst-1\nfirst-2\n"
+    assert second_logs == "second-0\nsecond-1\nsecond-2\n"
+    assert sys.stdout is stdout
@@ -1,14 +1,23 @@
 """Unit tests for streaming functionality in multi-serve app."""
 
 import asyncio
+import json
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from asgi_lifespan import LifespanManager
 from httpx import ASGITransport, AsyncClient
-from lfx.cli.serve_app import FlowMeta, StreamRequest, create_multi_serve_app
+from lfx.cli.serve_app import (
+    BoundedEventQueue,
+    FlowMeta,
+    StreamRequest,
+    create_multi_serve_app,
+    run_flow_generator_for_serve,
+    stream_events,
+)
 
 
 class MockNode:
@@ -143,14 +152,8 @@ class TestMultiServeStreaming:
             # Mock the streaming generator
             async def mock_stream_generator(*args, **kwargs):  # noqa: ARG001
                 event_manager = kwargs.get("event_manager")
-                client_consumed_queue = kwargs.get("client_consumed_queue")
                 if event_manager:
                     event_manager.on_end(data={"result": {"result": "Streamed response", "success": True}})
-                    if client_consumed_queue:
-                        await client_consumed_queue.get()
-                    else:
-                        msg = "client_consumed_queue is None"
-                        raise RuntimeError(msg)
                     # Send the final None to close the stream
                     await event_manager.queue.put((None, None, 0))
 
@@ -241,7 +244,7 @@ class TestMultiServeStreaming:
         """Test error handling in streaming endpoint."""
         with patch("lfx.cli.serve_app.run_flow_generator_for_serve") as mock_generator:
             # Mock an error in the generator that properly terminates the stream
-            async def mock_error_generator(graph, input_request, flow_id, event_manager, client_consumed_queue):  # noqa: ARG001
+            async def mock_error_generator(graph, input_request, flow_id, event_manager):  # noqa: ARG001
                 try:
                     msg = "Test error during streaming"
                     raise RuntimeError(msg)
@@ -383,3 +386,125 @@ class TestMultiServeStreaming:
             for response in responses:
                 assert response.status_code == 200
                 assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+
+
+class GatedGraph:
+    """Graph that streams a token, then waits until the test lets it finish."""
+
+    def __init__(self):
+        self.waiting = asyncio.Event()
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def async_start(self, inputs, event_manager=None):  # noqa: ARG002
+        await asyncio.to_thread(event_manager.on_token, data={"chunk": "Hel", "id": "message-1"})
+        self.waiting.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        component = SimpleNamespace(display_name="Chat Output")
+        yield SimpleNamespace(
+            vertex=SimpleNamespace(id="ChatOutput-1", display_name="Chat Output", custom_component=component),
+            result_dict=SimpleNamespace(results={"message": SimpleNamespace(text="Hello")}),
+            valid=True,
+        )
+
+
+def start_stream(graph):
+    from lfx.events.event_manager import create_stream_tokens_event_manager
+
+    queue = BoundedEventQueue(maxsize=4)
+    event_manager = create_stream_tokens_event_manager(queue=queue)
+    event_manager.register_event("on_end_vertex", "end_vertex")
+    event_manager.register_event("on_error", "error")
+    run_task = asyncio.create_task(
+        run_flow_generator_for_serve(
+            graph=graph,
+            input_request=StreamRequest(input_value="Hello"),
+            flow_id="flow1",
+            event_manager=event_manager,
+        )
+    )
+    return stream_events(queue, run_task), run_task
+
+
+def decode_events(value: bytes) -> list[dict]:
+    # Events waiting in the queue together are sent in a single write
+    return [json.loads(event) for event in value.decode().split("\n\n") if event]
+
+
+class TestIncrementalStreaming:
+    async def test_token_is_sent_before_the_run_finishes(self):
+        graph = GatedGraph()
+        events, run_task = start_stream(graph)
+
+        first = decode_events(await anext(events))
+        assert first == [{"event": "token", "data": {"chunk": "Hel", "id": "message-1"}}]
+        assert not run_task.done()
+
+        graph.release.set()
+        remaining = [event async for value in events for event in decode_events(value)]
+
+        assert [event["event"] for event in remaining] == ["end_vertex", "end"]
+        assert remaining[0]["data"]["build_data"] == {
+            "id": "ChatOutput-1",
+            "display_name": "Chat Output",
+            "valid": True,
+        }
+        await run_task
+
+    async def test_client_disconnect_cancels_the_run(self):
+        graph = GatedGraph()
+        events, run_task = start_stream(graph)
+
+        await anext(events)
+        await graph.waiting.wait()
+        await events.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+        assert graph.cancelled
+
+
+class TestBoundedEventQueue:
+    async def test_worker_threads_wait_for_room(self):
+        queue = BoundedEventQueue(maxsize=2)
+        produced = []
+
+        def produce():
+            for i in range(5):
+                queue.put_nowait((f"token-{i}", b"data", 0))
+                produced.append(i)
+
+        producer = asyncio.create_task(asyncio.to_thread(produce))
+        await asyncio.sleep(0.05)
+        assert produced == [0, 1]
+
+        received = [(await queue.get())[0] for _ in range(5)]
+        await producer
+        assert received == [f"token-{i}" for i in range(5)]
+
+    async def test_loop_events_are_always_accepted(self):
+        queue = BoundedEventQueue(maxsize=1)
+
+        for i in range(3):
+            queue.put_nowait((f"event-{i}", b"data", 0))
+
+        assert queue.qsize() == 3
+
+    async def test_close_releases_waiting_producers(self):
+        queue = BoundedEventQueue(maxsize=1)
+
+        def produce():
+            for i in range(3):
+                queue.put_nowait((f"token-{i}", b"data", 0))
+
+        producer = asyncio.create_task(asyncio.to_thread(produce))
+        await asyncio.sleep(0.05)
+        queue.close()
+        await asyncio.wait_for(producer, timeout=1)
+
+        assert queue.closed
+        assert (await queue.get())[0] == "token-0"
@@ -7,8 +7,10 @@ from unittest.mock import MagicMock
 import pytest
 from lfx.events.event_manager import (
     EventManager,
+    StreamEvent,
     create_default_event_manager,
     create_stream_tokens_event_manager,
+    create_typed_stream_tokens_event_manager,
 )
 
 
@@ -368,3 +370,40 @@ class TestEventManagerAsync:
         for sent, received in zip(events_to_send, received_events, strict=False):
             assert sent[0] == received[0]  # event type
             assert sent[1] == received[1]  # data
+
+
+class TestTypedEventManager:
+    """Test cases for the TypedEventManager class."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_queued_as_objects(self):
+        queue = asyncio.Queue()
+        manager = create_typed_stream_tokens_event_manager(queue)
+        data = {"chunk": "hello", "id": "message-1"}
+
+        manager.on_token(data=data)
+
+        event_id, event, _ = await queue.get()
+        assert event_id.startswith("token-")
+        assert event == StreamEvent("token", data)
+        assert event.data is data
+
+    @pytest.mark.asyncio
+    async def test_events_sent_from_threads_keep_their_order(self):
+        queue = asyncio.Queue()
+        manager = create_typed_stream_tokens_event_manager(queue)
+
+        def send_tokens():
+            for index in range(100):
+                manager.on_token(data={"chunk": str(index)})
+
+        await asyncio.to_thread(send_tokens)
+        manager.on_end(data={})
+
+        chunks = []
+        while True:
+            _, event, _ = await asyncio.wait_for(queue.get(), timeout=1)
+            if event.event_type == "end":
+                break
+            chunks.append(event.data["chunk"])
+        assert chunks == [str(index) for index in range(100)]
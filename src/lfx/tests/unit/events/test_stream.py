@@ -0,0 +1,105 @@
+import asyncio
+import json
+import time
+
+import pytest
+from lfx.events.event_manager import create_stream_tokens_event_manager
+from lfx.events.stream import LatencyHistogram, StreamMetrics, consume_and_yield, iter_event_batches
+
+
+def fill(queue: asyncio.Queue, values, *, put_time: float | None = None, end: bool = True) -> None:
+    for index, value in enumerate(values):
+        queue.put_nowait((f"event-{index}", value, time.time() if put_time is None else put_time))
+    if end:
+        queue.put_nowait((None, None, time.time()))
+
+
+async def test_waiting_events_are_batched_up_to_the_limit():
+    queue: asyncio.Queue = asyncio.Queue()
+    fill(queue, [b"a", b"b", b"c", b"d", b"e"])
+
+    batches = [batch async for batch in iter_event_batches(queue, max_batch_size=2, metrics=None)]
+
+    assert batches == [[b"a", b"b"], [b"c", b"d"], [b"e"]]
+
+
+async def test_end_of_stream_inside_a_batch_stops_the_stream():
+    queue: asyncio.Queue = asyncio.Queue()
+    fill(queue, [b"a", b"b"])
+    fill(queue, [b"after the end"], end=False)
+
+    assert [batch async for batch in iter_event_batches(queue, metrics=None)] == [[b"a", b"b"]]
+
+
+async def test_consume_and_yield_joins_bytes_and_strings_only():
+    queue: asyncio.Queue = asyncio.Queue()
+    fill(queue, [b"a", b"b"])
+    assert [value async for value in consume_and_yield(queue, metrics=None)] == [b"ab"]
+
+    fill(queue, ["a", "b"])
+    assert [value async for value in consume_and_yield(queue, metrics=None)] == ["ab"]
+
+    events = [{"event": "token"}, {"event": "end"}]
+    fill(queue, events)
+    assert [value async for value in consume_and_yield(queue, metrics=None)] == events
+
+
+async def test_queue_residency_and_client_lag_are_recorded_per_batch():
+    metrics = StreamMetrics()
+    queue: asyncio.Queue = asyncio.Queue()
+    fill(queue, [b"a", b"b", b"c"], put_time=time.time() - 0.2)
+
+    async for _ in consume_and_yield(queue, metrics=metrics):
+        await asyncio.sleep(0.02)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["events"] == 3
+    assert snapshot["batches"] == 1
+    assert snapshot["queue_residency_seconds"]["count"] == 3
+    assert snapshot["queue_residency_seconds"]["max"] >= 0.2
+    assert snapshot["queue_residency_seconds"]["buckets"]["le_0.25"] == 3
+    assert snapshot["client_lag_seconds"]["count"] == 1
+    assert snapshot["client_lag_seconds"]["sum"] >= 0.02
+
+
+def test_latency_histogram_buckets():
+    histogram = LatencyHistogram(bounds=(0.1, 1.0))
+    histogram.observe_many([0.05, 0.1, 0.5, 3.0])
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"le_0.1": 2, "le_1.0": 1, "le_inf": 1}
+    assert snapshot["count"] == 4
+    assert snapshot["max"] == 3.0
+
+    histogram.reset()
+    assert histogram.snapshot()["count"] == 0
+
+
+@pytest.mark.slow
+async def test_token_streaming_throughput_benchmark():
+    tokens = 100_000
+    queue: asyncio.Queue = asyncio.Queue()
+    event_manager = create_stream_tokens_event_manager(queue=queue)
+
+    async def produce() -> None:
+        for index in range(tokens):
+            event_manager.on_token(data={"chunk": "x", "id": "message-1"})
+            if index % 100 == 0:
+                # Let the consumer run, like a model streaming its tokens would
+                await asyncio.sleep(0)
+        await queue.put((None, None, time.time()))
+
+    producer = asyncio.create_task(produce())
+    started = time.perf_counter()
+    received = 0
+    async for value in consume_and_yield(queue, metrics=StreamMetrics()):
+        received += value.count(b"\n\n")
+    elapsed = time.perf_counter() - started
+    await producer
+
+    assert received == tokens
+    assert json.loads(value.split(b"\n\n")[-2])["data"]["chunk"] == "x"
+    tokens_per_second = tokens / elapsed
+    print(f"streamed {tokens_per_second:,.0f} tokens/s to the client")  # noqa: T201
+    # Event creation dominates; consuming the queue used to log and acknowledge every token on top of it
+    assert tokens_per_second > 10_000, f"streamed only {tokens_per_second:,.0f} tokens/s"
@@ -0,0 +1,135 @@
+import random
+import time
+from itertools import pairwise
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph import Graph
+from lfx.graph.graph import utils
+from lfx.graph.graph.index import GraphIndex
+
+
+def make_layered_graph(size: int, seed: int = 0, window: int = 50):
+    """Random DAG where each vertex depends on one or two of the ``window`` vertices before it."""
+    rng = random.Random(seed)  # noqa: S311
+    vertex_ids = [f"Component-{i}" for i in range(size)]
+    edges = []
+    for i in range(1, size):
+        parents = [vertex_ids[rng.randrange(max(0, i - window), i)] for _ in range(rng.randint(1, 2))]
+        edges.extend((parent, vertex_ids[i]) for parent in parents)
+    return vertex_ids, edges
+
+
+def sort_kwargs(vertex_ids, edges):
+    successor_map = {vertex_id: [] for vertex_id in vertex_ids}
+    predecessor_map = {vertex_id: [] for vertex_id in vertex_ids}
+    in_degree_map = dict.fromkeys(vertex_ids, 0)
+    for source, target in edges:
+        successor_map[source].append(target)
+        predecessor_map[target].append(source)
+        in_degree_map[target] += 1
+    return {
+        "vertices_ids": vertex_ids,
+        "cycle_vertices": set(),
+        "in_degree_map": in_degree_map,
+        "successor_map": successor_map,
+        "predecessor_map": predecessor_map,
+        "get_vertex_predecessors": predecessor_map.__getitem__,
+        "get_vertex_successors": successor_map.__getitem__,
+    }
+
+
+def normalize(result):
+    first_layer, remaining_layers = result
+    return [sorted(layer) for layer in [first_layer, *remaining_layers]]
+
+
+class TestGraphIndex:
+    def test_adjacency_keeps_edge_order(self):
+        index = GraphIndex(["A", "B", "C"], [("A", "C"), ("A", "B"), ("B", "C"), ("C", "D")])
+
+        assert index.vertex_ids == ["A", "B", "C", "D"]
+        assert index.successor_ids("A") == ["C", "B"]
+        assert index.predecessor_ids("C") == ["A", "B"]
+        assert index.successor_ids("missing") == []
+
+    def test_edge_positions(self):
+        index = GraphIndex(["A", "B"], [("A", "B"), ("B", "B"), ("B", "A")])
+
+        assert index.edge_positions("B") == [0, 1, 2]
+        assert index.edge_positions("B", incoming=False) == [1, 2]
+        assert index.edge_positions("B", outgoing=False) == [0, 1]
+
+    def test_mask_round_trip(self):
+        index = GraphIndex(["A", "B", "C"], [])
+
+        assert index.ids(index.mask(["C", "A", "missing"])) == ["A", "C"]
+        assert index.mask([]) == 0
+
+    def test_reachability(self):
+        index = GraphIndex([], [("A", "B"), ("B", "C"), ("D", "C"), ("C", "E")])
+
+        assert index.ids(index.descendants(["B"])) == ["B", "C", "E"]
+        assert index.ids(index.ancestors(["C"])) == ["A", "B", "C", "D"]
+        assert index.ids(index.ancestors(["C"], within=index.mask(["B", "C", "D"]))) == ["B", "C", "D"]
+        assert index.ancestors(["C"]) is index.ancestors(["C"])
+
+    def test_cycles(self):
+        index = GraphIndex([], [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("E", "E"), ("E", "F")])
+
+        assert index.ids(index.cycle_mask()) == ["A", "B", "C", "E"]
+        assert index.cycle_edges("A") == [("C", "A")]
+        assert index.cycle_edges("D") == []
+
+    def test_deep_graph_does_not_recurse(self):
+        vertex_ids = [str(i) for i in range(5000)]
+        edges = [*pairwise(vertex_ids), (vertex_ids[-1], vertex_ids[0])]
+
+        assert utils.find_all_cycle_edges("0", edges) == [(vertex_ids[-1], "0")]
+        assert len(utils.find_cycle_vertices(edges)) == len(vertex_ids)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("component", ["start", "stop"])
+def test_sorted_vertices_match_callable_filtering(seed, component):
+    vertex_ids, edges = make_layered_graph(300, seed=seed, window=10)
+    kwargs = sort_kwargs(vertex_ids, edges)
+    kwargs[f"{component}_component_id"] = random.Random(seed).choice(vertex_ids)  # noqa: S311
+
+    expected = utils.get_sorted_vertices(**kwargs)
+    result = utils.get_sorted_vertices(**kwargs, graph_index=GraphIndex(vertex_ids, edges))
+
+    assert normalize(result) == normalize(expected)
+
+
+def test_graph_index_follows_graph_edges():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    assert [(edge.source_id, edge.target_id) for edge in graph.get_vertex_edges("chat_output")] == [
+        ("chat_input", "chat_output")
+    ]
+    assert graph.get_vertex_edges("chat_output", is_target=False) == []
+    graph.remove_vertex("chat_input")
+    assert graph.get_vertex_edges("chat_output") == []
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_sort_with_start_component_benchmark(size):
+    vertex_ids, edges = make_layered_graph(size)
+    kwargs = sort_kwargs(vertex_ids, edges)
+
+    started = time.perf_counter()
+    index = GraphIndex(vertex_ids, edges)
+    first_layer, remaining_layers = utils.get_sorted_vertices(
+        **kwargs, start_component_id=vertex_ids[0], graph_index=index
+    )
+    elapsed = time.perf_counter() - started
+
+    assert first_layer == [vertex_ids[0]]
+    assert sum(len(layer) for layer in remaining_layers) == size - 1
+    # Filtering used to run one backward traversal per reachable vertex, which takes ~10s at 10k vertices
+    assert elapsed < 2, f"sorting {size} vertices took {elapsed:.2f}s"
@@ -1,12 +1,11 @@
 import pickle
-from typing import TYPE_CHECKING
+from collections import defaultdict
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 
-if TYPE_CHECKING:
-    from collections import defaultdict
-
 
 @pytest.fixture
 def data():
@@ -206,3 +205,167 @@ def test_add_to_vertices_being_run(data):
     manager.add_to_vertices_being_run(vertex_id)
 
     assert vertex_id in manager.vertices_being_run
+
+
+def test_add_predecessor(data):
+    manager = RunnableVerticesManager.from_dict(
+        {**data, "run_predecessors": {"A": [], "B": ["A"], "C": ["A"], "D": ["B", "C"]}}
+    )
+    manager.remove_from_predecessors("A")
+    assert manager.are_all_predecessors_fulfilled("B", is_loop=False)
+
+    manager.add_predecessor("B", "A")
+    manager.add_predecessor("B", "A")
+
+    assert manager.run_predecessors["B"] == ["A"]
+    assert manager.pending_count("B") == 1
+    assert not manager.are_all_predecessors_fulfilled("B", is_loop=False)
+    assert manager.remove_from_predecessors("A") == ["B"]
+
+
+def test_run_predecessors_changed_in_place_resync_the_countdowns():
+    # The update_dependency of Loop components saved in older flows
+    manager = RunnableVerticesManager()
+    manager.build_run_map({"loop": ["start"], "body": ["loop"]}, {"start", "loop", "body"})
+    manager.remove_from_predecessors("start")
+    assert manager.is_vertex_runnable("loop", is_active=True)
+
+    if "body" not in manager.run_predecessors["loop"]:
+        manager.run_predecessors["loop"].append("body")
+        if "loop" not in manager.run_map["body"]:
+            manager.run_map["body"].append("loop")
+
+    assert not manager.is_vertex_runnable("loop", is_active=True)
+    assert not manager.all_predecessors_are_fulfilled()
+
+    assert manager.remove_from_predecessors("body") == ["loop"]
+    assert manager.run_predecessors["loop"] == []
+    assert manager.is_vertex_runnable("loop", is_active=True)
+
+    manager.run_predecessors["loop"] = ["body"]
+    assert manager.pending_count("loop") == 1
+    del manager.run_predecessors["loop"]
+    assert manager.pending_count("loop") == 0
+
+    # Pickles keep plain lists
+    binary = pickle.dumps(manager)
+    assert b"_Predecessor" not in binary
+    assert pickle.loads(binary).pending_count("body") == 1  # noqa: S301
+
+
+def test_remove_from_predecessors_returns_the_fulfilled_successors():
+    manager = RunnableVerticesManager()
+    manager.build_run_map({"prompt": [f"retriever-{i}" for i in range(3)]}, {"prompt"})
+
+    assert manager.remove_from_predecessors("retriever-0") == []
+    assert manager.remove_from_predecessors("retriever-1") == []
+    assert not manager.all_predecessors_are_fulfilled()
+    assert manager.remove_from_predecessors("retriever-2") == ["prompt"]
+    assert manager.all_predecessors_are_fulfilled()
+
+
+class ListScanManager:
+    """The readiness checks of RunnableVerticesManager before countdowns, scanning the predecessor lists."""
+
+    def __init__(self, predecessor_map, cycle_vertices):
+        self.run_predecessors = {key: list(value) for key, value in predecessor_map.items()}
+        self.run_map = defaultdict(list)
+        for vertex_id, predecessors in predecessor_map.items():
+            for predecessor in predecessors:
+                self.run_map[predecessor].append(vertex_id)
+        self.cycle_vertices = cycle_vertices
+        self.vertices_being_run = set()
+        self.ran_at_least_once = set()
+
+    def all_predecessors_are_fulfilled(self):
+        return all(not value for value in self.run_predecessors.values())
+
+    def are_all_predecessors_fulfilled(self, vertex_id, *, is_loop):
+        pending = self.run_predecessors.get(vertex_id, [])
+        if not pending:
+            return True
+        if vertex_id in self.cycle_vertices:
+            pending_set = set(pending)
+            running_predecessors = pending_set & self.vertices_being_run
+            if vertex_id in self.ran_at_least_once:
+                return not (pending_set or running_predecessors)
+            return is_loop and pending_set <= self.cycle_vertices
+        return False
+
+    def remove_from_predecessors(self, vertex_id):
+        for predecessor in self.run_map.get(vertex_id, []):
+            if vertex_id in self.run_predecessors[predecessor]:
+                self.run_predecessors[predecessor].remove(vertex_id)
+
+    def add_predecessor(self, vertex_id, predecessor_id):
+        if predecessor_id not in self.run_predecessors.setdefault(vertex_id, []):
+            self.run_predecessors[vertex_id].append(predecessor_id)
+            if vertex_id not in self.run_map[predecessor_id]:
+                self.run_map[predecessor_id].append(vertex_id)
+
+
+VERTICES = [f"v{i}" for i in range(8)]
+
+
+@st.composite
+def run_scenarios(draw):
+    # Predecessor lists may repeat a vertex, as parallel edges do
+    predecessor_map = draw(
+        st.dictionaries(st.sampled_from(VERTICES), st.lists(st.sampled_from(VERTICES), max_size=6), max_size=8)
+    )
+    cycle_vertices = draw(st.sets(st.sampled_from(VERTICES)))
+    operations = draw(
+        st.lists(
+            st.tuples(
+                st.sampled_from(["complete", "start", "add_predecessor", "ran_once"]),
+                st.sampled_from(VERTICES),
+                st.sampled_from(VERTICES),
+            ),
+            max_size=30,
+        )
+    )
+    return predecessor_map, cycle_vertices, operations
+
+
+@given(scenario=run_scenarios())
+@settings(max_examples=300, deadline=None)
+def test_countdowns_match_the_list_scans(scenario):
+    predecessor_map, cycle_vertices, operations = scenario
+    expected = ListScanManager(predecessor_map, cycle_vertices)
+    manager = RunnableVerticesManager()
+    manager.build_run_map(defaultdict(list, {key: list(value) for key, value in predecessor_map.items()}), set())
+    manager.cycle_vertices = set(cycle_vertices)
+
+    def assert_same_state():
+        assert manager.all_predecessors_are_fulfilled() == expected.all_predecessors_are_fulfilled()
+        for vertex_id in VERTICES:
+            assert manager.run_predecessors.get(vertex_id, []) == expected.run_predecessors.get(vertex_id, [])
+            assert manager.pending_count(vertex_id) == len(expected.run_predecessors.get(vertex_id, []))
+            for is_loop in (False, True):
+                assert manager.are_all_predecessors_fulfilled(
+                    vertex_id, is_loop=is_loop
+                ) == expected.are_all_predecessors_fulfilled(vertex_id, is_loop=is_loop)
+
+    assert_same_state()
+    for operation, vertex_id, other_id in operations:
+        if operation == "complete":
+            waiting = {key for key, value in expected.run_predecessors.items() if value}
+            expected.remove_from_predecessors(vertex_id)
+            fulfilled = manager.remove_from_predecessors(vertex_id)
+            assert set(fulfilled) == {key for key in waiting if not expected.run_predecessors[key]}
+        elif operation == "start":
+            expected.vertices_being_run.add(vertex_id)
+            manager.add_to_vertices_being_run(vertex_id)
+        elif operation == "add_predecessor":
+            expected.add_predecessor(vertex_id, other_id)
+            manager.add_predecessor(vertex_id, other_id)
+        else:
+            expected.ran_at_least_once.add(vertex_id)
+            manager.ran_at_least_once.add(vertex_id)
+        assert_same_state()
+
+    # The countdowns survive pickling
+    restored = pickle.loads(pickle.dumps(manager))  # noqa: S301
+    restored.cycle_vertices = manager.cycle_vertices
+    assert restored.all_predecessors_are_fulfilled() == manager.all_predecessors_are_fulfilled()
+    assert all(restored.pending_count(vertex_id) == manager.pending_count(vertex_id) for vertex_id in VERTICES)
@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from lfx.schema.data import Data
-from lfx.schema.dataframe import DataFrame
+from lfx.schema.dataframe import DataFrame, DataFrameStep, LazyDataFrame
 
 
 @pytest.fixture
@@ -71,3 +71,60 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+
+class TestLazyDataFrame:
+    def test_operations_run_on_collect(self, sample_dataframe):
+        calls = []
+
+        def sort(df):
+            calls.append("sort")
+            return df.sort_values("name")
+
+        plan = DataFrame(sample_dataframe).lazy().then(DataFrameStep("Sort", sort))
+        assert isinstance(plan, LazyDataFrame)
+        assert calls == []
+        assert repr(plan) == "LazyDataFrame(2 rows -> Sort)"
+
+        result = plan.then(DataFrameStep("Head", lambda df: df.head(1), copies=False)).collect()
+
+        assert calls == ["sort"]
+        assert isinstance(result, DataFrame)
+        assert result["name"].tolist() == ["Jane"]
+
+    def test_source_is_never_modified(self, sample_dataframe):
+        def add_column(df):
+            df["age"] = 1
+            return df
+
+        source = DataFrame(sample_dataframe)
+        head = DataFrameStep("Head", lambda df: df.head(1), copies=False)
+
+        result = source.lazy().then(head).then(DataFrameStep("Add", add_column, in_place=True)).collect()
+        source.lazy().collect().loc[0, "name"] = "Changed"
+
+        assert "age" in result.columns
+        assert "age" not in source.columns
+        assert source.loc[0, "name"] == "John"
+
+    def test_in_place_steps_reuse_frames_returned_by_previous_steps(self, sample_dataframe):
+        sorted_frames = []
+        received = []
+
+        def sort(df):
+            sorted_frames.append(df.sort_values("name"))
+            return sorted_frames[-1]
+
+        def add_column(df):
+            received.append(df)
+            df["age"] = 1
+            return df
+
+        add = DataFrameStep("Add", add_column, in_place=True)
+        LazyDataFrame(sample_dataframe).then(DataFrameStep("Sort", sort)).then(add).collect()
+        LazyDataFrame(sample_dataframe).then(add).collect()
+
+        # The sorted frame is modified without copying, the source is copied first
+        assert received[0] is sorted_frames[0]
+        assert received[1] is not sample_dataframe
+        assert "age" not in sample_dataframe.columns
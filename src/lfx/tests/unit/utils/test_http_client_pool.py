@@ -0,0 +1,299 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from lfx.utils.http_client_pool import (
+    CACHE_EXTENSION,
+    MAX_RETRIES_EXTENSION,
+    HTTPClientPool,
+    HTTPResponseCache,
+    OriginStats,
+    PooledTransport,
+    RateLimiter,
+    origin_of,
+)
+
+
+class Origin:
+    """Mock origin server answering with the queued responses, then with ``default``."""
+
+    def __init__(self, default: httpx.Response | None = None) -> None:
+        self.default = default or httpx.Response(200, text="ok")
+        self.queued: list[httpx.Response | Exception] = []
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.queued.pop(0) if self.queued else self.default
+        if isinstance(response, Exception):
+            raise response
+        return httpx.Response(response.status_code, headers=response.headers, content=response.content)
+
+
+def make_client(origin: Origin, **kwargs) -> tuple[httpx.AsyncClient, OriginStats]:
+    stats = OriginStats()
+    kwargs.setdefault("cache", HTTPResponseCache())
+    kwargs.setdefault("retry_backoff", 0.01)
+    transport = PooledTransport(httpx.MockTransport(origin), stats=stats, **kwargs)
+    return httpx.AsyncClient(transport=transport, base_url="https://api.example.com"), stats
+
+
+CACHED = {CACHE_EXTENSION: True}
+
+
+def test_origin_of():
+    assert origin_of("https://api.example.com/v1/items?page=2") == "https://api.example.com"
+    assert origin_of("http://localhost:8080/") == "http://localhost:8080"
+
+
+async def test_fresh_responses_are_served_from_the_cache():
+    origin = Origin(httpx.Response(200, headers={"Cache-Control": "max-age=60"}, text="items"))
+    client, stats = make_client(origin)
+
+    first = await client.get("/items", extensions=CACHED)
+    second = await client.get("/items", extensions=CACHED)
+    uncached = await client.get("/items")
+
+    assert first.text == second.text == uncached.text == "items"
+    assert second.headers["age"] == "0"
+    assert len(origin.requests) == 2
+    assert stats.cache_hits == 1
+
+    # The client can ask for a response no older than max-age
+    await client.get("/items", headers={"Cache-Control": "no-cache"}, extensions=CACHED)
+    assert len(origin.requests) == 3
+
+
+async def test_stale_responses_are_revalidated():
+    origin = Origin()
+    origin.queued = [
+        httpx.Response(200, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}, text="items"),
+        httpx.Response(304, headers={"ETag": '"v1"', "Cache-Control": "max-age=60"}),
+    ]
+    client, stats = make_client(origin)
+
+    await client.get("/items", extensions=CACHED)
+    revalidated = await client.get("/items", extensions=CACHED)
+    fresh = await client.get("/items", extensions=CACHED)
+
+    assert revalidated.status_code == 200
+    assert revalidated.text == fresh.text == "items"
+    assert origin.requests[1].headers["if-none-match"] == '"v1"'
+    assert len(origin.requests) == 2
+    assert stats.cache_revalidations == 1
+    assert stats.cache_hits == 1
+
+
+@pytest.mark.parametrize(
+    ("response_headers", "request_headers"),
+    [
+        ({"Cache-Control": "no-store"}, {}),
+        ({"Cache-Control": "private, max-age=60"}, {}),
+        ({"Cache-Control": "max-age=60", "Vary": "*"}, {}),
+        ({"Cache-Control": "public, max-age=60"}, {"Authorization": "Bearer token"}),
+        ({"Cache-Control": "max-age=60"}, {"Cookie": "session=secret"}),
+        ({"Cache-Control": "max-age=60"}, {"X-API-Key": "secret"}),
+        ({"Cache-Control": "max-age=60"}, {"Cache-Control": "no-store"}),
+    ],
+)
+async def test_responses_that_must_not_be_shared_are_not_cached(response_headers, request_headers):
+    origin = Origin(httpx.Response(200, headers=response_headers, text="items"))
+    client, stats = make_client(origin)
+
+    for _ in range(2):
+        await client.get("/items", headers=request_headers, extensions=CACHED)
+
+    assert len(origin.requests) == 2
+    assert stats.cache_hits == 0
+
+
+async def test_requests_with_credentials_are_not_served_from_the_cache():
+    origin = Origin(httpx.Response(200, headers={"Cache-Control": "max-age=60"}, text="items"))
+    client, stats = make_client(origin)
+
+    await client.get("/items", extensions=CACHED)
+    await client.get("/items", headers={"X-Auth-Token": "secret"}, extensions=CACHED)
+
+    assert len(origin.requests) == 2
+    assert stats.cache_hits == 0
+
+
+async def test_vary_and_unsafe_methods():
+    origin = Origin(httpx.Response(200, headers={"Cache-Control": "max-age=60", "Vary": "Accept"}, text="items"))
+    client, _ = make_client(origin)
+
+    await client.get("/items", headers={"Accept": "application/json"}, extensions=CACHED)
+    await client.get("/items", headers={"Accept": "text/csv"}, extensions=CACHED)
+    assert len(origin.requests) == 2
+
+    await client.get("/items", headers={"Accept": "text/csv"}, extensions=CACHED)
+    assert len(origin.requests) == 2
+
+    await client.post("/items", json={})
+    await client.get("/items", headers={"Accept": "text/csv"}, extensions=CACHED)
+    assert len(origin.requests) == 4
+
+
+async def test_cache_is_bounded_by_entries_and_bytes():
+    cache = HTTPResponseCache(max_entries=2, max_bytes=10)
+    origin = Origin(httpx.Response(200, headers={"Cache-Control": "max-age=60"}, text="12345"))
+    client, _ = make_client(origin, cache=cache)
+
+    for path in ("/a", "/b", "/c"):
+        await client.get(path, extensions=CACHED)
+    assert len(cache) == 2
+    assert cache.size == 10
+
+    origin.default = httpx.Response(200, headers={"Cache-Control": "max-age=60"}, text="x" * 11)
+    await client.get("/large", extensions=CACHED)
+    assert len(cache) == 2
+
+
+async def test_idempotent_requests_are_retried():
+    origin = Origin()
+    origin.queued = [httpx.Response(503), httpx.ConnectError("refused"), httpx.Response(200, text="ok")]
+    client, stats = make_client(origin)
+
+    response = await client.get("/items", extensions={MAX_RETRIES_EXTENSION: 2})
+
+    assert response.text == "ok"
+    assert stats.retries == 2
+    assert stats.errors == 1
+    assert stats.requests == 3
+
+    # Unless the retries are exhausted
+    origin.queued = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(502)]
+    response = await client.get("/items", extensions={MAX_RETRIES_EXTENSION: 1})
+    assert response.status_code == 502
+
+
+async def test_non_idempotent_requests_are_not_retried():
+    origin = Origin()
+    origin.queued = [httpx.Response(503)]
+    client, stats = make_client(origin)
+
+    response = await client.post("/items", json={}, extensions={MAX_RETRIES_EXTENSION: 3})
+
+    assert response.status_code == 503
+    assert stats.retries == 0
+
+
+def test_backoff_uses_full_jitter_and_honors_retry_after():
+    transport = PooledTransport(httpx.MockTransport(Origin()), stats=OriginStats(), retry_max_backoff=5.0)
+
+    assert all(0 <= transport._backoff(3, None) <= 4.0 for _ in range(50))
+    assert transport._backoff(0, "3") >= 3.0
+    assert transport._backoff(0, "3600") == 5.0
+
+
+async def test_requests_are_rate_limited_per_origin():
+    origin = Origin()
+    client, stats = make_client(origin, rate_limiter=RateLimiter(20))
+
+    started = time.monotonic()
+    for _ in range(25):
+        await client.get("/items")
+    elapsed = time.monotonic() - started
+
+    # A burst of 20 requests, then one request every 50 ms
+    assert elapsed >= 0.2
+    assert stats.rate_limited == 5
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        data = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Set-Cookie", "session=secret")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def test_pooled_clients_reuse_connections(server_url):
+    pool = HTTPClientPool()
+    try:
+        async with pool.client(server_url + "/a") as client, pool.client(server_url + "/b") as other:
+            assert other is client
+
+            for path in ("/a", "/b", "/c", "/d"):
+                response = await client.get(server_url + path)
+                assert response.text == "ok"
+
+            # Cookies are not shared between the requests of the pooled client
+            assert not client.cookies
+
+        stats = pool.metrics()["origins"][server_url]
+        assert stats["requests"] == 4
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 3
+    finally:
+        await pool.aclose()
+
+
+@pytest.fixture
+def no_proxy_env(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+async def test_pooled_clients_use_the_environment_proxies(server_url, no_proxy_env):
+    # The test server answers every request, including the ones sent to it as a proxy
+    no_proxy_env.setenv("HTTP_PROXY", server_url)
+    pool = HTTPClientPool()
+    try:
+        async with pool.client("http://api.example.invalid") as client:
+            response = await client.get("http://api.example.invalid/items")
+        assert response.text == "ok"
+    finally:
+        await pool.aclose()
+
+    # Unless the host is excluded by NO_PROXY
+    no_proxy_env.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    no_proxy_env.setenv("NO_PROXY", "127.0.0.1")
+    pool = HTTPClientPool()
+    try:
+        async with pool.client(server_url) as client:
+            response = await client.get(server_url + "/items")
+        assert response.text == "ok"
+    finally:
+        await pool.aclose()
+
+
+async def test_least_recently_used_origins_are_closed_once_idle():
+    pool = HTTPClientPool(max_origins=2)
+    async with pool.client("https://a.example.com") as a:
+        async with pool.client("https://b.example.com"):
+            pass
+        async with pool.client("https://c.example.com"):
+            pass
+        # a is evicted while it is still in use
+        assert pool.metrics()["clients"] == 2
+        assert not a.is_closed
+    assert a.is_closed
+
+    async with pool.client("https://d.example.com") as d:
+        pass
+    await pool.aclose()
+    assert pool.metrics()["clients"] == 0
+    assert d.is_closed
@@ -0,0 +1,101 @@
+import base64
+import io
+import os
+
+import pytest
+from lfx.schema.image import Image
+from lfx.schema.message import Message
+from lfx.utils.image import ImageContentCache, create_image_content_dict, set_image_content_cache
+from PIL import Image as PILImage
+
+
+def save_image(path, size=(100, 50), color=(255, 0, 0)):
+    PILImage.new("RGB", size, color).save(path)
+    return path
+
+
+@pytest.fixture
+def image_cache():
+    cache = ImageContentCache()
+    set_image_content_cache(cache)
+    yield cache
+    set_image_content_cache(None)
+
+
+def decode_data_url(data_url):
+    header, data = data_url.split(",", 1)
+    return header, PILImage.open(io.BytesIO(base64.b64decode(data)))
+
+
+class TestImageContentCache:
+    def test_reuses_encoded_image(self, tmp_path):
+        cache = ImageContentCache()
+        path = save_image(tmp_path / "image.png")
+
+        first = cache.get_data_url(path)
+        second = cache.get_data_url(path)
+
+        assert first is second
+        assert first.startswith("data:image/png;base64,")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_modified_file_is_encoded_again(self, tmp_path):
+        cache = ImageContentCache()
+        path = save_image(tmp_path / "image.png")
+        first = cache.get_data_url(path)
+
+        save_image(path, color=(0, 0, 255))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get_data_url(path) != first
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used_within_byte_budget(self, tmp_path):
+        first_path = save_image(tmp_path / "first.png")
+        second_path = save_image(tmp_path / "second.png", color=(0, 255, 0))
+        entry_size = len(ImageContentCache().get_data_url(first_path))
+        cache = ImageContentCache(max_bytes=entry_size + 10)
+
+        cache.get_data_url(first_path)
+        cache.get_data_url(second_path)
+
+        assert len(cache) == 1
+        assert cache.size <= cache.max_bytes
+        cache.get_data_url(first_path)
+        assert cache.misses == 3
+
+    def test_downscales_to_max_dimension(self, tmp_path):
+        cache = ImageContentCache(max_dimension=20)
+        path = save_image(tmp_path / "image.png")
+
+        header, image = decode_data_url(cache.get_data_url(path))
+
+        assert header == "data:image/png;base64"
+        assert image.size == (20, 10)
+        _, original = decode_data_url(cache.get_data_url(path, max_dimension=200))
+        assert original.size == (100, 50)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Image file not found"):
+            ImageContentCache().get_data_url(tmp_path / "missing.png")
+
+
+def test_message_file_content_dicts_use_cache(tmp_path, image_cache):
+    path = save_image(tmp_path / "image.png")
+    message = Message(text="Look", files=[str(path)])
+
+    first = message.get_file_content_dicts()
+    second = message.get_file_content_dicts()
+
+    assert first == second == [create_image_content_dict(path)]
+    assert image_cache.misses == 1
+
+
+def test_image_to_base64(tmp_path, image_cache):
+    path = save_image(tmp_path / "image.png")
+
+    encoded = Image(path=str(path)).to_base64()
+
+    assert base64.b64decode(encoded) == path.read_bytes()
+    assert len(image_cache) == 1